@@ -17,19 +17,20 @@ from typing import TYPE_CHECKING, Any
 import discord
 from discord import app_commands
 
+from .crawler.admission import Priority
+
 if TYPE_CHECKING:
     pass
 
 _log = logging.getLogger(__name__)
-TRACK_NEW_AUTOCOMPLETE_CACHE_TTL_SECONDS = 20.0
-CHAPTER_AUTOCOMPLETE_CACHE_TTL_SECONDS = 120.0
+# Long-lived: a series' entries are dropped by invalidate_chapter_autocomplete_series
+# (subscribed to the crawler invalidation bus) when a new chapter is consumed.
+CHAPTER_AUTOCOMPLETE_CACHE_TTL_SECONDS = 900.0
 # Empty/failed fetches are cached only briefly so a transient miss (crawler busy
 # during an update check, or a series whose chapters aren't stored yet) doesn't
 # blackhole the field for the full TTL — it retries on the next keystroke.
 CHAPTER_AUTOCOMPLETE_EMPTY_CACHE_TTL_SECONDS = 8.0
 CHAPTER_AUTOCOMPLETE_WAIT_SECONDS = 1.5
-_track_new_autocomplete_cache: dict[str, tuple[float, list[app_commands.Choice[str]]]] = {}
-_track_new_autocomplete_inflight: dict[str, asyncio.Task[list[app_commands.Choice[str]]]] = {}
 _ChapterAutocompleteKey = tuple[int, int, str, str]
 _chapter_autocomplete_cache: dict[
     _ChapterAutocompleteKey, tuple[float, list[app_commands.Choice[str]]]
@@ -82,11 +83,6 @@ def _matches_manga_autocomplete(website_key: str, title: str, current: str) -> b
     return True
 
 
-def clear_track_new_autocomplete_cache() -> None:
-    _track_new_autocomplete_cache.clear()
-    _track_new_autocomplete_inflight.clear()
-
-
 def clear_chapter_autocomplete_cache() -> None:
     _chapter_autocomplete_cache.clear()
     for task in _chapter_autocomplete_inflight.values():
@@ -94,13 +90,22 @@ def clear_chapter_autocomplete_cache() -> None:
     _chapter_autocomplete_inflight.clear()
 
 
-def _normalize_track_new_query(current: str) -> tuple[str, str]:
-    query = str(current or "").strip()
-    return query, query.casefold()
+def invalidate_chapter_autocomplete_series(website_key: str, url_name: str) -> None:
+    """Drop every user's cached chapter choices for one series."""
+    series = (website_key, url_name)
+    for key in [key for key in _chapter_autocomplete_cache if key[2:] == series]:
+        del _chapter_autocomplete_cache[key]
+    # Detach (not cancel) in-flight fetches: waiters still get their answer,
+    # but a pre-update result is never written back into the cache.
+    for key in [key for key in _chapter_autocomplete_inflight if key[2:] == series]:
+        del _chapter_autocomplete_inflight[key]
 
 
-async def _fetch_track_new_choices(bot: Any, query: str) -> list[app_commands.Choice[str]]:
-    data = await bot.crawler.request("autocomplete", query=query, limit=10)
+async def _fetch_track_new_choices(bot: Any, current: str) -> list[app_commands.Choice[str]]:
+    # The crawler client caches and coalesces identical autocomplete queries, so
+    # every keystroke repeat across users costs at most one wire request.
+    query = str(current or "").strip()
+    data = await bot.crawler.cached_request("autocomplete", query=query, limit=10)
     results: list[dict] = data.get("results") or []
     choices: list[app_commands.Choice[str]] = []
     for r in results:
@@ -117,37 +122,6 @@ async def _fetch_track_new_choices(bot: Any, query: str) -> list[app_commands.Ch
     return choices
 
 
-async def _track_new_choices_from_cache_or_crawler(
-    bot: Any,
-    *,
-    query: str,
-    cache_key: str,
-) -> list[app_commands.Choice[str]]:
-    now = time.monotonic()
-    cached = _track_new_autocomplete_cache.get(cache_key)
-    if cached is not None:
-        expires_at, choices = cached
-        if expires_at > now:
-            return choices
-        _track_new_autocomplete_cache.pop(cache_key, None)
-
-    task = _track_new_autocomplete_inflight.get(cache_key)
-    if task is None:
-        task = asyncio.create_task(_fetch_track_new_choices(bot, query))
-        _track_new_autocomplete_inflight[cache_key] = task
-    try:
-        choices = await task
-    finally:
-        if _track_new_autocomplete_inflight.get(cache_key) is task:
-            _track_new_autocomplete_inflight.pop(cache_key, None)
-
-    _track_new_autocomplete_cache[cache_key] = (
-        time.monotonic() + TRACK_NEW_AUTOCOMPLETE_CACHE_TTL_SECONDS,
-        choices,
-    )
-    return choices
-
-
 async def tracked_manga_in_guild(
     interaction: discord.Interaction,
     current: str,
@@ -416,8 +390,9 @@ async def _fetch_chapter_choices(
         # always blows past the autocomplete budget and leaves the field empty;
         # ``series_data`` with ``allow_live=False`` is a fast local-DB read keyed
         # by url_name, so it works for tracked and untracked bookmarks alike.
-        data = await bot.crawler.request(
+        data = await bot.crawler.cached_request(
             "series_data",
+            priority=Priority.INTERACTIVE,
             website_key=website_key,
             url_name=url_name,
             allow_live=False,
@@ -434,12 +409,19 @@ async def _fetch_chapter_choices(
         _log.debug("chapter autocomplete fetch failed", exc_info=True)
         choices = []
 
+    if not choices:
+        # Don't let the shared response cache pin an empty stored list for the
+        # full series_data TTL; the chapters may land on the next update check.
+        bot.crawler.invalidate_cached(
+            "series_data", website_key=website_key, url_name=url_name, allow_live=False
+        )
     ttl = (
         CHAPTER_AUTOCOMPLETE_CACHE_TTL_SECONDS
         if choices
         else CHAPTER_AUTOCOMPLETE_EMPTY_CACHE_TTL_SECONDS
     )
-    _chapter_autocomplete_cache[key] = (time.monotonic() + ttl, choices)
+    if _chapter_autocomplete_inflight.get(key) is asyncio.current_task():
+        _chapter_autocomplete_cache[key] = (time.monotonic() + ttl, choices)
     return choices
 
 
@@ -531,17 +513,16 @@ async def supported_website_keys(
     """Website keys from the crawler's ``supported_websites`` op (TTL-cached)."""
     try:
         bot: Any = interaction.client
-        ttl = bot.config.supported_websites_cache.ttl_seconds
-
-        async def _loader() -> list[str]:
-            data = await bot.crawler.request("supported_websites")
-            return [
-                w.get("key") or w.get("website_key")
-                for w in data.get("websites", [])
-                if w.get("key") or w.get("website_key")
-            ]
-
-        keys: list[str] = await bot.websites_cache.get_or_set("websites", _loader, ttl)
+        data = await bot.crawler.cached_request(
+            "supported_websites",
+            ttl=bot.config.supported_websites_cache.ttl_seconds,
+            priority=Priority.INTERACTIVE,
+        )
+        keys: list[str] = [
+            w.get("key") or w.get("website_key")
+            for w in data.get("websites", [])
+            if w.get("key") or w.get("website_key")
+        ]
         lower = current.lower()
         choices = [
             app_commands.Choice(name=k, value=k) for k in keys if not lower or lower in k.lower()
@@ -562,7 +543,7 @@ async def track_new_url_or_search(
       1. Bare URL (``http(s)://...``) → return as-is.
       2. ``website_key|https://...`` shape → return as-is.
       3. Otherwise → query the crawler's local-DB ``autocomplete`` op immediately,
-         with a short in-process cache and in-flight request coalescing.
+         through the crawler client's shared response cache.
 
     Choice value format for autocomplete suggestions: ``"{website_key}|{series_url}"``.
     """
@@ -577,12 +558,7 @@ async def track_new_url_or_search(
                 return [app_commands.Choice(name=current[:100], value=current[:100])]
 
         bot: Any = interaction.client
-        query, cache_key = _normalize_track_new_query(current)
-        return await _track_new_choices_from_cache_or_crawler(
-            bot,
-            query=query,
-            cache_key=cache_key,
-        )
+        return await _fetch_track_new_choices(bot, current)
     except Exception:
         _log.exception("track_new_url_or_search autocomplete failed")
         return []
@@ -598,12 +574,7 @@ async def all_manga(
             return [app_commands.Choice(name=current[:100], value=current[:100])]
 
         bot: Any = interaction.client
-        query, cache_key = _normalize_track_new_query(current)
-        return await _track_new_choices_from_cache_or_crawler(
-            bot,
-            query=query,
-            cache_key=f"all:{cache_key}",
-        )
+        return await _fetch_track_new_choices(bot, current)
     except Exception:
         _log.exception("all_manga autocomplete failed")
         return []
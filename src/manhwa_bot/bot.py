@@ -14,7 +14,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from .cache import TtlCache
+from .autocomplete import invalidate_chapter_autocomplete_series
 from .checks import PREMIUM_REQUIRED
 from .cogs import COGS
 from .config import AppConfig
@@ -66,7 +66,6 @@ class ManhwaBot(commands.Bot):
     patreon: PatreonClient
     discord_ents: DiscordEntitlementsService
     premium: PremiumService
-    websites_cache: TtlCache[list]
 
     def __init__(self, config: AppConfig, db: DbPool, crawler: CrawlerClient) -> None:
         intents = discord.Intents.default()
@@ -141,11 +140,10 @@ class ManhwaBot(commands.Bot):
         # crawler-side tracker reconciliation) fires on the initial connect
         # too, not just on later reconnects.
         register_series_sync_handler(self)
+        self.crawler.invalidations.subscribe(invalidate_chapter_autocomplete_series)
         await self.crawler.start()
         _log.info("Crawler client started")
 
-        self.websites_cache: TtlCache[list] = TtlCache()
-
         for cog_path in COGS:
             await self.load_extension(cog_path)
             _log.info("Loaded cog: %s", cog_path)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -193,7 +194,7 @@ class BookmarksCog(commands.Cog, name="Bookmarks"):
             return _ResolvedSeries(wk, un, su, data)
         return None
 
-    async def _fetch_chapters_for(self, resolved: _ResolvedSeries) -> list[Chapter]:
+    async def _fetch_chapters_for(self, resolved: _ResolvedSeries) -> Sequence[Chapter]:
         return await self._fetch_chapters_with_fallback(
             website_key=resolved.website_key,
             identifier=resolved.series_url,
@@ -206,25 +207,25 @@ class BookmarksCog(commands.Cog, name="Bookmarks"):
         website_key: str,
         identifier: str,
         info_data: dict,
-    ) -> list[Chapter]:
-        raw_chapters: list = []
+    ) -> Sequence[Chapter]:
+        raw_chapters: Sequence = []
         try:
             data = await self.bot.crawler.request(  # type: ignore[attr-defined]
                 "chapters",
                 website_key=website_key,
                 url=identifier,
             )
-            raw_chapters = list(data.get("chapters") or [])
+            raw_chapters = data.get("chapters") or []
         except CrawlerError, RequestTimeout, Disconnected:
             pass
         if not raw_chapters:
-            raw_chapters = list(info_data.get("chapters") or info_data.get("latest_chapters") or [])
+            raw_chapters = info_data.get("chapters") or info_data.get("latest_chapters") or []
         return Chapter.list_from_payload({"chapters": raw_chapters})
 
     async def _cache_series_metadata(
         self,
         resolved: _ResolvedSeries,
-        chapters: list[Chapter],
+        chapters: Sequence[Chapter],
     ) -> tuple[str, str | None, str]:
         """Persist best-effort metadata without marking the series tracked in a guild."""
         info = resolved.info
@@ -532,15 +533,10 @@ class BookmarksCog(commands.Cog, name="Bookmarks"):
     async def _site_metadata(self, website_key: str) -> dict:
         try:
             bot: Any = self.bot
-            ttl = bot.config.supported_websites_cache.ttl_seconds
-
-            async def _loader() -> list[dict]:
-                d = await bot.crawler.request("supported_websites")
-                return d.get("websites") or []
-
-            websites: list[dict] = await bot.websites_cache.get_or_set(
-                "websites_full", _loader, ttl
+            d = await bot.crawler.cached_request(
+                "supported_websites", ttl=bot.config.supported_websites_cache.ttl_seconds
             )
+            websites: list[dict] = d.get("websites") or []
         except Exception:
             return {}
         for w in websites:
@@ -551,15 +547,10 @@ class BookmarksCog(commands.Cog, name="Bookmarks"):
     async def _supported_websites_keys(self) -> set[str]:
         try:
             bot: Any = self.bot
-            ttl = bot.config.supported_websites_cache.ttl_seconds
-
-            async def _loader() -> list[dict]:
-                d = await bot.crawler.request("supported_websites")
-                return d.get("websites") or []
-
-            websites: list[dict] = await bot.websites_cache.get_or_set(
-                "websites_full", _loader, ttl
+            d = await bot.crawler.cached_request(
+                "supported_websites", ttl=bot.config.supported_websites_cache.ttl_seconds
             )
+            websites: list[dict] = d.get("websites") or []
             return {
                 (w.get("key") or w.get("website_key"))
                 for w in websites
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
+from collections.abc import Sequence
 
 import discord
 from discord import app_commands
@@ -12,6 +13,7 @@ from discord.ext import commands
 
 from .. import autocomplete
 from ..checks import has_premium
+from ..crawler.chapter import Chapter
 from ..crawler.errors import CrawlerError, Disconnected, RequestTimeout
 from ..crawler.website_detect import detect_website_key, series_url_from_maybe_chapter_url
 from ..db.tracked import TrackedStore
@@ -81,14 +83,11 @@ def _format_search_partial(data: dict) -> tuple[str | None, str]:
 
 async def _get_websites_lookup(bot) -> dict[str, dict]:
     """Return a lookup of website_key -> website metadata dict using the cache."""
-    ttl = bot.config.supported_websites_cache.ttl_seconds
-
-    async def _loader() -> list[dict]:
-        d = await bot.crawler.request("supported_websites")
-        return d.get("websites") or []
-
     try:
-        websites: list[dict] = await bot.websites_cache.get_or_set("websites_full", _loader, ttl)
+        d = await bot.crawler.cached_request(
+            "supported_websites", ttl=bot.config.supported_websites_cache.ttl_seconds
+        )
+        websites: list[dict] = d.get("websites") or []
     except CrawlerError, RequestTimeout, Disconnected:
         websites = []
 
@@ -131,7 +130,7 @@ class CatalogCog(commands.Cog, name="Catalog"):
         identifier: str,
         info_data: dict,
         raise_unexpected: bool = False,
-    ) -> list[dict]:
+    ) -> Sequence[Chapter | dict]:
         """Fetch URL-rich chapter rows, falling back to chapters embedded in info."""
         try:
             chapters_data = await self.bot.crawler.request(  # type: ignore[attr-defined]
@@ -139,13 +138,13 @@ class CatalogCog(commands.Cog, name="Catalog"):
                 website_key=website_key,
                 url=identifier,
             )
-            chapters = list(chapters_data.get("chapters") or [])
+            chapters = chapters_data.get("chapters") or []
             if chapters:
                 return chapters
         except (CrawlerError, RequestTimeout, Disconnected) as exc:
             if raise_unexpected and (not isinstance(exc, CrawlerError) or exc.code != "not_found"):
                 raise
-        return list(info_data.get("chapters") or info_data.get("latest_chapters") or [])
+        return info_data.get("chapters") or info_data.get("latest_chapters") or []
 
     async def _resolve_series_input(self, value: str) -> tuple[str, str] | None:
         """Resolve a slash-command series input into ``(website_key, series_url)``.
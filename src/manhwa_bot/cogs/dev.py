@@ -6,6 +6,7 @@ Mirrors v1's ``developer`` group (aliases ``d``, ``dev``). Invoked via
 
 from __future__ import annotations
 
+import dataclasses
 import inspect
 import io
 import json
@@ -15,6 +16,7 @@ import shutil
 import sys
 import time
 import traceback as tb
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
@@ -23,7 +25,10 @@ import aiohttp
 import discord
 from discord.ext import commands
 
+from ..crawler.admission import Priority, priority_scope
+from ..crawler.breaker import BreakerState
 from ..crawler.errors import CrawlerError, Disconnected, RequestTimeout
+from ..crawler.metrics import CrawlerMetricsSnapshot
 from ..crawler.website_detect import (
     detect_website_key,
     series_url_from_maybe_chapter_url,
@@ -58,6 +63,8 @@ _TABLES_FOR_JSON_EXPORT = (
     "premium_grants",
     "patreon_links",
 )
+# Tables whose writes in-memory indexes listen for (see ``DbPool.changes``).
+_MIRRORED_TABLES = ("tracked_in_guild", "subscriptions", "guild_settings", "dm_settings")
 
 _DEV_COMMAND_DESCRIPTIONS = {
     "help": "Show this dev command reference.",
@@ -86,6 +93,7 @@ _DEV_COMMAND_DESCRIPTIONS = {
     "crawler heal": "Run crawler schema healing for a series URL.",
     "crawler test": "Run a crawler schema health test.",
     "crawler websites": "Refresh and list supported crawler websites.",
+    "crawler metrics": "Show crawler latency, errors, traffic and website circuits (--json: raw).",
     "premium": "Premium entitlement maintenance commands.",
     "premium grant": "Grant premium access to a user or guild.",
     "premium revoke": "Revoke a premium grant by ID or target.",
@@ -139,6 +147,46 @@ def _named(args: list[str], name: str) -> tuple[str | None, list[str]]:
     return value, remaining
 
 
+def _ms(seconds: float | None) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.0f}"
+
+
+def _format_crawler_metrics(
+    snapshot: CrawlerMetricsSnapshot, breakers: Sequence[BreakerState] = ()
+) -> str:
+    lines = [
+        f"uptime {snapshot.uptime_seconds / 3600:.1f}h, in flight {snapshot.in_flight}, "
+        f"reconnects {snapshot.reconnects}, progress {snapshot.progress_per_second:.2f}/s",
+        "",
+        f"{'op':<24} {'count':>7} {'p50ms':>6} {'p95ms':>6} {'p99ms':>6} {'t/o':>4} "
+        f"{'err':>4} {'fly':>3} {'KiB in':>8} {'KiB out':>7}",
+    ]
+    errors: list[str] = []
+    for op in snapshot.ops:
+        lines.append(
+            f"{op.op[:24]:<24} {op.count:>7} {_ms(op.p50_seconds):>6} "
+            f"{_ms(op.p95_seconds):>6} {_ms(op.p99_seconds):>6} {op.timeouts:>4} "
+            f"{op.error_count:>4} {op.in_flight:>3} {op.bytes_in / 1024:>8.1f} "
+            f"{op.bytes_out / 1024:>7.1f}"
+        )
+        if op.errors:
+            breakdown = ", ".join(f"{code}={n}" for code, n in sorted(op.errors.items()))
+            errors.append(f"{op.op}: {breakdown}")
+    if not snapshot.ops:
+        lines.append("(no crawler traffic yet)")
+    if errors:
+        lines += ["", "errors:", *errors]
+    if breakers:
+        lines += ["", "website circuits:"]
+        for b in breakers:
+            retry = f", probe in {b.retry_in_seconds:.0f}s" if b.retry_in_seconds else ""
+            lines.append(
+                f"{b.website_key}: {b.state} ({b.code}, {b.failures} failures, "
+                f"{b.rejected} rejected{retry})"
+            )
+    return "\n".join(lines)
+
+
 class DevCog(commands.Cog, name="Dev"):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot: ManhwaBot = bot  # type: ignore[assignment]
@@ -497,6 +545,8 @@ class DevCog(commands.Cog, name="Dev"):
                         inserted += 1
                     except Exception:
                         _log.exception("import_db: failed to insert into %s", table)
+                if table in _MIRRORED_TABLES:
+                    self.bot.db.changes.publish(table)
             await ctx.send(_code_block(f"-<[ Imported {inserted} rows. ]>-", "diff"))
             return
         await ctx.send("Unsupported attachment type. Use `.sqlite`/`.db` or `.json`.")
@@ -517,6 +567,8 @@ class DevCog(commands.Cog, name="Dev"):
             else:
                 cursor = await self.bot.db.execute(query, tuple(args))
                 results = [{"rowcount": cursor.rowcount, "lastrowid": cursor.lastrowid}]
+                for table in _MIRRORED_TABLES:
+                    self.bot.db.changes.publish(table)
             dt_ms = (time.perf_counter() - start) * 1000.0
         except Exception:
             await self._send_long_text(ctx, tb.format_exc(), lang="py")
@@ -600,11 +652,13 @@ class DevCog(commands.Cog, name="Dev"):
             # request timeout. Give it the long-operation watchdog budget the
             # other live-scrape commands use, or it times out while the crawler
             # is still working.
-            data = await self.bot.crawler.request(
-                "series_data",
-                timeout=self.bot.config.crawler.transport_watchdog_seconds,
-                **request,
-            )
+            # Operator-triggered background scrape: don't crowd out user traffic.
+            with priority_scope(Priority.BULK):
+                data = await self.bot.crawler.request(
+                    "series_data",
+                    timeout=self.bot.config.crawler.transport_watchdog_seconds,
+                    **request,
+                )
         except (CrawlerError, RequestTimeout, Disconnected) as exc:
             await ctx.send(f"crawler error: `{exc}`")
             return
@@ -831,7 +885,7 @@ class DevCog(commands.Cog, name="Dev"):
 
     @developer.group(name="crawler", invoke_without_command=True)
     async def crawler(self, ctx: commands.Context) -> None:
-        await ctx.send("Use `crawler health|heal|test|websites`.")
+        await ctx.send("Use `crawler health|heal|test|websites|metrics`.")
 
     @crawler.command(name="health")
     async def crawler_health(self, ctx: commands.Context, website_key: str | None = None) -> None:
@@ -895,8 +949,7 @@ class DevCog(commands.Cog, name="Dev"):
 
     @crawler.command(name="websites")
     async def crawler_websites(self, ctx: commands.Context) -> None:
-        self.bot.websites_cache.invalidate("websites")
-        self.bot.websites_cache.invalidate("websites_full")
+        self.bot.crawler.invalidate_cached("supported_websites")
         try:
             data = await self.bot.crawler.request("supported_websites")
         except CrawlerError as exc:
@@ -910,6 +963,18 @@ class DevCog(commands.Cog, name="Dev"):
             lang="",
         )
 
+    @crawler.command(name="metrics")
+    async def crawler_metrics(self, ctx: commands.Context, *flags: str) -> None:
+        as_json, _ = _flag(list(flags), "json")
+        snapshot = self.bot.crawler.metrics_snapshot()
+        breakers = self.bot.crawler.breaker_states()
+        if as_json:
+            data = snapshot.as_dict()
+            data["breakers"] = [dataclasses.asdict(b) for b in breakers]
+            await self._send_long_text(ctx, json.dumps(data, indent=2, default=str), lang="json")
+            return
+        await self._send_long_text(ctx, _format_crawler_metrics(snapshot, breakers), lang="")
+
     # -- premium subgroup ----------------------------------------------
 
     @developer.group(name="premium", invoke_without_command=True)
@@ -52,14 +52,11 @@ async def _premium_dm_only_predicate(interaction: discord.Interaction) -> bool:
 
 async def _get_lost_entries(bot: Any) -> list[dict]:
     """Return a list of dicts representing series/bookmarks on unsupported websites."""
-    ttl = bot.config.supported_websites_cache.ttl_seconds
-
-    async def _loader() -> list[dict]:
-        d = await bot.crawler.request("supported_websites")
-        return d.get("websites") or []
-
     try:
-        websites: list[dict] = await bot.websites_cache.get_or_set("websites_full", _loader, ttl)
+        d = await bot.crawler.cached_request(
+            "supported_websites", ttl=bot.config.supported_websites_cache.ttl_seconds
+        )
+        websites: list[dict] = d.get("websites") or []
     except CrawlerError, RequestTimeout, Disconnected:
         websites = []
 
@@ -268,7 +265,9 @@ class GeneralCog(commands.Cog, name="General"):
         guild_count = len(bot.guilds)
 
         try:
-            ws_data = await bot.crawler.request("supported_websites")
+            ws_data = await bot.crawler.cached_request(
+                "supported_websites", ttl=bot.config.supported_websites_cache.ttl_seconds
+            )
             websites_count = len(ws_data.get("websites") or [])
         except CrawlerError, RequestTimeout, Disconnected:
             websites_count = 0
@@ -302,7 +301,7 @@ class GeneralCog(commands.Cog, name="General"):
         Best-effort: on any transport error the section is simply omitted.
         """
         try:
-            data = await bot.crawler.request("website_stats", window="7d", recent_limit=0)
+            data = await bot.crawler.cached_request("website_stats", window="7d", recent_limit=0)
         except CrawlerError, RequestTimeout, Disconnected:
             return None
         rows = data.get("rows") if isinstance(data, dict) else None
@@ -459,9 +458,11 @@ class GeneralCog(commands.Cog, name="General"):
 
         try:
             if website_keys is not None:
-                data = await bot.crawler.request("next_update_check", website_keys=website_keys)
+                data = await bot.crawler.cached_request(
+                    "next_update_check", website_keys=website_keys
+                )
             else:
-                data = await bot.crawler.request("next_update_check")
+                data = await bot.crawler.cached_request("next_update_check")
         except (CrawlerError, RequestTimeout, Disconnected) as exc:
             await interaction.followup.send(
                 view=build_error_view(f"Couldn't reach the crawler: {exc}"),
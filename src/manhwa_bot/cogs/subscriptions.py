@@ -23,6 +23,7 @@ from ..ui.components.tracking import (
     build_simple_status_view,
     build_subscribe_success_view,
     build_unsubscribe_view,
+    enrich_grouped_list_items,
 )
 
 _log = logging.getLogger(__name__)
@@ -485,9 +486,10 @@ class SubscriptionsCog(commands.Cog, name="Subscriptions"):
             # build_grouped_list_views groups by scanlator and sorts by title.
             items = [
                 {
-                    "title": s.get("title") or s.get("url_name") or "Unknown",
+                    "title": s.get("title"),
                     "url": s.get("series_url") or "",
                     "website_key": s.get("website_key") or "",
+                    "url_name": s.get("url_name") or "",
                     "last_chapter": (
                         f"Last read: {s['last_read_chapter']}"
                         if s.get("last_read_chapter")
@@ -496,6 +498,15 @@ class SubscriptionsCog(commands.Cog, name="Subscriptions"):
                 }
                 for s in subs
             ]
+            # Series no longer in tracked_series have no stored title/url; fetch
+            # them all in one batched frame instead of one request per row.
+            await enrich_grouped_list_items(
+                self.bot.crawler,  # type: ignore[attr-defined]
+                items,
+                fields=("title", "url"),
+            )
+            for item in items:
+                item["title"] = item["title"] or item["url_name"] or "Unknown"
             count = len(items)
             title_prefix = "Your (Global) Subscriptions" if _global else "Your Subscriptions"
             pages = build_grouped_list_views(
@@ -31,6 +31,7 @@ from ..ui.components.tracking import (
     build_track_remove_view,
     build_track_update_view,
     build_tracking_success_view,
+    enrich_grouped_list_items,
 )
 
 _log = logging.getLogger(__name__)
@@ -233,7 +234,7 @@ class TrackingCog(commands.Cog, name="Tracking"):
                         website_key=website_key,
                         url=series_url,
                     )
-                    chapters = list(chapters_data.get("chapters") or [])
+                    chapters = chapters_data.get("chapters") or []
                 except CrawlerError, RequestTimeout, Disconnected:
                     chapters = []
                 if chapters:
@@ -570,12 +571,20 @@ class TrackingCog(commands.Cog, name="Tracking"):
                 "title": r.title,
                 "url": r.series_url,
                 "website_key": r.website_key,
+                "url_name": r.url_name,
                 "last_chapter": r.last_chapter_text,
                 "last_chapter_url": r.last_chapter_url,
                 "note": _ping_note(getattr(r, "ping_role_id", None)),
             }
             for r in rows
         ]
+        # Series tracked before their first notification have no stored latest
+        # chapter; one batched frame fills them from the crawler's stored copy.
+        await enrich_grouped_list_items(
+            self.bot.crawler,  # type: ignore[attr-defined]
+            items,
+            fields=("last_chapter",),
+        )
         pages = build_grouped_list_views(
             items,
             title=f"Tracked Manhwa ({len(items)})",
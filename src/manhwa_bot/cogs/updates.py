@@ -20,16 +20,21 @@ from discord.ext import commands
 from ..crawler.chapter import Chapter
 from ..crawler.notifications import NotificationConsumer
 from ..db.consumer_state import ConsumerStateStore
-from ..db.dm_settings import DmSettingsStore
-from ..db.guild_settings import GuildSettingsStore
+from ..db.dm_channels import DmChannelStore
 from ..db.notification_actions import NotificationActionContextStore
+from ..db.notification_deliveries import NotificationDeliveryStore
+from ..db.notification_inbox import NotificationInboxStore
 from ..db.subscriptions import SubscriptionStore
 from ..db.tracked import TrackedStore
 from ..notification_cover_relay import CoverAttachmentAsset, NotificationCoverRelay
+from ..notification_routing import (
+    DmRoute,
+    FanoutQueryRouting,
+    GuildRoute,
+    NotificationRoutingIndex,
+)
 from ..ui.components.notifications import (
-    ALL_UPDATE_BUTTONS,
-    build_chapter_update_view,
-    build_status_change_view,
+    NotificationRenderCache,
 )
 from ..ui.components.nsfw import should_spoiler
 
@@ -38,6 +43,11 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+# Successful sends are written to the delivery ledger in batches of this many,
+# so a crash mid fan-out loses at most one batch worth of bookkeeping.
+_LEDGER_FLUSH_EVERY = 25
+_LEDGER_PRUNE_INTERVAL_SECONDS = 60 * 60
+
 
 def _channel_is_nsfw(channel: Any) -> bool:
     """True if a Discord channel is age-gated NSFW (DMs/threads default to False)."""
@@ -61,35 +71,112 @@ async def _resolve_messageable_channel(
     return channel if isinstance(channel, discord.abc.Messageable) else None
 
 
+class _DeliveryLog:
+    """Targets one record has reached during this fan-out, bound for the ledger.
+
+    A no-op when the record has no id (dev replays) or the ledger is disabled.
+    """
+
+    def __init__(self, store: NotificationDeliveryStore | None, record_id: int | None) -> None:
+        self._store = store if record_id is not None else None
+        self._record_id = record_id
+        self._pending: list[tuple[str, int]] = []
+
+    async def add(self, target_kind: str, target_id: int) -> None:
+        if self._store is None:
+            return
+        self._pending.append((target_kind, int(target_id)))
+        if len(self._pending) >= _LEDGER_FLUSH_EVERY:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if self._store is None or not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        try:
+            await self._store.record(self._record_id, batch)  # type: ignore[arg-type]
+        except Exception:
+            _log.exception("failed to record deliveries for notification %s", self._record_id)
+
+
 class UpdatesCog(commands.Cog, name="Updates"):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot: ManhwaBot = bot  # type: ignore[assignment]
         self._tracked = TrackedStore(bot.db)  # type: ignore[attr-defined]
         self._subs = SubscriptionStore(bot.db)  # type: ignore[attr-defined]
-        self._guild_settings = GuildSettingsStore(bot.db)  # type: ignore[attr-defined]
-        self._dm_settings = DmSettingsStore(bot.db)  # type: ignore[attr-defined]
         self._consumer_state = ConsumerStateStore(bot.db)  # type: ignore[attr-defined]
+        self._dm_channels = DmChannelStore(bot.db)  # type: ignore[attr-defined]
         self._notification_actions = NotificationActionContextStore(bot.db)  # type: ignore[attr-defined]
         cfg = self.bot.config.notifications
+        self._routing = (
+            NotificationRoutingIndex(bot.db)  # type: ignore[attr-defined]
+            if cfg.routing_index
+            else FanoutQueryRouting(bot.db)  # type: ignore[attr-defined]
+        )
         self._channel_sem = asyncio.Semaphore(max(1, int(cfg.fanout_concurrency)))
         self._dm_sem = asyncio.Semaphore(max(1, int(cfg.dm_fanout_concurrency)))
         self._cover_relay = NotificationCoverRelay(cfg)
         self._consumer: NotificationConsumer | None = None
+        self._deliveries = (
+            NotificationDeliveryStore(bot.db)  # type: ignore[attr-defined]
+            if cfg.delivery_ledger_ttl_seconds > 0
+            else None
+        )
+        self._ledger_pruned_at: float | None = None
+
+    def _invalidate_series(self, website_key: str, url_name: str) -> None:
+        invalidations = getattr(getattr(self.bot, "crawler", None), "invalidations", None)
+        if invalidations is not None:
+            invalidations.publish(website_key, url_name)
+
+    async def _open_delivery_log(
+        self, record: dict[str, Any]
+    ) -> tuple[_DeliveryLog, set[tuple[str, int]]]:
+        """The ledger writer for *record* plus the targets it already reached."""
+        try:
+            record_id = int(record["id"])
+        except KeyError, TypeError, ValueError:
+            record_id = None
+        store = self._deliveries
+        if store is None or record_id is None:
+            return _DeliveryLog(None, None), set()
+        now = monotonic()
+        if (
+            self._ledger_pruned_at is None
+            or now - self._ledger_pruned_at >= _LEDGER_PRUNE_INTERVAL_SECONDS
+        ):
+            self._ledger_pruned_at = now
+            try:
+                pruned = await store.prune(
+                    self.bot.config.notifications.delivery_ledger_ttl_seconds
+                )
+                if pruned:
+                    _log.debug("pruned %s delivery ledger entries", pruned)
+            except Exception:
+                _log.exception("delivery ledger prune failed")
+        try:
+            done = await store.delivered_targets(record_id)
+        except Exception:
+            _log.exception("delivery ledger lookup failed for notification %s", record_id)
+            done = set()
+        if done:
+            _log.info(
+                "notification %s replayed; skipping %s targets already delivered",
+                record_id,
+                len(done),
+            )
+        return _DeliveryLog(store, record_id), done
 
     async def _scanlator_name(self, website_key: str) -> str:
         fallback = website_key.replace("_", " ").replace("-", " ").title()
-        cache = getattr(self.bot, "websites_cache", None)
         crawler = getattr(self.bot, "crawler", None)
-        if cache is None or crawler is None:
+        if crawler is None:
             return fallback
         try:
-            ttl = self.bot.config.supported_websites_cache.ttl_seconds
-
-            async def _loader() -> list[dict]:
-                data = await crawler.request("supported_websites")
-                return list(data.get("websites") or [])
-
-            websites = await cache.get_or_set("websites_full", _loader, ttl)
+            data = await crawler.cached_request(
+                "supported_websites", ttl=self.bot.config.supported_websites_cache.ttl_seconds
+            )
+            websites = list(data.get("websites") or [])
         except Exception:
             _log.debug("scanlator display-name lookup failed", exc_info=True)
             return fallback
@@ -99,11 +186,22 @@ class UpdatesCog(commands.Cog, name="Updates"):
         return fallback
 
     async def cog_load(self) -> None:
+        await self._routing.load()
         self._consumer = NotificationConsumer(
             client=self.bot.crawler,
             store=self._consumer_state,
             consumer_key=self.bot.config.crawler.consumer_key,
             dispatch=self.dispatch,
+            invalidations=self.bot.crawler.invalidations,
+            max_in_flight=self.bot.config.notifications.dispatch_pipeline_depth,
+            ack_every=self.bot.config.notifications.ack_batch_size,
+            ack_interval_seconds=self.bot.config.notifications.ack_interval_seconds,
+            inbox=(
+                NotificationInboxStore(self.bot.db)  # type: ignore[attr-defined]
+                if self.bot.config.notifications.durable_inbox
+                else None
+            ),
+            digest=self.bot.config.notifications.catchup_digest,
         )
         await self._consumer.start()
         _log.info("UpdatesCog loaded; notification consumer started")
@@ -112,6 +210,7 @@ class UpdatesCog(commands.Cog, name="Updates"):
         if self._consumer is not None:
             await self._consumer.stop()
             self._consumer = None
+        self._routing.close()
         await self._cover_relay.close()
 
     async def dispatch(self, record: dict[str, Any]) -> None:
@@ -125,11 +224,14 @@ class UpdatesCog(commands.Cog, name="Updates"):
                 "notification record missing website_key/url_name: id=%s", record.get("id")
             )
             return
+        # The consumer already published this series; direct callers (dev
+        # replays) rely on this so cached chapter data never outlives an update.
+        self._invalidate_series(website_key, url_name)
         if not str(payload.get("scanlator_name") or "").strip():
             payload["scanlator_name"] = await self._scanlator_name(website_key)
         if payload.get("event") == "status_change":
             recipients, attachment_sends = await self._dispatch_status_change(
-                payload, website_key, url_name
+                record, payload, website_key, url_name
             )
             self._log_dispatch_completion(
                 record,
@@ -139,36 +241,46 @@ class UpdatesCog(commands.Cog, name="Updates"):
                 started,
             )
             return
-        raw_chapter = payload.get("chapter") or {}
-        chapter = (
-            raw_chapter if isinstance(raw_chapter, Chapter) else Chapter.from_dict(raw_chapter)
-        )
-        # Replace the dict with a Chapter so downstream views can rely on .name/.url/etc.
+        # One entry per chapter: just this payload, or every record of a
+        # catch-up digest (oldest first) that the consumer collapsed into it.
+        entries = [
+            dict(member.get("payload") or {})
+            for member in record.get("digest") or []
+            if isinstance(member, dict)
+        ] or [payload]
+        for entry in entries:
+            raw_chapter = entry.get("chapter") or {}
+            # Replace the dict with a Chapter so downstream views can rely on .name/.url/etc.
+            entry["chapter"] = (
+                raw_chapter if isinstance(raw_chapter, Chapter) else Chapter.from_dict(raw_chapter)
+            )
+        chapter = entries[-1]["chapter"]
         payload["chapter"] = chapter
         is_premium = chapter.is_premium
 
         # A premium->free transition re-notifies an already-known chapter; it is
         # not a newer release, so it must not advance the stored latest chapter.
-        if not bool(payload.get("premium_freed")):
+        released = [entry for entry in entries if not bool(entry.get("premium_freed"))]
+        if released:
+            newest = released[-1]
+            latest = newest["chapter"]
             chapter_at = (
-                payload.get("released_at") or payload.get("created_at") or record.get("created_at")
+                newest.get("released_at") or newest.get("created_at") or record.get("created_at")
             )
             try:
                 await self._tracked.update_latest_chapter(
                     website_key,
                     url_name,
-                    text=chapter.name or None,
-                    url=chapter.url or None,
+                    text=latest.name or None,
+                    url=latest.url or None,
                     at=str(chapter_at) if chapter_at else None,
                 )
             except Exception:
                 _log.exception("failed to persist latest chapter for %s:%s", website_key, url_name)
 
-        guild_rows = await self._tracked.list_guilds_tracking(website_key, url_name)
-        user_ids = await self._subs.list_subscribers_for_series(website_key, url_name)
-        series_row = (
-            guild_rows[0] if guild_rows else await self._tracked.find(website_key, url_name)
-        )
+        routes = await self._routing.resolve(website_key, url_name)
+        guild_routes, dm_routes = routes.guilds, routes.users
+        series_row = await self._tracked.find(website_key, url_name)
         if series_row is not None:
             if not str(payload.get("series_title") or "").strip():
                 payload["series_title"] = series_row.title
@@ -179,17 +291,29 @@ class UpdatesCog(commands.Cog, name="Updates"):
             if payload.get("is_nsfw") is None and series_row.is_nsfw is not None:
                 payload["is_nsfw"] = series_row.is_nsfw
 
-        action_context = await self._notification_actions.get_or_create(
-            website_key=website_key,
-            url_name=url_name,
-            series_url=str(payload.get("series_url") or ""),
-            chapter_index=int(chapter.index if chapter.index is not None else -1),
-            chapter_name=chapter.name or None,
-            chapter_url=chapter.url or None,
-        )
-        payload["action_token"] = action_context.token
+        delivery_log, done = await self._open_delivery_log(record)
+        if done:
+            guild_routes = tuple(r for r in guild_routes if ("guild", r.guild_id) not in done)
+            dm_routes = tuple(r for r in dm_routes if ("dm", r.user_id) not in done)
+        dm_routes = await self._entitled_dm_routes(dm_routes)
+        dm_channels = await self._known_dm_channels(dm_routes)
 
-        recipients = len(guild_rows) + len(user_ids)
+        for entry in entries:
+            entry_chapter = entry["chapter"]
+            action_context = await self._notification_actions.get_or_create(
+                website_key=website_key,
+                url_name=url_name,
+                series_url=str(payload.get("series_url") or ""),
+                chapter_index=int(entry_chapter.index if entry_chapter.index is not None else -1),
+                chapter_name=entry_chapter.name or None,
+                chapter_url=entry_chapter.url or None,
+            )
+            entry["action_token"] = action_context.token
+        payload["action_token"] = entries[-1]["action_token"]
+        if len(entries) > 1:
+            payload["digest"] = entries
+
+        recipients = len(guild_routes) + len(dm_routes)
         cover_asset = (
             await self._cover_relay.prepare(
                 website_key=website_key,
@@ -199,15 +323,28 @@ class UpdatesCog(commands.Cog, name="Updates"):
             else None
         )
 
+        view_payloads = self._recipient_payloads(payload, is_premium)
+        render = NotificationRenderCache()
         guild_tasks = [
-            self._dispatch_to_guild(row, payload, is_premium, website_key, cover_asset)
-            for row in guild_rows
+            self._dispatch_to_guild(route, view_payloads, render, cover_asset, delivery_log)
+            for route in guild_routes
         ]
         dm_tasks = [
-            self._dispatch_to_user(uid, payload, is_premium, cover_asset) for uid in user_ids
+            self._dispatch_to_user(
+                route,
+                view_payloads,
+                render,
+                cover_asset,
+                delivery_log,
+                dm_channels.get(route.user_id),
+            )
+            for route in dm_routes
         ]
 
-        results = await asyncio.gather(*guild_tasks, *dm_tasks, return_exceptions=True)
+        try:
+            results = await asyncio.gather(*guild_tasks, *dm_tasks, return_exceptions=True)
+        finally:
+            await delivery_log.flush()
         self._log_dispatch_completion(
             record,
             website_key,
@@ -266,15 +403,14 @@ class UpdatesCog(commands.Cog, name="Updates"):
 
     async def _dispatch_status_change(
         self,
+        record: dict[str, Any],
         payload: dict[str, Any],
         website_key: str,
         url_name: str,
     ) -> tuple[int, int]:
-        guild_rows = await self._tracked.list_guilds_tracking(website_key, url_name)
-        user_ids = await self._subs.list_subscribers_for_series(website_key, url_name)
-        series_row = (
-            guild_rows[0] if guild_rows else await self._tracked.find(website_key, url_name)
-        )
+        routes = await self._routing.resolve(website_key, url_name)
+        guild_routes, dm_routes = routes.guilds, routes.users
+        series_row = await self._tracked.find(website_key, url_name)
         if series_row is not None:
             if not str(payload.get("series_title") or "").strip():
                 payload["series_title"] = series_row.title
@@ -297,7 +433,14 @@ class UpdatesCog(commands.Cog, name="Updates"):
             except Exception:
                 _log.exception("failed to persist status for %s:%s", website_key, url_name)
 
-        recipients = len(guild_rows) + len(user_ids)
+        delivery_log, done = await self._open_delivery_log(record)
+        if done:
+            guild_routes = tuple(r for r in guild_routes if ("guild", r.guild_id) not in done)
+            dm_routes = tuple(r for r in dm_routes if ("dm", r.user_id) not in done)
+        dm_routes = await self._entitled_dm_routes(dm_routes)
+        dm_channels = await self._known_dm_channels(dm_routes)
+
+        recipients = len(guild_routes) + len(dm_routes)
         cover_asset = (
             await self._cover_relay.prepare(
                 website_key=website_key,
@@ -306,12 +449,21 @@ class UpdatesCog(commands.Cog, name="Updates"):
             if recipients
             else None
         )
+        render = NotificationRenderCache()
         guild_tasks = [
-            self._dispatch_status_to_guild(row, payload, website_key, cover_asset)
-            for row in guild_rows
+            self._dispatch_status_to_guild(route, payload, render, cover_asset, delivery_log)
+            for route in guild_routes
         ]
-        dm_tasks = [self._dispatch_status_to_user(uid, payload, cover_asset) for uid in user_ids]
-        results = await asyncio.gather(*guild_tasks, *dm_tasks, return_exceptions=True)
+        dm_tasks = [
+            self._dispatch_status_to_user(
+                route, payload, render, cover_asset, delivery_log, dm_channels.get(route.user_id)
+            )
+            for route in dm_routes
+        ]
+        try:
+            results = await asyncio.gather(*guild_tasks, *dm_tasks, return_exceptions=True)
+        finally:
+            await delivery_log.flush()
 
         if bool(payload.get("terminal")):
             try:
@@ -323,31 +475,30 @@ class UpdatesCog(commands.Cog, name="Updates"):
 
     async def _dispatch_status_to_guild(
         self,
-        row: Any,
+        route: GuildRoute,
         payload: dict,
-        website_key: str,
+        render: NotificationRenderCache,
         cover_asset: CoverAttachmentAsset | None,
+        delivery_log: _DeliveryLog,
     ) -> bool:
         async with self._channel_sem:
             try:
-                settings = await self._guild_settings.get(row.guild_id)
-                channel_id = await self._resolve_channel_id(row.guild_id, website_key, settings)
-                if channel_id is None:
-                    _log.warning("guild %s has no notification channel; skipping", row.guild_id)
+                if route.channel_id is None:
+                    _log.warning("guild %s has no notification channel; skipping", route.guild_id)
                     return False
-                channel = await _resolve_messageable_channel(self.bot, channel_id)
+                channel = await _resolve_messageable_channel(self.bot, route.channel_id)
                 if channel is None:
                     _log.warning(
                         "channel %s for guild %s not resolvable; dropping notification",
-                        channel_id,
-                        row.guild_id,
+                        route.channel_id,
+                        route.guild_id,
                     )
                     return False
-                guild = getattr(channel, "guild", None) or self.bot.get_guild(row.guild_id)
-                content = self._compose_ping(guild, row, settings)
+                guild = getattr(channel, "guild", None) or self.bot.get_guild(route.guild_id)
+                content = self._compose_ping(guild, route, route)
                 spoiler = should_spoiler(
-                    payload.get("is_nsfw") if payload.get("is_nsfw") is not None else row.is_nsfw,
-                    mode=settings.nsfw_spoiler_mode if settings is not None else "always",
+                    payload.get("is_nsfw"),
+                    mode=route.nsfw_spoiler_mode,
                     channel_is_nsfw=_channel_is_nsfw(channel),
                 )
                 send_kwargs: dict[str, Any] = {}
@@ -357,11 +508,10 @@ class UpdatesCog(commands.Cog, name="Updates"):
                         users=False,
                         roles=True,
                     )
-                return await self._send_with_cover(
+                attached = await self._send_with_cover(
                     channel.send,
-                    view_factory=lambda cover_media_url: build_status_change_view(
+                    view_factory=lambda cover_media_url: render.status_view(
                         payload,
-                        bot=self.bot,
                         ping=content,
                         spoiler=spoiler,
                         cover_media_url=cover_media_url,
@@ -369,55 +519,56 @@ class UpdatesCog(commands.Cog, name="Updates"):
                     send_kwargs=send_kwargs,
                     cover_asset=cover_asset,
                 )
+                await delivery_log.add("guild", route.guild_id)
+                return attached
             except (discord.Forbidden, discord.NotFound) as exc:
                 _log.warning(
                     "guild %s status send failed (%s); skipping",
-                    getattr(row, "guild_id", "?"),
+                    route.guild_id,
                     exc.__class__.__name__,
                 )
             except discord.HTTPException:
                 _log.exception(
                     "guild %s status send failed with HTTP error; skipping",
-                    getattr(row, "guild_id", "?"),
+                    route.guild_id,
                 )
             except Exception:
                 _log.exception(
                     "unexpected error dispatching status to guild %s",
-                    getattr(row, "guild_id", "?"),
+                    route.guild_id,
                 )
         return False
 
     async def _dispatch_status_to_user(
         self,
-        user_id: int,
+        route: DmRoute,
         payload: dict,
+        render: NotificationRenderCache,
         cover_asset: CoverAttachmentAsset | None,
+        delivery_log: _DeliveryLog,
+        dm_channel_id: int | None,
     ) -> bool:
+        user_id = route.user_id
         async with self._dm_sem:
             try:
-                dm_settings = await self._dm_settings.get(user_id)
-                if dm_settings is not None and not dm_settings.notifications_enabled:
-                    return False
-                if not await self._user_has_premium(user_id):
-                    return False
-                user = await self.bot.fetch_user(user_id)
-                spoiler = should_spoiler(
-                    payload.get("is_nsfw"),
-                    mode=dm_settings.nsfw_spoiler_mode if dm_settings is not None else "always",
-                )
-                return await self._send_with_cover(
-                    user.send,
-                    view_factory=lambda cover_media_url: build_status_change_view(
+                target = await self._dm_target(user_id, dm_channel_id)
+                spoiler = should_spoiler(payload.get("is_nsfw"), mode=route.nsfw_spoiler_mode)
+                attached = await self._send_with_cover(
+                    target.send,
+                    view_factory=lambda cover_media_url: render.status_view(
                         payload,
-                        bot=self.bot,
                         spoiler=spoiler,
                         cover_media_url=cover_media_url,
                     ),
                     send_kwargs={},
                     cover_asset=cover_asset,
                 )
+                await delivery_log.add("dm", user_id)
+                await self._remember_dm_channel(user_id, target, dm_channel_id)
+                return attached
             except (discord.Forbidden, discord.NotFound) as exc:
                 _log.debug("status DM to user %s skipped (%s)", user_id, exc.__class__.__name__)
+                await self._forget_dm_channel(user_id, dm_channel_id)
             except discord.HTTPException:
                 _log.warning("status DM to user %s failed with HTTP error", user_id)
             except Exception:
@@ -426,39 +577,37 @@ class UpdatesCog(commands.Cog, name="Updates"):
 
     async def _dispatch_to_guild(
         self,
-        row: Any,
-        payload: dict,
-        is_premium: bool,
-        website_key: str,
+        route: GuildRoute,
+        view_payloads: dict[bool, dict[str, Any] | None],
+        render: NotificationRenderCache,
         cover_asset: CoverAttachmentAsset | None,
+        delivery_log: _DeliveryLog,
     ) -> bool:
         async with self._channel_sem:
             try:
-                settings = await self._guild_settings.get(row.guild_id)
-
-                channel_id = await self._resolve_channel_id(row.guild_id, website_key, settings)
-                if channel_id is None:
-                    _log.warning("guild %s has no notification channel; skipping", row.guild_id)
+                if route.channel_id is None:
+                    _log.warning("guild %s has no notification channel; skipping", route.guild_id)
                     return False
 
-                if not self._passes_paid_chapter_gate(payload, is_premium, settings):
+                view_payload = view_payloads[self._paid_opt_out(route)]
+                if view_payload is None:
                     return False
 
-                channel = await _resolve_messageable_channel(self.bot, channel_id)
+                channel = await _resolve_messageable_channel(self.bot, route.channel_id)
                 if channel is None:
                     _log.warning(
                         "channel %s for guild %s not resolvable; dropping notification",
-                        channel_id,
-                        row.guild_id,
+                        route.channel_id,
+                        route.guild_id,
                     )
                     return False
 
-                guild = getattr(channel, "guild", None) or self.bot.get_guild(row.guild_id)
-                content = self._compose_ping(guild, row, settings)
-                allowed = settings.update_buttons if settings is not None else ALL_UPDATE_BUTTONS
+                guild = getattr(channel, "guild", None) or self.bot.get_guild(route.guild_id)
+                content = self._compose_ping(guild, route, route)
+                allowed = route.update_buttons
                 spoiler = should_spoiler(
-                    payload.get("is_nsfw") if payload.get("is_nsfw") is not None else row.is_nsfw,
-                    mode=settings.nsfw_spoiler_mode if settings is not None else "always",
+                    view_payload.get("is_nsfw"),
+                    mode=route.nsfw_spoiler_mode,
                     channel_is_nsfw=_channel_is_nsfw(channel),
                 )
                 send_kwargs: dict[str, Any] = {}
@@ -468,11 +617,10 @@ class UpdatesCog(commands.Cog, name="Updates"):
                         users=False,
                         roles=True,
                     )
-                return await self._send_with_cover(
+                attached = await self._send_with_cover(
                     channel.send,
-                    view_factory=lambda cover_media_url: build_chapter_update_view(
-                        payload,
-                        bot=self.bot,
+                    view_factory=lambda cover_media_url: render.chapter_view(
+                        view_payload,
                         allowed_buttons=allowed,
                         ping=content,
                         spoiler=spoiler,
@@ -481,50 +629,85 @@ class UpdatesCog(commands.Cog, name="Updates"):
                     send_kwargs=send_kwargs,
                     cover_asset=cover_asset,
                 )
+                await delivery_log.add("guild", route.guild_id)
+                return attached
             except (discord.Forbidden, discord.NotFound) as exc:
                 _log.warning(
                     "guild %s send failed (%s); skipping",
-                    getattr(row, "guild_id", "?"),
+                    route.guild_id,
                     exc.__class__.__name__,
                 )
             except discord.HTTPException:
                 _log.exception(
                     "guild %s send failed with HTTP error; skipping",
-                    getattr(row, "guild_id", "?"),
+                    route.guild_id,
                 )
             except Exception:
                 _log.exception(
                     "unexpected error dispatching to guild %s",
-                    getattr(row, "guild_id", "?"),
+                    route.guild_id,
                 )
         return False
 
-    async def _resolve_channel_id(
-        self,
-        guild_id: int,
-        website_key: str,
-        settings: Any,
-    ) -> int | None:
-        scanlator_rows = await self._guild_settings.list_scanlator_channels(guild_id)
-        for entry in scanlator_rows:
-            if str(entry.get("website_key")) == website_key:
-                channel_id = entry.get("channel_id")
-                if channel_id is not None:
-                    return int(channel_id)
-        if settings is not None and settings.notifications_channel_id is not None:
-            return int(settings.notifications_channel_id)
-        return None
+    async def _known_dm_channels(self, routes: tuple[DmRoute, ...]) -> dict[int, int]:
+        """Cached DM channel ids for the recipients, fetched in one query."""
+        if not routes:
+            return {}
+        try:
+            return await self._dm_channels.get_many(route.user_id for route in routes)
+        except Exception:
+            _log.exception("DM channel lookup failed; fetching users instead")
+            return {}
+
+    async def _dm_target(self, user_id: int, dm_channel_id: int | None) -> Any:
+        """What to ``.send`` a DM through.
+
+        With a cached DM channel id this is a partial messageable for that
+        channel: no request until the send itself. Otherwise the user is
+        fetched, and their ``send`` opens the DM channel first.
+        """
+        if dm_channel_id is not None:
+            return self.bot.get_partial_messageable(dm_channel_id, type=discord.ChannelType.private)
+        return await self.bot.fetch_user(user_id)
+
+    async def _remember_dm_channel(
+        self, user_id: int, target: Any, dm_channel_id: int | None
+    ) -> None:
+        if dm_channel_id is not None:
+            return
+        channel_id = getattr(getattr(target, "dm_channel", None), "id", None)
+        if not isinstance(channel_id, int):
+            return
+        try:
+            await self._dm_channels.set(user_id, channel_id)
+        except Exception:
+            _log.exception("failed to cache DM channel for user %s", user_id)
+
+    async def _forget_dm_channel(self, user_id: int, dm_channel_id: int | None) -> None:
+        """Drop a cached DM channel the user's last send was refused on."""
+        if dm_channel_id is None:
+            return
+        try:
+            await self._dm_channels.delete(user_id)
+        except Exception:
+            _log.exception("failed to drop cached DM channel for user %s", user_id)
+
+    def _paid_opt_out(self, settings: Any) -> bool:
+        """Whether the recipient opted out of paid-chapter notifications."""
+        respect_paid = self.bot.config.notifications.respect_paid_chapter_setting
+        return respect_paid and settings is not None and not settings.paid_chapter_notifs
 
     def _passes_paid_chapter_gate(
         self,
         payload: dict[str, Any],
         is_premium: bool,
-        settings: Any,
+        opted_out: bool,
     ) -> bool:
         """Whether a chapter event should be delivered to one recipient.
 
         Returns True to deliver, False to suppress. Two mirror-image rules,
-        both keyed on the recipient's ``paid_chapter_notifs`` preference:
+        both keyed on the recipient's ``paid_chapter_notifs`` preference
+        (*opted_out*, from :meth:`_paid_opt_out`):
 
         * A *premium* chapter is suppressed for recipients who opted out of paid
           chapters.
@@ -532,27 +715,94 @@ class UpdatesCog(commands.Cog, name="Updates"):
           those same opted-out recipients — the ones who never saw the premium
           version — so recipients tracking premium aren't double-notified.
         """
-        respect_paid = self.bot.config.notifications.respect_paid_chapter_setting
-        opted_out = respect_paid and settings is not None and not settings.paid_chapter_notifs
         if bool(payload.get("premium_freed")):
             return opted_out
         if is_premium and opted_out:
             return False
         return True
 
-    async def _user_has_premium(self, user_id: int) -> bool:
-        """DM notifications are a premium perk — re-check on every delivery.
+    def _recipient_payloads(
+        self, payload: dict[str, Any], is_premium: bool
+    ) -> dict[bool, dict[str, Any] | None]:
+        """The payload each paid-chapter preference should see, keyed by opt-out.
+
+        Every recipient gets one of these two, so views render once per variant.
+        """
+        return {
+            opted_out: self._recipient_payload(payload, is_premium, opted_out)
+            for opted_out in (False, True)
+        }
 
+    def _recipient_payload(
+        self,
+        payload: dict[str, Any],
+        is_premium: bool,
+        opted_out: bool,
+    ) -> dict[str, Any] | None:
+        """The chapter payload a recipient should see, or None to skip them.
+
+        A digest keeps only the chapters that pass the recipient's paid-chapter
+        gate; its buttons then act on the newest of those.
+        """
+        entries = payload.get("digest")
+        if not entries:
+            return (
+                payload if self._passes_paid_chapter_gate(payload, is_premium, opted_out) else None
+            )
+        visible = [
+            entry
+            for entry in entries
+            if self._passes_paid_chapter_gate(entry, entry["chapter"].is_premium, opted_out)
+        ]
+        if not visible:
+            return None
+        return {
+            **payload,
+            "chapter": visible[-1]["chapter"],
+            "action_token": visible[-1]["action_token"],
+            "chapters": [entry["chapter"] for entry in visible],
+        }
+
+    async def _entitled_dm_routes(self, routes: tuple[DmRoute, ...]) -> tuple[DmRoute, ...]:
+        """The DM routes to deliver to: enabled and still premium.
+
+        DM notifications are a premium perk, re-checked on every event.
         ``/subscribe`` gates on premium at subscribe time, but premium can
         lapse afterwards; this keeps DMs flowing only while the user is still
-        premium. When the premium subsystem is disabled, ``is_premium`` returns
-        ``True`` so behaviour is unchanged.
+        premium. The whole subscriber set is checked in one bulk call before
+        any DM task takes a ``_dm_sem`` slot. If that call fails, each user is
+        checked on their own so one bad query only skips the users it fails
+        for. When the premium subsystem is disabled, every user comes back
+        entitled so behaviour is unchanged.
         """
+        wanted = [route for route in routes if route.notifications_enabled]
+        if not wanted:
+            return ()
         try:
-            ok, _ = await self.bot.premium.is_premium(user_id=user_id, guild_id=None, dm_only=True)
+            entitled = await self.bot.premium.is_premium_many(
+                [route.user_id for route in wanted], dm_only=True
+            )
         except Exception:
-            _log.exception("premium check failed for user %s; skipping DM", user_id)
-            return False
+            _log.exception(
+                "bulk premium check failed for %s DM subscribers; checking each user",
+                len(wanted),
+            )
+            checks = await asyncio.gather(
+                *(self._user_has_premium(route.user_id) for route in wanted)
+            )
+            return tuple(route for route, ok in zip(wanted, checks, strict=True) if ok)
+        return tuple(route for route in wanted if route.user_id in entitled)
+
+    async def _user_has_premium(self, user_id: int) -> bool:
+        """Single-user fallback for :meth:`_entitled_dm_routes`."""
+        async with self._dm_sem:
+            try:
+                ok, _ = await self.bot.premium.is_premium(
+                    user_id=user_id, guild_id=None, dm_only=True
+                )
+            except Exception:
+                _log.exception("premium check failed for user %s; skipping DM", user_id)
+                return False
         return ok
 
     @staticmethod
@@ -589,33 +839,26 @@ class UpdatesCog(commands.Cog, name="Updates"):
 
     async def _dispatch_to_user(
         self,
-        user_id: int,
-        payload: dict,
-        is_premium: bool,
+        route: DmRoute,
+        view_payloads: dict[bool, dict[str, Any] | None],
+        render: NotificationRenderCache,
         cover_asset: CoverAttachmentAsset | None,
+        delivery_log: _DeliveryLog,
+        dm_channel_id: int | None,
     ) -> bool:
+        user_id = route.user_id
         async with self._dm_sem:
             try:
-                dm_settings = await self._dm_settings.get(user_id)
-                if dm_settings is not None and not dm_settings.notifications_enabled:
-                    return False
-                if not await self._user_has_premium(user_id):
+                view_payload = view_payloads[self._paid_opt_out(route)]
+                if view_payload is None:
                     return False
-                if not self._passes_paid_chapter_gate(payload, is_premium, dm_settings):
-                    return False
-                user = await self.bot.fetch_user(user_id)
-                allowed = (
-                    dm_settings.update_buttons if dm_settings is not None else ALL_UPDATE_BUTTONS
-                )
-                spoiler = should_spoiler(
-                    payload.get("is_nsfw"),
-                    mode=dm_settings.nsfw_spoiler_mode if dm_settings is not None else "always",
-                )
-                return await self._send_with_cover(
-                    user.send,
-                    view_factory=lambda cover_media_url: build_chapter_update_view(
-                        payload,
-                        bot=self.bot,
+                target = await self._dm_target(user_id, dm_channel_id)
+                allowed = route.update_buttons
+                spoiler = should_spoiler(view_payload.get("is_nsfw"), mode=route.nsfw_spoiler_mode)
+                attached = await self._send_with_cover(
+                    target.send,
+                    view_factory=lambda cover_media_url: render.chapter_view(
+                        view_payload,
                         allowed_buttons=allowed,
                         spoiler=spoiler,
                         cover_media_url=cover_media_url,
@@ -623,8 +866,12 @@ class UpdatesCog(commands.Cog, name="Updates"):
                     send_kwargs={},
                     cover_asset=cover_asset,
                 )
+                await delivery_log.add("dm", user_id)
+                await self._remember_dm_channel(user_id, target, dm_channel_id)
+                return attached
             except (discord.Forbidden, discord.NotFound) as exc:
                 _log.debug("DM to user %s skipped (%s)", user_id, exc.__class__.__name__)
+                await self._forget_dm_channel(user_id, dm_channel_id)
             except discord.HTTPException:
                 _log.warning("DM to user %s failed with HTTP error", user_id)
             except Exception:
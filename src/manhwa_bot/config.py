@@ -13,6 +13,10 @@ import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 
+# Mirror crawler.codec.CODEC_NAMES / WIRE_FORMATS (importing it here would be circular).
+_JSON_CODECS = ("auto", "orjson", "stdlib")
+_WIRE_FORMATS = ("json", "msgpack", "cbor")
+
 
 class ConfigError(RuntimeError):
     """Raised when config is missing or malformed."""
@@ -41,6 +45,38 @@ class CrawlerConfig:
     api_key: str
     client_id: str = ""
     transport_watchdog_seconds: float = 180.0
+    # Number of pooled WebSocket connections; requests go to the least-busy one.
+    pool_size: int = 1
+    # Upper bound on entries in the shared read-through response cache (LRU).
+    response_cache_max_entries: int = 1024
+    # JSON codec for WebSocket frames: "auto" (orjson if installed), "orjson" or "stdlib".
+    json_codec: str = "auto"
+    # Text frames at least this many bytes are decoded in a worker thread.
+    decode_offload_bytes: int = 65536
+    # Offer permessage-deflate when connecting; falls back silently if declined.
+    ws_compress: bool = True
+    # Frame format offered as a subprotocol: "json" (text), "msgpack" or "cbor" (binary).
+    wire_format: str = "json"
+    # Admission caps: total requests in flight, and the share NORMAL / BULK work may
+    # hold (INTERACTIVE is bounded only by the total). See crawler.admission.
+    max_in_flight: int = 64
+    normal_max_in_flight: int = 48
+    bulk_max_in_flight: int = 8
+    # Adaptive deadlines: requests without an explicit timeout get the op's rolling
+    # p99 * multiplier, clamped between the floor and the static timeout. See
+    # crawler.timeouts.
+    adaptive_timeouts: bool = True
+    adaptive_timeout_multiplier: float = 4.0
+    adaptive_timeout_min_seconds: float = 3.0
+    adaptive_timeout_min_samples: int = 30
+    # Per-website circuit breaker: this many consecutive website_blocked /
+    # website_disabled replies open it; it half-opens after breaker_open_seconds.
+    breaker_failure_threshold: int = 3
+    breaker_open_seconds: float = 300.0
+    # Progress callbacks: latest-wins coalescing, and the minimum gap between two
+    # callbacks for one request (0 = coalesce only). Terminal events skip the gap.
+    progress_coalesce: bool = True
+    progress_min_interval_seconds: float = 1.0
 
 
 @dataclass(frozen=True)
@@ -87,6 +123,19 @@ class NotificationsConfig:
     cover_attachment_max_bytes: int = 2 * 1024 * 1024
     cover_attachment_cache_ttl_seconds: int = 6 * 60 * 60
     cover_attachment_cache_max_bytes: int = 32 * 1024 * 1024
+    # Notification records dispatched concurrently (same-series records stay in order).
+    dispatch_pipeline_depth: int = 8
+    # Offset writes + crawler acks are batched: every N records or T seconds.
+    ack_batch_size: int = 50
+    ack_interval_seconds: float = 1.0
+    # Store received records in SQLite before dispatching them (resume on restart).
+    durable_inbox: bool = True
+    # Remember which targets each record reached so a replay skips them; 0 disables.
+    delivery_ledger_ttl_seconds: int = 2 * 24 * 60 * 60
+    # Collapse a series' backlog of chapters into one message during catch-up.
+    catchup_digest: bool = True
+    # Keep every series' fan-out targets in memory; off = one joined query per event.
+    routing_index: bool = True
 
 
 @dataclass(frozen=True)
@@ -280,8 +329,136 @@ def load_config(
                 crawler_section.get("client_id", ""),
             )
         ),
+        pool_size=int(
+            _env_override(
+                "MANHWABOT_CRAWLER_POOL_SIZE",
+                crawler_section.get("pool_size", 1),
+            )
+        ),
+        response_cache_max_entries=int(
+            _env_override(
+                "MANHWABOT_CRAWLER_RESPONSE_CACHE_MAX_ENTRIES",
+                crawler_section.get("response_cache_max_entries", 1024),
+            )
+        ),
+        json_codec=str(
+            _env_override(
+                "MANHWABOT_CRAWLER_JSON_CODEC",
+                crawler_section.get("json_codec", "auto"),
+            )
+        )
+        .strip()
+        .lower(),
+        decode_offload_bytes=int(
+            _env_override(
+                "MANHWABOT_CRAWLER_DECODE_OFFLOAD_BYTES",
+                crawler_section.get("decode_offload_bytes", 65536),
+            )
+        ),
+        ws_compress=bool(
+            _env_override(
+                "MANHWABOT_CRAWLER_WS_COMPRESS",
+                crawler_section.get("ws_compress", True),
+            )
+        ),
+        wire_format=str(
+            _env_override(
+                "MANHWABOT_CRAWLER_WIRE_FORMAT",
+                crawler_section.get("wire_format", "json"),
+            )
+        )
+        .strip()
+        .lower(),
+        max_in_flight=int(
+            _env_override(
+                "MANHWABOT_CRAWLER_MAX_IN_FLIGHT",
+                crawler_section.get("max_in_flight", 64),
+            )
+        ),
+        normal_max_in_flight=int(
+            _env_override(
+                "MANHWABOT_CRAWLER_NORMAL_MAX_IN_FLIGHT",
+                crawler_section.get("normal_max_in_flight", 48),
+            )
+        ),
+        bulk_max_in_flight=int(
+            _env_override(
+                "MANHWABOT_CRAWLER_BULK_MAX_IN_FLIGHT",
+                crawler_section.get("bulk_max_in_flight", 8),
+            )
+        ),
+        adaptive_timeouts=bool(
+            _env_override(
+                "MANHWABOT_CRAWLER_ADAPTIVE_TIMEOUTS",
+                crawler_section.get("adaptive_timeouts", True),
+            )
+        ),
+        adaptive_timeout_multiplier=float(
+            _env_override(
+                "MANHWABOT_CRAWLER_ADAPTIVE_TIMEOUT_MULTIPLIER",
+                crawler_section.get("adaptive_timeout_multiplier", 4.0),
+            )
+        ),
+        adaptive_timeout_min_seconds=float(
+            _env_override(
+                "MANHWABOT_CRAWLER_ADAPTIVE_TIMEOUT_MIN_SECONDS",
+                crawler_section.get("adaptive_timeout_min_seconds", 3.0),
+            )
+        ),
+        adaptive_timeout_min_samples=int(
+            _env_override(
+                "MANHWABOT_CRAWLER_ADAPTIVE_TIMEOUT_MIN_SAMPLES",
+                crawler_section.get("adaptive_timeout_min_samples", 30),
+            )
+        ),
+        breaker_failure_threshold=int(
+            _env_override(
+                "MANHWABOT_CRAWLER_BREAKER_FAILURE_THRESHOLD",
+                crawler_section.get("breaker_failure_threshold", 3),
+            )
+        ),
+        breaker_open_seconds=float(
+            _env_override(
+                "MANHWABOT_CRAWLER_BREAKER_OPEN_SECONDS",
+                crawler_section.get("breaker_open_seconds", 300.0),
+            )
+        ),
+        progress_coalesce=bool(
+            _env_override(
+                "MANHWABOT_CRAWLER_PROGRESS_COALESCE",
+                crawler_section.get("progress_coalesce", True),
+            )
+        ),
+        progress_min_interval_seconds=float(
+            _env_override(
+                "MANHWABOT_CRAWLER_PROGRESS_MIN_INTERVAL",
+                crawler_section.get("progress_min_interval_seconds", 1.0),
+            )
+        ),
         api_key=crawler_api_key,
     )
+    crawler_limits = {
+        "pool_size": crawler.pool_size,
+        "response_cache_max_entries": crawler.response_cache_max_entries,
+        "decode_offload_bytes": crawler.decode_offload_bytes,
+        "max_in_flight": crawler.max_in_flight,
+        "normal_max_in_flight": crawler.normal_max_in_flight,
+        "bulk_max_in_flight": crawler.bulk_max_in_flight,
+        "adaptive_timeout_multiplier": crawler.adaptive_timeout_multiplier,
+        "adaptive_timeout_min_seconds": crawler.adaptive_timeout_min_seconds,
+        "adaptive_timeout_min_samples": crawler.adaptive_timeout_min_samples,
+        "breaker_failure_threshold": crawler.breaker_failure_threshold,
+        "breaker_open_seconds": crawler.breaker_open_seconds,
+    }
+    for name, value in crawler_limits.items():
+        if value <= 0:
+            raise ConfigError(f"crawler.{name} must be greater than zero")
+    if crawler.progress_min_interval_seconds < 0:
+        raise ConfigError("crawler.progress_min_interval_seconds must not be negative")
+    if crawler.json_codec not in _JSON_CODECS:
+        raise ConfigError(f"crawler.json_codec must be one of: {', '.join(_JSON_CODECS)}")
+    if crawler.wire_format not in _WIRE_FORMATS:
+        raise ConfigError(f"crawler.wire_format must be one of: {', '.join(_WIRE_FORMATS)}")
 
     db = DbConfig(
         path=str(_env_override("MANHWABOT_DB_PATH", db_section.get("path", "manhwa_bot.db"))),
@@ -334,6 +511,15 @@ def load_config(
         cover_attachment_cache_max_bytes=int(
             notifications_section.get("cover_attachment_cache_max_bytes", 32 * 1024 * 1024)
         ),
+        dispatch_pipeline_depth=int(notifications_section.get("dispatch_pipeline_depth", 8)),
+        ack_batch_size=int(notifications_section.get("ack_batch_size", 50)),
+        ack_interval_seconds=float(notifications_section.get("ack_interval_seconds", 1.0)),
+        durable_inbox=bool(notifications_section.get("durable_inbox", True)),
+        delivery_ledger_ttl_seconds=int(
+            notifications_section.get("delivery_ledger_ttl_seconds", 2 * 24 * 60 * 60)
+        ),
+        catchup_digest=bool(notifications_section.get("catchup_digest", True)),
+        routing_index=bool(notifications_section.get("routing_index", True)),
     )
     notification_limits = {
         "cover_attachment_timeout_seconds": notifications.cover_attachment_timeout_seconds,
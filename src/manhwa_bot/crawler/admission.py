@@ -0,0 +1,173 @@
+"""Priority-aware admission control for crawler requests.
+
+Every request the client sends holds one slot for as long as it is in flight.
+Slots are bounded in total and per priority: ``BULK`` work (series sync,
+catch-up pages, batch preloads) can never occupy more than its own cap, so
+``INTERACTIVE`` calls such as autocomplete always find headroom. When the
+total is saturated, freed slots go to the highest waiting priority first,
+FIFO within a priority. Time spent waiting is recorded per priority.
+
+The priority of a request is, in order: the explicit ``priority=`` argument,
+the innermost :func:`priority_scope`, the op's default in
+:data:`DEFAULT_PRIORITIES`, else ``NORMAL``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    """Lower value = served first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+DEFAULT_PRIORITIES: dict[str, Priority] = {
+    "autocomplete": Priority.INTERACTIVE,
+    "series_sync_submit": Priority.BULK,
+    "notifications_list": Priority.BULK,
+    "notifications_ack": Priority.BULK,
+    "series_data_batch": Priority.BULK,
+}
+
+_scoped_priority: ContextVar[Priority | None] = ContextVar("crawler_priority", default=None)
+
+
+@contextlib.contextmanager
+def priority_scope(priority: Priority) -> Iterator[None]:
+    """Run every crawler request made inside the block (and tasks it spawns) at *priority*."""
+    token = _scoped_priority.set(priority)
+    try:
+        yield
+    finally:
+        _scoped_priority.reset(token)
+
+
+def resolve_priority(type_: str, explicit: Priority | None = None) -> Priority:
+    if explicit is not None:
+        return explicit
+    scoped = _scoped_priority.get()
+    if scoped is not None:
+        return scoped
+    return DEFAULT_PRIORITIES.get(type_, Priority.NORMAL)
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    """Per-priority slot usage and queueing delay."""
+
+    priority: Priority
+    cap: int
+    in_flight: int
+    queued: int
+    admitted: int
+    waited: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Mean queueing delay over requests that had to wait."""
+        return self.total_wait_seconds / self.waited if self.waited else 0.0
+
+
+class _Counters:
+    __slots__ = ("admitted", "max_wait", "total_wait", "waited")
+
+    def __init__(self) -> None:
+        self.admitted = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class AdmissionScheduler:
+    """Bounded slots with per-priority caps and strict priority hand-off.
+
+    Only use from the event loop that awaits :meth:`slot`.
+    """
+
+    def __init__(self, total: int, caps: Mapping[Priority, int]) -> None:
+        self._total = max(1, int(total))
+        self._caps = {p: max(1, min(int(caps.get(p, self._total)), self._total)) for p in Priority}
+        self._running = dict.fromkeys(Priority, 0)
+        self._queues: dict[Priority, deque[asyncio.Future[None]]] = {p: deque() for p in Priority}
+        self._counters = {p: _Counters() for p in Priority}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: Priority) -> AsyncIterator[float]:
+        """Hold a slot for the block; yields the seconds spent queueing."""
+        waited = await self._acquire(priority)
+        try:
+            yield waited
+        finally:
+            self._release(priority)
+
+    def stats(self) -> list[AdmissionStats]:
+        return [
+            AdmissionStats(
+                priority=p,
+                cap=self._caps[p],
+                in_flight=self._running[p],
+                queued=sum(1 for fut in self._queues[p] if not fut.done()),
+                admitted=self._counters[p].admitted,
+                waited=self._counters[p].waited,
+                total_wait_seconds=self._counters[p].total_wait,
+                max_wait_seconds=self._counters[p].max_wait,
+            )
+            for p in Priority
+        ]
+
+    def _has_room(self, priority: Priority) -> bool:
+        return (
+            sum(self._running.values()) < self._total
+            and self._running[priority] < self._caps[priority]
+        )
+
+    async def _acquire(self, priority: Priority) -> float:
+        counters = self._counters[priority]
+        queue = self._queues[priority]
+        while queue and queue[0].done():
+            queue.popleft()
+        # FIFO within a priority: never overtake an earlier waiter of the same class.
+        if not queue and self._has_room(priority):
+            self._running[priority] += 1
+            counters.admitted += 1
+            return 0.0
+        started = time.monotonic()
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Granted in the same tick we were cancelled; hand the slot on.
+                self._release(priority)
+            raise
+        waited = time.monotonic() - started
+        counters.admitted += 1
+        counters.waited += 1
+        counters.total_wait += waited
+        counters.max_wait = max(counters.max_wait, waited)
+        return waited
+
+    def _release(self, priority: Priority) -> None:
+        self._running[priority] -= 1
+        for p in Priority:
+            queue = self._queues[p]
+            while queue and self._has_room(p):
+                fut = queue.popleft()
+                if fut.done():  # cancelled while queued
+                    continue
+                self._running[p] += 1
+                fut.set_result(None)
@@ -0,0 +1,152 @@
+"""Per-website circuit breaker for crawler requests.
+
+After ``threshold`` consecutive ``website_blocked`` / ``website_disabled``
+replies for one ``website_key``, the circuit opens. Every request naming that
+website then fails locally with :class:`~.errors.CircuitOpen` instead of
+spending a crawler round-trip on an answer we already know. Once
+``open_seconds`` have passed the circuit half-opens: one request goes through
+as a probe while the rest keep failing fast. A successful probe closes the
+circuit, a probe that is blocked again re-opens it, and a probe that fails
+for an unrelated reason frees the slot for the next one. Replies to requests
+admitted before the circuit opened never close it: a stale success says
+nothing about the website now. An ``operational_alert_event`` reporting the
+website ``recovered`` closes it straight away.
+
+Only websites that are failing hold state, so memory is bounded by the
+number of supported websites.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .errors import CircuitOpen
+
+# Reply codes that mean "this website is down", as opposed to "this request failed".
+TRIP_CODES = frozenset({"website_blocked", "website_disabled"})
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class BreakerState:
+    """One website's circuit, for diagnostics."""
+
+    website_key: str
+    state: str
+    code: str | None
+    failures: int
+    # Seconds until an open circuit half-opens (0 once it may probe).
+    retry_in_seconds: float
+    rejected: int
+
+
+class _Circuit:
+    __slots__ = (
+        "code",
+        "failures",
+        "opened_at",
+        "opened_ticket",
+        "probing",
+        "rejected",
+        "state",
+    )
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.code: str | None = None
+        self.opened_at = 0.0
+        # Last admission ticket issued when the circuit (re)opened; only replies
+        # to requests with a later ticket reflect the website's current health.
+        self.opened_ticket = 0
+        self.probing = False
+        self.rejected = 0
+
+
+class WebsiteBreaker:
+    """Circuit state per ``website_key``. Only use from the client's event loop."""
+
+    def __init__(
+        self,
+        *,
+        threshold: int,
+        open_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._threshold = max(1, int(threshold))
+        self._open_seconds = open_seconds
+        self._clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+        self._tickets = 0
+
+    def admit(self, website_key: str, *, request_id: str | None = None) -> int:
+        """Raise :class:`CircuitOpen` unless a request to *website_key* may go out.
+
+        Returns the request's admission ticket, to hand back to :meth:`record`
+        or :meth:`release` when it ends.
+        """
+        circuit = self._circuits.get(website_key)
+        if circuit is not None and circuit.state != CLOSED:
+            if circuit.state == OPEN and self._clock() - circuit.opened_at >= self._open_seconds:
+                circuit.state = HALF_OPEN
+            if circuit.state != HALF_OPEN or circuit.probing:
+                circuit.rejected += 1
+                raise CircuitOpen(
+                    website_key, circuit.code or "website_blocked", request_id=request_id
+                )
+            circuit.probing = True
+        self._tickets += 1
+        return self._tickets
+
+    def record(self, website_key: str, code: str | None, ticket: int) -> None:
+        """A reply arrived for *website_key*; *code* is its error code, if not ok."""
+        if code in TRIP_CODES:
+            circuit = self._circuits.setdefault(website_key, _Circuit())
+            circuit.failures += 1
+            circuit.code = code
+            if circuit.state == HALF_OPEN or circuit.failures >= self._threshold:
+                circuit.state = OPEN
+                circuit.opened_at = self._clock()
+                circuit.opened_ticket = self._tickets
+                circuit.probing = False
+            return
+        circuit = self._circuits.get(website_key)
+        if circuit is None or ticket <= circuit.opened_ticket:
+            return
+        if code is None:
+            self.close(website_key)
+        else:
+            # An unrelated error neither proves nor disproves the website is back.
+            circuit.probing = False
+
+    def release(self, website_key: str, ticket: int) -> None:
+        """A request ended without a reply (timeout, disconnect, cancel)."""
+        circuit = self._circuits.get(website_key)
+        if circuit is not None and ticket > circuit.opened_ticket:
+            circuit.probing = False
+
+    def close(self, website_key: str) -> None:
+        self._circuits.pop(website_key, None)
+
+    def states(self) -> list[BreakerState]:
+        now = self._clock()
+        return [
+            BreakerState(
+                website_key=key,
+                state=circuit.state,
+                code=circuit.code,
+                failures=circuit.failures,
+                retry_in_seconds=(
+                    max(0.0, circuit.opened_at + self._open_seconds - now)
+                    if circuit.state == OPEN
+                    else 0.0
+                ),
+                rejected=circuit.rejected,
+            )
+            for key, circuit in sorted(self._circuits.items())
+        ]
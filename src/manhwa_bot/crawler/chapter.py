@@ -5,13 +5,50 @@ vs ``name`` vs ``text``; ``url`` vs ``chapter_url``; ``is_premium`` vs ``premium
 vs ``is_paid`` vs ``locked``). Centralising the parsing here means downstream views
 never have to reach into the dict and can just call ``str(chapter)`` to render the
 canonical hyperlink (with the lock emoji on premium chapters).
+
+Whole chapter arrays are held in a :class:`ChapterList`, which keeps the raw
+dicts and parses a row only when it is read, so views that show 25 rows of a
+2 000-chapter series only ever parse 25.
 """
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, overload
+
+
+def _parse_index(data: Mapping[str, Any], fallback_idx: int | None) -> int | None:
+    idx_raw = data.get("index")
+    if isinstance(idx_raw, bool):
+        return fallback_idx
+    if isinstance(idx_raw, (int, float)):
+        return int(idx_raw)
+    return fallback_idx
+
+
+def _parse_fields(
+    data: Mapping[str, Any], fallback_idx: int | None
+) -> tuple[str, str, int | None, bool]:
+    name = str(
+        data.get("chapter")
+        or data.get("name")
+        or data.get("text")
+        or data.get("chapter_number")
+        or (f"#{fallback_idx}" if fallback_idx is not None else "?")
+    )
+    url = str(data.get("url") or data.get("chapter_url") or "")
+    index = _parse_index(data, fallback_idx)
+    premium = bool(
+        data.get("is_premium")
+        or data.get("premium")
+        or data.get("is_paid")
+        or data.get("paid")
+        or data.get("is_locked")
+        or data.get("locked")
+    )
+    return name, url, index, premium
 
 
 @dataclass(frozen=True)
@@ -29,44 +66,22 @@ class Chapter:
         data: Mapping[str, Any],
         fallback_idx: int | None = None,
     ) -> Chapter:
-        name = str(
-            data.get("chapter")
-            or data.get("name")
-            or data.get("text")
-            or data.get("chapter_number")
-            or (f"#{fallback_idx}" if fallback_idx is not None else "?")
-        )
-        url = str(data.get("url") or data.get("chapter_url") or "")
-        idx_raw = data.get("index")
-        if isinstance(idx_raw, bool):
-            index: int | None = fallback_idx
-        elif isinstance(idx_raw, (int, float)):
-            index = int(idx_raw)
-        else:
-            index = fallback_idx
-        premium = bool(
-            data.get("is_premium")
-            or data.get("premium")
-            or data.get("is_paid")
-            or data.get("paid")
-            or data.get("is_locked")
-            or data.get("locked")
-        )
+        name, url, index, premium = _parse_fields(data, fallback_idx)
         return cls(name=name, url=url, index=index, is_premium=premium)
 
     @classmethod
-    def list_from_payload(cls, payload: Mapping[str, Any]) -> list[Chapter]:
-        """Deserialise a crawler response's ``chapters``/``latest_chapters`` array."""
+    def list_from_payload(cls, payload: Mapping[str, Any]) -> ChapterList:
+        """Deserialise a crawler response's ``chapters``/``latest_chapters`` array.
+
+        An array that is already a :class:`ChapterList` (a payload the crawler
+        client wrapped) is returned as-is.
+        """
         raw: Any = payload.get("chapters")
         if raw is None:
             raw = payload.get("latest_chapters") or []
-        result: list[Chapter] = []
-        for i, item in enumerate(raw or []):
-            if isinstance(item, Chapter):
-                result.append(item)
-            elif isinstance(item, Mapping):
-                result.append(cls.from_dict(item, fallback_idx=i))
-        return result
+        if isinstance(raw, ChapterList):
+            return raw
+        return ChapterList.from_rows(raw or [])
 
     def __str__(self) -> str:
         from ..ui import emojis
@@ -78,3 +93,150 @@ class Chapter:
             link = f"[{self.name}]({self.url})"
             return f"{link} {emojis.LOCK}" if self.is_premium else link
         return f"{emojis.LOCK} {self.name}" if self.is_premium else self.name
+
+
+class ChapterList(Sequence[Chapter]):
+    """Immutable, lazily parsed ``Sequence[Chapter]``.
+
+    Holds the crawler's row mappings as received; a row's aliases are probed
+    and its ``Chapter`` built (once) the first time its position is read, and
+    slices are again lazy ``ChapterList``s. Behaves like ``list[Chapter]`` for
+    reading — iteration, ``len``, negative indexes, slicing, ``==`` against a
+    list — and adds :meth:`find_by_index` / :meth:`position_of` backed by a
+    hash index built on first use. Only those lookups and ``==`` between two
+    ``ChapterList``s parse every row, into columns that are then kept.
+
+    The rows are not copied, so they must not be mutated after wrapping.
+    """
+
+    __slots__ = ("_columns", "_fallbacks", "_indexes", "_positions", "_rows", "_source")
+
+    def __init__(
+        self,
+        source: Sequence[Mapping[str, Any] | Chapter],
+        fallbacks: Sequence[int],
+        rows: dict[int, Chapter] | None = None,
+    ) -> None:
+        self._source = source
+        # ``fallback_idx`` per position: the row's position in the original array.
+        self._fallbacks = fallbacks
+        # Chapters built so far, by position; repeated reads return the same object.
+        self._rows: dict[int, Chapter] = rows if rows is not None else {}
+        self._indexes: list[int | None] | None = None
+        self._positions: dict[int, int] | None = None
+        self._columns: tuple[list[str], list[str], list[bool]] | None = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any]) -> ChapterList:
+        """Wrap crawler dicts and/or ``Chapter`` objects; other items are skipped.
+
+        A dict without a usable ``index`` falls back to its position in *rows*,
+        exactly like ``Chapter.from_dict(row, fallback_idx=i)``.
+        """
+        items = rows if isinstance(rows, list) else list(rows)
+        if all(isinstance(item, (Mapping, Chapter)) for item in items):
+            return cls(items, range(len(items)))
+        source: list[Mapping[str, Any] | Chapter] = []
+        fallbacks = array("q")
+        for i, item in enumerate(items):
+            if isinstance(item, (Mapping, Chapter)):
+                source.append(item)
+                fallbacks.append(i)
+        return cls(source, fallbacks)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    @overload
+    def __getitem__(self, item: int) -> Chapter: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> ChapterList: ...
+
+    def __getitem__(self, item: int | slice) -> Chapter | ChapterList:
+        if isinstance(item, slice):
+            positions = range(len(self._source))[item]
+            return ChapterList(
+                self._source[item],
+                self._fallbacks[item],
+                {new: self._rows[old] for new, old in enumerate(positions) if old in self._rows},
+            )
+        position = range(len(self._source))[item]  # normalises negatives, raises IndexError
+        return self._row(position)
+
+    def __iter__(self) -> Iterator[Chapter]:
+        for position in range(len(self._source)):
+            yield self._row(position)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ChapterList):
+            return (
+                len(self) == len(other)
+                and self._index_column() == other._index_column()
+                and self._other_columns() == other._other_columns()
+            )
+        if isinstance(other, list):
+            return len(other) == len(self) and list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ChapterList({list(self)!r})"
+
+    def position_of(self, index: int) -> int | None:
+        """Position of the first chapter whose ``index`` field equals *index* (O(1))."""
+        if self._positions is None:
+            # Walk backwards so the first occurrence of a duplicate index wins,
+            # matching a linear ``for chapter in chapters`` scan.
+            indexes = self._index_column()
+            self._positions = {
+                value: position
+                for position, value in zip(
+                    range(len(indexes) - 1, -1, -1), reversed(indexes), strict=True
+                )
+                if value is not None
+            }
+        return self._positions.get(index)
+
+    def find_by_index(self, index: int) -> Chapter | None:
+        """The first chapter whose ``index`` field equals *index*, else ``None``."""
+        position = self.position_of(index)
+        return None if position is None else self._row(position)
+
+    def _index_column(self) -> list[int | None]:
+        if self._indexes is None:
+            self._indexes = [
+                item.index if isinstance(item, Chapter) else _parse_index(item, fallback)
+                for item, fallback in zip(self._source, self._fallbacks, strict=True)
+            ]
+        return self._indexes
+
+    def _other_columns(self) -> tuple[list[str], list[str], list[bool]]:
+        if self._columns is None:
+            names: list[str] = []
+            urls: list[str] = []
+            premium: list[bool] = []
+            for position in range(len(self._source)):
+                row = self._rows.get(position)
+                item = self._source[position] if row is None else row
+                if isinstance(item, Chapter):
+                    name, url, flag = item.name, item.url, item.is_premium
+                else:
+                    name, url, _, flag = _parse_fields(item, self._fallbacks[position])
+                names.append(name)
+                urls.append(url)
+                premium.append(flag)
+            self._columns = (names, urls, premium)
+        return self._columns
+
+    def _row(self, position: int) -> Chapter:
+        row = self._rows.get(position)
+        if row is None:
+            item = self._source[position]
+            if isinstance(item, Chapter):
+                row = item
+            else:
+                row = Chapter.from_dict(item, fallback_idx=self._fallbacks[position])
+            self._rows[position] = row
+        return row
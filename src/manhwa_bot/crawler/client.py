@@ -1,34 +1,55 @@
 """Long-lived WebSocket client to the crawler service.
 
-Single connection, request/response correlation by ``request_id``, plus a
-push-handler registry for unsolicited events like ``notification_event``.
-Reconnects with exponential backoff; in-flight requests fail fast on
-disconnect so callers can retry.
+A small pool of connections (``[crawler].pool_size``), request/response
+correlation by ``request_id``, plus a push-handler registry for unsolicited
+events like ``notification_event``. Each request goes to the connection with
+the fewest in-flight requests, so one large reply only delays the requests
+queued behind it on the same socket. Every connection reconnects with its own
+exponential backoff; in-flight requests fail fast on disconnect so callers can
+retry.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import inspect
-import json
 import uuid
-from collections.abc import Awaitable, Callable
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Coroutine, Mapping, Sequence
 from typing import Any
 
 import aiohttp
 
 from ..config import CrawlerConfig
 from ..log import get
+from .admission import (
+    AdmissionScheduler,
+    AdmissionStats,
+    Priority,
+    priority_scope,
+    resolve_priority,
+)
+from .breaker import BreakerState, WebsiteBreaker
 from .chapter import Chapter
+from .codec import BinaryCodec, get_binary_codec, get_codec
 from .errors import CrawlerError, Disconnected, RequestTimeout
+from .invalidation import InvalidationBus, SeriesTag, series_tag
+from .metrics import CrawlerMetrics, CrawlerMetricsSnapshot
 from .progress import CrawlerProgressEvent, parse_progress_event
+from .response_cache import CACHE_POLICIES, ResponseCache, ResponseCacheStats, cache_key
 from .retry import Backoff
+from .timeouts import AdaptiveTimeouts, latency_class
 
 _CHAPTER_PAYLOAD_OPS = frozenset({"chapters", "info", "search", "check_series", "series_data"})
+# The crawler may deliver the same push to every socket that shares our api key;
+# remember this many recent ``(type, request_id)`` pairs to drop the copies.
+_PUSH_DEDUP_WINDOW = 1024
 
 
 def _wrap_chapter_payload(type_: str, data: dict[str, Any]) -> dict[str, Any]:
-    """Replace ``chapters``/``latest_chapters`` arrays with ``list[Chapter]``."""
+    """Replace ``chapters``/``latest_chapters`` arrays with lazy ``ChapterList``s."""
     if type_ not in _CHAPTER_PAYLOAD_OPS:
         return data
     has_chapters = "chapters" in data
@@ -45,69 +66,244 @@ def _wrap_chapter_payload(type_: str, data: dict[str, Any]) -> dict[str, Any]:
     return wrapped
 
 
+def _error_code(response: Mapping[str, Any]) -> str:
+    err = response.get("error") or {}
+    return str(err.get("code") or "unknown_error")
+
+
+def _batch_item_fields(tag: SeriesTag, fields: Mapping[str, Any]) -> dict[str, Any]:
+    """The single-item request a batch entry stands in for (same cache key)."""
+    return {"website_key": tag[0], "url_name": tag[1], **fields}
+
+
+def _push_identity(payload: Mapping[str, Any]) -> str | None:
+    """What makes a push unique: its ``request_id``, else its record's ``id``."""
+    rid = payload.get("request_id")
+    if isinstance(rid, str) and rid:
+        return rid
+    data = payload.get("data")
+    if not isinstance(data, Mapping):
+        return None
+    record_id = data.get("id")
+    if record_id is None:
+        # Records are nested one level down, e.g. ``data.notification.id``.
+        for value in data.values():
+            if isinstance(value, Mapping) and value.get("id") is not None:
+                record_id = value["id"]
+                break
+    return None if record_id is None else f"#{record_id}"
+
+
 PushHandler = Callable[[dict[str, Any]], Awaitable[None]]
 ProgressCallback = Callable[[CrawlerProgressEvent], Awaitable[None] | None]
 PartialCallback = Callable[[dict[str, Any]], Awaitable[None] | None]
+BatchItemCallback = Callable[[SeriesTag, dict[str, Any]], Awaitable[None] | None]
+
+# Ops with a ``{type}_batch`` counterpart, and the most series per envelope.
+_BATCH_OPS = frozenset({"series_data"})
+_BATCH_MAX_ITEMS = 100
+# Per-item concurrency when a crawler predates the batch op.
+_BATCH_FALLBACK_CONCURRENCY = 3
+# Read-only ops that are safe to re-send (same request_id) after a reconnect.
+_REPLAYABLE_OPS = frozenset(
+    {"series_data", "chapters", "info", "search", "supported_websites", "notifications_list"}
+)
+# Diagnostics that must reach a website even while its circuit is open.
+_BREAKER_EXEMPT_OPS = frozenset({"schema_health_list", "schema_health_test", "schema_healing_run"})
 
 
 _log = get(__name__)
 
 
+class _Connection:
+    """One pooled WebSocket with its own reader, send lock and pending map."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.ws: aiohttp.ClientWebSocketResponse | None = None
+        self.reader_task: asyncio.Task[None] | None = None
+        self.connect_task: asyncio.Task[None] | None = None
+        self.send_lock = asyncio.Lock()
+        self.pending: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        # Binary frame format the crawler accepted for this socket; None = JSON text.
+        self.binary: BinaryCodec | None = None
+        self.ever_connected = False
+
+    @property
+    def connected(self) -> bool:
+        return self.ws is not None and not self.ws.closed
+
+    def fail_pending(self) -> None:
+        for fut in list(self.pending.values()):
+            if not fut.done():
+                fut.set_exception(Disconnected())
+        self.pending.clear()
+
+
+class _ProgressPump:
+    """Latest-wins, rate-capped delivery of one request's progress events.
+
+    At most one callback runs at a time. Events that arrive meanwhile replace
+    the queued one instead of lining up behind it, and callbacks start at
+    least ``min_interval`` apart. Terminal events skip the wait, and
+    :meth:`flush` delivers whatever is still queued once the reply is in, so
+    the caller always sees the final state.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[CrawlerProgressEvent], Awaitable[None]],
+        min_interval: float,
+        spawn: Callable[[Coroutine[Any, Any, None]], asyncio.Task[None]],
+    ) -> None:
+        self._deliver = deliver
+        self._interval = min_interval
+        self._spawn = spawn
+        self._pending: CrawlerProgressEvent | None = None
+        self._wake = asyncio.Event()
+        self._flushing = False
+        self._task: asyncio.Task[None] | None = None
+        self._last_started = float("-inf")
+        self.delivered = 0
+        self.replaced = 0
+
+    def push(self, event: CrawlerProgressEvent) -> None:
+        idle = self._task is None or self._task.done()
+        now = asyncio.get_running_loop().time()
+        if idle and (event.is_terminal or now >= self._last_started + self._interval):
+            # Nothing running: claim the event now so a burst arriving in the
+            # same tick can't supersede it before its callback starts.
+            self._last_started = now
+            self._task = self._spawn(self._run(event))
+            return
+        if self._pending is not None:
+            self.replaced += 1
+        self._pending = event
+        self._wake.set()
+        if idle:
+            self._task = self._spawn(self._run(None))
+
+    async def flush(self) -> None:
+        self._flushing = True
+        self._wake.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self, first: CrawlerProgressEvent | None) -> None:
+        loop = asyncio.get_running_loop()
+        if first is not None:
+            self.delivered += 1
+            await self._deliver(first)
+        while self._pending is not None:
+            event = self._pending
+            wait = self._last_started + self._interval - loop.time()
+            if wait > 0 and not self._flushing and not event.is_terminal:
+                self._wake.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), wait)
+                continue
+            self._pending = None
+            self._last_started = loop.time()
+            self.delivered += 1
+            await self._deliver(event)
+
+
 class CrawlerClient:
-    """Single-connection crawler WS client with request/response correlation."""
+    """Pooled crawler WS client with request/response correlation."""
 
     def __init__(self, config: CrawlerConfig) -> None:
         self._config = config
         self._session: aiohttp.ClientSession | None = None
-        self._ws: aiohttp.ClientWebSocketResponse | None = None
-        self._reader_task: asyncio.Task[None] | None = None
-        self._connect_task: asyncio.Task[None] | None = None
-        self._send_lock = asyncio.Lock()
-        self._pending: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._connections = [_Connection(i) for i in range(max(1, int(config.pool_size)))]
         self._progress_callbacks: dict[str, ProgressCallback] = {}
         self._progress_tasks_by_request: dict[str, asyncio.Task[None]] = {}
+        self._progress_pumps: dict[str, _ProgressPump] = {}
         self._partial_callbacks: dict[str, PartialCallback] = {}
         self._push_handlers: dict[str, list[PushHandler]] = {}
+        self._recent_pushes: OrderedDict[tuple[str, str], None] = OrderedDict()
         self._connected_event = asyncio.Event()
+        self._stopped_event = asyncio.Event()
+        # Requests that have received a streamed partial; never replayed.
+        self._streamed_requests: set[str] = set()
+        # Op type of every in-flight request, to attribute reply bytes and progress.
+        self._request_ops: dict[str, str] = {}
         self._stopping = False
         self._on_connect: list[Callable[[], Awaitable[None]]] = []
+        self._on_disconnect: list[Callable[[], Awaitable[None]]] = []
         self._background_tasks: set[asyncio.Task[None]] = set()
+        self._codec = get_codec(config.json_codec)
+        self._binary_codec = get_binary_codec(config.wire_format)
+        self._response_cache = ResponseCache(config.response_cache_max_entries)
+        self._admission = AdmissionScheduler(
+            config.max_in_flight,
+            {
+                Priority.NORMAL: config.normal_max_in_flight,
+                Priority.BULK: config.bulk_max_in_flight,
+            },
+        )
+        # Series-scoped invalidations (new chapter / status change consumed);
+        # other caches of crawler data subscribe alongside the response cache.
+        self.invalidations = InvalidationBus()
+        self.invalidations.subscribe(self._response_cache.invalidate_series)
+        self.metrics = CrawlerMetrics()
+        self._breaker = WebsiteBreaker(
+            threshold=config.breaker_failure_threshold,
+            open_seconds=config.breaker_open_seconds,
+        )
+        self.on_push("operational_alert_event", self._on_operational_alert)
+        self._timeouts = (
+            AdaptiveTimeouts(
+                multiplier=config.adaptive_timeout_multiplier,
+                floor_seconds=config.adaptive_timeout_min_seconds,
+                min_samples=config.adaptive_timeout_min_samples,
+            )
+            if config.adaptive_timeouts
+            else None
+        )
 
     # -- public api -----------------------------------------------------
 
     async def start(self) -> None:
-        """Open the WS and start the reader. Returns once the first connection lands."""
-        if self._connect_task is not None:
+        """Open the pool and start the readers. Returns once the first connection lands."""
+        if any(conn.connect_task is not None for conn in self._connections):
             return
         self._stopping = False
+        self._stopped_event.clear()
         self._session = aiohttp.ClientSession()
-        self._connect_task = asyncio.create_task(self._connect_loop(), name="crawler-connect")
+        for conn in self._connections:
+            conn.connect_task = asyncio.create_task(
+                self._connect_loop(conn), name=f"crawler-connect-{conn.index}"
+            )
         await self._connected_event.wait()
 
     async def stop(self) -> None:
-        """Close the WS and cancel background tasks. Idempotent."""
+        """Close every WS and cancel background tasks. Idempotent."""
         self._stopping = True
+        self._stopped_event.set()
         self._connected_event.clear()
-        for fut in list(self._pending.values()):
-            if not fut.done():
-                fut.set_exception(Disconnected())
-        self._pending.clear()
-        if self._ws is not None and not self._ws.closed:
-            await self._ws.close()
-        if self._reader_task is not None:
-            self._reader_task.cancel()
-            try:
-                await self._reader_task
-            except asyncio.CancelledError, Exception:
-                pass
-            self._reader_task = None
-        if self._connect_task is not None:
-            self._connect_task.cancel()
-            try:
-                await self._connect_task
-            except asyncio.CancelledError, Exception:
-                pass
-            self._connect_task = None
+        for conn in self._connections:
+            conn.fail_pending()
+            if conn.ws is not None and not conn.ws.closed:
+                await conn.ws.close()
+            if conn.reader_task is not None:
+                conn.reader_task.cancel()
+                try:
+                    await conn.reader_task
+                except asyncio.CancelledError, Exception:
+                    pass
+                conn.reader_task = None
+            if conn.connect_task is not None:
+                conn.connect_task.cancel()
+                try:
+                    await conn.connect_task
+                except asyncio.CancelledError, Exception:
+                    pass
+                conn.connect_task = None
         background_tasks = [
             task for task in self._background_tasks if task is not asyncio.current_task()
         ]
@@ -117,6 +313,7 @@ class CrawlerClient:
             await asyncio.gather(*background_tasks, return_exceptions=True)
             self._background_tasks.difference_update(background_tasks)
         self._progress_tasks_by_request.clear()
+        self._progress_pumps.clear()
         self._partial_callbacks.clear()
         if self._session is not None:
             await self._session.close()
@@ -128,13 +325,21 @@ class CrawlerClient:
         *,
         timeout: float | None = None,
         request_id: str | None = None,
+        priority: Priority | None = None,
         **fields: Any,
     ) -> dict[str, Any]:
         """Send a correlated request and await the response.
 
         Returns the ``data`` payload on success. Raises :class:`CrawlerError`
         with the server-provided ``code``/``message`` on failure, or
-        :class:`RequestTimeout` if no response arrives in time.
+        :class:`RequestTimeout` if no response arrives in time. *priority*
+        picks the admission class (see :mod:`.admission`); by default it comes
+        from the enclosing :func:`priority_scope` or the op.
+
+        Without ``timeout``, cheap reads (stored copies, ``supported_websites``)
+        get a deadline adapted to their observed latency (see :mod:`.timeouts`),
+        capped at ``request_timeout_seconds``; everything else waits the full
+        ``request_timeout_seconds``. An explicit ``timeout`` is used as-is.
         """
         return await self._request(
             type_,
@@ -142,9 +347,225 @@ class CrawlerClient:
             request_id=request_id,
             progress_callback=None,
             partial_callback=None,
+            priority=priority,
             **fields,
         )
 
+    async def cached_request(
+        self,
+        type_: str,
+        *,
+        ttl: float | None = None,
+        priority: Priority | None = None,
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """Like :meth:`request`, served from the shared response cache when possible.
+
+        Only ops listed in ``CACHE_POLICIES`` (and only requests satisfying the
+        policy's required fields) are cached; anything else is a plain
+        :meth:`request`. Identical concurrent calls share one wire request.
+        Pass ``ttl`` to override the policy's freshness window for this call.
+        Entries for a ``(website_key, url_name)`` are evicted as soon as that
+        series is published on :attr:`invalidations`.
+        """
+        if priority is not None:
+            # The shared load runs in its own task, which inherits the scope.
+            with priority_scope(priority):
+                return await self.cached_request(type_, ttl=ttl, **fields)
+        policy = CACHE_POLICIES.get(type_)
+        if policy is None or not policy.allows(fields):
+            return await self.request(type_, **fields)
+        data = await self._response_cache.get_or_fetch(
+            type_,
+            cache_key(type_, fields),
+            lambda: self.request(type_, **fields),
+            policy.ttl_seconds if ttl is None else ttl,
+            tag=series_tag(fields),
+        )
+        # Shallow copy so a caller adding keys can't corrupt the shared entry.
+        return dict(data)
+
+    def invalidate_cached(self, type_: str, **fields: Any) -> None:
+        """Evict cached responses: one request's entry, or every entry of *type_*."""
+        if fields:
+            self._response_cache.invalidate(cache_key(type_, fields))
+        else:
+            self._response_cache.invalidate_type(type_)
+
+    def cache_stats(self) -> ResponseCacheStats:
+        """Hit/miss counters for the shared response cache."""
+        return self._response_cache.stats()
+
+    def admission_stats(self) -> list[AdmissionStats]:
+        """Per-priority in-flight/queued counts and queueing delay."""
+        return self._admission.stats()
+
+    def metrics_snapshot(self) -> CrawlerMetricsSnapshot:
+        """Per-op latency percentiles, outcomes, bytes and progress rates."""
+        return self.metrics.snapshot()
+
+    def breaker_states(self) -> list[BreakerState]:
+        """Websites whose circuit is open, half-open, or accumulating failures."""
+        return self._breaker.states()
+
+    def adaptive_timeouts(self) -> dict[str, float]:
+        """Adaptive deadline per latency class, capped at ``request_timeout_seconds``."""
+        if self._timeouts is None:
+            return {}
+        return self._timeouts.snapshot(self._config.request_timeout_seconds)
+
+    async def request_batch(
+        self,
+        type_: str,
+        *,
+        items: Sequence[Mapping[str, Any]],
+        on_item: BatchItemCallback | None = None,
+        timeout: float | None = None,
+        priority: Priority | None = None,
+        **fields: Any,
+    ) -> dict[SeriesTag, dict[str, Any]]:
+        """Fetch many series with one ``{type_}_batch`` envelope per 100 items.
+
+        Each item names a series (``website_key`` + ``url_name``); *fields* are
+        shared by every item (e.g. ``allow_live=False``). The crawler streams
+        one ``{type_}_batch_partial`` message per series through the partial
+        callback path; each result is handed to *on_item* as it arrives and
+        stored in the response cache, so later :meth:`cached_request` calls
+        for the same series are hits. Items already fresh in the cache never go
+        on the wire. Returns the payload of every series that resolved; series
+        the crawler could not serve are left out.
+
+        Against a crawler without the batch op (``unknown_type``) this falls
+        back to bounded per-item :meth:`cached_request` calls. Those run at the
+        batch's priority (``BULK`` unless overridden).
+        """
+        if type_ not in _BATCH_OPS:
+            raise ValueError(f"no batch form for crawler op {type_!r}")
+        priority = resolve_priority(f"{type_}_batch", priority)
+        policy = CACHE_POLICIES.get(type_)
+        cacheable = policy is not None and policy.allows(fields)
+        results: dict[SeriesTag, dict[str, Any]] = {}
+        wanted: list[SeriesTag] = []
+
+        async def accept(tag: SeriesTag, data: dict[str, Any]) -> None:
+            results[tag] = data
+            if on_item is not None:
+                outcome = on_item(tag, data)
+                if inspect.isawaitable(outcome):
+                    await outcome
+
+        for item in items:
+            tag = series_tag(item)
+            if tag is None or tag in results or tag in wanted:
+                continue
+            cached = (
+                self._response_cache.get(cache_key(type_, _batch_item_fields(tag, fields)))
+                if cacheable
+                else None
+            )
+            if cached is not None:
+                await accept(tag, dict(cached))
+            else:
+                wanted.append(tag)
+
+        start = 0
+        while start < len(wanted):
+            chunk = wanted[start : start + _BATCH_MAX_ITEMS]
+            try:
+                received = await self._request_batch_frame(
+                    type_, chunk, timeout=timeout, priority=priority, **fields
+                )
+            except CrawlerError as exc:
+                if exc.code != "unknown_type":
+                    raise
+                # The crawler predates the batch op: serve the rest one by one.
+                chunk = wanted[start:]
+                received = await self._request_batch_fallback(
+                    type_, chunk, priority=priority, **fields
+                )
+            for tag in chunk:
+                data = received.get(tag)
+                if data is None:
+                    continue
+                if cacheable and policy is not None:
+                    self._response_cache.put(
+                        type_,
+                        cache_key(type_, _batch_item_fields(tag, fields)),
+                        data,
+                        policy.ttl_seconds,
+                        tag=tag,
+                    )
+                await accept(tag, dict(data))
+            start += len(chunk)
+        return results
+
+    async def _request_batch_frame(
+        self,
+        type_: str,
+        tags: list[SeriesTag],
+        *,
+        timeout: float | None,
+        priority: Priority,
+        **fields: Any,
+    ) -> dict[SeriesTag, dict[str, Any]]:
+        wanted = set(tags)
+        received: dict[SeriesTag, dict[str, Any]] = {}
+
+        def collect(item: dict[str, Any]) -> None:
+            tag = series_tag(item)
+            if tag is None or tag not in wanted or tag in received:
+                return
+            if item.get("ok") is False:
+                err = item.get("error") or {}
+                _log.debug(
+                    "%s_batch item %s:%s failed: [%s] %s",
+                    type_,
+                    tag[0],
+                    tag[1],
+                    err.get("code"),
+                    err.get("message"),
+                )
+                return
+            data = item.get("data")
+            if isinstance(data, dict):
+                received[tag] = _wrap_chapter_payload(type_, data)
+
+        # ``collect`` is synchronous, so every partial dispatched before the
+        # final response has run by the time the request resolves.
+        final = await self._request(
+            f"{type_}_batch",
+            timeout=timeout,
+            request_id=None,
+            progress_callback=None,
+            partial_callback=collect,
+            priority=priority,
+            items=[{"website_key": wk, "url_name": un} for wk, un in tags],
+            **fields,
+        )
+        # Crawlers that answer in one frame put the same item shape here.
+        for item in final.get("results") or []:
+            if isinstance(item, dict):
+                collect(item)
+        return received
+
+    async def _request_batch_fallback(
+        self, type_: str, tags: list[SeriesTag], *, priority: Priority, **fields: Any
+    ) -> dict[SeriesTag, dict[str, Any]]:
+        semaphore = asyncio.Semaphore(_BATCH_FALLBACK_CONCURRENCY)
+        received: dict[SeriesTag, dict[str, Any]] = {}
+
+        async def fetch(tag: SeriesTag) -> None:
+            async with semaphore:
+                try:
+                    received[tag] = await self.cached_request(
+                        type_, priority=priority, **_batch_item_fields(tag, fields)
+                    )
+                except CrawlerError as exc:
+                    _log.debug("%s fallback for %s:%s failed: %s", type_, tag[0], tag[1], exc)
+
+        await asyncio.gather(*(fetch(tag) for tag in tags))
+        return received
+
     async def request_with_progress(
         self,
         type_: str,
@@ -154,22 +575,35 @@ class CrawlerClient:
         on_progress: ProgressCallback | None = None,
         progress_callback: ProgressCallback | None = None,
         on_partial: PartialCallback | None = None,
+        priority: Priority | None = None,
+        coalesce_progress: bool | None = None,
         **fields: Any,
     ) -> dict[str, Any]:
         """Send a correlated request and route progress updates to a callback.
 
+        Progress is coalesced by default (``[crawler].progress_coalesce``):
+        while the callback runs, newer events replace the queued one, and
+        callbacks start at most once per ``progress_min_interval_seconds``.
+        The last event before the reply, and any terminal one, is always
+        delivered before this returns. Pass ``coalesce_progress=False`` to get
+        every event in order instead.
+
         Pass ``on_partial`` to receive intermediate streamed messages whose
         ``type`` is ``f"{type_}_partial"`` (for example ``"search_partial"``
         events from a multi-website ``"search"`` request). The callback gets
         the raw payload ``data`` dict. The final response future is unaffected.
+        Without ``timeout`` the request may run for the full
+        ``transport_watchdog_seconds``; progress requests never adapt.
         """
-        timeout_s = timeout if timeout is not None else self._config.transport_watchdog_seconds
         return await self._request(
             type_,
-            timeout=timeout_s,
+            timeout=timeout,
+            ceiling=self._config.transport_watchdog_seconds,
             request_id=request_id,
             progress_callback=on_progress or progress_callback,
             partial_callback=on_partial,
+            priority=priority,
+            coalesce_progress=coalesce_progress,
             **fields,
         )
 
@@ -181,49 +615,155 @@ class CrawlerClient:
         request_id: str | None,
         progress_callback: ProgressCallback | None,
         partial_callback: PartialCallback | None,
+        priority: Priority | None = None,
+        ceiling: float | None = None,
+        coalesce_progress: bool | None = None,
         **fields: Any,
     ) -> dict[str, Any]:
-        if self._ws is None or self._ws.closed:
-            raise Disconnected()
-        rid = request_id or uuid.uuid4().hex
-        timeout_s = timeout if timeout is not None else self._config.request_timeout_seconds
-        loop = asyncio.get_running_loop()
-        fut: asyncio.Future[dict[str, Any]] = loop.create_future()
-        self._pending[rid] = fut
-        if progress_callback is not None:
-            self._progress_callbacks[rid] = progress_callback
-        if partial_callback is not None:
-            self._partial_callbacks[rid] = partial_callback
-        envelope = {"type": type_, "request_id": rid, **fields}
-        response_received = False
-        try:
-            async with self._send_lock:
-                if self._ws is None or self._ws.closed:
-                    raise Disconnected(request_id=rid)
-                await self._ws.send_str(json.dumps(envelope))
+        website_key = fields.get("website_key") if type_ not in _BREAKER_EXEMPT_OPS else None
+        if not isinstance(website_key, str) or not website_key:
+            website_key = None
+        level = resolve_priority(type_, priority)
+        async with self._admission.slot(level) as waited:
+            if waited:
+                _log.debug("%s request queued %.3fs at %s priority", type_, waited, level.name)
+            rid = request_id or uuid.uuid4().hex
+            ticket = 0
+            if website_key is not None:
+                # Fail fast for a website known to be down; a half-open circuit
+                # lets exactly one probe through.
+                ticket = self._breaker.admit(website_key, request_id=rid)
+            ceiling_s = ceiling if ceiling is not None else self._config.request_timeout_seconds
+            # Progress-reporting and streamed (incl. batch) requests can legitimately
+            # run long, so only plain cheap reads get an adaptive deadline.
+            timeout_key = (
+                latency_class(type_, fields)
+                if self._timeouts is not None
+                and progress_callback is None
+                and partial_callback is None
+                else None
+            )
+            adaptive = timeout is None and timeout_key is not None
+            if adaptive:
+                timeout_s = self._timeouts.timeout_for(timeout_key, ceiling_s)
+            else:
+                timeout_s = timeout if timeout is not None else ceiling_s
+            # A cheap idempotent read stuck past its adaptive deadline is re-sent
+            # once under a fresh id, within what the static timeout would allow.
+            retry_on_timeout = (
+                adaptive
+                and timeout_s < ceiling_s
+                and type_ in _REPLAYABLE_OPS
+                and request_id is None
+            )
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout_s
+            if progress_callback is not None:
+                self._progress_callbacks[rid] = progress_callback
+                if (
+                    coalesce_progress
+                    if coalesce_progress is not None
+                    else self._config.progress_coalesce
+                ):
+                    self._progress_pumps[rid] = _ProgressPump(
+                        functools.partial(self._safe_progress_callback, progress_callback),
+                        self._config.progress_min_interval_seconds,
+                        functools.partial(self._spawn, name=f"progress-{rid}"),
+                    )
+            if partial_callback is not None:
+                self._partial_callbacks[rid] = partial_callback
+            envelope = {"type": type_, "request_id": rid, **fields}
+            response_received = False
+            self._request_ops[rid] = type_
+            self.metrics.request_started(type_)
+            started = attempt_started = loop.time()
             try:
-                response = await asyncio.wait_for(fut, timeout=timeout_s)
+                while True:
+                    conn = self._pick_connection()
+                    try:
+                        if conn is None:
+                            raise Disconnected(request_id=rid)
+                        response = await self._send_and_wait(
+                            conn, rid, envelope, deadline - loop.time()
+                        )
+                        break
+                    except RequestTimeout:
+                        if adaptive:
+                            self._timeouts.observe(timeout_key, loop.time() - attempt_started)
+                        if not retry_on_timeout:
+                            raise
+                        retry_on_timeout = False
+                        self.metrics.request_retried(type_)
+                        self._request_ops.pop(rid, None)
+                        rid = uuid.uuid4().hex
+                        envelope["request_id"] = rid
+                        self._request_ops[rid] = type_
+                        attempt_started = loop.time()
+                        retry_s = self._timeouts.timeout_for(timeout_key, ceiling_s)
+                        deadline = min(started + ceiling_s, attempt_started + retry_s)
+                        _log.info(
+                            "%s request timed out after %.1fs; retrying once", type_, timeout_s
+                        )
+                    except Disconnected:
+                        # Idempotent reads survive a crawler restart: park until a
+                        # connection is back, then re-send under the same request_id.
+                        # Anything that already streamed partials would duplicate them.
+                        if type_ not in _REPLAYABLE_OPS or rid in self._streamed_requests:
+                            raise
+                        await self._await_reconnect(rid, deadline)
+                        _log.info("replaying %s request %s after crawler reconnect", type_, rid)
                 response_received = True
-            except TimeoutError as exc:
-                raise RequestTimeout(request_id=rid) from exc
-            self._progress_callbacks.pop(rid, None)
-            self._partial_callbacks.pop(rid, None)
-            progress_task = self._progress_tasks_by_request.pop(rid, None)
-            if progress_task is not None:
-                await self._drain_progress_task(progress_task)
-        finally:
-            self._pending.pop(rid, None)
-            self._progress_callbacks.pop(rid, None)
-            self._partial_callbacks.pop(rid, None)
-            if not response_received:
+                error = None if response.get("ok", False) else _error_code(response)
+                self.metrics.request_finished(type_, loop.time() - started, error=error)
+                if website_key is not None:
+                    self._breaker.record(website_key, error, ticket)
+                if timeout_key is not None:
+                    self._timeouts.observe(timeout_key, loop.time() - attempt_started)
+                self._progress_callbacks.pop(rid, None)
+                self._partial_callbacks.pop(rid, None)
                 progress_task = self._progress_tasks_by_request.pop(rid, None)
                 if progress_task is not None:
-                    progress_task.cancel()
                     await self._drain_progress_task(progress_task)
+                pump = self._progress_pumps.pop(rid, None)
+                if pump is not None:
+                    await pump.flush()
+                    if pump.replaced:
+                        _log.debug(
+                            "%s request %s: %d progress events delivered, %d superseded",
+                            type_,
+                            rid,
+                            pump.delivered,
+                            pump.replaced,
+                        )
+            except RequestTimeout:
+                self.metrics.request_timed_out(type_)
+                raise
+            except Disconnected:
+                self.metrics.request_disconnected(type_)
+                raise
+            except BaseException:
+                if not response_received:
+                    self.metrics.request_abandoned(type_)
+                raise
+            finally:
+                if website_key is not None and not response_received:
+                    self._breaker.release(website_key, ticket)
+                self._request_ops.pop(rid, None)
+                self._progress_callbacks.pop(rid, None)
+                self._partial_callbacks.pop(rid, None)
+                self._streamed_requests.discard(rid)
+                if not response_received:
+                    progress_task = self._progress_tasks_by_request.pop(rid, None)
+                    if progress_task is not None:
+                        progress_task.cancel()
+                        await self._drain_progress_task(progress_task)
+                    pump = self._progress_pumps.pop(rid, None)
+                    if pump is not None:
+                        await pump.cancel()
         if not response.get("ok", False):
             err = response.get("error") or {}
             raise CrawlerError(
-                code=str(err.get("code") or "unknown_error"),
+                code=_error_code(response),
                 message=str(err.get("message") or "no message"),
                 request_id=rid,
             )
@@ -232,21 +772,104 @@ class CrawlerClient:
             return {}
         return _wrap_chapter_payload(type_, data)
 
+    async def _send_and_wait(
+        self,
+        conn: _Connection,
+        rid: str,
+        envelope: dict[str, Any],
+        remaining: float,
+    ) -> dict[str, Any]:
+        """One attempt on *conn*; raises ``Disconnected`` if the socket drops first."""
+        fut: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        conn.pending[rid] = fut
+        try:
+            async with conn.send_lock:
+                if conn.ws is None or conn.ws.closed:
+                    raise Disconnected(request_id=rid)
+                if conn.binary is not None:
+                    frame: str | bytes = conn.binary.dumps(envelope)
+                    await conn.ws.send_bytes(frame)
+                else:
+                    frame = self._codec.dumps(envelope)
+                    await conn.ws.send_str(frame)
+                self.metrics.frame_sent(str(envelope["type"]), len(frame))
+            try:
+                return await asyncio.wait_for(fut, timeout=max(0.0, remaining))
+            except TimeoutError as exc:
+                raise RequestTimeout(request_id=rid) from exc
+        finally:
+            if conn.pending.get(rid) is fut:
+                del conn.pending[rid]
+
+    async def _await_reconnect(self, rid: str, deadline: float) -> None:
+        """Wait for any pooled connection to come back before *deadline*.
+
+        Raises ``Disconnected`` if the client is stopping (or was never
+        started) and ``RequestTimeout`` once the deadline passes.
+        """
+        started = any(conn.connect_task is not None for conn in self._connections)
+        if self._stopping or not started:
+            raise Disconnected(request_id=rid)
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            raise RequestTimeout(request_id=rid)
+        waiters = [
+            asyncio.ensure_future(self._connected_event.wait()),
+            asyncio.ensure_future(self._stopped_event.wait()),
+        ]
+        try:
+            await asyncio.wait(waiters, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        if self._stopping:
+            raise Disconnected(request_id=rid)
+        if not self._connected_event.is_set():
+            raise RequestTimeout(request_id=rid)
+
     def on_push(self, type_: str, handler: PushHandler) -> None:
         """Register a handler for unsolicited messages of the given ``type``."""
         self._push_handlers.setdefault(type_, []).append(handler)
 
     def on_connect(self, handler: Callable[[], Awaitable[None]]) -> None:
-        """Register a callback invoked each time the WS (re)connects."""
+        """Register a callback invoked each time the client (re)connects.
+
+        Fires when a connection lands while no other pooled connection is up,
+        i.e. once per transition from fully disconnected to connected — not
+        once per socket.
+        """
         self._on_connect.append(handler)
 
+    def on_disconnect(self, handler: Callable[[], Awaitable[None]]) -> None:
+        """Register a callback invoked each time the client loses its last connection.
+
+        The mirror of :meth:`on_connect`: fires once per transition from
+        connected to fully disconnected, in the background, while the client
+        is not stopping.
+        """
+        self._on_disconnect.append(handler)
+
     @property
     def connected(self) -> bool:
-        return self._ws is not None and not self._ws.closed
+        return any(conn.connected for conn in self._connections)
+
+    @property
+    def pool_size(self) -> int:
+        return len(self._connections)
 
     # -- internals ------------------------------------------------------
 
-    async def _connect_loop(self) -> None:
+    def _pick_connection(self) -> _Connection | None:
+        """Least-pending routing: the live connection with the fewest in-flight requests."""
+        best: _Connection | None = None
+        for conn in self._connections:
+            if not conn.connected:
+                continue
+            if best is None or len(conn.pending) < len(best.pending):
+                best = conn
+        return best
+
+    async def _connect_loop(self, conn: _Connection) -> None:
         backoff = Backoff(
             initial=self._config.reconnect_initial_delay_seconds,
             maximum=self._config.reconnect_max_delay_seconds,
@@ -254,62 +877,98 @@ class CrawlerClient:
         )
         while not self._stopping:
             try:
-                await self._connect_once()
+                await self._connect_once(conn)
                 backoff.reset()
                 # Block until reader exits (disconnect or error).
-                if self._reader_task is not None:
-                    await self._reader_task
+                if conn.reader_task is not None:
+                    await conn.reader_task
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
-                _log.warning("crawler connect/read failed: %s", exc)
+                _log.warning("crawler connect/read failed (connection %d): %s", conn.index, exc)
             finally:
-                # Fail in-flight requests so callers retry.
-                for fut in list(self._pending.values()):
-                    if not fut.done():
-                        fut.set_exception(Disconnected())
-                self._pending.clear()
-                self._connected_event.clear()
-                self._ws = None
+                # Fail in-flight requests; replayable ones park and re-send.
+                conn.fail_pending()
+                had_socket = conn.ws is not None
+                conn.ws = None
+                if not self.connected:
+                    self._connected_event.clear()
+                    if had_socket and not self._stopping:
+                        for callback in list(self._on_disconnect):
+                            self._spawn(
+                                self._safe_connection_callback(callback),
+                                name="crawler-on-disconnect",
+                            )
             if self._stopping:
                 return
             delay = backoff.next_delay()
-            _log.info("reconnecting to crawler in %.1fs", delay)
+            _log.info("reconnecting crawler connection %d in %.1fs", conn.index, delay)
             try:
                 await asyncio.sleep(delay)
             except asyncio.CancelledError:
                 raise
 
-    async def _connect_once(self) -> None:
+    async def _connect_once(self, conn: _Connection) -> None:
         if self._session is None:
             self._session = aiohttp.ClientSession()
         headers = {"Authorization": f"Bearer {self._config.api_key}"}
-        _log.info("connecting to crawler at %s", self._config.ws_url)
-        self._ws = await self._session.ws_connect(
-            self._config.ws_url, headers=headers, heartbeat=30.0
+        _log.info("connecting to crawler at %s (connection %d)", self._config.ws_url, conn.index)
+        # permessage-deflate and the binary subprotocol are offers; a crawler that
+        # declines either keeps the connection on uncompressed JSON text.
+        protocols = (self._binary_codec.subprotocol,) if self._binary_codec is not None else ()
+        ws = await self._session.ws_connect(
+            self._config.ws_url,
+            headers=headers,
+            heartbeat=30.0,
+            compress=15 if self._config.ws_compress else 0,
+            protocols=protocols,
+        )
+        first = not self.connected
+        conn.ws = ws
+        if conn.ever_connected:
+            self.metrics.reconnected()
+        conn.ever_connected = True
+        conn.binary = (
+            self._binary_codec
+            if self._binary_codec is not None and ws.protocol == self._binary_codec.subprotocol
+            else None
+        )
+        _log.info(
+            "crawler connection %d negotiated %s frames, compression %s",
+            conn.index,
+            conn.binary.name if conn.binary is not None else "json",
+            "on" if ws.compress else "off",
         )
         self._connected_event.set()
-        self._reader_task = asyncio.create_task(self._reader_loop(), name="crawler-reader")
+        conn.reader_task = asyncio.create_task(
+            self._reader_loop(conn), name=f"crawler-reader-{conn.index}"
+        )
+        if not first:
+            return
         for callback in list(self._on_connect):
-            try:
-                await callback()
-            except Exception:
-                _log.exception("crawler on_connect callback failed")
+            await self._safe_connection_callback(callback)
+
+    async def _safe_connection_callback(self, callback: Callable[[], Awaitable[None]]) -> None:
+        try:
+            await callback()
+        except Exception:
+            _log.exception("crawler connection callback %r failed", callback)
 
-    async def _reader_loop(self) -> None:
-        ws = self._ws
+    async def _reader_loop(self, conn: _Connection) -> None:
+        ws = conn.ws
         if ws is None:
             return
         async for msg in ws:
-            if msg.type == aiohttp.WSMsgType.TEXT:
+            if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
                 try:
-                    payload = json.loads(msg.data)
-                except json.JSONDecodeError:
-                    _log.warning("crawler sent non-JSON frame; ignoring")
+                    payload = await self._decode(conn, msg.type, msg.data)
+                except ValueError:
+                    _log.warning("crawler sent an undecodable frame; ignoring")
                     continue
                 if not isinstance(payload, dict):
                     continue
-                await self._dispatch(payload)
+                self.metrics.frame_received(self._op_of(payload), len(msg.data))
+                await self._dispatch(conn, payload)
             elif msg.type in (
                 aiohttp.WSMsgType.CLOSE,
                 aiohttp.WSMsgType.CLOSED,
@@ -320,7 +979,26 @@ class CrawlerClient:
                 _log.warning("crawler WS error: %s", ws.exception())
                 break
 
-    async def _dispatch(self, payload: dict[str, Any]) -> None:
+    async def _decode(self, conn: _Connection, kind: aiohttp.WSMsgType, data: str | bytes) -> Any:
+        loads: Callable[[Any], Any] = self._codec.loads
+        if kind == aiohttp.WSMsgType.BINARY:
+            if conn.binary is None:
+                raise ValueError("binary frame on a connection without a binary wire format")
+            loads = conn.binary.loads
+        # Big frames (full chapter lists, batch partials) are parsed off-loop so
+        # autocomplete and button callbacks keep running meanwhile. Awaiting here
+        # still keeps this connection's frames dispatched in arrival order.
+        if len(data) >= self._config.decode_offload_bytes:
+            return await asyncio.to_thread(loads, data)
+        return loads(data)
+
+    def _op_of(self, payload: dict[str, Any]) -> str:
+        """The request op a reply/progress/partial frame belongs to, else its own type."""
+        rid = payload.get("request_id")
+        op = self._request_ops.get(rid) if isinstance(rid, str) else None
+        return op or str(payload.get("type") or "")
+
+    async def _dispatch(self, conn: _Connection, payload: dict[str, Any]) -> None:
         rid = payload.get("request_id")
         type_ = str(payload.get("type") or "")
         if type_ == "request_progress":
@@ -329,15 +1007,15 @@ class CrawlerClient:
         # Intermediate streamed update for an in-flight request (e.g. search_partial).
         if (
             isinstance(rid, str)
-            and rid in self._pending
+            and rid in conn.pending
             and type_.endswith("_partial")
             and rid in self._partial_callbacks
         ):
             await self._dispatch_partial(payload, rid)
             return
         # Correlated response.
-        if isinstance(rid, str) and rid in self._pending:
-            fut = self._pending.get(rid)
+        if isinstance(rid, str) and rid in conn.pending:
+            fut = conn.pending.get(rid)
             if fut is not None and not fut.done():
                 self._progress_callbacks.pop(rid, None)
                 self._partial_callbacks.pop(rid, None)
@@ -348,15 +1026,49 @@ class CrawlerClient:
         if not handlers:
             _log.debug("ignoring unsolicited crawler message of type %r", type_)
             return
+        if self._is_duplicate_push(type_, payload):
+            return
         for handler in handlers:
             task = asyncio.create_task(self._safe_push(handler, payload), name=f"push-{type_}")
             self._background_tasks.add(task)
             task.add_done_callback(self._background_tasks.discard)
 
+    async def _on_operational_alert(self, payload: dict[str, Any]) -> None:
+        """Close a website's circuit as soon as the crawler reports it recovered."""
+        data = payload.get("data")
+        record = data.get("alert") if isinstance(data, dict) else None
+        record = record if isinstance(record, dict) else payload
+        inner = record.get("payload")
+        inner = inner if isinstance(inner, dict) else {}
+        event = str(record.get("event") or inner.get("event") or "").lower()
+        website_key = record.get("website_key") or inner.get("website_key")
+        if event == "recovered" and isinstance(website_key, str) and website_key:
+            self._breaker.close(website_key)
+
+    def _is_duplicate_push(self, type_: str, payload: dict[str, Any]) -> bool:
+        """True if another pooled connection already delivered this push.
+
+        Pushes are told apart by ``request_id``, or, for pushes without one
+        (e.g. ``notification_event``), by the id of the record they carry.
+        """
+        if len(self._connections) == 1:
+            return False
+        identity = _push_identity(payload)
+        if identity is None:
+            return False
+        key = (type_, identity)
+        if key in self._recent_pushes:
+            return True
+        self._recent_pushes[key] = None
+        if len(self._recent_pushes) > _PUSH_DEDUP_WINDOW:
+            self._recent_pushes.popitem(last=False)
+        return False
+
     async def _dispatch_partial(self, payload: dict[str, Any], rid: str) -> None:
         callback = self._partial_callbacks.get(rid)
         if callback is None:
             return
+        self._streamed_requests.add(rid)
         data = payload.get("data")
         if not isinstance(data, dict):
             data = {}
@@ -384,6 +1096,7 @@ class CrawlerClient:
     async def _dispatch_progress(self, payload: dict[str, Any], rid: object) -> None:
         if not isinstance(rid, str):
             return
+        self.metrics.progress_event(self._request_ops.get(rid, "unknown"))
         callback = self._progress_callbacks.get(rid)
         if callback is None:
             return
@@ -392,6 +1105,10 @@ class CrawlerClient:
         except ValueError:
             _log.exception("crawler sent invalid progress event; ignoring")
             return
+        pump = self._progress_pumps.get(rid)
+        if pump is not None:
+            pump.push(event)
+            return
         previous = self._progress_tasks_by_request.get(rid)
         task = asyncio.create_task(
             self._run_progress_chain(previous, callback, event),
@@ -411,6 +1128,12 @@ class CrawlerClient:
             await asyncio.gather(previous, return_exceptions=True)
         await self._safe_progress_callback(callback, event)
 
+    def _spawn(self, coro: Coroutine[Any, Any, None], *, name: str) -> asyncio.Task[None]:
+        task = asyncio.create_task(coro, name=name)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
     async def _drain_progress_task(self, task: asyncio.Task[None]) -> None:
         await asyncio.gather(task, return_exceptions=True)
 
@@ -0,0 +1,139 @@
+"""Frame codecs for the crawler WebSocket.
+
+Text frames are JSON: ``orjson`` is used when installed
+(``pip install manhwa_bot[fast]``) and the stdlib ``json`` module otherwise;
+``[crawler].json_codec`` can pin either. Both produce and accept the same wire
+text, so that choice is purely local.
+
+Binary frames (MessagePack or CBOR) are opt-in through ``[crawler].wire_format``
+and negotiated per connection as a WebSocket subprotocol; a crawler that does
+not pick the offered subprotocol keeps talking JSON text.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional binary framing
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # optional binary framing
+    cbor2 = None
+
+CODEC_NAMES = ("auto", "orjson", "stdlib")
+WIRE_FORMATS = ("json", "msgpack", "cbor")
+SUBPROTOCOL_PREFIX = "manhwa-crawler."
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """A named ``dumps``/``loads`` pair. ``loads`` raises ``ValueError`` on bad input."""
+
+    name: str
+    dumps: Callable[[Any], str]
+    loads: Callable[[str | bytes], Any]
+
+
+STDLIB_CODEC = JsonCodec(name="stdlib", dumps=json.dumps, loads=json.loads)
+
+
+def _orjson_dumps(value: Any) -> str:
+    # Text frames need ``str``; OPT_NON_STR_KEYS matches json.dumps' int-key handling.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+ORJSON_CODEC: JsonCodec | None = (
+    JsonCodec(name="orjson", dumps=_orjson_dumps, loads=orjson.loads)
+    if orjson is not None
+    else None
+)
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """Resolve a ``[crawler].json_codec`` value to a codec.
+
+    ``"auto"`` prefers orjson and silently falls back to stdlib; asking for
+    ``"orjson"`` explicitly when it is not installed raises ``ValueError``.
+    """
+    if name == "stdlib":
+        return STDLIB_CODEC
+    if name == "orjson":
+        if ORJSON_CODEC is None:
+            raise ValueError("json_codec = 'orjson' but the orjson package is not installed")
+        return ORJSON_CODEC
+    if name == "auto":
+        return ORJSON_CODEC or STDLIB_CODEC
+    raise ValueError(f"unknown json codec {name!r}; expected one of {', '.join(CODEC_NAMES)}")
+
+
+@dataclass(frozen=True)
+class BinaryCodec:
+    """A binary frame format; ``loads`` raises ``ValueError`` on bad input."""
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+    @property
+    def subprotocol(self) -> str:
+        """WebSocket subprotocol offered (and echoed by the crawler) for this format."""
+        return f"{SUBPROTOCOL_PREFIX}{self.name}"
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+MSGPACK_CODEC: BinaryCodec | None = (
+    BinaryCodec(name="msgpack", dumps=_msgpack_dumps, loads=_msgpack_loads)
+    if msgpack is not None
+    else None
+)
+CBOR_CODEC: BinaryCodec | None = (
+    BinaryCodec(name="cbor", dumps=cbor2.dumps, loads=cbor2.loads) if cbor2 is not None else None
+)
+
+
+def get_binary_codec(wire_format: str = "json") -> BinaryCodec | None:
+    """Resolve a ``[crawler].wire_format`` value; ``"json"`` means no binary framing.
+
+    Raises ``ValueError`` for unknown formats or when the format's package
+    (``msgpack`` / ``cbor2``) is not installed.
+    """
+    if wire_format == "json":
+        return None
+    if wire_format not in WIRE_FORMATS:
+        raise ValueError(
+            f"unknown wire format {wire_format!r}; expected one of {', '.join(WIRE_FORMATS)}"
+        )
+    codec = MSGPACK_CODEC if wire_format == "msgpack" else CBOR_CODEC
+    if codec is None:
+        package = "msgpack" if wire_format == "msgpack" else "cbor2"
+        raise ValueError(
+            f"wire_format = {wire_format!r} but the {package} package is not installed"
+        )
+    return codec
+
+
+def binary_codec_for_subprotocol(protocol: str | None) -> BinaryCodec | None:
+    """The installed binary codec named by a negotiated subprotocol, if any."""
+    for codec in (MSGPACK_CODEC, CBOR_CODEC):
+        if codec is not None and codec.subprotocol == protocol:
+            return codec
+    return None
@@ -45,3 +45,24 @@ class NotificationRecord(TypedDict, total=False):
     chapter_index: int
     payload: NotificationPayload
     created_at: str
+
+
+class BatchItemRef(TypedDict):
+    """One series named in a ``{op}_batch`` request's ``items`` list."""
+
+    website_key: str
+    url_name: str
+
+
+class BatchItemResult(TypedDict):
+    """Server → client ``{op}_batch_partial`` data: one series' outcome.
+
+    ``data`` holds the same payload the single-item op would return; failed
+    items carry ``ok: false`` and an ``error`` instead.
+    """
+
+    website_key: str
+    url_name: str
+    ok: bool
+    data: NotRequired[dict[str, Any]]
+    error: NotRequired[ErrorPayload]
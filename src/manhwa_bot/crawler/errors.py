@@ -39,3 +39,24 @@ class Disconnected(CrawlerError):
             "crawler connection closed before response",
             request_id=request_id,
         )
+
+
+class CircuitOpen(CrawlerError):
+    """Requests to a website are failing fast after repeated block/disable replies.
+
+    ``code`` is the crawler code that opened the circuit (``website_blocked`` /
+    ``website_disabled``), so callers handle it exactly like the reply it stands in for.
+
+    Attributes:
+        website_key: the website whose circuit is open
+        cause: same as ``code``
+    """
+
+    def __init__(self, website_key: str, cause: str, *, request_id: str | None = None) -> None:
+        super().__init__(
+            cause,
+            f"{website_key} is failing with {cause}; skipping requests to it for now",
+            request_id=request_id,
+        )
+        self.website_key = website_key
+        self.cause = cause
@@ -0,0 +1,72 @@
+"""Series-scoped cache invalidation bus.
+
+Caches of crawler data go stale exactly when a ``notification_event`` (new
+chapter or status change) for a series is consumed. Publishers — the
+notification consumer and the updates cog — announce the
+``(website_key, url_name)`` pair; every subscribed cache drops the entries it
+has tagged with that series. Because staleness is signalled explicitly, cached
+reads can use long TTLs without ever showing an outdated latest chapter.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Mapping
+from typing import Any
+
+_log = logging.getLogger(__name__)
+
+SeriesTag = tuple[str, str]
+InvalidationListener = Callable[[str, str], None]
+
+
+def series_tag(fields: Mapping[str, Any]) -> SeriesTag | None:
+    """``(website_key, url_name)`` named by a request or record payload, if any."""
+    website_key = str(fields.get("website_key") or "").strip()
+    url_name = str(fields.get("url_name") or "").strip()
+    if not website_key or not url_name:
+        return None
+    return (website_key, url_name)
+
+
+class InvalidationBus:
+    """Synchronous fan-out of series invalidations to registered caches.
+
+    Listeners run inline on the event loop and must not block; one failing
+    listener never prevents the others from evicting.
+    """
+
+    def __init__(self) -> None:
+        self._listeners: list[InvalidationListener] = []
+
+    def subscribe(self, listener: InvalidationListener) -> Callable[[], None]:
+        """Register *listener*; returns a callable that unregisters it."""
+        self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _unsubscribe
+
+    def publish(self, website_key: str, url_name: str) -> None:
+        """Evict every cached entry tagged with ``(website_key, url_name)``."""
+        for listener in list(self._listeners):
+            try:
+                listener(website_key, url_name)
+            except Exception:
+                _log.exception(
+                    "cache invalidation listener failed for %s:%s", website_key, url_name
+                )
+
+    def publish_record(self, record: Mapping[str, Any]) -> bool:
+        """Publish the series a stream record's ``payload`` refers to.
+
+        Returns ``False`` (and does nothing) for records without a series.
+        """
+        payload = record.get("payload")
+        tag = series_tag(payload) if isinstance(payload, Mapping) else None
+        if tag is None:
+            return False
+        self.publish(*tag)
+        return True
@@ -0,0 +1,292 @@
+"""Per-op request metrics for the crawler client, in constant memory.
+
+Every op type gets a fixed-bucket latency histogram (log-spaced bounds in
+:data:`LATENCY_BUCKETS`), outcome counters, an error-code breakdown, frame
+byte totals, an in-flight gauge and a one-minute progress-event rate window.
+Nothing grows with traffic: the histogram and rate window are fixed arrays,
+distinct error codes per op and distinct op types are capped, and overflow
+lands in an ``"other"`` bucket.
+
+Latency is measured from admission to the correlated reply (including any
+replay after a reconnect) and only for requests that got one; timeouts and
+disconnects are counted separately so they do not drag p99 to the timeout.
+Percentiles are estimated by linear interpolation inside the matching bucket,
+so they are accurate to one bucket width (~25%).
+
+:meth:`CrawlerMetrics.snapshot` returns frozen dataclasses; ``as_dict()`` on
+the snapshot is plain JSON-serialisable data for dashboards and the
+``?dev crawler metrics --json`` command.
+"""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import time
+from array import array
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+# Upper bounds (seconds) of the latency buckets: 1 ms growing 25% per bucket up
+# to ~5.5 minutes, then an overflow bucket. Shared by every op.
+LATENCY_BUCKETS: tuple[float, ...] = tuple(0.001 * 1.25**i for i in range(58))
+# Client-side outcomes recorded in the error breakdown next to crawler codes.
+DISCONNECTED = "disconnected"
+OTHER = "other"
+# Caps that keep memory constant whatever the crawler sends back.
+_MAX_ERROR_CODES = 32
+_MAX_OPS = 64
+_RATE_WINDOW_SECONDS = 60
+
+
+class _RateWindow:
+    """Events per second over the last minute, in one-second slots."""
+
+    __slots__ = ("_counts", "_seconds")
+
+    def __init__(self) -> None:
+        self._counts = array("q", [0] * _RATE_WINDOW_SECONDS)
+        self._seconds = array("q", [-1] * _RATE_WINDOW_SECONDS)
+
+    def add(self, now: float) -> None:
+        second = int(now)
+        slot = second % _RATE_WINDOW_SECONDS
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._counts[slot] = 0
+        self._counts[slot] += 1
+
+    def per_second(self, now: float) -> float:
+        oldest = int(now) - _RATE_WINDOW_SECONDS
+        total = sum(
+            count
+            for count, second in zip(self._counts, self._seconds, strict=True)
+            if second > oldest
+        )
+        return total / _RATE_WINDOW_SECONDS
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram over :data:`LATENCY_BUCKETS`."""
+
+    __slots__ = ("buckets", "max", "observed", "total")
+
+    def __init__(self) -> None:
+        self.buckets = array("q", [0] * (len(LATENCY_BUCKETS) + 1))
+        self.observed = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.observed += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float | None:
+        return estimate_quantile(q, (self,))
+
+
+def estimate_quantile(q: float, histograms: Iterable[LatencyHistogram]) -> float | None:
+    """The *q* quantile of the merged *histograms*; ``None`` if they are empty.
+
+    Interpolates linearly inside the matching bucket and never exceeds the
+    largest observed value.
+    """
+    histograms = tuple(histograms)
+    observed = sum(h.observed for h in histograms)
+    if not observed:
+        return None
+    largest = max(h.max for h in histograms)
+    rank = q * observed
+    seen = 0
+    for i in range(len(LATENCY_BUCKETS) + 1):
+        count = sum(h.buckets[i] for h in histograms)
+        if not count:
+            continue
+        if seen + count >= rank:
+            lower = LATENCY_BUCKETS[i - 1] if i else 0.0
+            upper = LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else largest
+            return min(lower + (upper - lower) * (rank - seen) / count, largest)
+        seen += count
+    return largest
+
+
+class _OpMetrics:
+    __slots__ = (
+        "bytes_in",
+        "bytes_out",
+        "count",
+        "errors",
+        "in_flight",
+        "latency",
+        "progress",
+        "progress_events",
+        "retries",
+        "timeouts",
+    )
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.count = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.errors: dict[str, int] = {}
+        self.in_flight = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.progress_events = 0
+        self.progress = _RateWindow()
+
+    def add_error(self, code: str) -> None:
+        if code not in self.errors and len(self.errors) >= _MAX_ERROR_CODES:
+            code = OTHER
+        self.errors[code] = self.errors.get(code, 0) + 1
+
+
+@dataclass(frozen=True)
+class OpMetricsSnapshot:
+    """Counters for one op type. Latencies are seconds; ``None`` until observed."""
+
+    op: str
+    count: int
+    timeouts: int
+    # Attempts re-sent after an adaptive timeout (see crawler.timeouts).
+    retries: int
+    errors: dict[str, int]
+    in_flight: int
+    p50_seconds: float | None
+    p95_seconds: float | None
+    p99_seconds: float | None
+    max_seconds: float | None
+    mean_seconds: float | None
+    bytes_in: int
+    bytes_out: int
+    progress_events: int
+    progress_per_second: float
+    # Per-bucket counts aligned with LATENCY_BUCKETS (+ one overflow bucket).
+    latency_buckets: tuple[int, ...]
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+
+@dataclass(frozen=True)
+class CrawlerMetricsSnapshot:
+    uptime_seconds: float
+    in_flight: int
+    reconnects: int
+    progress_per_second: float
+    ops: tuple[OpMetricsSnapshot, ...]
+
+    def op(self, name: str) -> OpMetricsSnapshot | None:
+        return next((entry for entry in self.ops if entry.op == name), None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-serialisable form, with ``latency_bucket_bounds`` for the histograms."""
+        data = dataclasses.asdict(self)
+        data["latency_bucket_bounds"] = list(LATENCY_BUCKETS)
+        return data
+
+
+class CrawlerMetrics:
+    """Registry of per-op metrics. Only use from the client's event loop."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._started_at = clock()
+        self._ops: dict[str, _OpMetrics] = {}
+        self._progress = _RateWindow()
+        self.reconnects = 0
+
+    def _op(self, op: str) -> _OpMetrics:
+        entry = self._ops.get(op)
+        if entry is None:
+            if len(self._ops) >= _MAX_OPS:
+                op = OTHER
+                entry = self._ops.get(op)
+            if entry is None:
+                entry = self._ops[op] = _OpMetrics()
+        return entry
+
+    def request_started(self, op: str) -> None:
+        self._op(op).in_flight += 1
+
+    def request_finished(self, op: str, seconds: float, *, error: str | None = None) -> None:
+        """A reply arrived after *seconds*; *error* is its error code, if not ok."""
+        entry = self._op(op)
+        entry.in_flight -= 1
+        entry.count += 1
+        entry.latency.observe(seconds)
+        if error is not None:
+            entry.add_error(error)
+
+    def request_timed_out(self, op: str) -> None:
+        entry = self._op(op)
+        entry.in_flight -= 1
+        entry.count += 1
+        entry.timeouts += 1
+
+    def request_retried(self, op: str) -> None:
+        self._op(op).retries += 1
+
+    def request_disconnected(self, op: str) -> None:
+        entry = self._op(op)
+        entry.in_flight -= 1
+        entry.count += 1
+        entry.add_error(DISCONNECTED)
+
+    def request_abandoned(self, op: str) -> None:
+        """The caller was cancelled before a reply; only the gauge moves."""
+        self._op(op).in_flight -= 1
+
+    def frame_sent(self, op: str, size: int) -> None:
+        self._op(op).bytes_out += size
+
+    def frame_received(self, op: str, size: int) -> None:
+        self._op(op).bytes_in += size
+
+    def progress_event(self, op: str) -> None:
+        now = self._clock()
+        entry = self._op(op)
+        entry.progress_events += 1
+        entry.progress.add(now)
+        self._progress.add(now)
+
+    def reconnected(self) -> None:
+        self.reconnects += 1
+
+    def snapshot(self) -> CrawlerMetricsSnapshot:
+        now = self._clock()
+        ops = tuple(
+            OpMetricsSnapshot(
+                op=name,
+                count=entry.count,
+                timeouts=entry.timeouts,
+                retries=entry.retries,
+                errors=dict(entry.errors),
+                in_flight=entry.in_flight,
+                p50_seconds=entry.latency.quantile(0.50),
+                p95_seconds=entry.latency.quantile(0.95),
+                p99_seconds=entry.latency.quantile(0.99),
+                max_seconds=entry.latency.max if entry.latency.observed else None,
+                mean_seconds=(
+                    entry.latency.total / entry.latency.observed if entry.latency.observed else None
+                ),
+                bytes_in=entry.bytes_in,
+                bytes_out=entry.bytes_out,
+                progress_events=entry.progress_events,
+                progress_per_second=entry.progress.per_second(now),
+                latency_buckets=tuple(entry.latency.buckets),
+            )
+            for name, entry in sorted(self._ops.items())
+        )
+        return CrawlerMetricsSnapshot(
+            uptime_seconds=now - self._started_at,
+            in_flight=sum(entry.in_flight for entry in ops),
+            reconnects=self.reconnects,
+            progress_per_second=self._progress.per_second(now),
+            ops=ops,
+        )
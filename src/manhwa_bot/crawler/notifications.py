@@ -4,23 +4,91 @@ Owns the WS-level state machine that turns one crawler push/replay protocol
 into an in-order stream of records delivered to a single ``dispatch`` callback.
 The default protocol is chapter notifications; callers can supply another
 protocol, such as operational alerts, while sharing the same replay guarantee.
+
+With ``max_in_flight > 1`` dispatch is pipelined: up to that many records run
+concurrently, but records for the same ``(website_key, url_name)`` still run
+one after another in id order, so one slow fan-out no longer holds up every
+other series. A record only takes a slot once its series predecessor has
+finished, so a slow series' backlog waits without occupying slots. At most
+:data:`_MAX_WINDOW` records are outstanding (submitted but not yet acked);
+submission waits for room beyond that. The acked offset is a low-watermark:
+it only advances over a prefix of records that have all finished
+successfully. A failed record pins it just below itself and halts the
+consumer: nothing new is dispatched, and after ``retry_delay_seconds``
+(doubling per consecutive failure, up to :data:`_MAX_RETRY_DELAY_SECONDS`)
+it resyncs like a reconnect, replaying from the watermark. Nothing is
+skipped that the serial consumer would have replayed. Records that finished
+after the failed one are delivered again by that replay (at-least-once, as
+with any unacked record today).
+
+Offsets are persisted (``ConsumerStateStore``) and acked to the crawler in
+batches: once ``ack_every`` records have been acked locally, or
+``ack_interval_seconds`` after the first unflushed one, whichever comes
+first, and always on ``stop()`` and on disconnect. A crash can therefore
+replay at most that many records (or that much time) of already-delivered
+notifications. The defaults flush after every record.
+
+Catch-up is double-buffered: as soon as a full page arrives, the next page
+is requested (``since_id`` = that page's last id) while the current one
+dispatches, so the list round-trip is off the critical path. The page size
+starts at ``catchup_page_size`` and then follows the observed dispatch rate,
+aiming for pages that take about :data:`_PAGE_TARGET_SECONDS` (or two list
+round-trips, if longer) to dispatch. A page's time runs from its submission
+until every one of its dispatches has finished, so a pipelined page is not
+mistaken for fast just because it was queued quickly. It at most doubles or
+halves per page and stays within 1..500.
+
+With an ``inbox`` (:class:`~..db.notification_inbox.NotificationInboxStore`)
+every record is written to SQLite, in bulk per push or page, before it is
+dispatched, and its row is deleted (batched with the offset flush) once
+dispatch succeeds. Live pushes that arrive during catch-up wait in the inbox
+rather than in memory. Alongside the offset the consumer persists a
+"received through" id: every record at or below it is acked or stored.
+Catch-up pages advance it, and live pushes only do once a catch-up has
+completed on the current connection, so a push stored mid-catch-up never
+hides the records before it. ``start()`` resumes dispatching the inbox up to
+that id straight away, without waiting for the crawler, and catch-up then
+lists only what came after it. A catch-up that ends early (a failed list
+request) is retried after ``retry_delay_seconds``; until then, later live
+pushes wait in the inbox. Without an inbox, live pushes queued during
+catch-up are held in memory and dropped on ``stop()``.
+
+With ``digest`` enabled, catch-up (and resuming from the inbox) collapses
+each run of chapter records for one series within a page into a single
+dispatch: the newest record, with every record of the run, oldest first,
+under ``"digest"``. It is dispatched at the position of its newest id, and
+all of the run's ids are acked together once it succeeds. A status change
+for the series ends the run, so a series' events never reorder. Live pushes
+are never collapsed, including those that waited in the inbox during
+catch-up; after a restart, whatever the inbox still holds counts as backlog.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections import deque
 from collections.abc import Awaitable, Callable
 from typing import Any
 
 from ..db.consumer_state import ConsumerStateStore
+from ..db.notification_inbox import NotificationInboxStore
 from .client import CrawlerClient
 from .errors import CrawlerError, Disconnected, RequestTimeout
+from .invalidation import InvalidationBus
 
 _log = logging.getLogger(__name__)
 
 DispatchFn = Callable[[dict[str, Any]], Awaitable[None]]
+SeriesKey = tuple[str, str] | None
+
+# Catch-up pages are sized to take about this long to dispatch.
+_PAGE_TARGET_SECONDS = 2.0
+_MAX_PAGE_SIZE = 500
+# Most records submitted but not yet acked at once.
+_MAX_WINDOW = 2 * _MAX_PAGE_SIZE
+_MAX_RETRY_DELAY_SECONDS = 300.0
 
 
 class NotificationConsumer:
@@ -30,6 +98,18 @@ class NotificationConsumer:
     The single ``dispatch`` callback is responsible for any per-target
     error isolation; if it raises, the consumer treats the record as failed
     and refrains from advancing the offset.
+
+    When ``invalidations`` is given, each record's series is published on it
+    just before dispatch, so cached crawler data for that series is evicted
+    before anything renders the new chapter.
+
+    ``max_in_flight`` bounds how many records dispatch concurrently (see the
+    module docstring); ``1`` dispatches strictly one record at a time.
+    ``retry_delay_seconds`` is how long a failed dispatch waits before the
+    consumer replays from the watermark.
+    ``ack_every`` / ``ack_interval_seconds`` batch offset writes and acks.
+    ``inbox`` makes received records durable before dispatch. ``digest``
+    collapses catch-up backlogs per series.
     """
 
     def __init__(
@@ -46,22 +126,68 @@ class NotificationConsumer:
         records_key: str = "notifications",
         push_record_key: str = "notification",
         last_id_key: str = "last_notification_id",
+        invalidations: InvalidationBus | None = None,
+        max_in_flight: int = 1,
+        retry_delay_seconds: float = 5.0,
+        ack_every: int = 1,
+        ack_interval_seconds: float = 0.0,
+        inbox: NotificationInboxStore | None = None,
+        digest: bool = False,
     ) -> None:
         self._client = client
         self._store = store
         self._consumer_key = consumer_key
         self._dispatch = dispatch
-        self._catchup_page_size = max(1, min(int(catchup_page_size), 500))
+        self._catchup_page_size = max(1, min(int(catchup_page_size), _MAX_PAGE_SIZE))
         self._push_type = str(push_type)
         self._list_request_type = str(list_request_type)
         self._ack_request_type = str(ack_request_type)
         self._records_key = str(records_key)
         self._push_record_key = str(push_record_key)
         self._last_id_key = str(last_id_key)
+        self._invalidations = invalidations
         self._lock = asyncio.Lock()
         self._pending_live: deque[dict[str, Any]] = deque()
         self._catching_up = False
         self._last_acked = 0
+        # Pipeline state. ``_cursor`` is the highest id handed to dispatch;
+        # ``_window`` maps every id above ``_last_acked`` up to the cursor, in
+        # id order, to None (running), True (done) or False (failed).
+        self._max_in_flight = max(1, int(max_in_flight))
+        self._slots = asyncio.Semaphore(self._max_in_flight)
+        self._cursor = 0
+        self._window: dict[int, bool | None] = {}
+        self._series_tails: dict[SeriesKey, asyncio.Task[None]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        # Waits for a pipelined catch-up page to finish before adapting the page size.
+        self._page_timers: set[asyncio.Task[None]] = set()
+        self._window_room = asyncio.Event()
+        self._window_room.set()
+        # Set by a failed dispatch; cleared by the resync that replays it.
+        self._halted = False
+        self._retry_delay = max(0.0, float(retry_delay_seconds))
+        self._next_retry_delay = self._retry_delay
+        self._failed_id: int | None = None
+        self._resync_timer: asyncio.Task[None] | None = None
+        self._ack_lock = asyncio.Lock()
+        # Batched acks: ``_flushed`` is the offset last written and acked.
+        self._ack_every = max(1, int(ack_every))
+        self._ack_interval = max(0.0, float(ack_interval_seconds))
+        self._flushed = 0
+        self._unflushed = 0
+        self._flush_timer: asyncio.Task[None] | None = None
+        # Durable inbox: ``_received`` is the newest id stored in it,
+        # ``_received_through`` the contiguous watermark below which nothing is
+        # missing, and ``_inbox_done`` the dispatched ids whose rows the next
+        # flush deletes. ``_caught_up``: a catch-up completed on this connection,
+        # so live pushes follow on from the watermark.
+        self._inbox = inbox
+        self._received = 0
+        self._received_through = 0
+        self._received_through_flushed = 0
+        self._caught_up = False
+        self._inbox_done: set[int] = set()
+        self._digest = bool(digest)
         self._started = False
         self._initial_task: asyncio.Task[None] | None = None
 
@@ -73,12 +199,23 @@ class NotificationConsumer:
     def catching_up(self) -> bool:
         return self._catching_up
 
+    @property
+    def catchup_page_size(self) -> int:
+        """The ``limit`` the next catch-up page will be requested with."""
+        return self._catchup_page_size
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
     async def start(self) -> None:
         """Register handlers and trigger first-run catch-up if already connected."""
         if self._started:
             return
         self._started = True
         self._last_acked = await self._store.get_last_acked(self._consumer_key)
+        self._cursor = self._last_acked
+        self._flushed = self._last_acked
         _log.info(
             "notification consumer starting (consumer_key=%s, last_acked=%d)",
             self._consumer_key,
@@ -86,83 +223,266 @@ class NotificationConsumer:
         )
         self._client.on_push(self._push_type, self._on_push)
         self._client.on_connect(self._on_connect)
+        if self._batches_acks:
+            self._client.on_disconnect(self._flush)
+        if self._inbox is not None:
+            self._client.on_disconnect(self._on_disconnect)
+            await self._inbox.delete(self._consumer_key, through_id=self._last_acked)
+            self._received_through = max(
+                self._last_acked, await self._store.get_received_through(self._consumer_key)
+            )
+            self._received_through_flushed = self._received_through
+            self._received = max(
+                self._received_through, await self._inbox.max_id(self._consumer_key)
+            )
         if self._client.connected:
             self._initial_task = asyncio.create_task(
                 self._on_connect(),
                 name="notif-consumer-initial-catchup",
             )
+        elif self._received_through > self._last_acked:
+            self._initial_task = asyncio.create_task(
+                self._resume_from_inbox(),
+                name="notif-consumer-inbox-resume",
+            )
 
     async def stop(self) -> None:
-        """Mark stopped. Pending live records are dropped (replayed on next start)."""
+        """Mark stopped and flush the offset. Live records queued in memory are
+        dropped (replayed on next start)."""
         self._started = False
         self._pending_live.clear()
+        if self._resync_timer is not None:
+            self._resync_timer.cancel()
+            self._resync_timer = None
+        await self._flush()
+
+    @property
+    def _batches_acks(self) -> bool:
+        return self._ack_every > 1 or self._ack_interval > 0
+
+    async def _on_disconnect(self) -> None:
+        # Records published while offline only arrive through the next catch-up.
+        self._caught_up = False
 
     async def _on_connect(self) -> None:
+        timer, self._resync_timer = self._resync_timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        self._caught_up = False
         async with self._lock:
             self._catching_up = True
+            # Let records from the previous connection finish, then replay
+            # from the watermark so anything that failed is delivered again.
+            await self._settle()
+            self._window.clear()
+            self._window_room.set()
+            self._cursor = self._last_acked
+            self._halted = False
+            completed = False
             try:
-                await self._run_catchup()
+                if self._inbox is not None:
+                    await self._drain_inbox()
+                    # Everything up to the watermark is acked or was just submitted.
+                    self._cursor = max(self._cursor, self._received_through)
+                completed = await self._run_catchup()
             except Exception:
-                _log.exception("notification catch-up failed; will retry on next reconnect")
+                _log.exception("notification catch-up failed; will retry")
             finally:
-                await self._drain_queued_live()
-                self._catching_up = False
+                if not completed and not self._halted:
+                    self._schedule_resync()
+                elif completed and self._failed_id is None:
+                    self._next_retry_delay = self._retry_delay
+                if self._inbox is None:
+                    await self._drain_queued_live()
+                    self._catching_up = False
+                else:
+                    if completed:
+                        # Pushes stored during a completed catch-up follow on
+                        # from its last page.
+                        self._received_through = max(self._received_through, self._received)
+                        self._caught_up = True
+                    # Flip first: a push stored before this point is picked up
+                    # by the drain below, one stored after it dispatches itself.
+                    self._catching_up = False
+                    if self._started:
+                        try:
+                            # Only live pushes are left here; they dispatch as-is.
+                            await self._drain_inbox(digest=False)
+                        except Exception:
+                            _log.exception("draining the notification inbox failed")
+
+    async def _resume_from_inbox(self) -> None:
+        async with self._lock:
+            try:
+                await self._drain_inbox()
+            except Exception:
+                _log.exception("resuming from the notification inbox failed")
 
-    async def _run_catchup(self) -> None:
+    async def _drain_inbox(self, *, digest: bool = True) -> None:
+        """Dispatch stored records above the cursor, oldest first, up to the
+        received-through watermark (anything past a gap waits for catch-up).
+        *digest* False dispatches them one by one even with ``digest`` on."""
+        assert self._inbox is not None
+        while not self._halted:
+            records = await self._inbox.pending(
+                self._consumer_key,
+                after_id=self._cursor,
+                through_id=self._received_through,
+                limit=_MAX_PAGE_SIZE,
+            )
+            if not records:
+                return
+            await self._submit_page(records, digest=digest)
+
+    async def _store_received(self, records: list[tuple[int, dict[str, Any]]]) -> None:
+        if self._inbox is None or not records:
+            return
+        await self._inbox.append(self._consumer_key, records)
+        self._received = max(self._received, records[-1][0])
+
+    async def _run_catchup(self) -> bool:
+        """Page through the crawler's log from the cursor; True if it reached the end."""
+        fetch = self._fetch_page(self._cursor)
         while True:
             try:
-                data = await self._client.request(
-                    self._list_request_type,
-                    consumer_key=self._consumer_key,
-                    since_id=self._last_acked,
-                    limit=self._catchup_page_size,
-                )
+                records, limit, fetch_seconds = await fetch
             except (Disconnected, RequestTimeout, CrawlerError) as exc:
                 _log.warning("%s failed: %s", self._list_request_type, exc)
-                return
-            records = data.get(self._records_key) or []
-            if not records:
-                _log.info("catch-up complete, last_acked=%d", self._last_acked)
-                return
-            page_advanced = False
-            halt = False
-            for record in records:
-                rid = _record_id(record)
-                if rid is None or rid <= self._last_acked:
-                    continue
-                try:
-                    await self._dispatch(record)
-                except Exception:
-                    _log.exception("dispatch raised for notification id=%s; halting catch-up", rid)
-                    halt = True
-                    break
-                self._last_acked = rid
-                page_advanced = True
-            if page_advanced:
-                await self._persist_and_ack()
-            if halt:
-                return
-            if len(records) < self._catchup_page_size:
+                return False
+            ids = [rid for rid in map(_record_id, records) if rid is not None]
+            prefetch: asyncio.Task[tuple[list[dict[str, Any]], int, float]] | None = None
+            if ids and len(records) >= limit:
+                prefetch = asyncio.create_task(
+                    self._fetch_page(max(ids)), name="notif-consumer-prefetch"
+                )
+            try:
+                await self._store_received(
+                    [
+                        (rid, record)
+                        for rid, record in ((_record_id(r), r) for r in records)
+                        if rid is not None and rid > self._cursor
+                    ]
+                )
+                if ids:
+                    # Pages list everything after the previous one, so nothing
+                    # below this page's last id is missing any more.
+                    self._received_through = max(self._received_through, max(ids))
+                started = time.monotonic()
+                submitted, tasks = await self._submit_page(records)
+                self._time_page(submitted, tasks, started, fetch_seconds)
+            except BaseException:
+                if prefetch is not None:
+                    prefetch.cancel()
+                raise
+            if self._halted:
+                if prefetch is not None:
+                    prefetch.cancel()
+                _log.warning(
+                    "halting catch-up at last_acked=%d after a dispatch failure", self._last_acked
+                )
+                return False
+            if prefetch is None:
                 _log.info("catch-up complete, last_acked=%d", self._last_acked)
-                return
+                return True
+            fetch = prefetch
 
-    async def _drain_queued_live(self) -> None:
-        while self._pending_live:
-            record = self._pending_live.popleft()
+    async def _submit_page(
+        self, records: list[dict[str, Any]], *, digest: bool = True
+    ) -> tuple[int, list[asyncio.Task[None]]]:
+        """Submit a page's records above the cursor, in id order, collapsing
+        per-series runs when ``digest`` is on. Returns how many records it
+        covered and the dispatch tasks it started."""
+        entries: list[tuple[int, dict[str, Any]]] = []
+        for record in records:
             rid = _record_id(record)
-            if rid is None or rid <= self._last_acked:
+            if rid is not None and rid > self._cursor:
+                entries.append((rid, record))
+        runs = (
+            _digest_runs([e for e in entries if e[0] not in self._inbox_done])
+            if self._digest and digest
+            else {}
+        )
+        absorbed = {rid for run in runs.values() for rid, _ in run[:-1]}
+        tasks: list[asyncio.Task[None]] = []
+        covered = 0
+        for rid, record in entries:
+            covered += 1
+            if rid in self._inbox_done:
+                self._cursor = rid
                 continue
-            try:
-                await self._dispatch(record)
-            except Exception:
-                _log.exception(
-                    "dispatch raised for queued live notification id=%s; "
-                    "halting drain (will replay on next reconnect)",
+            if rid in absorbed:
+                # Held open until the run's digest, submitted at its last id,
+                # finishes; the watermark cannot pass it before then.
+                self._cursor = rid
+                self._window[rid] = None
+                continue
+            run = runs.get(rid)
+            if run is None:
+                task = await self._submit(record, rid)
+            else:
+                task = await self._submit(
+                    {**record, "digest": [r for _, r in run]},
                     rid,
+                    absorbed=tuple(i for i, _ in run[:-1]),
                 )
+            if task is not None:
+                tasks.append(task)
+            if self._halted:
+                break
+        return covered, tasks
+
+    async def _fetch_page(self, since_id: int) -> tuple[list[dict[str, Any]], int, float]:
+        """One catch-up page after *since_id*: (records, limit asked for, seconds taken)."""
+        limit = self._catchup_page_size
+        started = time.monotonic()
+        data = await self._client.request(
+            self._list_request_type,
+            consumer_key=self._consumer_key,
+            since_id=since_id,
+            limit=limit,
+        )
+        return list(data.get(self._records_key) or []), limit, time.monotonic() - started
+
+    def _time_page(
+        self,
+        dispatched: int,
+        tasks: list[asyncio.Task[None]],
+        started: float,
+        fetch_seconds: float,
+    ) -> None:
+        """Adapt the page size once a page's dispatches have all finished."""
+        pending = [task for task in tasks if not task.done()]
+        if not pending:
+            self._adapt_page_size(dispatched, time.monotonic() - started, fetch_seconds)
+            return
+
+        async def _wait() -> None:
+            await asyncio.wait(pending)
+            self._adapt_page_size(dispatched, time.monotonic() - started, fetch_seconds)
+
+        timer = asyncio.create_task(_wait(), name="notif-consumer-page-timer")
+        self._page_timers.add(timer)
+        timer.add_done_callback(self._page_timers.discard)
+
+    def _adapt_page_size(self, dispatched: int, seconds: float, fetch_seconds: float) -> None:
+        if dispatched <= 0:
+            return
+        target = max(_PAGE_TARGET_SECONDS, 2 * fetch_seconds)
+        ideal = round(dispatched / max(seconds, 1e-6) * target)
+        current = self._catchup_page_size
+        self._catchup_page_size = max(1, min(_MAX_PAGE_SIZE, current * 2, max(current // 2, ideal)))
+
+    async def _drain_queued_live(self) -> None:
+        while self._pending_live:
+            if self._halted:
+                # Still in the crawler's log above the pinned watermark.
+                self._pending_live.clear()
                 return
-            self._last_acked = rid
-            await self._persist_and_ack()
+            record = self._pending_live.popleft()
+            rid = _record_id(record)
+            if rid is None or rid <= self._cursor:
+                continue
+            await self._submit(record, rid)
 
     async def _on_push(self, envelope: dict[str, Any]) -> None:
         data = envelope.get("data") or {}
@@ -170,6 +490,9 @@ class NotificationConsumer:
         if not isinstance(record, dict):
             _log.debug("%s with no record payload; ignoring", self._push_type)
             return
+        if self._inbox is not None:
+            await self._on_push_stored(record)
+            return
         # Fast queue path: don't take the lock if we know we're catching up.
         if self._catching_up:
             self._pending_live.append(record)
@@ -179,41 +502,250 @@ class NotificationConsumer:
                 self._pending_live.append(record)
                 return
             rid = _record_id(record)
-            if rid is None or rid <= self._last_acked:
+            if rid is None or rid <= self._cursor or self._halted:
+                # While halted it stays in the crawler's log for the resync.
                 return
-            try:
-                await self._dispatch(record)
-            except Exception:
-                _log.exception(
-                    "dispatch raised for live notification id=%s; "
-                    "skipping ack (will replay on next reconnect)",
-                    rid,
-                )
-                return
-            self._last_acked = rid
-            await self._persist_and_ack()
+            await self._submit(record, rid)
 
-    async def _persist_and_ack(self) -> None:
-        if self._last_acked <= 0:
+    async def _on_push_stored(self, record: dict[str, Any]) -> None:
+        rid = _record_id(record)
+        if rid is None or rid <= self._cursor:
             return
+        await self._store_received([(rid, record)])
+        # During catch-up, while halted, or until a catch-up has completed, the
+        # record waits in the inbox; the drain after the next catch-up
+        # dispatches it.
+        if self._catching_up or self._halted or not self._caught_up:
+            return
+        async with self._lock:
+            if self._catching_up or self._halted or not self._caught_up:
+                return
+            self._received_through = max(self._received_through, rid)
+            if rid <= self._cursor:
+                return
+            await self._submit(record, rid)
+
+    async def _submit(
+        self, record: dict[str, Any], rid: int, *, absorbed: tuple[int, ...] = ()
+    ) -> asyncio.Task[None] | None:
+        """Queue *record* for dispatch once the window has room.
+
+        Returns as soon as it is queued (after it finishes when
+        ``max_in_flight`` is 1, which keeps dispatch strictly serial). The
+        task waits for the previous record of the same series, then for a
+        slot, before calling ``dispatch``. *absorbed* are the earlier ids a
+        digest record stands for; they settle with it. Does nothing once the
+        consumer has halted. Returns the dispatch task, if one was started.
+        """
+        while len(self._window) >= _MAX_WINDOW and not self._halted:
+            self._window_room.clear()
+            await self._window_room.wait()
+        if self._halted:
+            return None
+        self._cursor = rid
+        self._window[rid] = None
+        key = _series_key(record)
+        task = asyncio.create_task(
+            self._run_record(record, (*absorbed, rid), key, self._series_tails.get(key)),
+            name=f"notif-dispatch-{rid}",
+        )
+        self._series_tails[key] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if self._max_in_flight == 1:
+            await asyncio.wait({task})
+        return task
+
+    async def _run_record(
+        self,
+        record: dict[str, Any],
+        rids: tuple[int, ...],
+        key: SeriesKey,
+        previous: asyncio.Task[None] | None,
+    ) -> None:
         try:
-            await self._store.set_last_acked(self._consumer_key, self._last_acked)
-        except Exception:
-            _log.exception("failed to persist last_acked=%d locally", self._last_acked)
-        try:
-            await self._client.request(
-                self._ack_request_type,
-                consumer_key=self._consumer_key,
-                **{self._last_id_key: self._last_acked},
+            if previous is not None:
+                await asyncio.wait({previous})
+            async with self._slots:
+                try:
+                    await self._deliver(record)
+                except Exception:
+                    _log.exception(
+                        "dispatch raised for notification id=%s; "
+                        "holding the ack below it (will replay in %.0fs)",
+                        rids[-1],
+                        self._next_retry_delay,
+                    )
+                    for rid in rids:
+                        self._window[rid] = False
+                    self._halt(rids[-1])
+                else:
+                    for rid in rids:
+                        self._window[rid] = True
+                    if self._inbox is not None:
+                        self._inbox_done.update(rids)
+        finally:
+            if self._series_tails.get(key) is asyncio.current_task():
+                del self._series_tails[key]
+        await self._advance_watermark()
+
+    def _halt(self, rid: int) -> None:
+        """Stop dispatching new records and schedule a replay from the watermark."""
+        self._halted = True
+        if self._failed_id is None:
+            self._failed_id = rid
+        self._window_room.set()
+        self._schedule_resync()
+
+    def _schedule_resync(self) -> None:
+        if self._resync_timer is None and self._started:
+            delay = self._next_retry_delay
+            self._next_retry_delay = min(
+                max(2 * delay, self._retry_delay), _MAX_RETRY_DELAY_SECONDS
             )
-        except (Disconnected, RequestTimeout, CrawlerError) as exc:
-            _log.warning(
-                "%s(%d) failed: %s; offset stored locally, will retry on reconnect",
-                self._ack_request_type,
-                self._last_acked,
-                exc,
+            self._resync_timer = asyncio.create_task(
+                self._resync_later(delay), name="notif-consumer-resync"
             )
 
+    async def _resync_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if self._resync_timer is asyncio.current_task():
+            self._resync_timer = None
+        if self._started and self._client.connected:
+            await self._on_connect()
+
+    async def _advance_watermark(self) -> None:
+        advanced = 0
+        for rid, done in list(self._window.items()):
+            if not done:
+                break
+            del self._window[rid]
+            self._last_acked = rid
+            advanced += 1
+        if not advanced:
+            return
+        if self._failed_id is not None and self._last_acked >= self._failed_id:
+            # The failed record went through on replay: back to the base delay.
+            self._failed_id = None
+            self._next_retry_delay = self._retry_delay
+        if len(self._window) < _MAX_WINDOW:
+            self._window_room.set()
+        self._unflushed += advanced
+        if self._unflushed >= self._ack_every:
+            await self._flush()
+        elif self._ack_interval > 0 and self._flush_timer is None:
+            self._flush_timer = asyncio.create_task(
+                self._flush_later(), name="notif-consumer-ack-timer"
+            )
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._ack_interval)
+        self._flush_timer = None
+        await self._flush()
+
+    async def _settle(self) -> None:
+        """Wait until every running dispatch has finished."""
+        while self._tasks:
+            await asyncio.wait(set(self._tasks))
+
+    async def _deliver(self, record: dict[str, Any]) -> None:
+        if self._invalidations is not None:
+            self._invalidations.publish_record(record)
+        await self._dispatch(record)
+
+    async def _flush(self) -> None:
+        """Persist and ack the current offset if it moved since the last flush,
+        and delete dispatched records from the inbox."""
+        timer, self._flush_timer = self._flush_timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        # Serialised so concurrent completions never write an older offset
+        # over a newer one.
+        async with self._ack_lock:
+            offset = self._last_acked
+            received_through = self._received_through
+            if received_through > self._received_through_flushed:
+                # A stale value only means relisting a few records next start.
+                try:
+                    await self._store.set_received_through(self._consumer_key, received_through)
+                except Exception:
+                    _log.exception("failed to persist received_through=%d", received_through)
+                else:
+                    self._received_through_flushed = received_through
+            if self._inbox is not None and (self._inbox_done or offset > self._flushed):
+                done = set(self._inbox_done)
+                try:
+                    await self._inbox.delete(self._consumer_key, through_id=offset, ids=done)
+                except Exception:
+                    _log.exception("failed to delete dispatched records from the inbox")
+                else:
+                    self._inbox_done -= done
+            if offset <= 0 or offset <= self._flushed:
+                return
+            self._flushed = offset
+            self._unflushed = 0
+            try:
+                await self._store.set_last_acked(self._consumer_key, offset)
+            except Exception:
+                _log.exception("failed to persist last_acked=%d locally", offset)
+            try:
+                await self._client.request(
+                    self._ack_request_type,
+                    consumer_key=self._consumer_key,
+                    **{self._last_id_key: offset},
+                )
+            except (Disconnected, RequestTimeout, CrawlerError) as exc:
+                _log.warning(
+                    "%s(%d) failed: %s; offset stored locally, will retry on reconnect",
+                    self._ack_request_type,
+                    offset,
+                    exc,
+                )
+
+
+def _series_key(record: dict[str, Any]) -> SeriesKey:
+    """The ordering lane for *record*; records without a series share one lane."""
+    payload = record.get("payload")
+    payload = payload if isinstance(payload, dict) else {}
+    website_key = record.get("website_key") or payload.get("website_key")
+    url_name = record.get("url_name") or payload.get("url_name")
+    if not website_key or not url_name:
+        return None
+    return str(website_key), str(url_name)
+
+
+def _digest_runs(
+    entries: list[tuple[int, dict[str, Any]]],
+) -> dict[int, list[tuple[int, dict[str, Any]]]]:
+    """Runs of two or more chapter records per series, keyed by the run's last id.
+
+    Any other record for the series (a status change) ends its current run.
+    """
+    open_runs: dict[SeriesKey, list[tuple[int, dict[str, Any]]]] = {}
+    runs: dict[int, list[tuple[int, dict[str, Any]]]] = {}
+
+    def _close(key: SeriesKey) -> None:
+        run = open_runs.pop(key, None)
+        if run is not None and len(run) > 1:
+            runs[run[-1][0]] = run
+
+    for rid, record in entries:
+        key = _series_key(record)
+        if key is None:
+            continue
+        payload = record.get("payload")
+        if (
+            isinstance(payload, dict)
+            and payload.get("event") != "status_change"
+            and isinstance(payload.get("chapter"), dict)
+        ):
+            open_runs.setdefault(key, []).append((rid, record))
+        else:
+            _close(key)
+    for key in list(open_runs):
+        _close(key)
+    return runs
+
 
 def _record_id(record: dict[str, Any]) -> int | None:
     raw = record.get("id")
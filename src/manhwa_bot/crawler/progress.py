@@ -22,6 +22,9 @@ _TOP_LEVEL_PROGRESS_KEYS = frozenset(
 
 _CRAWLER_DATA_PROGRESS_KEYS = frozenset({"stage", "message", "severity"})
 
+# Statuses after which the crawler sends no further progress for the request.
+TERMINAL_STATUSES = frozenset({"succeeded", "failed", "completed", "cancelled"})
+
 
 @dataclass(frozen=True, slots=True)
 class CrawlerProgressEvent:
@@ -38,6 +41,10 @@ class CrawlerProgressEvent:
     error_code: str | None = None
     elapsed_ms: int | None = None
 
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
 
 def parse_progress_event(payload: Mapping[str, Any]) -> CrawlerProgressEvent:
     """Parse a crawler ``request_progress`` payload.
@@ -0,0 +1,228 @@
+"""Read-through response cache with in-flight coalescing for idempotent crawler ops.
+
+Shared by every cog through :meth:`CrawlerClient.cached_request`, so a hot key
+(the same series' stored chapters, the supported-websites list, an autocomplete
+query) costs one wire request no matter how many views ask for it at once.
+Entries are keyed on the canonicalized request envelope and bounded by count
+with LRU eviction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from .invalidation import SeriesTag
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How long an op's responses stay fresh, and which requests may be cached."""
+
+    ttl_seconds: float
+    # Field values a request must carry to be cacheable — ``series_data`` is only
+    # idempotent when it reads the crawler's stored copy instead of scraping.
+    required_fields: tuple[tuple[str, object], ...] = ()
+
+    def allows(self, fields: Mapping[str, Any]) -> bool:
+        return all(name in fields and fields[name] == value for name, value in self.required_fields)
+
+
+CACHE_POLICIES: dict[str, CachePolicy] = {
+    # Long-lived: series entries are evicted through the invalidation bus the
+    # moment a new chapter or status change for the series is consumed.
+    "series_data": CachePolicy(1800.0, required_fields=(("allow_live", False),)),
+    "supported_websites": CachePolicy(3600.0),
+    "next_update_check": CachePolicy(30.0),
+    "website_stats": CachePolicy(300.0),
+    "autocomplete": CachePolicy(20.0),
+}
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    entries: int
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    type_: str
+    tag: SeriesTag | None
+    value: dict[str, Any]
+
+
+def cache_key(type_: str, fields: Mapping[str, Any]) -> str:
+    """Canonical key for a request envelope: field order and spacing never matter."""
+    return json.dumps(
+        {"type": type_, **fields},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+class ResponseCache:
+    """Entry-bounded LRU of crawler responses with singleflight loading.
+
+    Not thread-safe — only call from the asyncio event loop. Failed loads are
+    never cached; every caller coalesced onto the failing load sees the error.
+    Entries may carry a series tag so :meth:`invalidate_series` can evict
+    everything cached about one series when a notification for it arrives.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        self._inflight_tags: dict[str, SeriesTag] = {}
+        self._by_series: dict[SeriesTag, set[str]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the fresh cached value for *key*, or ``None`` (no load)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry.expires_at:
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    def put(
+        self,
+        type_: str,
+        key: str,
+        value: dict[str, Any],
+        ttl_seconds: float,
+        *,
+        tag: SeriesTag | None = None,
+    ) -> None:
+        """Store a value fetched outside :meth:`get_or_fetch` (e.g. a batch)."""
+        if ttl_seconds > 0:
+            self._store(key, _Entry(time.monotonic() + ttl_seconds, type_, tag, value))
+
+    async def get_or_fetch(
+        self,
+        type_: str,
+        key: str,
+        loader: Callable[[], Awaitable[dict[str, Any]]],
+        ttl_seconds: float,
+        *,
+        tag: SeriesTag | None = None,
+    ) -> dict[str, Any]:
+        """Return the fresh cached value for *key*, or run *loader* once for all callers."""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            self._misses += 1
+            task = asyncio.create_task(self._load(type_, key, loader, ttl_seconds, tag))
+            self._inflight[key] = task
+            if tag is not None:
+                self._inflight_tags[key] = tag
+            task.add_done_callback(self._forget_inflight(key))
+        else:
+            self._coalesced += 1
+        # Shield so one impatient caller (e.g. an autocomplete budget) cannot
+        # cancel the shared load out from under the others.
+        return await asyncio.shield(task)
+
+    async def _load(
+        self,
+        type_: str,
+        key: str,
+        loader: Callable[[], Awaitable[dict[str, Any]]],
+        ttl_seconds: float,
+        tag: SeriesTag | None,
+    ) -> dict[str, Any]:
+        value = await loader()
+        # An invalidation that raced the load detaches it from ``_inflight``;
+        # its (possibly pre-update) result is returned but never stored.
+        if ttl_seconds > 0 and self._inflight.get(key) is asyncio.current_task():
+            self._store(key, _Entry(time.monotonic() + ttl_seconds, type_, tag, value))
+        return value
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        self._drop(key)
+        self._entries[key] = entry
+        if entry.tag is not None:
+            self._by_series.setdefault(entry.tag, set()).add(key)
+        while len(self._entries) > self._max_entries:
+            self._drop(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None or entry.tag is None:
+            return
+        keys = self._by_series.get(entry.tag)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_series[entry.tag]
+
+    def _forget_inflight(self, key: str) -> Callable[[asyncio.Task[dict[str, Any]]], None]:
+        def _done(task: asyncio.Task[dict[str, Any]]) -> None:
+            if self._inflight.get(key) is task:
+                self._inflight.pop(key, None)
+                self._inflight_tags.pop(key, None)
+            # Mark the exception retrieved even when every waiter went away.
+            if not task.cancelled():
+                task.exception()
+
+        return _done
+
+    def _detach_inflight(self, key: str) -> None:
+        self._inflight.pop(key, None)
+        self._inflight_tags.pop(key, None)
+
+    def invalidate(self, key: str) -> None:
+        """Drop one entry (next call re-fetches)."""
+        self._drop(key)
+        self._detach_inflight(key)
+
+    def invalidate_type(self, type_: str) -> int:
+        """Drop every entry cached for op *type_*; returns the number removed."""
+        stale = [key for key, entry in self._entries.items() if entry.type_ == type_]
+        for key in stale:
+            self._drop(key)
+        return len(stale)
+
+    def invalidate_series(self, website_key: str, url_name: str) -> int:
+        """Drop every entry (and in-flight load) tagged with the series."""
+        tag = (website_key, url_name)
+        stale = list(self._by_series.get(tag, ()))
+        for key in stale:
+            self._drop(key)
+        for key in [key for key, t in self._inflight_tags.items() if t == tag]:
+            self._detach_inflight(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_series.clear()
+
+    def stats(self) -> ResponseCacheStats:
+        return ResponseCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            coalesced=self._coalesced,
+            evictions=self._evictions,
+            entries=len(self._entries),
+        )
@@ -0,0 +1,99 @@
+"""Adaptive per-op request deadlines derived from observed latency.
+
+Only cheap reads adapt: stored-copy reads (``allow_live=False``) and the
+website-less ops in ``_CHEAP_OPS``. Their latency does not depend on which
+website is named, so one p99 per op describes them all. Live scrapes vary by
+orders of magnitude between websites and keep the static timeout, as do
+progress-reporting, partial-streaming and batch requests (the client never
+asks for their class). A cheap read that does not pass ``timeout=`` gets
+``p99 * multiplier``, clamped to ``[floor, ceiling]``. The ceiling is the
+static ``request_timeout_seconds``, so adaptation only ever shortens a
+deadline. Until a class has ``min_samples`` observations it uses the ceiling.
+
+The estimate is rolling: samples go into two fixed histograms that swap every
+``window`` observations, so it reflects the last ``window`` to ``2 * window``
+requests in constant memory. A timeout counts as a sample at the deadline that
+expired, so an op that really got slower raises its own p99 instead of
+timing out forever.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from .metrics import LatencyHistogram, estimate_quantile
+
+_QUANTILE = 0.99
+_MAX_CLASSES = 64
+# Ops that never scrape, whatever their fields.
+_CHEAP_OPS = frozenset({"supported_websites"})
+
+
+def latency_class(type_: str, fields: Mapping[str, Any]) -> str | None:
+    """The estimator key for a cheap read, or ``None`` if the op keeps its static timeout."""
+    if fields.get("allow_live") is False:
+        return f"{type_}:stored"
+    if type_ in _CHEAP_OPS:
+        return type_
+    return None
+
+
+class _RollingEstimate:
+    __slots__ = ("current", "previous", "window")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.current = LatencyHistogram()
+        self.previous = LatencyHistogram()
+
+    def observe(self, seconds: float) -> None:
+        self.current.observe(seconds)
+        if self.current.observed >= self.window:
+            self.previous, self.current = self.current, LatencyHistogram()
+
+    @property
+    def samples(self) -> int:
+        return self.current.observed + self.previous.observed
+
+    def quantile(self, q: float) -> float | None:
+        return estimate_quantile(q, (self.previous, self.current))
+
+
+class AdaptiveTimeouts:
+    """Per-class rolling p99 estimates and the deadlines derived from them."""
+
+    def __init__(
+        self,
+        *,
+        multiplier: float,
+        floor_seconds: float,
+        min_samples: int,
+        window: int = 256,
+    ) -> None:
+        self._multiplier = multiplier
+        self._floor = floor_seconds
+        self._min_samples = min_samples
+        self._window = max(window, min_samples)
+        self._estimates: dict[str, _RollingEstimate] = {}
+
+    def observe(self, key: str, seconds: float) -> None:
+        """Record a reply after *seconds*, or a timeout at the deadline that expired."""
+        estimate = self._estimates.get(key)
+        if estimate is None:
+            if len(self._estimates) >= _MAX_CLASSES:
+                return
+            estimate = self._estimates[key] = _RollingEstimate(self._window)
+        estimate.observe(seconds)
+
+    def timeout_for(self, key: str, ceiling: float) -> float:
+        """The deadline for the next *key* request; *ceiling* until enough samples."""
+        estimate = self._estimates.get(key)
+        if estimate is None or estimate.samples < self._min_samples:
+            return ceiling
+        p99 = estimate.quantile(_QUANTILE) or 0.0
+        return min(ceiling, max(self._floor, p99 * self._multiplier))
+
+    def snapshot(self, ceiling: float) -> dict[str, float]:
+        """Current deadline per class against *ceiling*, for diagnostics."""
+        return {key: self.timeout_for(key, ceiling) for key in sorted(self._estimates)}
@@ -36,8 +36,8 @@ def series_url_from_maybe_chapter_url(url: str) -> str:
 async def detect_website_key(bot: Any, url: str) -> str | None:
     """Return the website_key whose ``base_url`` host matches *url*'s host.
 
-    Reads from ``bot.websites_cache`` (populated via the crawler
-    ``supported_websites`` request). Returns ``None`` when no match is found
+    Reads the crawler ``supported_websites`` response through the client's
+    shared response cache. Returns ``None`` when no match is found
     or the cache cannot be loaded.
     """
     if not url or "://" not in url:
@@ -52,13 +52,10 @@ async def detect_website_key(bot: Any, url: str) -> str | None:
         return None
 
     try:
-        ttl = bot.config.supported_websites_cache.ttl_seconds
-
-        async def _loader() -> list[dict]:
-            data = await bot.crawler.request("supported_websites")
-            return data.get("websites") or []
-
-        websites: list[dict] = await bot.websites_cache.get_or_set("websites_full", _loader, ttl)
+        data = await bot.crawler.cached_request(
+            "supported_websites", ttl=bot.config.supported_websites_cache.ttl_seconds
+        )
+        websites: list[dict] = data.get("websites") or []
     except Exception:
         return None
 
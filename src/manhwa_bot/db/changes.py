@@ -0,0 +1,45 @@
+"""Write notifications for tables that in-memory indexes mirror.
+
+Stores publish ``(table, key)`` right after a write: ``key`` names the rows
+touched (a guild id, a user id, a ``(website_key, url_name)`` pair), or is
+``None`` when the write may have touched any row of the table. Subscribers,
+such as the notification routing index, mark what they hold for that key as
+stale and reload it before they next answer.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Hashable
+
+_log = logging.getLogger(__name__)
+
+ChangeListener = Callable[[str, Hashable | None], None]
+
+
+class ChangeFeed:
+    """Synchronous fan-out of table writes to registered listeners.
+
+    Listeners run inline on the event loop and must not block; one failing
+    listener never prevents the others from hearing about the write.
+    """
+
+    def __init__(self) -> None:
+        self._listeners: list[ChangeListener] = []
+
+    def subscribe(self, listener: ChangeListener) -> Callable[[], None]:
+        """Register *listener*; returns a callable that unregisters it."""
+        self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _unsubscribe
+
+    def publish(self, table: str, key: Hashable | None = None) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(table, key)
+            except Exception:
+                _log.exception("change listener failed for %s %r", table, key)
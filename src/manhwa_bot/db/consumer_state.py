@@ -27,3 +27,22 @@ class ConsumerStateStore:
             """,
             (consumer_key, notification_id),
         )
+
+    async def get_received_through(self, consumer_key: str) -> int:
+        row = await self._pool.fetchone(
+            "SELECT received_through_notification FROM consumer_state WHERE consumer_key = ?",
+            (consumer_key,),
+        )
+        return row["received_through_notification"] if row else 0
+
+    async def set_received_through(self, consumer_key: str, notification_id: int) -> None:
+        await self._pool.execute(
+            """
+            INSERT INTO consumer_state (consumer_key, received_through_notification)
+            VALUES (?, ?)
+            ON CONFLICT(consumer_key) DO UPDATE SET
+              received_through_notification = excluded.received_through_notification,
+              updated_at                    = CURRENT_TIMESTAMP
+            """,
+            (consumer_key, notification_id),
+        )
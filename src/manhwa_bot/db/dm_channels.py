@@ -0,0 +1,44 @@
+"""Store for the dm_channels table."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from .pool import DbPool
+
+# Ids per IN (...) list; keeps bound parameters well under SQLite's limit.
+_CHUNK = 500
+
+
+class DmChannelStore:
+    def __init__(self, pool: DbPool) -> None:
+        self._pool = pool
+
+    async def get_many(self, user_ids: Iterable[int]) -> dict[int, int]:
+        """``user_id -> channel_id`` for each of *user_ids* with a known DM channel."""
+        ids = sorted({int(uid) for uid in user_ids})
+        found: dict[int, int] = {}
+        for start in range(0, len(ids), _CHUNK):
+            chunk = ids[start : start + _CHUNK]
+            rows = await self._pool.fetchall(
+                "SELECT user_id, channel_id FROM dm_channels WHERE user_id IN ("
+                + ", ".join("?" * len(chunk))
+                + ")",
+                tuple(chunk),
+            )
+            found.update((int(r["user_id"]), int(r["channel_id"])) for r in rows)
+        return found
+
+    async def set(self, user_id: int, channel_id: int) -> None:
+        await self._pool.execute(
+            """
+            INSERT INTO dm_channels (user_id, channel_id) VALUES (?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+              channel_id = excluded.channel_id,
+              updated_at = CURRENT_TIMESTAMP
+            """,
+            (user_id, channel_id),
+        )
+
+    async def delete(self, user_id: int) -> None:
+        await self._pool.execute("DELETE FROM dm_channels WHERE user_id = ?", (user_id,))
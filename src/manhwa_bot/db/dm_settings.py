@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -14,6 +14,9 @@ from .guild_settings import (
 )
 from .pool import DbPool
 
+# Ids per IN (...) list; keeps bound parameters well under SQLite's limit.
+_CHUNK = 500
+
 
 @dataclass(frozen=True)
 class DmSettings:
@@ -44,6 +47,25 @@ class DmSettingsStore:
         row = await self._pool.fetchone("SELECT * FROM dm_settings WHERE user_id = ?", (user_id,))
         return _row_to_dm_settings(row) if row else None
 
+    async def get_many(self, user_ids: Sequence[int]) -> dict[int, DmSettings]:
+        """Settings for each of *user_ids* that has a row; users without one are absent."""
+        ids = list(dict.fromkeys(int(uid) for uid in user_ids))
+        found: dict[int, DmSettings] = {}
+        for start in range(0, len(ids), _CHUNK):
+            chunk = ids[start : start + _CHUNK]
+            rows = await self._pool.fetchall(
+                "SELECT * FROM dm_settings WHERE user_id IN (" + ", ".join("?" * len(chunk)) + ")",
+                tuple(chunk),
+            )
+            for row in rows:
+                settings = _row_to_dm_settings(row)
+                found[settings.user_id] = settings
+        return found
+
+    async def list_all(self) -> list[DmSettings]:
+        rows = await self._pool.fetchall("SELECT * FROM dm_settings")
+        return [_row_to_dm_settings(r) for r in rows]
+
     async def upsert(self, settings: DmSettings) -> None:
         await self._pool.execute(
             """
@@ -66,6 +88,7 @@ class DmSettingsStore:
                 _clean_nsfw_mode(settings.nsfw_spoiler_mode),
             ),
         )
+        self._pool.changes.publish("dm_settings", settings.user_id)
 
     async def set_nsfw_spoiler_mode(self, user_id: int, mode: str) -> None:
         await self._pool.execute(
@@ -78,6 +101,7 @@ class DmSettingsStore:
             """,
             (user_id, _clean_nsfw_mode(mode)),
         )
+        self._pool.changes.publish("dm_settings", user_id)
 
     async def set_notifications_enabled(self, user_id: int, enabled: bool) -> None:
         await self._pool.execute(
@@ -90,6 +114,7 @@ class DmSettingsStore:
             """,
             (user_id, int(enabled)),
         )
+        self._pool.changes.publish("dm_settings", user_id)
 
     async def set_paid_chapter_notifs(self, user_id: int, enabled: bool) -> None:
         await self._pool.execute(
@@ -102,6 +127,7 @@ class DmSettingsStore:
             """,
             (user_id, int(enabled)),
         )
+        self._pool.changes.publish("dm_settings", user_id)
 
     async def set_update_buttons(self, user_id: int, keys: Iterable[str]) -> None:
         encoded = _serialize_update_buttons(keys)
@@ -115,3 +141,4 @@ class DmSettingsStore:
             """,
             (user_id, encoded),
         )
+        self._pool.changes.publish("dm_settings", user_id)
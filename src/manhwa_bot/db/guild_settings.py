@@ -113,6 +113,7 @@ class GuildSettingsStore:
                 _clean_nsfw_mode(settings.nsfw_spoiler_mode),
             ),
         )
+        self._pool.changes.publish("guild_settings", settings.guild_id)
 
     async def set_nsfw_spoiler_mode(self, guild_id: int, mode: str) -> None:
         await self._pool.execute(
@@ -125,6 +126,7 @@ class GuildSettingsStore:
             """,
             (guild_id, _clean_nsfw_mode(mode)),
         )
+        self._pool.changes.publish("guild_settings", guild_id)
 
     async def set_notifications_channel(self, guild_id: int, channel_id: int | None) -> None:
         await self._pool.execute(
@@ -137,6 +139,7 @@ class GuildSettingsStore:
             """,
             (guild_id, channel_id),
         )
+        self._pool.changes.publish("guild_settings", guild_id)
 
     async def set_system_alerts_channel(self, guild_id: int, channel_id: int | None) -> None:
         await self._pool.execute(
@@ -149,6 +152,7 @@ class GuildSettingsStore:
             """,
             (guild_id, channel_id),
         )
+        self._pool.changes.publish("guild_settings", guild_id)
 
     async def set_default_ping_role(self, guild_id: int, role_id: int | None) -> None:
         await self._pool.execute(
@@ -161,6 +165,7 @@ class GuildSettingsStore:
             """,
             (guild_id, role_id),
         )
+        self._pool.changes.publish("guild_settings", guild_id)
 
     async def set_bot_manager_role(self, guild_id: int, role_id: int | None) -> None:
         await self._pool.execute(
@@ -173,6 +178,7 @@ class GuildSettingsStore:
             """,
             (guild_id, role_id),
         )
+        self._pool.changes.publish("guild_settings", guild_id)
 
     async def set_paid_chapter_notifs(self, guild_id: int, enabled: bool) -> None:
         await self._pool.execute(
@@ -185,6 +191,7 @@ class GuildSettingsStore:
             """,
             (guild_id, int(enabled)),
         )
+        self._pool.changes.publish("guild_settings", guild_id)
 
     async def set_auto_create_role(self, guild_id: int, enabled: bool) -> None:
         await self._pool.execute(
@@ -197,6 +204,7 @@ class GuildSettingsStore:
             """,
             (guild_id, int(enabled)),
         )
+        self._pool.changes.publish("guild_settings", guild_id)
 
     async def set_update_buttons(self, guild_id: int, keys: Iterable[str]) -> None:
         encoded = _serialize_update_buttons(keys)
@@ -210,6 +218,7 @@ class GuildSettingsStore:
             """,
             (guild_id, encoded),
         )
+        self._pool.changes.publish("guild_settings", guild_id)
 
     async def set_scanlator_channel(self, guild_id: int, website_key: str, channel_id: int) -> None:
         # Ensure guild_settings row exists so FK is satisfied.
@@ -224,12 +233,14 @@ class GuildSettingsStore:
             """,
             (guild_id, website_key, channel_id),
         )
+        self._pool.changes.publish("guild_settings", guild_id)
 
     async def clear_scanlator_channel(self, guild_id: int, website_key: str) -> None:
         await self._pool.execute(
             "DELETE FROM guild_scanlator_channels WHERE guild_id = ? AND website_key = ?",
             (guild_id, website_key),
         )
+        self._pool.changes.publish("guild_settings", guild_id)
 
     async def list_scanlator_channels(self, guild_id: int) -> list[dict]:
         rows = await self._pool.fetchall(
@@ -237,6 +248,14 @@ class GuildSettingsStore:
         )
         return [dict(r) for r in rows]
 
+    async def list_all(self) -> list[GuildSettings]:
+        rows = await self._pool.fetchall("SELECT * FROM guild_settings")
+        return [_row_to_settings(r) for r in rows]
+
+    async def list_all_scanlator_channels(self) -> list[dict]:
+        rows = await self._pool.fetchall("SELECT * FROM guild_scanlator_channels")
+        return [dict(r) for r in rows]
+
     async def list_with_system_alerts(self) -> list[GuildSettings]:
         """Return guild settings rows that have a system-alerts channel configured."""
         rows = await self._pool.fetchall(
@@ -0,0 +1,7 @@
+CREATE TABLE notification_inbox (
+  consumer_key    TEXT NOT NULL,
+  notification_id INTEGER NOT NULL,
+  record          TEXT NOT NULL,
+  received_at     TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (consumer_key, notification_id)
+) WITHOUT ROWID;
@@ -0,0 +1,12 @@
+-- Targets a notification record has already been delivered to, so a replayed
+-- record (after a failed or interrupted fan-out) only reaches the ones it missed.
+-- Rows are pruned by age, since they are only needed until the record is acked.
+CREATE TABLE notification_deliveries (
+  record_id    INTEGER NOT NULL,
+  target_kind  TEXT NOT NULL CHECK (target_kind IN ('guild','dm')),
+  target_id    INTEGER NOT NULL,
+  delivered_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (record_id, target_kind, target_id)
+) WITHOUT ROWID;
+
+CREATE INDEX idx_notification_deliveries_age ON notification_deliveries(delivered_at);
@@ -0,0 +1,8 @@
+-- DM channel id per user, learned from the first DM that went through, so later
+-- DMs post to the channel directly instead of fetching the user and reopening it.
+-- A row is dropped when a send to its channel is refused (403) or not found (404).
+CREATE TABLE dm_channels (
+  user_id    INTEGER PRIMARY KEY,
+  channel_id INTEGER NOT NULL,
+  updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
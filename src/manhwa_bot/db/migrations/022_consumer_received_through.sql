@@ -0,0 +1,5 @@
+-- Contiguous receive watermark for the durable notification inbox: every record
+-- with an id at or below it is either acked or stored in notification_inbox.
+-- Only catch-up pages (and live pushes once caught up) advance it, so a live push
+-- stored mid-catch-up never makes the next catch-up skip the records before it.
+ALTER TABLE consumer_state ADD COLUMN received_through_notification INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,51 @@
+"""Store for the notification_deliveries table.
+
+A ledger of ``(record_id, target_kind, target_id)`` triples: which guilds and
+DM users a crawler notification record has already reached. The updates cog
+reads it before a fan-out so a replayed record skips those targets, writes it
+in small bulk batches as sends succeed, and prunes it by age.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from .pool import DbPool
+
+# Rows per statement; keeps bound parameters well under SQLite's limit.
+_CHUNK = 200
+
+
+class NotificationDeliveryStore:
+    def __init__(self, pool: DbPool) -> None:
+        self._pool = pool
+
+    async def delivered_targets(self, record_id: int) -> set[tuple[str, int]]:
+        """Every ``(target_kind, target_id)`` already delivered for *record_id*."""
+        rows = await self._pool.fetchall(
+            "SELECT target_kind, target_id FROM notification_deliveries WHERE record_id = ?",
+            (int(record_id),),
+        )
+        return {(str(row["target_kind"]), int(row["target_id"])) for row in rows}
+
+    async def record(self, record_id: int, targets: Sequence[tuple[str, int]]) -> None:
+        """Mark ``(target_kind, target_id)`` pairs delivered; duplicates are ignored."""
+        for start in range(0, len(targets), _CHUNK):
+            chunk = targets[start : start + _CHUNK]
+            params: list[object] = []
+            for kind, target_id in chunk:
+                params += [int(record_id), kind, int(target_id)]
+            await self._pool.execute(
+                "INSERT OR IGNORE INTO notification_deliveries "
+                "(record_id, target_kind, target_id) VALUES "
+                + ", ".join(["(?, ?, ?)"] * len(chunk)),
+                tuple(params),
+            )
+
+    async def prune(self, max_age_seconds: int) -> int:
+        """Delete entries older than *max_age_seconds*; returns how many went."""
+        cursor = await self._pool.execute(
+            "DELETE FROM notification_deliveries WHERE delivered_at < datetime('now', ?)",
+            (f"-{int(max_age_seconds)} seconds",),
+        )
+        return cursor.rowcount  # type: ignore[return-value]
@@ -0,0 +1,98 @@
+"""Store for the notification_inbox table.
+
+A durable queue of crawler records that a consumer has received but not yet
+finished dispatching. Rows are appended in bulk as pushes and catch-up pages
+arrive, and deleted in bulk once dispatched. Each write is one statement, so
+it is atomic without holding an explicit transaction on the shared connection.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from .pool import DbPool
+
+# Rows per statement; keeps bound parameters well under SQLite's limit.
+_CHUNK = 200
+
+
+class NotificationInboxStore:
+    def __init__(self, pool: DbPool) -> None:
+        self._pool = pool
+
+    async def append(
+        self, consumer_key: str, records: Sequence[tuple[int, dict[str, Any]]]
+    ) -> None:
+        """Store ``(notification_id, record)`` pairs; ids already present are kept as-is."""
+        for start in range(0, len(records), _CHUNK):
+            chunk = records[start : start + _CHUNK]
+            params: list[Any] = []
+            for notification_id, record in chunk:
+                params += [consumer_key, int(notification_id), json.dumps(record)]
+            await self._pool.execute(
+                "INSERT OR IGNORE INTO notification_inbox "
+                "(consumer_key, notification_id, record) VALUES "
+                + ", ".join(["(?, ?, ?)"] * len(chunk)),
+                tuple(params),
+            )
+
+    async def pending(
+        self,
+        consumer_key: str,
+        *,
+        after_id: int = 0,
+        through_id: int | None = None,
+        limit: int = 500,
+    ) -> list[dict[str, Any]]:
+        """Up to *limit* stored records with an id above *after_id* (and at most
+        *through_id*, if given), in id order."""
+        rows = await self._pool.fetchall(
+            """
+            SELECT record FROM notification_inbox
+            WHERE consumer_key = ? AND notification_id > ? AND notification_id <= ?
+            ORDER BY notification_id
+            LIMIT ?
+            """,
+            (
+                consumer_key,
+                int(after_id),
+                int(through_id) if through_id is not None else 2**63 - 1,
+                int(limit),
+            ),
+        )
+        return [json.loads(row["record"]) for row in rows]
+
+    async def max_id(self, consumer_key: str) -> int:
+        row = await self._pool.fetchone(
+            "SELECT MAX(notification_id) AS max_id FROM notification_inbox WHERE consumer_key = ?",
+            (consumer_key,),
+        )
+        return int(row["max_id"] or 0) if row else 0
+
+    async def count(self, consumer_key: str) -> int:
+        row = await self._pool.fetchone(
+            "SELECT COUNT(*) AS n FROM notification_inbox WHERE consumer_key = ?",
+            (consumer_key,),
+        )
+        return int(row["n"]) if row else 0
+
+    async def delete(
+        self, consumer_key: str, *, through_id: int = 0, ids: Iterable[int] = ()
+    ) -> None:
+        """Delete every row up to *through_id*, plus the listed *ids*."""
+        extra = sorted({int(i) for i in ids if int(i) > through_id})
+        if through_id > 0:
+            await self._pool.execute(
+                "DELETE FROM notification_inbox WHERE consumer_key = ? AND notification_id <= ?",
+                (consumer_key, int(through_id)),
+            )
+        for start in range(0, len(extra), _CHUNK):
+            chunk = extra[start : start + _CHUNK]
+            await self._pool.execute(
+                "DELETE FROM notification_inbox WHERE consumer_key = ? AND notification_id IN ("
+                + ", ".join("?" * len(chunk))
+                + ")",
+                (consumer_key, *chunk),
+            )
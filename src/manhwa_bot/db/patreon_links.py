@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
 from .pool import DbPool
 
+# Ids per IN (...) list; keeps bound parameters well under SQLite's limit.
+_CHUNK = 500
+
 
 @dataclass(frozen=True)
 class PatreonLink:
@@ -70,6 +74,21 @@ class PatreonLinkStore:
         )
         return row is not None
 
+    async def active_among(self, discord_user_ids: Iterable[int]) -> set[int]:
+        """The subset of *discord_user_ids* with an unexpired link."""
+        ids = sorted({int(i) for i in discord_user_ids})
+        active: set[int] = set()
+        for start in range(0, len(ids), _CHUNK):
+            chunk = ids[start : start + _CHUNK]
+            rows = await self._pool.fetchall(
+                "SELECT discord_user_id FROM patreon_links WHERE discord_user_id IN ("
+                + ", ".join("?" * len(chunk))
+                + ") AND expires_at > datetime('now')",
+                tuple(chunk),
+            )
+            active.update(int(r["discord_user_id"]) for r in rows)
+        return active
+
     async def delete(self, discord_user_id: int) -> None:
         await self._pool.execute(
             "DELETE FROM patreon_links WHERE discord_user_id = ?", (discord_user_id,)
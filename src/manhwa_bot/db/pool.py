@@ -8,12 +8,16 @@ from typing import Any
 
 import aiosqlite
 
+from .changes import ChangeFeed
+
 
 class DbPool:
     """Manages a single aiosqlite connection with WAL + FK pragmas applied."""
 
     def __init__(self, conn: aiosqlite.Connection) -> None:
         self._conn = conn
+        # Stores announce writes here so in-memory mirrors can stay coherent.
+        self.changes = ChangeFeed()
 
     @classmethod
     async def open(cls, path: str) -> DbPool:
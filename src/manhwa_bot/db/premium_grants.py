@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
 from .pool import DbPool
 
 _ACTIVE_FILTER = "revoked_at IS NULL AND (expires_at IS NULL OR expires_at > datetime('now'))"
+# Ids per IN (...) list; keeps bound parameters well under SQLite's limit.
+_CHUNK = 500
 
 
 @dataclass(frozen=True)
@@ -97,6 +100,20 @@ class PremiumGrantStore:
         )
         return _row_to_grant(row) if row else None
 
+    async def active_targets(self, scope: str, target_ids: Iterable[int]) -> set[int]:
+        """The subset of *target_ids* holding an active grant in *scope*."""
+        ids = sorted({int(i) for i in target_ids})
+        active: set[int] = set()
+        for start in range(0, len(ids), _CHUNK):
+            chunk = ids[start : start + _CHUNK]
+            rows = await self._pool.fetchall(
+                f"SELECT DISTINCT target_id FROM premium_grants WHERE scope = ? AND target_id IN "
+                f"({', '.join('?' * len(chunk))}) AND {_ACTIVE_FILTER}",
+                (scope, *chunk),
+            )
+            active.update(int(r["target_id"]) for r in rows)
+        return active
+
     async def sweep_expired(self) -> int:
         cursor = await self._pool.execute(
             """
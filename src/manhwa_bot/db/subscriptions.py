@@ -17,6 +17,7 @@ class SubscriptionStore:
             """,
             (user_id, guild_id, website_key, url_name),
         )
+        self._pool.changes.publish("subscriptions", (website_key, url_name))
 
     async def unsubscribe(
         self, user_id: int, guild_id: int, website_key: str, url_name: str
@@ -28,6 +29,7 @@ class SubscriptionStore:
             """,
             (user_id, guild_id, website_key, url_name),
         )
+        self._pool.changes.publish("subscriptions", (website_key, url_name))
 
     async def unsubscribe_all_for_user(self, user_id: int, *, guild_id: int | None = None) -> None:
         if guild_id is not None:
@@ -40,12 +42,14 @@ class SubscriptionStore:
                 "DELETE FROM subscriptions WHERE user_id = ?",
                 (user_id,),
             )
+        self._pool.changes.publish("subscriptions")
 
     async def unsubscribe_all_for_series(self, website_key: str, url_name: str) -> None:
         await self._pool.execute(
             "DELETE FROM subscriptions WHERE website_key = ? AND url_name = ?",
             (website_key, url_name),
         )
+        self._pool.changes.publish("subscriptions", (website_key, url_name))
 
     async def list_for_user(
         self,
@@ -113,6 +117,13 @@ class SubscriptionStore:
             )
         return [r["user_id"] for r in rows]
 
+    async def list_all_subscriptions(self) -> list[dict]:
+        """Every distinct (user_id, website_key, url_name) subscription."""
+        rows = await self._pool.fetchall(
+            "SELECT DISTINCT user_id, website_key, url_name FROM subscriptions"
+        )
+        return [dict(r) for r in rows]
+
     async def is_subscribed(
         self, user_id: int, guild_id: int, website_key: str, url_name: str
     ) -> bool:
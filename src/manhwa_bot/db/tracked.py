@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from .guild_settings import _VALID_UPDATE_BUTTONS, _clean_nsfw_mode, _parse_update_buttons
 from .pool import DbPool
 
 
@@ -40,6 +41,23 @@ class GuildTrackedSeries:
     is_nsfw: bool | None = None
 
 
+@dataclass(frozen=True)
+class GuildFanoutRow:
+    """One tracking guild's delivery settings for a series, defaults applied.
+
+    ``channel_id`` is the guild's scanlator channel for the series' website if
+    it set one, else its notifications channel (None when it has neither).
+    """
+
+    guild_id: int
+    channel_id: int | None
+    ping_role_id: int | None
+    default_ping_role_id: int | None
+    paid_chapter_notifs: bool
+    update_buttons: frozenset[str]
+    nsfw_spoiler_mode: str
+
+
 def _as_bool(value: Any) -> bool | None:
     return None if value is None else bool(value)
 
@@ -78,6 +96,29 @@ def _row_to_guild_tracked(row: Any) -> GuildTrackedSeries:
     )
 
 
+def _row_to_fanout(row: Any) -> GuildFanoutRow:
+    # A guild that never saved settings gets the guild_settings column defaults.
+    if not row["has_settings"]:
+        return GuildFanoutRow(
+            guild_id=row["guild_id"],
+            channel_id=row["channel_id"],
+            ping_role_id=row["ping_role_id"],
+            default_ping_role_id=None,
+            paid_chapter_notifs=True,
+            update_buttons=_VALID_UPDATE_BUTTONS,
+            nsfw_spoiler_mode="always",
+        )
+    return GuildFanoutRow(
+        guild_id=row["guild_id"],
+        channel_id=row["channel_id"],
+        ping_role_id=row["ping_role_id"],
+        default_ping_role_id=row["default_ping_role_id"],
+        paid_chapter_notifs=bool(row["paid_chapter_notifs"]),
+        update_buttons=_parse_update_buttons(row["update_buttons"]),
+        nsfw_spoiler_mode=_clean_nsfw_mode(row["nsfw_spoiler_mode"]),
+    )
+
+
 def _optional(row: Any, key: str) -> Any:
     try:
         return row[key]
@@ -168,6 +209,7 @@ class TrackedStore:
             """,
             (guild_id, website_key, url_name, ping_role_id),
         )
+        self._pool.changes.publish("tracked_in_guild", (website_key, url_name))
 
     async def update_ping_role(
         self,
@@ -183,6 +225,7 @@ class TrackedStore:
             """,
             (ping_role_id, guild_id, website_key, url_name),
         )
+        self._pool.changes.publish("tracked_in_guild", (website_key, url_name))
 
     async def remove_from_guild(
         self, guild_id: int, website_key: str, url_name: str
@@ -192,6 +235,7 @@ class TrackedStore:
             "DELETE FROM tracked_in_guild WHERE guild_id = ? AND website_key = ? AND url_name = ?",
             (guild_id, website_key, url_name),
         )
+        self._pool.changes.publish("tracked_in_guild", (website_key, url_name))
         row = await self._pool.fetchone(
             "SELECT COUNT(*) AS cnt FROM tracked_in_guild WHERE website_key = ? AND url_name = ?",
             (website_key, url_name),
@@ -204,6 +248,8 @@ class TrackedStore:
             "DELETE FROM tracked_series WHERE website_key = ? AND url_name = ?",
             (website_key, url_name),
         )
+        # Cascades to the series' tracked_in_guild rows.
+        self._pool.changes.publish("tracked_in_guild", (website_key, url_name))
 
     async def list_for_guild(
         self, guild_id: int, *, limit: int | None = None, offset: int = 0
@@ -272,6 +318,37 @@ class TrackedStore:
         )
         return [_row_to_guild_tracked(r) for r in rows]
 
+    async def resolve_fanout(self, website_key: str, url_name: str) -> list[GuildFanoutRow]:
+        """Every guild tracking the series with its delivery settings, in one query."""
+        rows = await self._pool.fetchall(
+            """
+            SELECT
+              tig.guild_id,
+              tig.ping_role_id,
+              COALESCE(gsc.channel_id, gs.notifications_channel_id) AS channel_id,
+              gs.guild_id IS NOT NULL AS has_settings,
+              gs.default_ping_role_id,
+              gs.paid_chapter_notifs,
+              gs.update_buttons,
+              gs.nsfw_spoiler_mode
+            FROM tracked_in_guild tig
+            JOIN tracked_series ts USING (website_key, url_name)
+            LEFT JOIN guild_settings gs ON gs.guild_id = tig.guild_id
+            LEFT JOIN guild_scanlator_channels gsc
+              ON gsc.guild_id = tig.guild_id AND gsc.website_key = tig.website_key
+            WHERE tig.website_key = ? AND tig.url_name = ?
+            """,
+            (website_key, url_name),
+        )
+        return [_row_to_fanout(r) for r in rows]
+
+    async def list_all_guild_tracking(self) -> list[dict[str, Any]]:
+        """Every tracked_in_guild row: guild_id, website_key, url_name, ping_role_id."""
+        rows = await self._pool.fetchall(
+            "SELECT guild_id, website_key, url_name, ping_role_id FROM tracked_in_guild"
+        )
+        return [dict(r) for r in rows]
+
     async def count_for_guild(self, guild_id: int) -> int:
         row = await self._pool.fetchone(
             "SELECT COUNT(*) AS cnt FROM tracked_in_guild WHERE guild_id = ?",
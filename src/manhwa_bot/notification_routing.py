@@ -0,0 +1,310 @@
+"""In-memory routing index for notification fan-out.
+
+For every series the index holds the fully resolved delivery targets: each
+tracking guild with its effective channel, ping roles and display settings,
+and each DM subscriber with their DM settings. Dispatch asks
+:meth:`NotificationRoutingIndex.resolve` instead of querying the tracking,
+subscription and settings tables per notification and per recipient.
+
+The index is bulk-loaded once and kept coherent through
+:attr:`DbPool.changes <manhwa_bot.db.pool.DbPool.changes>`: every store write
+to a mirrored table marks the affected series, guild or user stale, and the
+next ``resolve`` reloads just those keys before answering.
+
+:class:`FanoutQueryRouting` answers the same question straight from the
+database instead, with a fixed number of set-based queries per series (one
+joined query for the guilds, two for the DM subscribers) however many
+targets it has; it is used when ``notifications.routing_index`` is off.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from .db.dm_settings import DmSettings, DmSettingsStore
+from .db.guild_settings import GuildSettings, GuildSettingsStore
+from .db.pool import DbPool
+from .db.subscriptions import SubscriptionStore
+from .db.tracked import GuildFanoutRow, TrackedStore
+from .ui.components.notification_buttons import ALL_UPDATE_BUTTONS
+
+_log = logging.getLogger(__name__)
+
+SeriesKey = tuple[str, str]
+
+_TABLES = ("tracked_in_guild", "subscriptions", "guild_settings", "dm_settings")
+
+
+@dataclass(frozen=True)
+class GuildRoute:
+    """One tracking guild's resolved delivery settings for a series.
+
+    Carries both ``ping_role_id`` and ``default_ping_role_id``, so it can stand
+    in for the tracking row and the guild settings wherever dispatch wants them.
+    """
+
+    guild_id: int
+    channel_id: int | None
+    ping_role_id: int | None
+    default_ping_role_id: int | None
+    paid_chapter_notifs: bool = True
+    update_buttons: frozenset[str] = ALL_UPDATE_BUTTONS
+    nsfw_spoiler_mode: str = "always"
+
+
+@dataclass(frozen=True)
+class DmRoute:
+    """One DM subscriber's resolved delivery settings."""
+
+    user_id: int
+    notifications_enabled: bool = True
+    paid_chapter_notifs: bool = True
+    update_buttons: frozenset[str] = ALL_UPDATE_BUTTONS
+    nsfw_spoiler_mode: str = "always"
+
+
+@dataclass(frozen=True)
+class SeriesRoutes:
+    guilds: tuple[GuildRoute, ...] = ()
+    users: tuple[DmRoute, ...] = ()
+
+
+class NotificationRoutingIndex:
+    """Series -> resolved guild and DM targets, mirrored from SQLite."""
+
+    def __init__(self, pool: DbPool) -> None:
+        self._tracked = TrackedStore(pool)
+        self._subs = SubscriptionStore(pool)
+        self._guild_store = GuildSettingsStore(pool)
+        self._dm_store = DmSettingsStore(pool)
+        self._lock = asyncio.Lock()
+        self._loaded = False
+        # series -> {guild_id: per-series ping role}, plus the reverse map.
+        self._tracking: dict[SeriesKey, dict[int, int | None]] = {}
+        self._guild_series: dict[int, set[SeriesKey]] = {}
+        # series -> subscribed user ids (insertion-ordered), plus the reverse map.
+        self._subscribers: dict[SeriesKey, dict[int, None]] = {}
+        self._user_series: dict[int, set[SeriesKey]] = {}
+        self._guild_settings: dict[int, GuildSettings] = {}
+        # guild_id -> {website_key: channel_id} scanlator overrides.
+        self._scanlator_channels: dict[int, dict[str, int]] = {}
+        self._dm_settings: dict[int, DmSettings] = {}
+        self._routes: dict[SeriesKey, SeriesRoutes] = {}
+        # Keys written since the last refresh, and tables written wholesale.
+        self._dirty: dict[str, set[Any]] = {table: set() for table in _TABLES}
+        self._dirty_tables: set[str] = set()
+        # Subscribe before loading so writes racing the initial load are replayed.
+        self._unsubscribe = pool.changes.subscribe(self._on_change)
+
+    def close(self) -> None:
+        self._unsubscribe()
+
+    def _on_change(self, table: str, key: Hashable | None) -> None:
+        if table not in self._dirty:
+            return
+        if key is None:
+            self._dirty_tables.add(table)
+        else:
+            self._dirty[table].add(key)
+
+    async def load(self) -> None:
+        """(Re)build the whole index from the database."""
+        async with self._lock:
+            await self._load_tables(set(_TABLES))
+            self._loaded = True
+
+    async def resolve(self, website_key: str, url_name: str) -> SeriesRoutes:
+        """The current delivery targets for one series."""
+        key = (website_key, url_name)
+        async with self._lock:
+            if not self._loaded:
+                await self._load_tables(set(_TABLES))
+                self._loaded = True
+            else:
+                await self._refresh()
+            routes = self._routes.get(key)
+            if routes is None:
+                routes = self._build(key)
+                self._routes[key] = routes
+            return routes
+
+    async def _load_tables(self, tables: set[str]) -> None:
+        # Clear before reading: writes landing mid-load stay dirty for next time.
+        for table in tables:
+            self._dirty[table].clear()
+        self._dirty_tables -= tables
+        if "tracked_in_guild" in tables:
+            self._tracking.clear()
+            self._guild_series.clear()
+            for row in await self._tracked.list_all_guild_tracking():
+                series = (str(row["website_key"]), str(row["url_name"]))
+                guild_id = int(row["guild_id"])
+                self._tracking.setdefault(series, {})[guild_id] = row["ping_role_id"]
+                self._guild_series.setdefault(guild_id, set()).add(series)
+        if "subscriptions" in tables:
+            self._subscribers.clear()
+            self._user_series.clear()
+            for row in await self._subs.list_all_subscriptions():
+                series = (str(row["website_key"]), str(row["url_name"]))
+                user_id = int(row["user_id"])
+                self._subscribers.setdefault(series, {})[user_id] = None
+                self._user_series.setdefault(user_id, set()).add(series)
+        if "guild_settings" in tables:
+            self._guild_settings = {s.guild_id: s for s in await self._guild_store.list_all()}
+            self._scanlator_channels.clear()
+            for row in await self._guild_store.list_all_scanlator_channels():
+                self._scanlator_channels.setdefault(int(row["guild_id"]), {})[
+                    str(row["website_key"])
+                ] = int(row["channel_id"])
+        if "dm_settings" in tables:
+            self._dm_settings = {s.user_id: s for s in await self._dm_store.list_all()}
+        self._routes.clear()
+
+    async def _refresh(self) -> None:
+        if self._dirty_tables:
+            await self._load_tables(set(self._dirty_tables))
+        for series in _drain(self._dirty["tracked_in_guild"]):
+            await self._reload_tracking(series)
+        for series in _drain(self._dirty["subscriptions"]):
+            await self._reload_subscribers(series)
+        for guild_id in _drain(self._dirty["guild_settings"]):
+            await self._reload_guild(int(guild_id))
+        dirty_users = [int(uid) for uid in _drain(self._dirty["dm_settings"])]
+        if dirty_users:
+            await self._reload_users(dirty_users)
+
+    async def _reload_tracking(self, series: SeriesKey) -> None:
+        for guild_id in self._tracking.pop(series, {}):
+            self._guild_series.get(guild_id, set()).discard(series)
+        rows = await self._tracked.list_guilds_tracking(*series)
+        if rows:
+            self._tracking[series] = {row.guild_id: row.ping_role_id for row in rows}
+            for row in rows:
+                self._guild_series.setdefault(row.guild_id, set()).add(series)
+        self._routes.pop(series, None)
+
+    async def _reload_subscribers(self, series: SeriesKey) -> None:
+        for user_id in self._subscribers.pop(series, {}):
+            self._user_series.get(user_id, set()).discard(series)
+        user_ids = await self._subs.list_subscribers_for_series(*series)
+        if user_ids:
+            self._subscribers[series] = dict.fromkeys(int(uid) for uid in user_ids)
+            for user_id in self._subscribers[series]:
+                self._user_series.setdefault(user_id, set()).add(series)
+        self._routes.pop(series, None)
+
+    async def _reload_guild(self, guild_id: int) -> None:
+        settings = await self._guild_store.get(guild_id)
+        if settings is None:
+            self._guild_settings.pop(guild_id, None)
+        else:
+            self._guild_settings[guild_id] = settings
+        channels = {
+            str(row["website_key"]): int(row["channel_id"])
+            for row in await self._guild_store.list_scanlator_channels(guild_id)
+        }
+        if channels:
+            self._scanlator_channels[guild_id] = channels
+        else:
+            self._scanlator_channels.pop(guild_id, None)
+        for series in self._guild_series.get(guild_id, ()):
+            self._routes.pop(series, None)
+
+    async def _reload_users(self, user_ids: list[int]) -> None:
+        found = await self._dm_store.get_many(user_ids)
+        for user_id in user_ids:
+            settings = found.get(user_id)
+            if settings is None:
+                self._dm_settings.pop(user_id, None)
+            else:
+                self._dm_settings[user_id] = settings
+            for series in self._user_series.get(user_id, ()):
+                self._routes.pop(series, None)
+
+    def _build(self, series: SeriesKey) -> SeriesRoutes:
+        website_key = series[0]
+        guilds: list[GuildRoute] = []
+        for guild_id, ping_role_id in self._tracking.get(series, {}).items():
+            settings = self._guild_settings.get(guild_id)
+            channel_id = self._scanlator_channels.get(guild_id, {}).get(website_key)
+            if channel_id is None and settings is not None:
+                channel_id = settings.notifications_channel_id
+            if settings is None:
+                guilds.append(GuildRoute(guild_id, channel_id, ping_role_id, None))
+                continue
+            guilds.append(
+                GuildRoute(
+                    guild_id=guild_id,
+                    channel_id=channel_id,
+                    ping_role_id=ping_role_id,
+                    default_ping_role_id=settings.default_ping_role_id,
+                    paid_chapter_notifs=settings.paid_chapter_notifs,
+                    update_buttons=settings.update_buttons,
+                    nsfw_spoiler_mode=settings.nsfw_spoiler_mode,
+                )
+            )
+        users = tuple(
+            _dm_route(user_id, self._dm_settings.get(user_id))
+            for user_id in self._subscribers.get(series, {})
+        )
+        return SeriesRoutes(guilds=tuple(guilds), users=users)
+
+
+class FanoutQueryRouting:
+    """Resolves routes per call with set-based queries; nothing is cached."""
+
+    def __init__(self, pool: DbPool) -> None:
+        self._tracked = TrackedStore(pool)
+        self._subs = SubscriptionStore(pool)
+        self._dm_store = DmSettingsStore(pool)
+
+    async def load(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    async def resolve(self, website_key: str, url_name: str) -> SeriesRoutes:
+        guilds = tuple(
+            _guild_route(row) for row in await self._tracked.resolve_fanout(website_key, url_name)
+        )
+        user_ids = list(
+            dict.fromkeys(await self._subs.list_subscribers_for_series(website_key, url_name))
+        )
+        settings = await self._dm_store.get_many(user_ids) if user_ids else {}
+        users = tuple(_dm_route(user_id, settings.get(user_id)) for user_id in user_ids)
+        return SeriesRoutes(guilds=guilds, users=users)
+
+
+def _guild_route(row: GuildFanoutRow) -> GuildRoute:
+    return GuildRoute(
+        guild_id=row.guild_id,
+        channel_id=row.channel_id,
+        ping_role_id=row.ping_role_id,
+        default_ping_role_id=row.default_ping_role_id,
+        paid_chapter_notifs=row.paid_chapter_notifs,
+        update_buttons=row.update_buttons,
+        nsfw_spoiler_mode=row.nsfw_spoiler_mode,
+    )
+
+
+def _dm_route(user_id: int, settings: DmSettings | None) -> DmRoute:
+    if settings is None:
+        return DmRoute(user_id)
+    return DmRoute(
+        user_id=user_id,
+        notifications_enabled=settings.notifications_enabled,
+        paid_chapter_notifs=settings.paid_chapter_notifs,
+        update_buttons=settings.update_buttons,
+        nsfw_spoiler_mode=settings.nsfw_spoiler_mode,
+    )
+
+
+def _drain(keys: set[Any]) -> list[Any]:
+    drained = list(keys)
+    keys.clear()
+    return drained
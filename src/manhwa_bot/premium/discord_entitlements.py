@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any, Protocol
 
@@ -37,6 +38,8 @@ class DiscordEntitlementsService:
     def __init__(self, config: DiscordPremiumConfig) -> None:
         self._config = config
         self._cache: dict[int, _EntitlementLike] = {}
+        # user_id -> ids of that user's cached entitlements, so user lookups skip the scan.
+        self._by_user: dict[int, set[int]] = {}
 
     @property
     def enabled(self) -> bool:
@@ -67,32 +70,55 @@ class DiscordEntitlementsService:
             _log.exception("Failed to fetch entitlements from Discord")
             return
 
-        self._cache = {ent.id: ent for ent in entitlements if _is_active(ent)}
+        self._cache = {}
+        self._by_user = {}
+        for ent in entitlements:
+            if _is_active(ent):
+                self._store(ent)
         _log.info("Warmed Discord entitlement cache: %d active", len(self._cache))
 
-    async def on_entitlement_create(self, entitlement: _EntitlementLike) -> None:
+    def _store(self, entitlement: _EntitlementLike) -> None:
+        self._drop(entitlement.id)
         self._cache[entitlement.id] = entitlement
+        user_id = getattr(entitlement, "user_id", None)
+        if user_id is not None:
+            self._by_user.setdefault(user_id, set()).add(entitlement.id)
+
+    def _drop(self, entitlement_id: int) -> None:
+        previous = self._cache.pop(entitlement_id, None)
+        user_id = getattr(previous, "user_id", None)
+        if user_id is not None:
+            ids = self._by_user.get(user_id)
+            if ids is not None:
+                ids.discard(entitlement_id)
+                if not ids:
+                    del self._by_user[user_id]
+
+    async def on_entitlement_create(self, entitlement: _EntitlementLike) -> None:
+        self._store(entitlement)
 
     async def on_entitlement_update(self, entitlement: _EntitlementLike) -> None:
         if _is_active(entitlement):
-            self._cache[entitlement.id] = entitlement
+            self._store(entitlement)
         else:
-            self._cache.pop(entitlement.id, None)
+            self._drop(entitlement.id)
 
     async def on_entitlement_delete(self, entitlement: _EntitlementLike) -> None:
-        self._cache.pop(entitlement.id, None)
+        self._drop(entitlement.id)
 
     def is_user_premium(self, user_id: int) -> bool:
         if not self._config.user_sku_ids:
             return False
         sku_set = set(self._config.user_sku_ids)
-        for ent in self._cache.values():
-            if not _is_active(ent):
-                continue
-            if ent.sku_id in sku_set and getattr(ent, "user_id", None) == user_id:
+        for entitlement_id in self._by_user.get(user_id, ()):
+            ent = self._cache[entitlement_id]
+            if ent.sku_id in sku_set and _is_active(ent):
                 return True
         return False
 
+    def premium_users_among(self, user_ids: Iterable[int]) -> set[int]:
+        return {user_id for user_id in user_ids if self.is_user_premium(user_id)}
+
     def is_guild_premium(self, guild_id: int) -> bool:
         if not self._config.guild_sku_ids:
             return False
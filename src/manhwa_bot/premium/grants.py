@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
 
 from ..db.premium_grants import PremiumGrantStore
@@ -71,6 +72,9 @@ class GrantsService:
     async def is_active(self, scope: str, target_id: int) -> bool:
         return (await self._store.find_active(scope, target_id)) is not None
 
+    async def active_among(self, scope: str, target_ids: Iterable[int]) -> set[int]:
+        return await self._store.active_targets(scope, target_ids)
+
     async def start(self) -> None:
         if self._task is not None:
             return
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -46,6 +46,11 @@ class PatreonClient:
             return False
         return await self._store.is_active(discord_user_id)
 
+    async def premium_among(self, discord_user_ids: Iterable[int]) -> set[int]:
+        if not self.enabled:
+            return set()
+        return await self._store.active_among(discord_user_ids)
+
     async def start(self) -> None:
         if not self.enabled:
             _log.info("Patreon premium source disabled — skipping poll")
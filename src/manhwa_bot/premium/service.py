@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -71,6 +72,41 @@ class PremiumService:
             )
         return decision
 
+    async def is_premium_many(self, user_ids: Iterable[int], *, dm_only: bool = True) -> set[int]:
+        """The subset of *user_ids* that is premium, answered in bulk.
+
+        Same sources and outcome as calling :meth:`is_premium` per user with no
+        guild and no interaction, where *dm_only* makes no difference: one
+        grants query, one Patreon query and an indexed entitlement lookup for
+        the whole set, each source only asked about users still undecided.
+        """
+        pending = {int(uid) for uid in user_ids}
+        if not self._config.enabled:
+            return pending
+        entitled: set[int] = set()
+
+        def _take(found: set[int]) -> None:
+            entitled.update(found)
+            pending.difference_update(found)
+
+        owner_ids = getattr(self._bot, "owner_ids", None) or set()
+        if self._config.owner_bypass:
+            _take(pending & set(owner_ids))
+        if pending:
+            _take(await self._grants.active_among("user", pending))
+        if pending and self._config.patreon.enabled:
+            _take(await self._patreon.premium_among(pending))
+        if pending and self._config.discord.enabled:
+            _take(self._discord_ents.premium_users_among(pending))
+        if self._config.log_decisions:
+            _log.debug(
+                "premium bulk decision dm_only=%s -> %s of %s users premium",
+                dm_only,
+                len(entitled),
+                len(entitled) + len(pending),
+            )
+        return entitled
+
     async def _evaluate(
         self,
         *,
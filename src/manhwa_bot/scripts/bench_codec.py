@@ -0,0 +1,118 @@
+"""Measure how long decoding a crawler frame blocks the event loop.
+
+For each frame size (a ``series_data`` reply with N chapters) and each
+available codec, decodes the frame repeatedly two ways:
+
+    inline     ``codec.loads`` on the loop — the loop is blocked for the
+               whole decode (what every frame did before the offload)
+    offloaded  ``asyncio.to_thread(codec.loads, ...)`` — what the client does
+               for frames at or above ``[crawler].decode_offload_bytes``
+
+and reports the worst event-loop stall seen by a 1 ms ticker while that
+happens. Offloading keeps stalls short for big frames but costs a thread hop,
+which is why small frames stay inline.
+
+Usage:
+    python -m manhwa_bot.scripts.bench_codec
+    python -m manhwa_bot.scripts.bench_codec --chapters 10 500 5000 --rounds 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from manhwa_bot.crawler.codec import ORJSON_CODEC, STDLIB_CODEC, JsonCodec
+from manhwa_bot.scripts.fake_crawler import sample_series
+
+_TICK_SECONDS = 0.001
+
+
+def _frame(chapters: int) -> str:
+    data = sample_series("bench", "bench-series", chapters=chapters)
+    envelope = {"type": "series_data", "request_id": "bench", "ok": True, "data": data}
+    return STDLIB_CODEC.dumps(envelope)
+
+
+async def _max_stall(work) -> float:
+    """Run *work* while a ticker records the longest gap between its wake-ups."""
+    worst = 0.0
+    done = asyncio.Event()
+
+    async def _ticker() -> None:
+        nonlocal worst
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(_TICK_SECONDS)
+            now = time.perf_counter()
+            worst = max(worst, now - last - _TICK_SECONDS)
+            last = now
+
+    ticker = asyncio.create_task(_ticker())
+    await asyncio.sleep(0)
+    try:
+        await work()
+    finally:
+        done.set()
+        await ticker
+    return worst
+
+
+async def _bench(codec: JsonCodec, frame: str, rounds: int) -> tuple[float, float, float]:
+    async def _inline() -> None:
+        for _ in range(rounds):
+            codec.loads(frame)
+            await asyncio.sleep(0)
+
+    async def _offloaded() -> None:
+        for _ in range(rounds):
+            await asyncio.to_thread(codec.loads, frame)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        codec.loads(frame)
+    per_decode = (time.perf_counter() - started) / rounds
+    inline_stall = await _max_stall(_inline)
+    offloaded_stall = await _max_stall(_offloaded)
+    return per_decode, inline_stall, offloaded_stall
+
+
+async def _run(args: argparse.Namespace) -> None:
+    codecs = [STDLIB_CODEC] + ([ORJSON_CODEC] if ORJSON_CODEC is not None else [])
+    print(
+        f"{'codec':<8} {'chapters':>8} {'frame KiB':>10} {'decode ms':>10} "
+        f"{'inline stall ms':>16} {'offload stall ms':>17}"
+    )
+    for chapters in args.chapters:
+        frame = _frame(chapters)
+        for codec in codecs:
+            per_decode, inline_stall, offloaded_stall = await _bench(codec, frame, args.rounds)
+            print(
+                f"{codec.name:<8} {chapters:>8} {len(frame) / 1024:>10.1f} "
+                f"{per_decode * 1000:>10.3f} {inline_stall * 1000:>16.3f} "
+                f"{offloaded_stall * 1000:>17.3f}"
+            )
+    if ORJSON_CODEC is None:
+        print("orjson not installed; install manhwa_bot[fast] to compare it.")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark crawler frame decoding.")
+    parser.add_argument(
+        "--chapters",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000, 5000],
+        help="Chapter counts of the series_data frames to decode.",
+    )
+    parser.add_argument("--rounds", type=int, default=20, help="Decodes per measurement.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Benchmark notification catch-up through the real consumer, offline.
+
+Seeds the fake crawler's notification log with ``--records`` chapter
+notifications spread over ``--series`` series, then starts a fresh
+:class:`NotificationConsumer` (real client, real SQLite offset store in a
+temp directory) and times how long it takes to replay and ack all of them.
+Each ack policy in ``--policies`` runs against its own fresh database, so
+per-record acking and batched acking can be compared side by side.
+
+A policy is ``N`` (flush every N records) or ``N/T`` (every N records or T
+seconds, whichever comes first); ``1`` is one offset write and one
+``notifications_ack`` per record.
+
+Usage:
+    python -m manhwa_bot.scripts.bench_consumer
+    python -m manhwa_bot.scripts.bench_consumer --records 10000 --policies 1 50/1.0 500/1.0
+    python -m manhwa_bot.scripts.bench_consumer --dispatch-ms 20 --depth 1 8 --policies 50/1.0
+    python -m manhwa_bot.scripts.bench_consumer --inbox --policies 50/1.0
+    python -m manhwa_bot.scripts.bench_consumer --series 50 --digest --dispatch-ms 20 --depth 8
+
+With ``--digest`` each series' backlog in a page collapses into one dispatch;
+the ``dispatches`` column shows how many fan-outs the replay cost.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from manhwa_bot.config import CrawlerConfig
+from manhwa_bot.crawler.client import CrawlerClient
+from manhwa_bot.crawler.notifications import NotificationConsumer
+from manhwa_bot.db.consumer_state import ConsumerStateStore
+from manhwa_bot.db.migrate import apply_pending
+from manhwa_bot.db.notification_inbox import NotificationInboxStore
+from manhwa_bot.db.pool import DbPool
+from manhwa_bot.scripts.fake_crawler import FakeCrawler
+
+
+def _config(ws_url: str) -> CrawlerConfig:
+    return CrawlerConfig(
+        ws_url=ws_url,
+        http_base_url="http://unused",
+        request_timeout_seconds=30.0,
+        reconnect_initial_delay_seconds=0.1,
+        reconnect_max_delay_seconds=1.0,
+        reconnect_jitter_seconds=0.0,
+        consumer_key="bench",
+        api_key="bench",
+    )
+
+
+def _policy(text: str) -> tuple[int, float]:
+    every, _, interval = text.partition("/")
+    return int(every), float(interval or 0.0)
+
+
+async def _run_once(
+    crawler: FakeCrawler, args: argparse.Namespace, depth: int, policy: str
+) -> tuple[float, int, int]:
+    """Replay the whole log once; returns (seconds, acks sent, dispatches)."""
+    ack_every, ack_interval = _policy(policy)
+    crawler.consumer_offsets.clear()
+    acks_before = len(crawler.requests_of("notifications_ack"))
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = await DbPool.open(str(Path(tmp) / "bench.db"))
+        await apply_pending(pool)
+        client = CrawlerClient(_config(crawler.ws_url))
+        done = asyncio.Event()
+        dispatch_seconds = args.dispatch_ms / 1000
+        dispatches = 0
+
+        async def dispatch(record: dict[str, Any]) -> None:
+            nonlocal dispatches
+            dispatches += 1
+            if dispatch_seconds:
+                await asyncio.sleep(dispatch_seconds)
+            if record["id"] == args.records:
+                done.set()
+
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="bench",
+            dispatch=dispatch,
+            catchup_page_size=args.page_size,
+            max_in_flight=depth,
+            ack_every=ack_every,
+            ack_interval_seconds=ack_interval,
+            inbox=NotificationInboxStore(pool) if args.inbox else None,
+            digest=args.digest,
+        )
+        try:
+            await consumer.start()
+            started = time.perf_counter()
+            await client.start()
+            await done.wait()
+            # Count the time to make the final offset durable too.
+            await consumer.stop()
+            elapsed = time.perf_counter() - started
+        finally:
+            await client.stop()
+            await pool.close()
+    return elapsed, len(crawler.requests_of("notifications_ack")) - acks_before, dispatches
+
+
+async def _run(args: argparse.Namespace) -> None:
+    crawler = FakeCrawler(latency=args.latency)
+    for index in range(args.records):
+        await crawler.publish_notification(
+            "bench", f"series-{index % args.series}", chapter_index=index, push=False
+        )
+    await crawler.start()
+    print(
+        f"catch-up of {args.records} notifications over {args.series} series, "
+        f"page size {args.page_size}, dispatch {args.dispatch_ms:g} ms, "
+        f"crawler latency {args.latency * 1000:.1f} ms"
+        f"{', durable inbox' if args.inbox else ''}{', digest' if args.digest else ''}"
+    )
+    print(
+        f"{'depth':>5} {'ack policy':>12} {'seconds':>9} {'records/s':>10} {'acks':>7} "
+        f"{'dispatches':>10}"
+    )
+    try:
+        for depth in args.depth:
+            for policy in args.policies:
+                elapsed, acks, dispatches = await _run_once(crawler, args, depth, policy)
+                print(
+                    f"{depth:>5} {policy:>12} {elapsed:>9.2f} "
+                    f"{args.records / elapsed:>10,.0f} {acks:>7} {dispatches:>10}"
+                )
+    finally:
+        await crawler.stop()
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark notification catch-up and acking.")
+    parser.add_argument("--records", type=int, default=5000, help="Notifications to replay.")
+    parser.add_argument("--series", type=int, default=200, help="Distinct series in the log.")
+    parser.add_argument("--page-size", type=int, default=200, help="notifications_list limit.")
+    parser.add_argument(
+        "--dispatch-ms", type=float, default=0.0, help="Simulated fan-out time per record."
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake crawler latency, seconds.")
+    parser.add_argument(
+        "--depth", type=int, nargs="+", default=[1], help="Dispatch pipeline depths to compare."
+    )
+    parser.add_argument(
+        "--policies",
+        nargs="+",
+        default=["1", "50/1.0"],
+        help="Ack policies to compare: N or N/T (records / seconds).",
+    )
+    parser.add_argument(
+        "--inbox", action="store_true", help="Store records in the durable inbox first."
+    )
+    parser.add_argument(
+        "--digest", action="store_true", help="Collapse per-series backlogs into digests."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
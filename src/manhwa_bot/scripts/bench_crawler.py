@@ -0,0 +1,227 @@
+"""Load-test the crawler client against the fake crawler, offline.
+
+Starts :class:`~manhwa_bot.scripts.fake_crawler.FakeCrawler` in-process with
+the requested latency, payload size and fault rates, then drives
+``--clients`` independent :class:`CrawlerClient` instances, each running
+``--concurrency`` workers that issue ``series_data`` requests back to back
+for ``--duration`` seconds. Reports throughput, tail latency and failures.
+
+With ``--reconnects N`` it then drops every server socket N times while the
+load keeps running, and reports reconnect recovery time: from the drop until
+each client's next request that was sent after the drop is answered.
+
+Usage:
+    python -m manhwa_bot.scripts.bench_crawler
+    python -m manhwa_bot.scripts.bench_crawler --clients 8 --concurrency 16 --latency 0.02
+    python -m manhwa_bot.scripts.bench_crawler --chapters 500 --error-rate 0.01 --reconnects 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+
+from manhwa_bot.config import CrawlerConfig
+from manhwa_bot.crawler.client import CrawlerClient
+from manhwa_bot.crawler.errors import CrawlerError, Disconnected, RequestTimeout
+from manhwa_bot.scripts.fake_crawler import FakeCrawler, sample_series
+
+_WEBSITE_KEY = "bench"
+
+
+def _config(ws_url: str, args: argparse.Namespace) -> CrawlerConfig:
+    return CrawlerConfig(
+        ws_url=ws_url,
+        http_base_url="http://unused",
+        request_timeout_seconds=args.timeout,
+        reconnect_initial_delay_seconds=0.05,
+        reconnect_max_delay_seconds=1.0,
+        reconnect_jitter_seconds=0.0,
+        consumer_key="bench",
+        api_key="bench",
+        pool_size=args.pool_size,
+        wire_format=args.wire_format,
+    )
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class _Load:
+    """Back-to-back ``series_data`` workers over a set of clients."""
+
+    def __init__(self, clients: list[CrawlerClient], series: int) -> None:
+        self._clients = clients
+        self._series = series
+        self.latencies: list[float] = []
+        self.failures: Counter[str] = Counter()
+        # Per client: send time of the most recent request that got an answer.
+        self.answered_sent_at = [0.0] * len(clients)
+        self._stopping = False
+
+    async def _worker(self, index: int) -> None:
+        client = self._clients[index]
+        while not self._stopping:
+            url_name = f"series-{random.randrange(self._series)}"
+            sent_at = time.perf_counter()
+            try:
+                await client.request("series_data", website_key=_WEBSITE_KEY, url_name=url_name)
+            except CrawlerError as exc:
+                self.failures[exc.code] += 1
+            except RequestTimeout:
+                self.failures["timeout"] += 1
+                continue
+            except Disconnected:
+                self.failures["disconnected"] += 1
+                await asyncio.sleep(0.01)
+                continue
+            else:
+                self.latencies.append(time.perf_counter() - sent_at)
+            self.answered_sent_at[index] = max(self.answered_sent_at[index], sent_at)
+
+    async def run(self, concurrency: int, duration: float) -> float:
+        """Run for *duration* seconds; returns the measured wall time."""
+        self._stopping = False
+        started = time.perf_counter()
+        workers = [
+            asyncio.create_task(self._worker(index))
+            for index in range(len(self._clients))
+            for _ in range(concurrency)
+        ]
+        await asyncio.sleep(duration)
+        self._stopping = True
+        await asyncio.gather(*workers)
+        return time.perf_counter() - started
+
+
+def _report(label: str, load: _Load, elapsed: float) -> None:
+    ordered = sorted(load.latencies)
+    failed = sum(load.failures.values())
+    print(
+        f"{label}: {len(ordered)} ok, {failed} failed in {elapsed:.1f}s "
+        f"= {len(ordered) / elapsed:,.0f} req/s"
+    )
+    if ordered:
+        print(
+            "  latency ms  "
+            + "  ".join(
+                f"{name} {_percentile(ordered, q) * 1000:.2f}"
+                for name, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99), ("p99.9", 0.999))
+            )
+            + f"  max {ordered[-1] * 1000:.2f}"
+        )
+    if load.failures:
+        print("  failures    " + ", ".join(f"{k}={v}" for k, v in load.failures.most_common()))
+
+
+async def _measure_recovery(
+    crawler: FakeCrawler, load: _Load, trials: int, concurrency: int
+) -> tuple[list[float], float]:
+    """Drop every socket *trials* times under load; time until each client recovers.
+
+    Returns the recovery times and the wall time of the load run.
+    """
+    recoveries: list[float] = []
+    running = asyncio.create_task(load.run(concurrency, duration=trials * 2.0 + 1.0))
+    try:
+        for _ in range(trials):
+            await asyncio.sleep(0.5)
+            dropped_at = time.perf_counter()
+            await crawler.drop_connections()
+            pending = set(range(len(load.answered_sent_at)))
+            while pending:
+                await asyncio.sleep(0.005)
+                pending = {i for i in pending if load.answered_sent_at[i] <= dropped_at}
+                if time.perf_counter() - dropped_at > 30.0:
+                    break
+            recoveries.append(time.perf_counter() - dropped_at)
+            await asyncio.sleep(0.5)
+    finally:
+        elapsed = await running
+    return recoveries, elapsed
+
+
+async def _run(args: argparse.Namespace) -> None:
+    catalog = {
+        (_WEBSITE_KEY, f"series-{i}"): sample_series(
+            _WEBSITE_KEY, f"series-{i}", chapters=args.chapters
+        )
+        for i in range(args.series)
+    }
+    crawler = FakeCrawler(
+        catalog,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+        seed=args.seed,
+    )
+    await crawler.start()
+    clients = [CrawlerClient(_config(crawler.ws_url, args)) for _ in range(args.clients)]
+    print(
+        f"{args.clients} clients * {args.concurrency} workers, {args.chapters} chapters/reply, "
+        f"latency {args.latency * 1000:.0f}+{args.latency_jitter * 1000:.0f} ms, "
+        f"error rate {args.error_rate:.2%}, drop rate {args.drop_rate:.2%}"
+    )
+    try:
+        await asyncio.gather(*(client.start() for client in clients))
+        load = _Load(clients, args.series)
+        elapsed = await load.run(args.concurrency, args.duration)
+        _report("steady state", load, elapsed)
+
+        if args.reconnects:
+            load = _Load(clients, args.series)
+            recoveries, elapsed = await _measure_recovery(
+                crawler, load, args.reconnects, args.concurrency
+            )
+            recoveries.sort()
+            print(
+                f"reconnect recovery over {len(recoveries)} drops: "
+                f"mean {sum(recoveries) / len(recoveries) * 1000:.0f} ms, "
+                f"max {recoveries[-1] * 1000:.0f} ms"
+            )
+            _report("under reconnects", load, elapsed)
+    finally:
+        await asyncio.gather(*(client.stop() for client in clients))
+        await crawler.stop()
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the crawler client under load.")
+    parser.add_argument("--clients", type=int, default=4, help="Independent crawler clients.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Workers per client.")
+    parser.add_argument("--duration", type=float, default=5.0, help="Steady-state seconds.")
+    parser.add_argument("--series", type=int, default=200, help="Series in the fake catalog.")
+    parser.add_argument("--chapters", type=int, default=50, help="Chapters per series_data reply.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake crawler latency, seconds.")
+    parser.add_argument(
+        "--latency-jitter", type=float, default=0.0, help="Extra uniform random latency, seconds."
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction answered with errors."
+    )
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Fraction never answered.")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Client request timeout.")
+    parser.add_argument("--pool-size", type=int, default=1, help="WebSockets per client.")
+    parser.add_argument(
+        "--wire-format", default="json", choices=("json", "msgpack", "cbor"), help="Frame format."
+    )
+    parser.add_argument(
+        "--reconnects", type=int, default=0, help="Socket drops to time recovery over."
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the fault knobs.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Benchmark per-event recipient resolution for notification fan-out, offline.
+
+Seeds a temp database with one series tracked by ``--guilds`` guilds (each
+with saved settings, every fourth with a scanlator channel override) and
+``--subscribers`` DM subscribers with DM settings, then resolves that
+series' targets ``--events`` times per strategy:
+
+* ``per-recipient``: the lookups dispatch used to do, one tracking query,
+  one subscriber query, then settings and scanlator channels per guild and
+  DM settings per subscriber.
+* ``joined``: :class:`FanoutQueryRouting`, one joined guild query plus a
+  subscriber query and one bulk DM-settings query.
+* ``index``: a warm :class:`NotificationRoutingIndex`, no queries at all.
+
+Every query is a round-trip through the aiosqlite worker thread; the
+``queries/event`` column counts them.
+
+Usage:
+    python -m manhwa_bot.scripts.bench_fanout
+    python -m manhwa_bot.scripts.bench_fanout --guilds 5000 --subscribers 1000 --events 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from manhwa_bot.db.dm_settings import DmSettingsStore
+from manhwa_bot.db.guild_settings import GuildSettingsStore
+from manhwa_bot.db.migrate import apply_pending
+from manhwa_bot.db.pool import DbPool
+from manhwa_bot.db.subscriptions import SubscriptionStore
+from manhwa_bot.db.tracked import TrackedStore
+from manhwa_bot.notification_routing import FanoutQueryRouting, NotificationRoutingIndex
+
+_WEBSITE_KEY = "bench"
+_URL_NAME = "series-0"
+
+
+class _QueryCounter:
+    """Counts statements sent through *pool*."""
+
+    def __init__(self, pool: DbPool) -> None:
+        self.queries = 0
+        for name in ("execute", "fetchone", "fetchall"):
+            original = getattr(pool, name)
+
+            async def _counted(*args: Any, _original: Any = original, **kwargs: Any) -> Any:
+                self.queries += 1
+                return await _original(*args, **kwargs)
+
+            setattr(pool, name, _counted)
+
+
+async def _seed(pool: DbPool, guilds: int, subscribers: int) -> None:
+    tracked = TrackedStore(pool)
+    settings = GuildSettingsStore(pool)
+    await tracked.upsert_series(_WEBSITE_KEY, _URL_NAME, "https://example.com/s", "Series")
+    for guild_id in range(1, guilds + 1):
+        await tracked.add_to_guild(guild_id, _WEBSITE_KEY, _URL_NAME, ping_role_id=guild_id)
+        await settings.set_notifications_channel(guild_id, guild_id * 10)
+        if guild_id % 4 == 0:
+            await settings.set_scanlator_channel(guild_id, _WEBSITE_KEY, guild_id * 10 + 1)
+    subs = SubscriptionStore(pool)
+    dm = DmSettingsStore(pool)
+    for user_id in range(1, subscribers + 1):
+        await subs.subscribe(user_id, 1, _WEBSITE_KEY, _URL_NAME)
+        await dm.set_nsfw_spoiler_mode(user_id, "never")
+
+
+async def _per_recipient(pool: DbPool) -> int:
+    """The pre-index lookups: two list queries, then one or two per recipient."""
+    tracked = TrackedStore(pool)
+    settings = GuildSettingsStore(pool)
+    dm = DmSettingsStore(pool)
+    rows = await tracked.list_guilds_tracking(_WEBSITE_KEY, _URL_NAME)
+    user_ids = await SubscriptionStore(pool).list_subscribers_for_series(_WEBSITE_KEY, _URL_NAME)
+    for row in rows:
+        await settings.get(row.guild_id)
+        await settings.list_scanlator_channels(row.guild_id)
+    for user_id in user_ids:
+        await dm.get(user_id)
+    return len(rows) + len(user_ids)
+
+
+async def _time(label: str, resolve: Any, counter: _QueryCounter, events: int) -> None:
+    before = counter.queries
+    started = time.perf_counter()
+    for _ in range(events):
+        targets = await resolve()
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:>14} {targets:>8} {(counter.queries - before) / events:>14,.0f} "
+        f"{elapsed / events * 1000:>10.2f}"
+    )
+
+
+async def _run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = await DbPool.open(str(Path(tmp) / "bench.db"))
+        try:
+            await apply_pending(pool)
+            await _seed(pool, args.guilds, args.subscribers)
+            index = NotificationRoutingIndex(pool)
+            await index.load()
+            joined = FanoutQueryRouting(pool)
+            counter = _QueryCounter(pool)
+
+            async def _resolve_with(routing: Any) -> int:
+                routes = await routing.resolve(_WEBSITE_KEY, _URL_NAME)
+                return len(routes.guilds) + len(routes.users)
+
+            print(
+                f"resolving {args.guilds} guilds + {args.subscribers} DM subscribers, "
+                f"{args.events} events per strategy"
+            )
+            print(f"{'strategy':>14} {'targets':>8} {'queries/event':>14} {'ms/event':>10}")
+            await _time("per-recipient", lambda: _per_recipient(pool), counter, args.events)
+            await _time("joined", lambda: _resolve_with(joined), counter, args.events)
+            await _time("index", lambda: _resolve_with(index), counter, args.events)
+            index.close()
+        finally:
+            await pool.close()
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark fan-out recipient resolution.")
+    parser.add_argument("--guilds", type=int, default=1000, help="Guilds tracking the series.")
+    parser.add_argument("--subscribers", type=int, default=200, help="DM subscribers.")
+    parser.add_argument("--events", type=int, default=20, help="Resolutions per strategy.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
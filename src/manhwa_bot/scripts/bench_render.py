@@ -0,0 +1,117 @@
+"""Benchmark rendering one chapter notification for many recipients, offline.
+
+Renders a notification for ``--recipients`` recipients spread over
+``--button-sets`` allowed-button sets, spoiler on and off, and a ping for
+every other recipient, then serializes each view the way a send does.
+Compares building a full view per recipient against
+:class:`NotificationRenderCache`, which builds each variant once and only
+splices the ping in per recipient.
+
+Usage:
+    python -m manhwa_bot.scripts.bench_render
+    python -m manhwa_bot.scripts.bench_render --recipients 5000 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+import discord
+
+from manhwa_bot.crawler.chapter import Chapter
+from manhwa_bot.ui.components.notifications import (
+    ALL_UPDATE_BUTTONS,
+    NotificationRenderCache,
+    build_chapter_update_view,
+)
+
+_BUTTON_SETS = (
+    ALL_UPDATE_BUTTONS,
+    frozenset({"open_chapter", "mark_read"}),
+    frozenset(),
+    frozenset({"bookmark", "subscribe"}),
+)
+
+
+def _payload() -> dict[str, Any]:
+    return {
+        "website_key": "bench",
+        "url_name": "series-0",
+        "series_title": "Bench Series",
+        "series_url": "https://example.com/series-0",
+        "cover_url": "https://example.com/series-0/cover.png",
+        "scanlator_name": "Bench Scans",
+        "source": "main",
+        "action_token": "bench-token",
+        "chapter": Chapter.from_dict(
+            {"index": 12, "name": "Chapter 12", "url": "https://example.com/series-0/12"}
+        ),
+    }
+
+
+def _recipients(count: int, button_sets: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "allowed_buttons": _BUTTON_SETS[index % button_sets],
+            "spoiler": index % 3 == 0,
+            "ping": f"<@&{1000 + index}>" if index % 2 else None,
+        }
+        for index in range(count)
+    ]
+
+
+def _per_recipient(payload: dict[str, Any], recipients: list[dict[str, Any]]) -> int:
+    for recipient in recipients:
+        build_chapter_update_view(payload, **recipient).to_components()
+    return len(recipients)
+
+
+def _cached(payload: dict[str, Any], recipients: list[dict[str, Any]]) -> int:
+    render = NotificationRenderCache()
+    for recipient in recipients:
+        render.chapter_view(payload, **recipient).to_components()
+    return render.builds
+
+
+def _time(label: str, run: Any, rounds: int, recipients: int) -> None:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        builds = run()
+    elapsed = (time.perf_counter() - started) / rounds
+    print(f"{label:>14} {builds:>7} {elapsed * 1000:>10.2f} {elapsed / recipients * 1e6:>16.1f}")
+
+
+async def _run(args: argparse.Namespace) -> None:
+    # Views bind to the running loop, as they do inside the bot.
+    payload = _payload()
+    recipients = _recipients(args.recipients, max(1, min(args.button_sets, len(_BUTTON_SETS))))
+    print(
+        f"rendering one notification for {args.recipients} recipients, "
+        f"{args.rounds} rounds, discord.py {discord.__version__}"
+    )
+    print(f"{'strategy':>14} {'builds':>7} {'ms/event':>10} {'us/recipient':>16}")
+    _time(
+        "per-recipient", lambda: _per_recipient(payload, recipients), args.rounds, len(recipients)
+    )
+    _time("render cache", lambda: _cached(payload, recipients), args.rounds, len(recipients))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark notification view rendering.")
+    parser.add_argument("--recipients", type=int, default=1000, help="Recipients per event.")
+    parser.add_argument(
+        "--button-sets", type=int, default=4, help="Distinct allowed-button sets (1-4)."
+    )
+    parser.add_argument("--rounds", type=int, default=10, help="Events to average over.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
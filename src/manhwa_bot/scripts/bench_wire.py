@@ -0,0 +1,156 @@
+"""Compare crawler WebSocket wire modes over loopback.
+
+Runs the fake crawler behind a byte-counting TCP relay and issues
+``series_data`` requests through a real :class:`CrawlerClient` in each mode:
+JSON text, MessagePack and CBOR (when installed), each with and without
+permessage-deflate. Reports bytes received per reply, round-trip time, and
+the pure decode cost of one reply in that format.
+
+Usage:
+    python -m manhwa_bot.scripts.bench_wire
+    python -m manhwa_bot.scripts.bench_wire --chapters 1500 --requests 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+from manhwa_bot.config import CrawlerConfig
+from manhwa_bot.crawler.client import CrawlerClient
+from manhwa_bot.crawler.codec import CBOR_CODEC, MSGPACK_CODEC, STDLIB_CODEC
+from manhwa_bot.scripts.fake_crawler import FakeCrawler, sample_series
+
+
+class _CountingRelay:
+    """TCP relay in front of the fake crawler that counts crawler→bot bytes."""
+
+    def __init__(self, target_port: int) -> None:
+        self._target_port = target_port
+        self.downstream_bytes = 0
+        self._server: asyncio.Server | None = None
+        self.port = 0
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        up_reader, up_writer = await asyncio.open_connection("127.0.0.1", self._target_port)
+
+        async def _pipe(
+            src: asyncio.StreamReader, dst: asyncio.StreamWriter, *, count: bool
+        ) -> None:
+            try:
+                while chunk := await src.read(65536):
+                    if count:
+                        self.downstream_bytes += len(chunk)
+                    dst.write(chunk)
+                    await dst.drain()
+            except ConnectionError:
+                pass
+            finally:
+                dst.close()
+
+        await asyncio.gather(
+            _pipe(reader, up_writer, count=False),
+            _pipe(up_reader, writer, count=True),
+        )
+
+
+def _config(ws_url: str, wire_format: str, compress: bool) -> CrawlerConfig:
+    return CrawlerConfig(
+        ws_url=ws_url,
+        http_base_url="http://unused",
+        request_timeout_seconds=30.0,
+        reconnect_initial_delay_seconds=0.1,
+        reconnect_max_delay_seconds=1.0,
+        reconnect_jitter_seconds=0.0,
+        consumer_key="bench",
+        api_key="bench",
+        ws_compress=compress,
+        wire_format=wire_format,
+    )
+
+
+def _decode_micros(wire_format: str, envelope: dict, rounds: int = 50) -> float:
+    if wire_format == "msgpack" and MSGPACK_CODEC is not None:
+        frame, loads = MSGPACK_CODEC.dumps(envelope), MSGPACK_CODEC.loads
+    elif wire_format == "cbor" and CBOR_CODEC is not None:
+        frame, loads = CBOR_CODEC.dumps(envelope), CBOR_CODEC.loads
+    else:
+        frame, loads = STDLIB_CODEC.dumps(envelope), STDLIB_CODEC.loads
+    started = time.perf_counter()
+    for _ in range(rounds):
+        loads(frame)
+    return (time.perf_counter() - started) / rounds * 1_000_000
+
+
+async def _run_mode(
+    crawler: FakeCrawler, wire_format: str, compress: bool, requests: int
+) -> tuple[float, float]:
+    relay = _CountingRelay(crawler.port)
+    await relay.start()
+    client = CrawlerClient(_config(f"ws://127.0.0.1:{relay.port}/ws", wire_format, compress))
+    try:
+        await client.start()
+        before = relay.downstream_bytes
+        started = time.perf_counter()
+        for _ in range(requests):
+            await client.request("series_data", website_key="bench", url_name="bench-series")
+        elapsed = time.perf_counter() - started
+        return (relay.downstream_bytes - before) / requests, elapsed / requests
+    finally:
+        await client.stop()
+        await relay.stop()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    series = sample_series("bench", "bench-series", chapters=args.chapters)
+    crawler = FakeCrawler({("bench", "bench-series"): series})
+    await crawler.start()
+    envelope = {"type": "series_data", "request_id": "bench", "ok": True, "data": series}
+    formats = ["json"]
+    formats += ["msgpack"] if MSGPACK_CODEC is not None else []
+    formats += ["cbor"] if CBOR_CODEC is not None else []
+    raw_json = len(json.dumps(envelope))
+    print(f"series_data reply with {args.chapters} chapters; raw JSON {raw_json / 1024:.1f} KiB")
+    print(f"{'mode':<16} {'KiB/reply':>10} {'vs json':>8} {'rtt ms':>8} {'decode us':>10}")
+    try:
+        baseline: float | None = None
+        for wire_format in formats:
+            decode_us = _decode_micros(wire_format, envelope)
+            for compress in (False, True):
+                per_reply, rtt = await _run_mode(crawler, wire_format, compress, args.requests)
+                baseline = baseline or per_reply
+                label = f"{wire_format}{'+deflate' if compress else ''}"
+                print(
+                    f"{label:<16} {per_reply / 1024:>10.1f} {baseline / per_reply:>7.1f}x "
+                    f"{rtt * 1000:>8.2f} {decode_us:>10.0f}"
+                )
+    finally:
+        await crawler.stop()
+    if MSGPACK_CODEC is None or CBOR_CODEC is None:
+        print("install manhwa_bot[msgpack] / manhwa_bot[cbor] to include binary modes.")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark crawler WebSocket wire modes.")
+    parser.add_argument("--chapters", type=int, default=500, help="Chapters per series_data reply.")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per mode.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,506 @@
+"""Local stand-in for the crawler WebSocket service.
+
+Speaks the crawler's envelope protocol over aiohttp so the bot (or a test)
+can run without the real crawler. Series are served from an in-memory
+catalog; ops the fake does not know answer with ``unknown_type`` exactly like
+the real service. Requests are answered concurrently, each correlated by its
+``request_id``.
+
+Supported ops:
+    series_data          one stored series (``website_key`` + ``url_name``)
+    series_data_batch    many series; one ``series_data_batch_partial`` per item
+    supported_websites   the websites present in the catalog
+    search               title substring match; one ``search_partial`` per website
+    notifications_list   page of the notification log after ``since_id``
+    notifications_ack    record a consumer's offset
+    series_sync_submit   accept a bot's tracked-series references
+
+:meth:`FakeCrawler.publish_notification` appends to the notification log and
+pushes a ``notification_event`` to every open socket.
+
+Knobs for load and failure testing (constructor arguments, also plain
+attributes that may be changed while serving):
+    latency / latency_jitter   seconds to wait before answering (base + uniform)
+    progress_events            ``request_progress`` events before each
+                               ``series_data`` / ``search`` reply
+    error_rate                 fraction of requests answered ``unavailable``
+    drop_rate                  fraction of requests never answered
+    disconnect_every           close the socket on every Nth request
+:meth:`FakeCrawler.drop_connections` closes every open socket at once, and
+``sample_series(chapters=...)`` sets reply payload size.
+
+Like the real service it accepts permessage-deflate and the binary
+``manhwa-crawler.msgpack`` / ``manhwa-crawler.cbor`` subprotocols (when the
+package is installed); both can be refused to exercise the client's fallback.
+
+Usage:
+    python -m manhwa_bot.scripts.fake_crawler --port 8765 --series 500 --no-binary
+    python -m manhwa_bot.scripts.fake_crawler --latency 0.05 --error-rate 0.01 --notify-every 2
+    # then point [crawler].ws_url at ws://127.0.0.1:8765/ws
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+from manhwa_bot.crawler.codec import (
+    CBOR_CODEC,
+    MSGPACK_CODEC,
+    BinaryCodec,
+    binary_codec_for_subprotocol,
+)
+
+SeriesKey = tuple[str, str]
+
+
+def sample_series(website_key: str, url_name: str, *, chapters: int = 3) -> dict[str, Any]:
+    """A stored ``series_data`` payload shaped like the crawler's."""
+    base = f"https://{website_key}.test/series/{url_name}"
+    chapter_rows = [
+        {"name": f"Chapter {i}", "url": f"{base}/chapter-{i}", "index": i - 1}
+        for i in range(1, chapters + 1)
+    ]
+    return {
+        "website_key": website_key,
+        "url_name": url_name,
+        "url": base,
+        "title": url_name.replace("-", " ").title(),
+        "cover_url": None,
+        "status": "Ongoing",
+        "chapter_count": len(chapter_rows),
+        "chapters": chapter_rows,
+        "latest_chapters": chapter_rows[-1:],
+        "website": {"key": website_key, "name": website_key.title(), "base_url": base},
+        "source": "db",
+    }
+
+
+def sample_notification(
+    notification_id: int, website_key: str, url_name: str, *, chapter_index: int = 0
+) -> dict[str, Any]:
+    """A ``notifications_list`` / ``notification_event`` record shaped like the crawler's."""
+    base = f"https://{website_key}.test/series/{url_name}"
+    return {
+        "id": notification_id,
+        "website_key": website_key,
+        "url_name": url_name,
+        "chapter_index": chapter_index,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "payload": {
+            "event": "new_chapter",
+            "website_key": website_key,
+            "url_name": url_name,
+            "series_title": url_name.replace("-", " ").title(),
+            "series_url": base,
+            "chapter": {
+                "index": chapter_index,
+                "name": f"Chapter {chapter_index + 1}",
+                "url": f"{base}/chapter-{chapter_index + 1}",
+                "is_premium": False,
+            },
+        },
+    }
+
+
+class FakeCrawler:
+    """In-process fake crawler server; ``await start()`` then connect to ``ws_url``."""
+
+    def __init__(
+        self,
+        series: dict[SeriesKey, dict[str, Any]] | None = None,
+        *,
+        compress: bool = True,
+        binary: bool = True,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        progress_events: int = 0,
+        error_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        disconnect_every: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        self.series: dict[SeriesKey, dict[str, Any]] = dict(series or {})
+        # Every request envelope received, in order — tests assert on frames.
+        self.requests: list[dict[str, Any]] = []
+        self.compress = compress
+        self.binary = binary
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.progress_events = progress_events
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.disconnect_every = disconnect_every
+        self._random = random.Random(seed)
+        # Notification log (ascending ids) and the offset each consumer acked.
+        self.notifications: list[dict[str, Any]] = []
+        self.consumer_offsets: dict[str, int] = {}
+        self._notification_ids = itertools.count(1)
+        # Latest series_sync_submit refs per client_id.
+        self.synced_refs: dict[str, list[dict[str, Any]]] = {}
+        # Binary format negotiated per open socket (absent = JSON text).
+        self._binary_by_ws: dict[web.WebSocketResponse, BinaryCodec] = {}
+        self._send_locks: dict[web.WebSocketResponse, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._runner: web.AppRunner | None = None
+        self._host = "127.0.0.1"
+        self._port = 0
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://{self._host}:{self._port}/ws"
+
+    @property
+    def connections(self) -> int:
+        return len(self._send_locks)
+
+    def requests_of(self, type_: str) -> list[dict[str, Any]]:
+        return [envelope for envelope in self.requests if envelope.get("type") == type_]
+
+    async def start(self, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        app = web.Application()
+        app.router.add_get("/ws", self._handle_ws)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self._host = host
+        self._port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def drop_connections(self) -> int:
+        """Close every open socket, as a crawler restart would. Returns how many."""
+        sockets = list(self._send_locks)
+        for ws in sockets:
+            await ws.close(code=1012, message=b"fake crawler restart")
+        return len(sockets)
+
+    async def publish_notification(
+        self, website_key: str, url_name: str, *, chapter_index: int = 0, push: bool = True
+    ) -> dict[str, Any]:
+        """Append a ``new_chapter`` record to the log and, if *push*, push it live."""
+        record = sample_notification(
+            next(self._notification_ids), website_key, url_name, chapter_index=chapter_index
+        )
+        self.notifications.append(record)
+        if push:
+            envelope = {
+                "type": "notification_event",
+                "request_id": f"notification-{record['id']}",
+                "data": {"notification": record},
+            }
+            for ws in list(self._send_locks):
+                try:
+                    await self.send(ws, envelope)
+                except ConnectionError, RuntimeError:
+                    pass
+        return record
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        offered = [codec for codec in (MSGPACK_CODEC, CBOR_CODEC) if codec is not None]
+        ws = web.WebSocketResponse(
+            protocols=[codec.subprotocol for codec in offered] if self.binary else (),
+            compress=self.compress,
+        )
+        await ws.prepare(request)
+        binary = binary_codec_for_subprotocol(ws.ws_protocol)
+        if binary is not None:
+            self._binary_by_ws[ws] = binary
+        self._send_locks[ws] = asyncio.Lock()
+        try:
+            async for msg in ws:
+                try:
+                    if msg.type == WSMsgType.TEXT:
+                        envelope = json.loads(msg.data)
+                    elif msg.type == WSMsgType.BINARY and binary is not None:
+                        envelope = binary.loads(msg.data)
+                    else:
+                        continue
+                except ValueError:
+                    continue
+                self.requests.append(envelope)
+                if self.disconnect_every and len(self.requests) % self.disconnect_every == 0:
+                    await ws.close(code=1011, message=b"injected disconnect")
+                    break
+                task = asyncio.create_task(self._serve(ws, envelope))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        finally:
+            self._binary_by_ws.pop(ws, None)
+            self._send_locks.pop(ws, None)
+        return ws
+
+    async def _serve(self, ws: web.WebSocketResponse, envelope: dict[str, Any]) -> None:
+        """Apply the latency and fault knobs, then :meth:`_answer`."""
+        delay = self.latency + self._random.uniform(0.0, self.latency_jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.drop_rate and self._random.random() < self.drop_rate:
+            return
+        try:
+            if self.error_rate and self._random.random() < self.error_rate:
+                await self._send_error(
+                    ws,
+                    str(envelope.get("type") or ""),
+                    envelope.get("request_id"),
+                    "unavailable",
+                    "injected failure",
+                )
+                return
+            await self._answer(ws, envelope)
+        except ConnectionError, RuntimeError:
+            # The socket closed while this request was pending; the client replays it.
+            pass
+
+    async def send(self, ws: web.WebSocketResponse, envelope: dict[str, Any]) -> None:
+        """Send *envelope* in the format negotiated for *ws*."""
+        binary = self._binary_by_ws.get(ws)
+        frame: str | bytes = binary.dumps(envelope) if binary is not None else json.dumps(envelope)
+        async with self._send_locks.get(ws) or asyncio.Lock():
+            if isinstance(frame, bytes):
+                await ws.send_bytes(frame)
+            else:
+                await ws.send_str(frame)
+
+    async def _send_ok(
+        self, ws: web.WebSocketResponse, type_: str, rid: object, data: dict
+    ) -> None:
+        await self.send(ws, {"type": type_, "request_id": rid, "ok": True, "data": data})
+
+    async def _send_error(
+        self, ws: web.WebSocketResponse, type_: str, rid: object, code: str, message: str
+    ) -> None:
+        await self.send(
+            ws,
+            {
+                "type": type_,
+                "request_id": rid,
+                "ok": False,
+                "error": {"code": code, "message": message},
+            },
+        )
+
+    async def _send_progress(self, ws: web.WebSocketResponse, rid: object, title: str) -> None:
+        for sequence in range(1, self.progress_events + 1):
+            last = sequence == self.progress_events
+            await self.send(
+                ws,
+                {
+                    "type": "request_progress",
+                    "request_id": rid,
+                    "event": "scrape_done" if last else "scrape_step",
+                    "sequence": sequence,
+                    "title": title,
+                    "status": "succeeded" if last else "running",
+                },
+            )
+
+    async def _answer(self, ws: web.WebSocketResponse, envelope: dict[str, Any]) -> None:
+        type_ = str(envelope.get("type") or "")
+        rid = envelope.get("request_id")
+        if type_ == "series_data":
+            key = (str(envelope.get("website_key")), str(envelope.get("url_name")))
+            data = self.series.get(key)
+            await self._send_progress(ws, rid, f"Fetching {key[1]}")
+            if data is None:
+                await self._send_error(ws, type_, rid, "not_found", "series not found")
+            else:
+                await self._send_ok(ws, type_, rid, data)
+        elif type_ == "series_data_batch":
+            served = 0
+            for item in envelope.get("items") or []:
+                key = (str(item.get("website_key")), str(item.get("url_name")))
+                data = self.series.get(key)
+                result: dict[str, Any] = {"website_key": key[0], "url_name": key[1]}
+                if data is None:
+                    result["ok"] = False
+                    result["error"] = {"code": "not_found", "message": "series not found"}
+                else:
+                    result["ok"] = True
+                    result["data"] = data
+                    served += 1
+                await self._send_ok(ws, "series_data_batch_partial", rid, result)
+            await self._send_ok(ws, type_, rid, {"count": served})
+        elif type_ == "supported_websites":
+            keys = sorted({website_key for website_key, _ in self.series})
+            websites = [
+                {"key": key, "name": key.title(), "base_url": f"https://{key}.test"} for key in keys
+            ]
+            await self._send_ok(ws, type_, rid, {"websites": websites})
+        elif type_ == "search":
+            await self._answer_search(ws, envelope)
+        elif type_ == "notifications_list":
+            since_id = int(envelope.get("since_id") or 0)
+            limit = max(1, min(int(envelope.get("limit") or 200), 500))
+            page = [record for record in self.notifications if record["id"] > since_id][:limit]
+            consumer_key = str(envelope.get("consumer_key") or "")
+            data = {
+                "notifications": page,
+                "last_notification_id": page[-1]["id"] if page else since_id,
+                "consumer_offset": self.consumer_offsets.get(consumer_key, 0),
+            }
+            await self._send_ok(ws, type_, rid, data)
+        elif type_ == "notifications_ack":
+            consumer_key = str(envelope.get("consumer_key") or "")
+            acked = int(envelope.get("last_notification_id") or 0)
+            offset = max(self.consumer_offsets.get(consumer_key, 0), acked)
+            self.consumer_offsets[consumer_key] = offset
+            await self._send_ok(ws, type_, rid, {"acknowledged_to": offset})
+        elif type_ == "series_sync_submit":
+            refs = [ref for ref in envelope.get("refs") or [] if isinstance(ref, dict)]
+            self.synced_refs[str(envelope.get("client_id") or "")] = refs
+            unrepairable = sum(
+                (str(ref.get("website_key")), str(ref.get("url_name"))) not in self.series
+                for ref in refs
+            )
+            data = {
+                "sync_request_id": envelope.get("sync_request_id"),
+                "accepted_refs": len(refs),
+                "repaired_trackers": 0,
+                "unrepairable_refs": unrepairable,
+            }
+            await self._send_ok(ws, type_, rid, data)
+        else:
+            await self._send_error(ws, type_, rid, "unknown_type", f"unknown type {type_!r}")
+
+    async def _answer_search(self, ws: web.WebSocketResponse, envelope: dict[str, Any]) -> None:
+        rid = envelope.get("request_id")
+        query = str(envelope.get("query") or "").lower()
+        only = envelope.get("website_key")
+        limit = int(envelope.get("limit") or 25)
+        by_website: dict[str, list[dict[str, Any]]] = {}
+        for (website_key, _), data in sorted(self.series.items()):
+            if only and website_key != only:
+                continue
+            hits = by_website.setdefault(website_key, [])
+            if query in str(data.get("title") or "").lower():
+                hits.append(
+                    {
+                        "website_key": website_key,
+                        "url_name": data["url_name"],
+                        "title": data["title"],
+                        "url": data["url"],
+                        "cover_url": data.get("cover_url"),
+                    }
+                )
+        await self._send_progress(ws, rid, f"Searching for {query!r}")
+        websites = list(by_website)
+        await self._send_ok(
+            ws, "search_partial", rid, {"status": "started", "total": len(websites)}
+        )
+        results: list[dict[str, Any]] = []
+        for completed, website_key in enumerate(websites, start=1):
+            hits = by_website[website_key][:limit]
+            results.extend(hits)
+            await self._send_ok(
+                ws,
+                "search_partial",
+                rid,
+                {
+                    "status": "success",
+                    "website_key": website_key,
+                    "completed": completed,
+                    "total": len(websites),
+                    "pending_websites": websites[completed:],
+                    "results": hits,
+                },
+            )
+        await self._send_ok(ws, "search", rid, {"results": results[:limit], "failed_websites": []})
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a local fake crawler WebSocket server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--series", type=int, default=100, help="Number of sample series to serve.")
+    parser.add_argument("--chapters", type=int, default=3, help="Chapters per sample series.")
+    parser.add_argument("--website-key", default="fake", help="Website key for sample series.")
+    parser.add_argument("--no-compress", action="store_true", help="Refuse permessage-deflate.")
+    parser.add_argument(
+        "--no-binary", action="store_true", help="Refuse binary subprotocols (JSON text only)."
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before each reply.")
+    parser.add_argument(
+        "--latency-jitter", type=float, default=0.0, help="Extra uniform random latency, seconds."
+    )
+    parser.add_argument(
+        "--progress-events", type=int, default=0, help="request_progress events per scrape."
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of requests that fail."
+    )
+    parser.add_argument(
+        "--drop-rate", type=float, default=0.0, help="Fraction of requests never answered."
+    )
+    parser.add_argument(
+        "--disconnect-every", type=int, default=0, help="Close the socket on every Nth request."
+    )
+    parser.add_argument(
+        "--notify-every",
+        type=float,
+        default=0.0,
+        help="Publish a notification for a random series every N seconds (0 = never).",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the fault knobs.")
+    return parser.parse_args()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    catalog = {
+        (args.website_key, f"series-{i}"): sample_series(
+            args.website_key, f"series-{i}", chapters=args.chapters
+        )
+        for i in range(args.series)
+    }
+    crawler = FakeCrawler(
+        catalog,
+        compress=not args.no_compress,
+        binary=not args.no_binary,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        progress_events=args.progress_events,
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+        disconnect_every=args.disconnect_every,
+        seed=args.seed,
+    )
+    await crawler.start(host=args.host, port=args.port)
+    print(f"fake crawler listening on {crawler.ws_url} ({len(catalog)} series)")
+    try:
+        if args.notify_every > 0 and catalog:
+            keys = sorted(catalog)
+            while True:
+                await asyncio.sleep(args.notify_every)
+                website_key, url_name = random.choice(keys)
+                await crawler.publish_notification(website_key, url_name)
+        await asyncio.Event().wait()
+    finally:
+        await crawler.stop()
+
+
+def main() -> None:
+    try:
+        asyncio.run(_serve(_parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
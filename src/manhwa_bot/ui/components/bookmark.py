@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import difflib
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass, replace
 from typing import Any, Literal
 
@@ -309,7 +310,7 @@ class BookmarkBrowserView(BaseLayoutView):
         self._bot = bot
         self._meta: dict[tuple[str, str], dict[str, Any]] = {}
         self._series_data_cache: dict[tuple[str, str], dict[str, Any]] = {}
-        self._chapter_cache: dict[tuple[str, str], list[Chapter]] = {}
+        self._chapter_cache: dict[tuple[str, str], Sequence[Chapter]] = {}
         self._site_meta_cache: dict[str, dict[str, Any]] = {}
         self._tracking_cache: dict[tuple[str, str], _TrackingStatus] = {}
         self._track_button_cache: dict[tuple[str, str], _TrackButtonState] = {}
@@ -414,7 +415,7 @@ class BookmarkBrowserView(BaseLayoutView):
             return self._series_data_cache[key]
         data: dict[str, Any] = {}
         try:
-            raw = await self._crawler.request(
+            raw = await self._crawler.cached_request(
                 "series_data",
                 website_key=bm.website_key,
                 url_name=bm.url_name,
@@ -422,14 +423,37 @@ class BookmarkBrowserView(BaseLayoutView):
             )
             if isinstance(raw, dict):
                 data = raw
-                website = raw.get("website")
-                if isinstance(website, dict):
-                    self._site_meta_cache[bm.website_key] = dict(website)
         except Exception:
             _log.debug("series_data cache lookup failed for %s:%s", bm.website_key, bm.url_name)
-        self._series_data_cache[key] = data
+        self._remember_series_data(bm, data)
         return data
 
+    def _remember_series_data(self, bm: Bookmark, data: dict[str, Any]) -> None:
+        website = data.get("website")
+        if isinstance(website, dict):
+            self._site_meta_cache[bm.website_key] = dict(website)
+        self._series_data_cache[self._bookmark_key(bm)] = data
+
+    async def _prefetch_series_data(self, bookmarks: list[Bookmark]) -> None:
+        """Fill ``_series_data_cache`` for *bookmarks* with one batched crawler frame."""
+        missing = [bm for bm in bookmarks if self._bookmark_key(bm) not in self._series_data_cache]
+        if not missing:
+            return
+        try:
+            results = await self._crawler.request_batch(
+                "series_data",
+                items=[{"website_key": bm.website_key, "url_name": bm.url_name} for bm in missing],
+                allow_live=False,
+            )
+        except Exception:
+            _log.debug("series_data batch prefetch failed", exc_info=True)
+            return
+        for bm in missing:
+            data = results.get(self._bookmark_key(bm))
+            # Unresolved series are left for ``_series_data_for`` to retry alone.
+            if isinstance(data, dict):
+                self._remember_series_data(bm, data)
+
     async def _site_meta_for(self, website_key: str) -> dict[str, Any]:
         if website_key in self._site_meta_cache:
             return self._site_meta_cache[website_key]
@@ -437,7 +461,7 @@ class BookmarkBrowserView(BaseLayoutView):
         self._site_meta_cache[website_key] = meta
         return meta
 
-    async def _get_chapters(self, bm: Bookmark) -> list[Chapter]:
+    async def _get_chapters(self, bm: Bookmark) -> Sequence[Chapter]:
         key = self._bookmark_key(bm)
         if key in self._chapter_cache:
             return self._chapter_cache[key]
@@ -707,6 +731,9 @@ class BookmarkBrowserView(BaseLayoutView):
 
     async def _preload_visible_cache(self) -> None:
         ordered = self._preload_order()
+        # One frame for the whole window; the per-bookmark warm-up below is then
+        # local work (metadata, tracking status) against the filled cache.
+        await self._prefetch_series_data(ordered)
         for bm in ordered[:3]:
             await self._warm_bookmark(bm)
 
@@ -835,7 +862,9 @@ class BookmarkBrowserView(BaseLayoutView):
             lines.append(f"**Subscribed:** {'Yes' if ts.subscribed else 'No'}")
         return lines
 
-    def _chapter_lines(self, bm: Bookmark, chapters: list[Chapter], status: str) -> tuple[str, str]:
+    def _chapter_lines(
+        self, bm: Bookmark, chapters: Sequence[Chapter], status: str
+    ) -> tuple[str, str]:
         """Render the **Latest Chapter** and **Next Chapter** rows as hyperlinks.
 
         Latest is the newest chapter; next-to-read is the chapter right after the
@@ -855,7 +884,9 @@ class BookmarkBrowserView(BaseLayoutView):
             next_md = "`Wait for updates`"
         return f"**Latest Chapter:** {latest_md}", f"**Next Chapter:** {next_md}"
 
-    async def _visual_container(self, bm: Bookmark) -> tuple[discord.ui.Container, list[Chapter]]:
+    async def _visual_container(
+        self, bm: Bookmark
+    ) -> tuple[discord.ui.Container, Sequence[Chapter]]:
         meta = await self._meta_for(bm)
         title = meta["title"]
         series_url = meta["series_url"]
@@ -945,7 +976,9 @@ class BookmarkBrowserView(BaseLayoutView):
         row.add_item(select)
         return row
 
-    def _build_last_read_row(self, bm: Bookmark, chapters: list[Chapter]) -> discord.ui.ActionRow:
+    def _build_last_read_row(
+        self, bm: Bookmark, chapters: Sequence[Chapter]
+    ) -> discord.ui.ActionRow:
         """[-5] [-1] [Chapter X (link)] [+1] [+5]."""
         row = discord.ui.ActionRow()
 
@@ -1685,7 +1718,7 @@ class _BookmarkSearchModal(discord.ui.Modal, title="Search bookmarks"):
         await self._browser._jump_to_search(interaction, str(self.query.value or ""))
 
 
-def _format_last_read(bm: Bookmark, chapters: list[Chapter]) -> str:
+def _format_last_read(bm: Bookmark, chapters: Sequence[Chapter]) -> str:
     """Format the bookmark's last-read chapter as a hyperlink when possible."""
     if bm.last_read_index is not None and 0 <= bm.last_read_index < len(chapters):
         return chapter_markdown(chapters[bm.last_read_index])
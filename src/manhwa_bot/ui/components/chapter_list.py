@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import discord
 
+from ...crawler.chapter import Chapter
 from .base import (
     LIST_MAX,
     BaseLayoutView,
@@ -15,12 +18,12 @@ from .base import (
 )
 
 
-def _format_chapter_line(idx: int, ch: dict) -> str:
+def _format_chapter_line(idx: int, ch: Chapter | dict) -> str:
     return f"`{idx:>3}.` {chapter_markdown(ch, idx)}"
 
 
 def build_chapter_list_views(
-    chapters: list[dict],
+    chapters: Sequence[Chapter | dict],
     *,
     manga_title: str,
     manga_url: str | None,
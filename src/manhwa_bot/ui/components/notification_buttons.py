@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Sequence
 from types import SimpleNamespace
 
 import discord
 
-from ...crawler.chapter import Chapter
+from ...crawler.chapter import Chapter, ChapterList
 from ...db.bookmarks import Bookmark, BookmarkStore
 from ...db.dm_settings import DmSettingsStore
 from ...db.guild_settings import GuildSettingsStore
@@ -95,10 +96,7 @@ async def _resolve_mark_read_chapter(
                 "failed to resolve notification chapter for %s:%s", website_key, url_name
             )
         else:
-            chapter = next(
-                (chapter for chapter in chapters if chapter.index == chapter_index),
-                chapters[chapter_index] if 0 <= chapter_index < len(chapters) else None,
-            )
+            _, chapter = _locate_chapter(chapters, chapter_index)
             if chapter is not None:
                 return chapter.name, str(chapter)
 
@@ -291,7 +289,7 @@ async def _resolve_chapter_list(
     tracked: TrackedSeries | None,
     website_key: str,
     url_name: str,
-) -> list[Chapter]:
+) -> Sequence[Chapter]:
     """Fetch the crawler's chapter list for a series (empty on any failure)."""
     crawler = getattr(client, "crawler", None)
     if crawler is None:
@@ -306,7 +304,7 @@ async def _resolve_chapter_list(
 
 
 def _locate_chapter(
-    chapters: list[Chapter], chapter_index: int
+    chapters: Sequence[Chapter], chapter_index: int
 ) -> tuple[int | None, Chapter | None]:
     """Find the bookmark's last-read chapter by its ``index`` field, else by position.
 
@@ -315,9 +313,14 @@ def _locate_chapter(
     the index field first and falling back to the position handles both, and the
     returned position lets callers derive the *next* chapter to read.
     """
-    for position, chapter in enumerate(chapters):
-        if chapter.index == chapter_index:
-            return position, chapter
+    if isinstance(chapters, ChapterList):
+        position = chapters.position_of(chapter_index)
+        if position is not None:
+            return position, chapters[position]
+    else:
+        for position, chapter in enumerate(chapters):
+            if chapter.index == chapter_index:
+                return position, chapter
     if 0 <= chapter_index < len(chapters):
         return chapter_index, chapters[chapter_index]
     return None, None
@@ -339,7 +342,7 @@ def _clicked_chapter_details(
 
 
 def _expected_next_chapter(
-    chapters: list[Chapter],
+    chapters: Sequence[Chapter],
     bookmark: Bookmark | None,
 ) -> tuple[int | None, Chapter | None]:
     if not chapters:
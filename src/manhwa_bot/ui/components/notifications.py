@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from typing import Any
+
 import discord
 
 from ...crawler.chapter import Chapter
@@ -37,6 +40,10 @@ _SOURCE_FOOTERS = {
 # Discord's hard cap on a component custom_id; longer ids 400 the whole message.
 _CUSTOM_ID_MAX = 100
 
+# A digest lists at most this many chapters (the newest ones) and counts the rest,
+# keeping the message well inside Discord's text limit.
+_DIGEST_MAX_LISTED = 10
+
 
 def _notification_footer(payload: dict) -> str | None:
     """Compose the human scanlator label with the update-check source."""
@@ -62,16 +69,25 @@ def build_chapter_update_view(
 ) -> discord.ui.LayoutView:
     """Build a fresh push-notification LayoutView for a new chapter.
 
-    Must be called per delivery — views can't be shared across messages. The
+    Returns a fresh view — views can't be shared across messages. Fan-out goes
+    through :class:`NotificationRenderCache`, which builds one per recipient
+    variant and hands each delivery a light wrapper around it. The
     view has `timeout=None` so interactive buttons survive bot restarts
     (callbacks are routed through `DynamicItem` classes registered in
     `ManhwaBot.setup_hook`).
+
+    When `payload["chapters"]` holds more than one chapter (a catch-up digest,
+    oldest first), they are listed together; `payload["chapter"]` is still the
+    newest one and is what the buttons act on.
     """
     series_title = payload.get("series_title") or payload.get("url_name") or "New chapter"
     series_url = payload.get("series_url") or None
     raw_chapter = payload.get("chapter") or {}
     chapter = raw_chapter if isinstance(raw_chapter, Chapter) else Chapter.from_dict(raw_chapter)
-    is_premium = chapter.is_premium
+    chapters = [
+        c if isinstance(c, Chapter) else Chapter.from_dict(c) for c in payload.get("chapters") or []
+    ]
+    is_premium = any(c.is_premium for c in chapters) if len(chapters) > 1 else chapter.is_premium
     cover_url = cover_media_url or payload.get("cover_url")
     website_key = str(payload.get("website_key") or "")
     url_name = str(payload.get("url_name") or "")
@@ -82,8 +98,15 @@ def build_chapter_update_view(
         if series_url
         else f"## {glyph}  {series_title}"
     )
-    chapter_display = chapter_markdown(chapter)
-    body = f"**New chapter:** {chapter_display}"
+    if len(chapters) > 1:
+        listed = chapters[-_DIGEST_MAX_LISTED:]
+        lines = [f"**{len(chapters)} new chapters:**"]
+        if len(chapters) > len(listed):
+            lines.append(f"-# …and {len(chapters) - len(listed)} earlier")
+        lines.extend(f"- {chapter_markdown(c)}" for c in listed)
+        body = "\n".join(lines)
+    else:
+        body = f"**New chapter:** {chapter_markdown(chapter)}"
 
     container = discord.ui.Container()  # no accent_colour
     gallery = hero_cover_gallery(cover_url, spoiler=spoiler)
@@ -221,10 +244,132 @@ def _build_button_row(
     return row
 
 
+class RenderedNotificationView(discord.ui.LayoutView):
+    """A notification rendered once, sent with one recipient's ping in front.
+
+    Wraps a shared template view and its serialized components; only the ping
+    TextDisplay is per recipient. It is never dispatchable: the buttons are
+    plain items whose clicks are routed by the ``DynamicItem`` templates
+    registered in ``ManhwaBot.setup_hook``, so discord.py has nothing to store
+    per message (and the shared template is never bound to one).
+    """
+
+    def __init__(
+        self, template: discord.ui.LayoutView, components: list[dict[str, Any]], ping: str
+    ) -> None:
+        self._template = template
+        self._components = components
+        self._ping = ping
+        super().__init__(timeout=None)
+
+    @property
+    def children(self) -> list[discord.ui.Item[Any]]:
+        head: list[discord.ui.Item[Any]] = (
+            [discord.ui.TextDisplay(self._ping)] if self._ping else []
+        )
+        return head + self._template.children
+
+    def walk_children(self) -> Iterator[discord.ui.Item[Any]]:
+        if self._ping:
+            yield discord.ui.TextDisplay(self._ping)
+        yield from self._template.walk_children()
+
+    def to_components(self) -> list[dict[str, Any]]:
+        if not self._ping:
+            return list(self._components)
+        ping = {"type": discord.ComponentType.text_display.value, "content": self._ping}
+        return [ping, *self._components]
+
+    def is_dispatchable(self) -> bool:
+        return False
+
+    def has_components_v2(self) -> bool:
+        return True
+
+    def content_length(self) -> int:
+        return len(self._ping) + self._template.content_length()
+
+
+class NotificationRenderCache:
+    """Renders one notification record once per recipient variant.
+
+    Recipients of a record differ only in the payload they may see (a digest is
+    filtered per paid-chapter preference), their allowed buttons, spoilering,
+    the cover URI and their ping. Each ``(payload, allowed_buttons, spoiler,
+    cover_media_url)`` variant is built and serialized once, without a ping;
+    every recipient then gets a :class:`RenderedNotificationView` that splices
+    its ping in front. Create one cache per record: it keys payloads by
+    identity and keeps them alive for that reason.
+    """
+
+    def __init__(self) -> None:
+        # key -> (payload, template view, its serialized components)
+        self._variants: dict[
+            tuple[Any, ...], tuple[dict, discord.ui.LayoutView, list[dict[str, Any]]]
+        ] = {}
+        self.builds = 0
+
+    def chapter_view(
+        self,
+        payload: dict,
+        *,
+        allowed_buttons: frozenset[str] = ALL_UPDATE_BUTTONS,
+        ping: str | None = None,
+        spoiler: bool = False,
+        cover_media_url: str | None = None,
+    ) -> discord.ui.LayoutView:
+        return self._view(
+            ("chapter", id(payload), allowed_buttons, spoiler, cover_media_url),
+            payload,
+            ping,
+            lambda: build_chapter_update_view(
+                payload,
+                allowed_buttons=allowed_buttons,
+                spoiler=spoiler,
+                cover_media_url=cover_media_url,
+            ),
+        )
+
+    def status_view(
+        self,
+        payload: dict,
+        *,
+        ping: str | None = None,
+        spoiler: bool = False,
+        cover_media_url: str | None = None,
+    ) -> discord.ui.LayoutView:
+        return self._view(
+            ("status", id(payload), spoiler, cover_media_url),
+            payload,
+            ping,
+            lambda: build_status_change_view(
+                payload, spoiler=spoiler, cover_media_url=cover_media_url
+            ),
+        )
+
+    def _view(
+        self,
+        key: tuple[Any, ...],
+        payload: dict,
+        ping: str | None,
+        build: Callable[[], discord.ui.LayoutView],
+    ) -> discord.ui.LayoutView:
+        cached = self._variants.get(key)
+        if cached is None:
+            template = build()
+            self.builds += 1
+            cached = (payload, template, template.to_components())
+            self._variants[key] = cached
+        _, template, components = cached
+        return RenderedNotificationView(template, components, (ping or "").strip())
+
+
 __all__ = [
     "ALL_UPDATE_BUTTONS",
     "UPDATE_BUTTON_KEYS",
     "UPDATE_BUTTON_LABELS",
+    "NotificationRenderCache",
+    "RenderedNotificationView",
     "build_chapter_update_view",
     "build_status_change_view",
 ]
@@ -633,6 +633,7 @@ class SettingsLayoutView(BaseLayoutView):
                 "DELETE FROM guild_settings WHERE guild_id = ?",
                 (self._guild_id,),
             )
+            pool.changes.publish("guild_settings", self._guild_id)
         from .error import build_success_view
 
         await interaction.response.edit_message(
@@ -733,18 +734,15 @@ class ScanlatorChannelsLayoutView(BaseLayoutView):
 
     async def _on_add_override(self, interaction: discord.Interaction) -> None:
         bot = self._bot
-        ttl = bot.config.supported_websites_cache.ttl_seconds
-
-        async def _loader() -> list[str]:
-            data = await bot.crawler.request("supported_websites")
-            return [
+        try:
+            data = await bot.crawler.cached_request(
+                "supported_websites", ttl=bot.config.supported_websites_cache.ttl_seconds
+            )
+            keys: list[str] = [
                 w.get("key") or w.get("website_key")
                 for w in data.get("websites", [])
                 if w.get("key") or w.get("website_key")
             ]
-
-        try:
-            keys: list[str] = await bot.websites_cache.get_or_set("websites", _loader, ttl)
         except Exception:
             _log.exception("Failed to load website keys for scanlator override")
             keys = []
@@ -7,10 +7,13 @@ formatter.
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Sequence
+from typing import Any
 
 import discord
 
+from ...crawler.admission import Priority
 from .. import emojis
 from .base import (
     LIST_MAX,
@@ -24,6 +27,8 @@ from .base import (
     small_separator,
 )
 
+_log = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # /track new — hero success view
 # ---------------------------------------------------------------------------
@@ -231,6 +236,55 @@ def build_role_hierarchy_view(bot: discord.Client | None = None) -> discord.ui.L
 # ---------------------------------------------------------------------------
 
 
+async def enrich_grouped_list_items(
+    crawler: Any, items: Sequence[dict], *, fields: Sequence[str]
+) -> None:
+    """Fill blank *fields* of grouped-list items from the crawler's stored series data.
+
+    Items carry ``website_key`` + ``url_name``; every item missing one of
+    *fields* (``title``, ``url``, ``last_chapter``) is covered by a single
+    batched ``series_data`` request. Best-effort: on failure items are left
+    as they were.
+    """
+    needy = [
+        item
+        for item in items
+        if item.get("website_key")
+        and item.get("url_name")
+        and any(not item.get(field) for field in fields)
+    ]
+    if not needy:
+        return
+    try:
+        results = await crawler.request_batch(
+            "series_data",
+            items=[{"website_key": it["website_key"], "url_name": it["url_name"]} for it in needy],
+            # The user is waiting on this list; don't queue it behind background batches.
+            priority=Priority.NORMAL,
+            allow_live=False,
+        )
+    except Exception:
+        _log.debug("grouped list enrichment failed", exc_info=True)
+        return
+    for item in needy:
+        data = results.get((item["website_key"], item["url_name"]))
+        if not isinstance(data, dict):
+            continue
+        if "title" in fields and not item.get("title") and data.get("title"):
+            item["title"] = str(data["title"])
+        if "url" in fields and not item.get("url"):
+            item["url"] = str(data.get("url") or data.get("series_url") or "")
+        if "last_chapter" in fields and not item.get("last_chapter"):
+            # Chapters arrive ascending (oldest → newest).
+            chapters = data.get("latest_chapters") or data.get("chapters") or []
+            newest = chapters[-1] if chapters else None
+            name = getattr(newest, "name", None)
+            if name:
+                item["last_chapter"] = name
+                item["last_chapter_url"] = getattr(newest, "url", None) or None
+                item["last_chapter_is_premium"] = getattr(newest, "is_premium", None)
+
+
 def build_grouped_list_views(
     items: Sequence[dict],
     *,
@@ -7,6 +7,8 @@ from types import SimpleNamespace
 from typing import Any
 
 from manhwa_bot import autocomplete
+from manhwa_bot.config import CrawlerConfig
+from manhwa_bot.crawler.client import CrawlerClient
 from manhwa_bot.db.bookmarks import BookmarkStore
 from manhwa_bot.db.migrate import apply_pending
 from manhwa_bot.db.pool import DbPool
@@ -14,6 +16,25 @@ from manhwa_bot.db.subscriptions import SubscriptionStore
 from manhwa_bot.db.tracked import TrackedStore
 
 
+class _CachingCrawler(CrawlerClient):
+    """Real ``cached_request`` layer over a test-scripted ``request``."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            CrawlerConfig(
+                ws_url="ws://unused",
+                http_base_url="http://unused",
+                request_timeout_seconds=5.0,
+                transport_watchdog_seconds=10.0,
+                reconnect_initial_delay_seconds=0.05,
+                reconnect_max_delay_seconds=0.2,
+                reconnect_jitter_seconds=0.0,
+                consumer_key="test",
+                api_key="test-key",
+            )
+        )
+
+
 async def _make_pool(tmp: str) -> DbPool:
     pool = await DbPool.open(str(Path(tmp) / "test.db"))
     await apply_pending(pool)
@@ -189,7 +210,7 @@ def test_track_new_autocomplete_queries_crawler_for_empty_input() -> None:
     async def _run() -> None:
         calls: list[dict[str, Any]] = []
 
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 calls.append({"type": type_, **fields})
                 return {
@@ -202,7 +223,6 @@ def test_track_new_autocomplete_queries_crawler_for_empty_input() -> None:
                     ]
                 }
 
-        autocomplete.clear_track_new_autocomplete_cache()
         choices = await autocomplete.track_new_url_or_search(_interaction(crawler=Crawler()), "")
 
         assert calls == [{"type": "autocomplete", "query": "", "limit": 10}]
@@ -217,7 +237,7 @@ def test_all_manga_autocomplete_queries_crawler_catalog() -> None:
     async def _run() -> None:
         calls: list[dict[str, Any]] = []
 
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 calls.append({"type": type_, **fields})
                 return {
@@ -230,7 +250,6 @@ def test_all_manga_autocomplete_queries_crawler_catalog() -> None:
                     ]
                 }
 
-        autocomplete.clear_track_new_autocomplete_cache()
         choices = await autocomplete.all_manga(_interaction(crawler=Crawler()), "someone")
 
         assert calls == [{"type": "autocomplete", "query": "someone", "limit": 10}]
@@ -248,7 +267,7 @@ def test_track_new_autocomplete_reuses_cached_results() -> None:
     async def _run() -> None:
         calls: list[str] = []
 
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 del type_
                 calls.append(str(fields["query"]))
@@ -262,7 +281,6 @@ def test_track_new_autocomplete_reuses_cached_results() -> None:
                     ]
                 }
 
-        autocomplete.clear_track_new_autocomplete_cache()
         interaction = _interaction(crawler=Crawler())
 
         first_choices = await autocomplete.track_new_url_or_search(interaction, "solo")
@@ -284,7 +302,7 @@ def test_track_new_autocomplete_coalesces_identical_inflight_queries() -> None:
         calls: list[str] = []
         release = asyncio.Event()
 
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 del type_
                 calls.append(str(fields["query"]))
@@ -299,7 +317,6 @@ def test_track_new_autocomplete_coalesces_identical_inflight_queries() -> None:
                     ]
                 }
 
-        autocomplete.clear_track_new_autocomplete_cache()
         interaction = _interaction(crawler=Crawler())
         first = asyncio.create_task(autocomplete.track_new_url_or_search(interaction, "solo"))
         await asyncio.sleep(0)
@@ -326,7 +343,7 @@ def test_track_new_autocomplete_does_not_sleep_before_different_queries(
     async def _run() -> None:
         calls: list[str] = []
 
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 del type_
                 calls.append(str(fields["query"]))
@@ -335,7 +352,6 @@ def test_track_new_autocomplete_does_not_sleep_before_different_queries(
         async def _fail_sleep(delay: float) -> None:
             raise AssertionError(f"autocomplete should not sleep before querying: {delay}")
 
-        autocomplete.clear_track_new_autocomplete_cache()
         monkeypatch.setattr(autocomplete.asyncio, "sleep", _fail_sleep)
         interaction = _interaction(crawler=Crawler())
 
@@ -350,7 +366,7 @@ def test_user_bookmark_chapters_uses_selected_series_from_namespace() -> None:
     async def _run() -> None:
         calls: list[dict[str, Any]] = []
 
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 calls.append({"type": type_, **fields})
                 return {
@@ -406,7 +422,7 @@ def test_user_bookmark_chapters_uses_selected_series_from_namespace() -> None:
 
 def test_user_bookmark_chapters_filters_by_typed_value() -> None:
     async def _run() -> None:
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 del type_, fields
                 return {
@@ -446,7 +462,7 @@ def test_user_bookmark_chapters_prompts_when_no_series_selected() -> None:
     # Before a manga is picked the field instantly shows a single hint choice,
     # without touching the DB or crawler.
     async def _run() -> None:
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 raise AssertionError("must not query the crawler without a selected series")
 
@@ -466,7 +482,7 @@ def test_user_bookmark_chapters_prompts_when_no_series_selected() -> None:
 def test_user_bookmark_chapters_returns_latest_first_descending() -> None:
     # No chapter input yet → newest chapters at the top (descending index).
     async def _run() -> None:
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 del type_, fields
                 return {
@@ -506,7 +522,7 @@ def test_user_bookmark_chapters_returns_latest_first_descending() -> None:
 
 def test_user_bookmark_chapters_returns_empty_without_selected_bookmark() -> None:
     async def _run() -> None:
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 raise AssertionError("chapter autocomplete should not query without a bookmark")
 
@@ -536,7 +552,7 @@ def test_user_bookmark_chapters_returns_quickly_while_fetch_warms_cache(monkeypa
         release = asyncio.Event()
         calls: list[dict[str, Any]] = []
 
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 calls.append({"type": type_, **fields})
                 await release.wait()
@@ -606,7 +622,7 @@ def test_user_bookmark_chapters_does_not_cache_empty_result_long(monkeypatch) ->
     async def _run() -> None:
         state = {"fail": True}
 
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 if state["fail"]:
                     raise RuntimeError("crawler busy")
@@ -643,6 +659,46 @@ def test_user_bookmark_chapters_does_not_cache_empty_result_long(monkeypatch) ->
     asyncio.run(_run())
 
 
+def test_user_bookmark_chapters_refetches_after_series_invalidation() -> None:
+    async def _run() -> None:
+        chapters = [{"chapter": "Chapter 1"}]
+
+        class Crawler(_CachingCrawler):
+            async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
+                return {"chapters": list(chapters)}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pool = await _make_pool(tmp)
+            try:
+                autocomplete.clear_chapter_autocomplete_cache()
+                await BookmarkStore(pool).upsert_bookmark(200, "asura", "solo-leveling")
+                crawler = Crawler()
+                crawler.invalidations.subscribe(autocomplete.invalidate_chapter_autocomplete_series)
+                interaction = _interaction(
+                    pool=pool,
+                    crawler=crawler,
+                    namespace=SimpleNamespace(manga="asura:solo-leveling"),
+                )
+
+                first = await autocomplete.user_bookmark_chapters(interaction, "")
+                chapters.append({"chapter": "Chapter 2"})
+                cached = await autocomplete.user_bookmark_chapters(interaction, "")
+                crawler.invalidations.publish("asura", "solo-leveling")
+                fresh = await autocomplete.user_bookmark_chapters(interaction, "")
+
+                assert [c.value for c in first] == ["0"]
+                assert [c.value for c in cached] == ["0"]
+                assert [(c.name, c.value) for c in fresh] == [
+                    ("1 - Chapter 2", "1"),
+                    ("0 - Chapter 1", "0"),
+                ]
+            finally:
+                autocomplete.clear_chapter_autocomplete_cache()
+                await pool.close()
+
+    asyncio.run(_run())
+
+
 def test_user_bookmark_chapters_uses_url_name_for_untracked_bookmark() -> None:
     # Untracked bookmarks have no stored series_url; the autocomplete must key
     # the cached series_data lookup on url_name (a bare url_name passed to a
@@ -650,7 +706,7 @@ def test_user_bookmark_chapters_uses_url_name_for_untracked_bookmark() -> None:
     async def _run() -> None:
         calls: list[dict[str, Any]] = []
 
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 calls.append({"type": type_, **fields})
                 return {
@@ -754,7 +810,7 @@ def test_user_bookmark_chapters_resolves_tokenized_series_value() -> None:
         token = autocomplete.series_choice_value("comix", long_url)
         assert token.startswith("#")
 
-        class Crawler:
+        class Crawler(_CachingCrawler):
             async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
                 assert fields["url_name"] == long_url
                 return {"chapters": [{"chapter": "Chapter 1"}, {"chapter": "Chapter 2"}]}
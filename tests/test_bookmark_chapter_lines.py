@@ -25,6 +25,10 @@ def _collect_text(view) -> str:
 
 
 class _Crawler:
+    async def cached_request(self, type_: str, *, ttl: float | None = None, **kwargs):
+        del ttl
+        return await self.request(type_, **kwargs)
+
     async def request(self, type_: str, **kwargs):
         if type_ == "series_data":
             slug = str(kwargs.get("url_name") or kwargs.get("url") or "series")
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from manhwa_bot.crawler.chapter import Chapter
+import pytest
+
+from manhwa_bot.crawler.chapter import Chapter, ChapterList
 from manhwa_bot.ui import emojis
 
 
@@ -88,3 +90,70 @@ def test_list_from_payload_preserves_existing_chapter_instances() -> None:
     out = Chapter.list_from_payload({"chapters": [existing, {"name": "Other"}]})
     assert out[0] is existing
     assert out[1].name == "Other"
+
+
+def _rows(count: int) -> list[dict]:
+    return [
+        {"name": f"Ch {i}", "url": f"https://example.test/{i}", "index": i * 10, "paid": i % 3 == 0}
+        for i in range(count)
+    ]
+
+
+def test_chapter_list_reads_like_a_list_of_chapters() -> None:
+    raw = _rows(20)
+    eager = [Chapter.from_dict(row, fallback_idx=i) for i, row in enumerate(raw)]
+
+    chapters = Chapter.list_from_payload({"chapters": raw})
+
+    assert isinstance(chapters, ChapterList)
+    assert len(chapters) == 20
+    assert chapters == eager
+    assert list(chapters) == eager
+    assert chapters[-1] == eager[-1]
+    assert chapters[3] is chapters[3]
+    assert chapters[5:9] == eager[5:9]
+    assert chapters[::-4] == eager[::-4]
+    assert chapters[-25:] == eager[-25:]
+    assert [c.is_premium for c in chapters[9:13]] == [True, False, False, True]
+    with pytest.raises(IndexError):
+        chapters[20]
+
+
+def test_chapter_list_find_by_index_uses_first_match() -> None:
+    raw = [*_rows(5), {"name": "Dup", "url": "u", "index": 20}]
+
+    chapters = ChapterList.from_rows(raw)
+
+    assert chapters.position_of(20) == 2
+    assert chapters.find_by_index(20) == chapters[2]
+    assert chapters.find_by_index(7) is None
+    assert chapters[1:].position_of(20) == 1
+
+
+def test_chapter_list_payload_passthrough_and_missing_index() -> None:
+    chapters = ChapterList.from_rows([{"name": "A"}, "junk", Chapter("B", "", None, False)])
+
+    assert Chapter.list_from_payload({"chapters": chapters}) is chapters
+    assert [c.index for c in chapters] == [0, None]
+    assert chapters.find_by_index(0) == chapters[0]
+
+
+class _CountingRow(dict):
+    reads = 0
+
+    def get(self, *args, **kwargs):  # type: ignore[override]
+        _CountingRow.reads += 1
+        return super().get(*args, **kwargs)
+
+
+def test_chapter_list_parses_rows_only_when_read() -> None:
+    _CountingRow.reads = 0
+    chapters = ChapterList.from_rows([_CountingRow(row) for row in _rows(100)])
+    assert _CountingRow.reads == 0
+
+    assert [c.index for c in chapters[-2:]] == [980, 990]
+    assert 0 < _CountingRow.reads < 30
+    before = _CountingRow.reads
+    # The hash index reads only each row's ``index`` field.
+    assert chapters.position_of(500) == 50
+    assert _CountingRow.reads - before == 100
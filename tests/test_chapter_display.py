@@ -198,6 +198,9 @@ def test_info_command_renders_dedicated_chapter_urls_when_info_payload_lacks_url
                 "chapters": [{"name": "Chapter 9", "is_premium": True}],
             }
 
+        async def cached_request(self, type_: str, **kwargs) -> dict:
+            return await self.request(type_, **kwargs)
+
         async def request(self, type_: str, **kwargs) -> dict:
             del kwargs
             self.calls.append(type_)
@@ -215,18 +218,12 @@ def test_info_command_renders_dedicated_chapter_urls_when_info_payload_lacks_url
                 return {"websites": [{"key": "site", "name": "Site"}]}
             raise AssertionError(type_)
 
-    class FakeCache:
-        async def get_or_set(self, key, loader, ttl):
-            del key, ttl
-            return await loader()
-
     async def _run() -> None:
         message = FakeMessage()
         crawler = FakeCrawler()
         bot = SimpleNamespace(
             db=None,
             crawler=crawler,
-            websites_cache=FakeCache(),
             config=SimpleNamespace(supported_websites_cache=SimpleNamespace(ttl_seconds=60)),
         )
         interaction = SimpleNamespace(
@@ -6,6 +6,7 @@ import discord
 
 from manhwa_bot.ui.components.notifications import (
     ALL_UPDATE_BUTTONS,
+    NotificationRenderCache,
     build_chapter_update_view,
     build_status_change_view,
 )
@@ -136,3 +137,16 @@ def test_status_change_view_sends_without_buttons() -> None:
     assert _buttons(view) == []
     assert isinstance(view.children[0], discord.ui.TextDisplay)
     assert view.children[0].content == "<@&42>"
+
+
+def test_render_cache_builds_each_variant_once_and_splices_the_ping() -> None:
+    payload = _payload()
+    render = NotificationRenderCache()
+    for ping in ("<@&1>", "<@&2>", None):
+        view = render.chapter_view(payload, allowed_buttons=ALL_UPDATE_BUTTONS, ping=ping)
+        direct = build_chapter_update_view(payload, allowed_buttons=ALL_UPDATE_BUTTONS, ping=ping)
+        assert view.to_components() == direct.to_components()
+        assert [type(c) for c in view.children] == [type(c) for c in direct.children]
+        assert not view.is_dispatchable()
+    render.chapter_view(payload, allowed_buttons=frozenset(), spoiler=True)
+    assert render.builds == 2
@@ -0,0 +1,65 @@
+"""Crawler WebSocket JSON codec selection."""
+
+from __future__ import annotations
+
+import pytest
+
+from manhwa_bot.crawler import codec
+
+
+def test_stdlib_codec_round_trips_envelope() -> None:
+    envelope = {"type": "series_data", "request_id": "r1", "website_key": "asura", "n": 3}
+
+    stdlib = codec.get_codec("stdlib")
+
+    assert stdlib.name == "stdlib"
+    assert stdlib.loads(stdlib.dumps(envelope)) == envelope
+
+
+def test_auto_prefers_orjson_when_installed() -> None:
+    expected = "orjson" if codec.ORJSON_CODEC is not None else "stdlib"
+
+    assert codec.get_codec("auto").name == expected
+
+
+def test_auto_falls_back_to_stdlib_without_orjson(monkeypatch) -> None:
+    monkeypatch.setattr(codec, "ORJSON_CODEC", None)
+
+    assert codec.get_codec("auto") is codec.STDLIB_CODEC
+    with pytest.raises(ValueError, match="not installed"):
+        codec.get_codec("orjson")
+
+
+def test_unknown_codec_name_rejected() -> None:
+    with pytest.raises(ValueError, match="unknown json codec"):
+        codec.get_codec("msgpack")
+
+
+def test_codecs_raise_value_error_on_bad_input() -> None:
+    for name in ("stdlib", "auto"):
+        with pytest.raises(ValueError):
+            codec.get_codec(name).loads("{not json")
+
+
+def test_json_wire_format_has_no_binary_codec() -> None:
+    assert codec.get_binary_codec("json") is None
+    with pytest.raises(ValueError, match="unknown wire format"):
+        codec.get_binary_codec("protobuf")
+
+
+def test_missing_binary_package_rejected(monkeypatch) -> None:
+    monkeypatch.setattr(codec, "MSGPACK_CODEC", None)
+
+    with pytest.raises(ValueError, match="msgpack package is not installed"):
+        codec.get_binary_codec("msgpack")
+
+
+def test_binary_codec_round_trips_and_names_its_subprotocol() -> None:
+    pytest.importorskip("msgpack")
+    msgpack_codec = codec.get_binary_codec("msgpack")
+    envelope = {"type": "series_data", "ok": True, "data": {"chapters": [{"index": 0}]}}
+
+    assert msgpack_codec is not None
+    assert msgpack_codec.loads(msgpack_codec.dumps(envelope)) == envelope
+    assert codec.binary_codec_for_subprotocol(msgpack_codec.subprotocol) is msgpack_codec
+    assert codec.binary_codec_for_subprotocol(None) is None
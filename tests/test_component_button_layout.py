@@ -10,9 +10,16 @@ from unittest.mock import AsyncMock
 
 import discord
 
-from manhwa_bot.config import DiscordPremiumConfig, PatreonPremiumConfig, PremiumConfig
+from manhwa_bot.config import (
+    CrawlerConfig,
+    DiscordPremiumConfig,
+    PatreonPremiumConfig,
+    PremiumConfig,
+)
+from manhwa_bot.crawler.client import CrawlerClient
 from manhwa_bot.db.bookmarks import Bookmark
 from manhwa_bot.db.guild_settings import GuildSettings
+from manhwa_bot.scripts.fake_crawler import FakeCrawler, sample_series
 from manhwa_bot.ui.components import (
     bookmark,
     chapter_list,
@@ -535,6 +542,10 @@ class _DeletingBookmarkStore:
 
 
 class _FakeBookmarkCrawler:
+    async def cached_request(self, type_: str, *, ttl: float | None = None, **kwargs):
+        del ttl
+        return await self.request(type_, **kwargs)
+
     async def request(self, type_: str, **kwargs):
         if type_ == "series_data":
             slug = str(kwargs.get("url_name") or kwargs.get("url") or "series")
@@ -700,6 +711,10 @@ class _CountingBookmarkCrawler:
     def __init__(self) -> None:
         self.calls: list[tuple[str, str]] = []
 
+    async def cached_request(self, type_: str, *, ttl: float | None = None, **kwargs):
+        del ttl
+        return await self.request(type_, **kwargs)
+
     async def request(self, type_: str, **kwargs):
         self.calls.append((type_, str(kwargs.get("url_name") or kwargs.get("url") or "")))
         if type_ == "series_data":
@@ -765,6 +780,10 @@ class _SeriesDataBookmarkCrawler:
     def __init__(self) -> None:
         self.calls: list[tuple[str, dict]] = []
 
+    async def cached_request(self, type_: str, *, ttl: float | None = None, **kwargs):
+        del ttl
+        return await self.request(type_, **kwargs)
+
     async def request(self, type_: str, **kwargs):
         self.calls.append((type_, dict(kwargs)))
         if type_ == "series_data":
@@ -796,6 +815,10 @@ class _BlockingSeriesDataCrawler:
         self.started = asyncio.Event()
         self.release = asyncio.Event()
 
+    async def cached_request(self, type_: str, *, ttl: float | None = None, **kwargs):
+        del ttl
+        return await self.request(type_, **kwargs)
+
     async def request(self, type_: str, **kwargs):
         if type_ != "series_data":
             return {}
@@ -1780,3 +1803,47 @@ def test_paginator_buttons_are_nested_inside_page_containers() -> None:
 
     for page in paginator._pages:
         _assert_buttons_are_nested(page)
+
+
+def test_bookmark_browser_preload_warms_window_with_one_batch_frame() -> None:
+    async def run() -> FakeCrawler:
+        crawler = FakeCrawler(
+            {("site", f"series-{i}"): sample_series("site", f"series-{i}") for i in range(30)}
+        )
+        await crawler.start()
+        client = CrawlerClient(
+            CrawlerConfig(
+                ws_url=crawler.ws_url,
+                http_base_url="http://unused",
+                request_timeout_seconds=5.0,
+                transport_watchdog_seconds=10.0,
+                reconnect_initial_delay_seconds=0.05,
+                reconnect_max_delay_seconds=0.2,
+                reconnect_jitter_seconds=0.0,
+                consumer_key="test",
+                api_key="test-key",
+            )
+        )
+        try:
+            await client.start()
+            browser = bookmark.BookmarkBrowserView(
+                _bookmark_series(30),
+                store=SimpleNamespace(),
+                tracked=_CountingTrackedStore(),
+                subscriptions=_NoopSubscriptionStore(),
+                guild_settings=_NoopGuildSettingsStore(),
+                crawler=client,
+                invoker_id=1,
+                index=12,
+            )
+            await browser._preload_visible_cache()
+            assert _cached_series_names(browser) == [f"series-{i}" for i in range(7, 17)]
+        finally:
+            await client.stop()
+            await crawler.stop()
+        return crawler
+
+    crawler = asyncio.run(run())
+
+    assert crawler.requests_of("series_data") == []
+    assert len(crawler.requests_of("series_data_batch")) == 1
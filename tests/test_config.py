@@ -90,6 +90,114 @@ transport_watchdog_seconds = 180.0
     assert config.crawler.transport_watchdog_seconds == 240.0
 
 
+def test_load_config_reads_crawler_pool_size(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("[crawler]\npool_size = 3\n", encoding="utf-8")
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "fake-token")
+    monkeypatch.setenv("CRAWLER_API_KEY", "fake-crawler-key")
+
+    config = load_config(config_path, env_path=tmp_path / ".env")
+
+    assert config.crawler.pool_size == 3
+
+
+def test_load_config_rejects_empty_crawler_pool(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("[crawler]\npool_size = 0\n", encoding="utf-8")
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "fake-token")
+    monkeypatch.setenv("CRAWLER_API_KEY", "fake-crawler-key")
+
+    with pytest.raises(ConfigError, match="pool_size"):
+        load_config(config_path, env_path=tmp_path / ".env")
+
+
+def test_load_config_reads_crawler_response_cache_size(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("[crawler]\n", encoding="utf-8")
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "fake-token")
+    monkeypatch.setenv("CRAWLER_API_KEY", "fake-crawler-key")
+    monkeypatch.setenv("MANHWABOT_CRAWLER_RESPONSE_CACHE_MAX_ENTRIES", "64")
+
+    config = load_config(config_path, env_path=tmp_path / ".env")
+
+    assert config.crawler.response_cache_max_entries == 64
+
+
+def test_load_config_reads_crawler_codec_settings(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        '[crawler]\njson_codec = "STDLIB"\ndecode_offload_bytes = 4096\n', encoding="utf-8"
+    )
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "fake-token")
+    monkeypatch.setenv("CRAWLER_API_KEY", "fake-crawler-key")
+
+    config = load_config(config_path, env_path=tmp_path / ".env")
+
+    assert config.crawler.json_codec == "stdlib"
+    assert config.crawler.decode_offload_bytes == 4096
+    assert config.crawler.ws_compress is True
+    assert config.crawler.wire_format == "json"
+
+
+def test_load_config_rejects_unknown_wire_format(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("[crawler]\n", encoding="utf-8")
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "fake-token")
+    monkeypatch.setenv("CRAWLER_API_KEY", "fake-crawler-key")
+    monkeypatch.setenv("MANHWABOT_CRAWLER_WIRE_FORMAT", "protobuf")
+
+    with pytest.raises(ConfigError, match="wire_format"):
+        load_config(config_path, env_path=tmp_path / ".env")
+
+
+def test_load_config_rejects_unknown_json_codec(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('[crawler]\njson_codec = "yaml"\n', encoding="utf-8")
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "fake-token")
+    monkeypatch.setenv("CRAWLER_API_KEY", "fake-crawler-key")
+
+    with pytest.raises(ConfigError, match="json_codec"):
+        load_config(config_path, env_path=tmp_path / ".env")
+
+
+def test_load_config_reads_crawler_admission_caps(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("[crawler]\nbulk_max_in_flight = 2\n", encoding="utf-8")
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "fake-token")
+    monkeypatch.setenv("CRAWLER_API_KEY", "fake-crawler-key")
+    monkeypatch.setenv("MANHWABOT_CRAWLER_MAX_IN_FLIGHT", "16")
+
+    config = load_config(config_path, env_path=tmp_path / ".env")
+
+    assert config.crawler.max_in_flight == 16
+    assert config.crawler.normal_max_in_flight == 48
+    assert config.crawler.bulk_max_in_flight == 2
+
+
+def test_load_config_reads_crawler_adaptive_timeouts(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("[crawler]\nadaptive_timeout_multiplier = 2.5\n", encoding="utf-8")
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "fake-token")
+    monkeypatch.setenv("CRAWLER_API_KEY", "fake-crawler-key")
+
+    config = load_config(config_path, env_path=tmp_path / ".env")
+
+    assert config.crawler.adaptive_timeouts is True
+    assert config.crawler.adaptive_timeout_multiplier == 2.5
+    assert config.crawler.adaptive_timeout_min_seconds == 3.0
+    assert config.crawler.adaptive_timeout_min_samples == 30
+
+
+def test_load_config_rejects_non_positive_adaptive_timeout_floor(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("[crawler]\nadaptive_timeout_min_seconds = 0\n", encoding="utf-8")
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "fake-token")
+    monkeypatch.setenv("CRAWLER_API_KEY", "fake-crawler-key")
+
+    with pytest.raises(ConfigError, match="adaptive_timeout_min_seconds"):
+        load_config(config_path, env_path=tmp_path / ".env")
+
+
 def test_load_config_defaults_cover_attachment_relay(tmp_path, monkeypatch) -> None:
     config_path = tmp_path / "config.toml"
     config_path.write_text("[notifications]\n", encoding="utf-8")
@@ -152,3 +260,13 @@ def test_load_config_rejects_non_positive_cover_attachment_limits(
 
     with pytest.raises(ConfigError, match="cover_attachment"):
         load_config(config_path, env_path=tmp_path / ".env")
+
+
+def test_load_config_rejects_negative_progress_interval(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("[crawler]\nprogress_min_interval_seconds = -1\n", encoding="utf-8")
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "fake-token")
+    monkeypatch.setenv("CRAWLER_API_KEY", "fake-crawler-key")
+
+    with pytest.raises(ConfigError, match="progress_min_interval_seconds"):
+        load_config(config_path, env_path=tmp_path / ".env")
@@ -0,0 +1,136 @@
+"""Priority admission control for crawler requests."""
+
+from __future__ import annotations
+
+import asyncio
+
+from manhwa_bot.config import CrawlerConfig
+from manhwa_bot.crawler.admission import (
+    AdmissionScheduler,
+    Priority,
+    priority_scope,
+    resolve_priority,
+)
+from manhwa_bot.crawler.client import CrawlerClient
+from manhwa_bot.scripts.fake_crawler import FakeCrawler, sample_series
+
+
+def _stats(scheduler: AdmissionScheduler, priority: Priority):
+    return next(s for s in scheduler.stats() if s.priority is priority)
+
+
+def test_priority_resolution_order() -> None:
+    assert resolve_priority("search") is Priority.NORMAL
+    assert resolve_priority("autocomplete") is Priority.INTERACTIVE
+    assert resolve_priority("notifications_list") is Priority.BULK
+    with priority_scope(Priority.BULK):
+        assert resolve_priority("search") is Priority.BULK
+        assert resolve_priority("search", Priority.INTERACTIVE) is Priority.INTERACTIVE
+    assert resolve_priority("search") is Priority.NORMAL
+
+
+def test_bulk_cap_queues_bulk_but_not_interactive() -> None:
+    async def _run() -> None:
+        scheduler = AdmissionScheduler(4, {Priority.BULK: 1})
+        release = asyncio.Event()
+
+        async def hold(priority: Priority) -> float:
+            async with scheduler.slot(priority) as waited:
+                await release.wait()
+                return waited
+
+        first = asyncio.create_task(hold(Priority.BULK))
+        second = asyncio.create_task(hold(Priority.BULK))
+        await asyncio.sleep(0.02)
+        assert _stats(scheduler, Priority.BULK).in_flight == 1
+        assert _stats(scheduler, Priority.BULK).queued == 1
+
+        async with scheduler.slot(Priority.INTERACTIVE) as waited:
+            assert waited == 0.0
+
+        release.set()
+        assert await first == 0.0
+        assert await second > 0.0
+        bulk = _stats(scheduler, Priority.BULK)
+        assert (bulk.admitted, bulk.waited, bulk.in_flight) == (2, 1, 0)
+        assert bulk.max_wait_seconds >= 0.02
+
+    asyncio.run(_run())
+
+
+def test_freed_slot_goes_to_highest_waiting_priority() -> None:
+    async def _run() -> None:
+        scheduler = AdmissionScheduler(1, {})
+        order: list[Priority] = []
+
+        async def take(priority: Priority) -> None:
+            async with scheduler.slot(priority):
+                order.append(priority)
+
+        async with scheduler.slot(Priority.NORMAL):
+            tasks = [
+                asyncio.create_task(take(p))
+                for p in (Priority.BULK, Priority.NORMAL, Priority.INTERACTIVE)
+            ]
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        assert order == [Priority.INTERACTIVE, Priority.NORMAL, Priority.BULK]
+
+    asyncio.run(_run())
+
+
+def test_cancelled_waiter_does_not_leak_a_slot() -> None:
+    async def _run() -> None:
+        scheduler = AdmissionScheduler(1, {})
+
+        async def take() -> None:
+            async with scheduler.slot(Priority.BULK):
+                pass
+
+        async with scheduler.slot(Priority.NORMAL):
+            waiter = asyncio.create_task(take())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+
+        async with scheduler.slot(Priority.BULK) as waited:
+            assert waited == 0.0
+        assert all(s.in_flight == 0 and s.queued == 0 for s in scheduler.stats())
+
+    asyncio.run(_run())
+
+
+def test_client_admits_requests_at_their_priority() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler({("site", "s-0"): sample_series("site", "s-0")})
+        await crawler.start()
+        client = CrawlerClient(
+            CrawlerConfig(
+                ws_url=crawler.ws_url,
+                http_base_url="http://unused",
+                request_timeout_seconds=5.0,
+                transport_watchdog_seconds=10.0,
+                reconnect_initial_delay_seconds=0.05,
+                reconnect_max_delay_seconds=0.2,
+                reconnect_jitter_seconds=0.0,
+                consumer_key="test",
+                api_key="test-key",
+            )
+        )
+        try:
+            await client.start()
+            await client.request("supported_websites")
+            await client.request_batch(
+                "series_data", items=[{"website_key": "site", "url_name": "s-0"}]
+            )
+            with priority_scope(Priority.INTERACTIVE):
+                await client.request("series_data", website_key="site", url_name="s-0")
+
+            admitted = {s.priority: s.admitted for s in client.admission_stats()}
+            assert admitted == {Priority.INTERACTIVE: 1, Priority.NORMAL: 1, Priority.BULK: 1}
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
@@ -0,0 +1,155 @@
+"""CrawlerClient.request_batch against the local fake crawler."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from aiohttp import web
+
+from manhwa_bot.config import CrawlerConfig
+from manhwa_bot.crawler.chapter import Chapter
+from manhwa_bot.crawler.client import CrawlerClient
+from manhwa_bot.scripts.fake_crawler import FakeCrawler, sample_series
+from manhwa_bot.ui.components.tracking import enrich_grouped_list_items
+
+
+def _config(ws_url: str) -> CrawlerConfig:
+    return CrawlerConfig(
+        ws_url=ws_url,
+        http_base_url="http://unused",
+        request_timeout_seconds=5.0,
+        transport_watchdog_seconds=10.0,
+        reconnect_initial_delay_seconds=0.05,
+        reconnect_max_delay_seconds=0.2,
+        reconnect_jitter_seconds=0.0,
+        consumer_key="test",
+        api_key="test-key",
+    )
+
+
+def _catalog(count: int) -> dict[tuple[str, str], dict[str, Any]]:
+    return {("site", f"s-{i}"): sample_series("site", f"s-{i}") for i in range(count)}
+
+
+class _NoBatchCrawler(FakeCrawler):
+    """A crawler build that predates ``series_data_batch``."""
+
+    async def _answer(self, ws: web.WebSocketResponse, envelope: dict[str, Any]) -> None:
+        if envelope.get("type") == "series_data_batch":
+            await self._send_error(
+                ws, "series_data_batch", envelope.get("request_id"), "unknown_type", "nope"
+            )
+            return
+        await super()._answer(ws, envelope)
+
+
+def test_request_batch_sends_one_frame_and_streams_items() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler(_catalog(5))
+        await crawler.start()
+        client = CrawlerClient(_config(crawler.ws_url))
+        streamed: list[tuple[str, str]] = []
+        try:
+            await client.start()
+            items = [{"website_key": "site", "url_name": f"s-{i}"} for i in range(5)]
+            items.append({"website_key": "site", "url_name": "missing"})
+
+            results = await client.request_batch(
+                "series_data",
+                items=items,
+                allow_live=False,
+                on_item=lambda tag, data: streamed.append(tag),
+            )
+
+            assert len(crawler.requests_of("series_data_batch")) == 1
+            assert crawler.requests_of("series_data_batch")[0]["allow_live"] is False
+            assert sorted(streamed) == sorted(results) == [("site", f"s-{i}") for i in range(5)]
+            assert all(isinstance(c, Chapter) for c in results[("site", "s-0")]["chapters"])
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
+
+
+def test_request_batch_fills_and_reuses_the_response_cache() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler(_catalog(3))
+        await crawler.start()
+        client = CrawlerClient(_config(crawler.ws_url))
+        try:
+            await client.start()
+            await client.cached_request(
+                "series_data", website_key="site", url_name="s-0", allow_live=False
+            )
+            items = [{"website_key": "site", "url_name": f"s-{i}"} for i in range(3)]
+
+            await client.request_batch("series_data", items=items, allow_live=False)
+            again = await client.request_batch("series_data", items=items, allow_live=False)
+            single = await client.cached_request(
+                "series_data", website_key="site", url_name="s-2", allow_live=False
+            )
+
+            batches = crawler.requests_of("series_data_batch")
+            assert [[item["url_name"] for item in batch["items"]] for batch in batches] == [
+                ["s-1", "s-2"]
+            ]
+            assert len(crawler.requests_of("series_data")) == 1
+            assert len(again) == 3
+            assert single["title"] == "S 2"
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
+
+
+def test_request_batch_falls_back_to_single_requests_on_unknown_type() -> None:
+    async def _run() -> None:
+        crawler = _NoBatchCrawler(_catalog(4))
+        await crawler.start()
+        client = CrawlerClient(_config(crawler.ws_url))
+        try:
+            await client.start()
+            items = [{"website_key": "site", "url_name": f"s-{i}"} for i in range(4)]
+
+            results = await client.request_batch("series_data", items=items, allow_live=False)
+
+            assert sorted(results) == [("site", f"s-{i}") for i in range(4)]
+            assert len(crawler.requests_of("series_data")) == 4
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
+
+
+def test_enrich_grouped_list_items_fills_blanks_with_one_batch() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler(_catalog(3))
+        await crawler.start()
+        client = CrawlerClient(_config(crawler.ws_url))
+        try:
+            await client.start()
+            items: list[dict[str, Any]] = [
+                {"website_key": "site", "url_name": "s-0", "last_chapter": None},
+                {"website_key": "site", "url_name": "s-1", "last_chapter": "Chapter 9"},
+                {"website_key": "site", "url_name": "s-2", "last_chapter": None},
+            ]
+
+            await enrich_grouped_list_items(client, items, fields=("last_chapter",))
+
+            batches = crawler.requests_of("series_data_batch")
+            assert [[item["url_name"] for item in b["items"]] for b in batches] == [["s-0", "s-2"]]
+            assert [item["last_chapter"] for item in items] == [
+                "Chapter 3",
+                "Chapter 9",
+                "Chapter 3",
+            ]
+            assert items[0]["last_chapter_url"] == "https://site.test/series/s-0/chapter-3"
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
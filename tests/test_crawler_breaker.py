@@ -0,0 +1,168 @@
+"""Per-website circuit breaker: state machine and client wiring."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from manhwa_bot.bot import _CRAWLER_ERROR_MESSAGES, _user_message_for_error
+from manhwa_bot.config import CrawlerConfig
+from manhwa_bot.crawler.breaker import WebsiteBreaker
+from manhwa_bot.crawler.client import CrawlerClient
+from manhwa_bot.crawler.errors import CircuitOpen, CrawlerError
+from manhwa_bot.scripts.fake_crawler import FakeCrawler, sample_series
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _tripped(clock: _Clock, *, threshold: int = 2) -> WebsiteBreaker:
+    breaker = WebsiteBreaker(threshold=threshold, open_seconds=60.0, clock=clock)
+    for _ in range(threshold):
+        breaker.record("asura", "website_blocked", breaker.admit("asura"))
+    return breaker
+
+
+def test_opens_after_consecutive_block_codes_only() -> None:
+    breaker = WebsiteBreaker(threshold=2, open_seconds=60.0, clock=_Clock())
+    breaker.record("asura", "website_blocked", breaker.admit("asura"))
+    breaker.record("asura", None, breaker.admit("asura"))  # a success resets the count
+    breaker.record("asura", "website_blocked", breaker.admit("asura"))
+    breaker.record("asura", "not_found", breaker.admit("asura"))
+    assert breaker.states()[0].failures == 1
+    breaker.admit("asura")
+
+    breaker.record("asura", "website_disabled", breaker.admit("asura"))
+    with pytest.raises(CircuitOpen) as excinfo:
+        breaker.admit("asura")
+    assert excinfo.value.code == "website_disabled"
+    assert isinstance(excinfo.value, CrawlerError)
+    breaker.admit("comix")  # other websites are unaffected
+
+
+def test_replies_admitted_before_opening_never_close_it() -> None:
+    clock = _Clock()
+    breaker = WebsiteBreaker(threshold=2, open_seconds=60.0, clock=clock)
+    stale = [breaker.admit("asura") for _ in range(3)]
+    breaker.record("asura", "website_blocked", stale[0])
+    breaker.record("asura", "website_blocked", stale[1])
+    breaker.record("asura", None, stale[2])
+    with pytest.raises(CircuitOpen):
+        breaker.admit("asura")
+
+    clock.now += 61
+    probe = breaker.admit("asura")
+    breaker.release("asura", stale[2])  # a stale timeout does not free the probe slot
+    with pytest.raises(CircuitOpen):
+        breaker.admit("asura")
+    breaker.record("asura", "page_blocked", probe)  # unrelated error: still half-open
+    [state] = breaker.states()
+    assert state.state == "half_open"
+    breaker.record("asura", None, breaker.admit("asura"))
+    assert breaker.states() == []
+
+
+def test_half_opens_on_timer_and_lets_one_probe_through() -> None:
+    clock = _Clock()
+    breaker = _tripped(clock)
+    clock.now += 61
+
+    probe = breaker.admit("asura")
+    with pytest.raises(CircuitOpen):
+        breaker.admit("asura")
+    [state] = breaker.states()
+    assert state.state == "half_open"
+    assert state.rejected == 1
+
+    breaker.record("asura", None, probe)
+    breaker.admit("asura")
+    assert breaker.states() == []
+
+
+def test_blocked_probe_reopens_and_lost_probe_frees_the_slot() -> None:
+    clock = _Clock()
+    breaker = _tripped(clock)
+    clock.now += 61
+    breaker.release("asura", breaker.admit("asura"))  # probe timed out: try again
+    probe = breaker.admit("asura")
+
+    breaker.record("asura", "website_blocked", probe)
+    with pytest.raises(CircuitOpen):
+        breaker.admit("asura")
+    assert breaker.states()[0].retry_in_seconds == pytest.approx(60.0)
+
+
+def test_circuit_open_maps_to_the_tripping_code_message() -> None:
+    _, message = _user_message_for_error(CircuitOpen("asura", "website_blocked"))
+    assert message == _CRAWLER_ERROR_MESSAGES["website_blocked"]
+
+
+class _BlockingCrawler(FakeCrawler):
+    """Answers every ``series_data`` for website ``blocked`` with ``website_blocked``."""
+
+    async def _answer(self, ws: Any, envelope: dict[str, Any]) -> None:
+        if envelope.get("type") == "series_data" and envelope.get("website_key") == "blocked":
+            await self._send_error(
+                ws, "series_data", envelope.get("request_id"), "website_blocked", "403"
+            )
+            return
+        await super()._answer(ws, envelope)
+
+
+def test_client_fails_fast_until_the_crawler_reports_recovery() -> None:
+    async def _run() -> None:
+        crawler = _BlockingCrawler({("site", "s-0"): sample_series("site", "s-0")})
+        await crawler.start()
+        client = CrawlerClient(
+            CrawlerConfig(
+                ws_url=crawler.ws_url,
+                http_base_url="http://unused",
+                request_timeout_seconds=5.0,
+                transport_watchdog_seconds=10.0,
+                reconnect_initial_delay_seconds=0.05,
+                reconnect_max_delay_seconds=0.2,
+                reconnect_jitter_seconds=0.0,
+                consumer_key="test",
+                api_key="test-key",
+                breaker_failure_threshold=2,
+            )
+        )
+        await client.start()
+        try:
+            for _ in range(2):
+                with pytest.raises(CrawlerError) as excinfo:
+                    await client.request("series_data", website_key="blocked", url_name="x")
+                assert excinfo.value.code == "website_blocked"
+            with pytest.raises(CircuitOpen) as excinfo:
+                await client.request("series_data", website_key="blocked", url_name="x")
+            assert excinfo.value.code == "website_blocked"
+            assert len(crawler.requests_of("series_data")) == 2
+            # Other websites and website-less ops still go out.
+            await client.request("series_data", website_key="site", url_name="s-0")
+            await client.request("supported_websites")
+
+            await client._dispatch(
+                client._connections[0],
+                {
+                    "type": "operational_alert_event",
+                    "request_id": "alert-1",
+                    "data": {"alert": {"event": "recovered", "website_key": "blocked"}},
+                },
+            )
+            await asyncio.sleep(0.01)
+            assert client.breaker_states() == []
+            with pytest.raises(CrawlerError) as excinfo:
+                await client.request("series_data", website_key="blocked", url_name="x")
+            assert excinfo.value.code == "website_blocked"
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
@@ -13,7 +13,7 @@ from aiohttp import WSMsgType, web
 
 from manhwa_bot.config import CrawlerConfig
 from manhwa_bot.crawler.client import CrawlerClient
-from manhwa_bot.crawler.errors import CrawlerError, RequestTimeout
+from manhwa_bot.crawler.errors import CrawlerError, Disconnected, RequestTimeout
 from manhwa_bot.crawler.progress import CrawlerProgressEvent, parse_progress_event
 
 
@@ -22,6 +22,9 @@ def _config(
     *,
     request_timeout: float = 5.0,
     transport_watchdog: float = 10.0,
+    pool_size: int = 1,
+    decode_offload_bytes: int = 65536,
+    progress_min_interval: float = 1.0,
 ) -> CrawlerConfig:
     return CrawlerConfig(
         ws_url=ws_url,
@@ -33,6 +36,9 @@ def _config(
         reconnect_jitter_seconds=0.0,
         consumer_key="test",
         api_key="test-key",
+        pool_size=pool_size,
+        decode_offload_bytes=decode_offload_bytes,
+        progress_min_interval_seconds=progress_min_interval,
     )
 
 
@@ -631,6 +637,95 @@ def test_request_with_progress_waits_for_queued_progress_callbacks() -> None:
     asyncio.run(_run())
 
 
+async def _progress_burst_server(
+    events: int,
+) -> tuple[web.AppRunner, str]:
+    """Answers every request with a burst of progress, a terminal event, then the reply."""
+
+    async def handler(request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            payload = json.loads(msg.data)
+            for sequence in range(1, events + 1):
+                await ws.send_str(
+                    json.dumps(
+                        {
+                            "type": "request_progress",
+                            "request_id": payload["request_id"],
+                            "event": "scrape_retrying",
+                            "sequence": sequence,
+                            "title": f"Attempt {sequence}",
+                            "status": "succeeded" if sequence == events else "retrying",
+                        }
+                    )
+                )
+            await asyncio.sleep(0.3)
+            await ws.send_str(
+                json.dumps(
+                    {
+                        "request_id": payload["request_id"],
+                        "type": f"{payload['type']}_result",
+                        "ok": True,
+                        "data": {"done": True},
+                    }
+                )
+            )
+        return ws
+
+    return await _start_server(handler)
+
+
+def test_progress_burst_is_coalesced_and_rate_capped_but_keeps_the_terminal_event() -> None:
+    async def _run() -> None:
+        runner, url = await _progress_burst_server(31)
+        client = CrawlerClient(_config(url, progress_min_interval=0.1))
+        received: list[int] = []
+
+        async def on_progress(event: CrawlerProgressEvent) -> None:
+            await asyncio.sleep(0.05)  # a Discord message edit
+            received.append(event.sequence)
+
+        try:
+            await client.start()
+            data = await client.request_with_progress("scrape_series", on_progress=on_progress)
+            assert data == {"done": True}
+            assert received[0] == 1
+            assert received[-1] == 31
+            assert received == sorted(received)
+            assert len(received) <= 4
+        finally:
+            await client.stop()
+            await runner.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_progress_coalescing_can_be_disabled_per_call() -> None:
+    async def _run() -> None:
+        runner, url = await _progress_burst_server(10)
+        client = CrawlerClient(_config(url))
+        received: list[int] = []
+
+        async def on_progress(event: CrawlerProgressEvent) -> None:
+            await asyncio.sleep(0.01)
+            received.append(event.sequence)
+
+        try:
+            await client.start()
+            await client.request_with_progress(
+                "scrape_series", on_progress=on_progress, coalesce_progress=False
+            )
+            assert received == list(range(1, 11))
+        finally:
+            await client.stop()
+            await runner.cleanup()
+
+    asyncio.run(_run())
+
+
 def test_trailing_progress_after_final_response_is_ignored() -> None:
     async def _run() -> None:
         async def handler(request: web.Request) -> web.WebSocketResponse:
@@ -879,3 +974,312 @@ def test_progress_callback_failure_is_logged_and_request_continues(
             await runner.cleanup()
 
     asyncio.run(_run())
+
+
+def test_pool_routes_requests_away_from_busy_connection() -> None:
+    async def _run() -> None:
+        async def handler(request: web.Request) -> web.WebSocketResponse:
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            async for msg in ws:
+                if msg.type == WSMsgType.TEXT:
+                    payload = json.loads(msg.data)
+                    # The fake replies in order per socket, so a slow reply
+                    # blocks everything queued behind it on that connection.
+                    if payload["type"] == "search":
+                        await asyncio.sleep(0.5)
+                    await ws.send_str(
+                        json.dumps(
+                            {
+                                "request_id": payload["request_id"],
+                                "type": f"{payload['type']}_result",
+                                "ok": True,
+                                "data": {"type": payload["type"]},
+                            }
+                        )
+                    )
+            return ws
+
+        runner, url = await _start_server(handler)
+        client = CrawlerClient(_config(url, pool_size=2))
+        try:
+            await client.start()
+            for _ in range(40):
+                if all(conn.connected for conn in client._connections):
+                    break
+                await asyncio.sleep(0.02)
+            slow = asyncio.create_task(client.request("search", query="x"))
+            await asyncio.sleep(0.05)
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            data = await client.request("autocomplete", query="x")
+            assert data == {"type": "autocomplete"}
+            assert loop.time() - started < 0.3
+            assert await slow == {"type": "search"}
+        finally:
+            await client.stop()
+            await runner.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_pool_delivers_broadcast_push_once() -> None:
+    async def _run() -> None:
+        async def handler(request: web.Request) -> web.WebSocketResponse:
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            await asyncio.sleep(0.1)
+            await ws.send_str(
+                json.dumps(
+                    {
+                        "request_id": "push-1",
+                        "type": "notification_event",
+                        "ok": True,
+                        "data": {"notification": {"id": 7}},
+                    }
+                )
+            )
+            async for _ in ws:
+                pass
+            return ws
+
+        runner, url = await _start_server(handler)
+        client = CrawlerClient(_config(url, pool_size=3))
+        received: list[dict] = []
+
+        async def on_event(payload: dict) -> None:
+            received.append(payload)
+
+        client.on_push("notification_event", on_event)
+        try:
+            await client.start()
+            await asyncio.sleep(0.4)
+            assert len(received) == 1
+        finally:
+            await client.stop()
+            await runner.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_pool_dedups_pushes_without_request_id_by_record_id() -> None:
+    async def _run() -> None:
+        async def handler(request: web.Request) -> web.WebSocketResponse:
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            await asyncio.sleep(0.1)
+            for notification_id in (7, 8):
+                await ws.send_str(
+                    json.dumps(
+                        {
+                            "type": "notification_event",
+                            "ok": True,
+                            "data": {"notification": {"id": notification_id}},
+                        }
+                    )
+                )
+            async for _ in ws:
+                pass
+            return ws
+
+        runner, url = await _start_server(handler)
+        client = CrawlerClient(_config(url, pool_size=3))
+        received: list[int] = []
+
+        async def on_event(payload: dict) -> None:
+            received.append(payload["data"]["notification"]["id"])
+
+        client.on_push("notification_event", on_event)
+        try:
+            await client.start()
+            await asyncio.sleep(0.4)
+            assert sorted(received) == [7, 8]
+        finally:
+            await client.stop()
+            await runner.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_pool_reconnects_dropped_connection_without_failing_the_other() -> None:
+    async def _run() -> None:
+        connects = 0
+        on_connect_calls = 0
+
+        async def handler(request: web.Request) -> web.WebSocketResponse:
+            nonlocal connects
+            connects += 1
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            async for msg in ws:
+                if msg.type == WSMsgType.TEXT:
+                    payload = json.loads(msg.data)
+                    await ws.send_str(
+                        json.dumps(
+                            {
+                                "request_id": payload["request_id"],
+                                "type": f"{payload['type']}_result",
+                                "ok": True,
+                                "data": {},
+                            }
+                        )
+                    )
+            return ws
+
+        async def on_connect() -> None:
+            nonlocal on_connect_calls
+            on_connect_calls += 1
+
+        runner, url = await _start_server(handler)
+        client = CrawlerClient(_config(url, pool_size=2))
+        client.on_connect(on_connect)
+        try:
+            await client.start()
+            for _ in range(40):
+                if all(conn.connected for conn in client._connections):
+                    break
+                await asyncio.sleep(0.02)
+            ws = client._connections[1].ws
+            assert ws is not None
+            await ws.close()
+            assert client.connected
+            assert await client.request("info") == {}
+            for _ in range(40):
+                if connects >= 3 and client._connections[1].connected:
+                    break
+                await asyncio.sleep(0.05)
+            assert connects == 3
+            # The pool never went fully offline, so the reconnect is not a new session.
+            assert on_connect_calls == 1
+        finally:
+            await client.stop()
+            await runner.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_large_frames_decoded_off_loop_keep_arrival_order() -> None:
+    async def _run() -> None:
+        async def handler(request: web.Request) -> web.WebSocketResponse:
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                payload = json.loads(msg.data)
+                rid = payload["request_id"]
+                # Big partial (offloaded), small partial (inline), then the final reply.
+                for seq, size in enumerate((5000, 1)):
+                    await ws.send_str(
+                        json.dumps(
+                            {
+                                "request_id": rid,
+                                "type": "search_partial",
+                                "ok": True,
+                                "data": {"seq": seq, "blob": "x" * size},
+                            }
+                        )
+                    )
+                await ws.send_str(
+                    json.dumps({"request_id": rid, "type": "search", "ok": True, "data": {}})
+                )
+            return ws
+
+        runner, url = await _start_server(handler)
+        client = CrawlerClient(_config(url, decode_offload_bytes=1024))
+        seen: list[int] = []
+        try:
+            await client.start()
+            await client.request_with_progress(
+                "search", query="x", on_partial=lambda data: seen.append(data["seq"])
+            )
+            assert seen == [0, 1]
+        finally:
+            await client.stop()
+            await runner.cleanup()
+
+    asyncio.run(_run())
+
+
+def _dropping_server(drops: int, seen: list[dict]):
+    """Handler that closes the socket on the first *drops* requests, then answers."""
+
+    async def handler(request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            payload = json.loads(msg.data)
+            seen.append(payload)
+            if len(seen) <= drops:
+                await ws.close()
+                break
+            await ws.send_str(
+                json.dumps(
+                    {
+                        "request_id": payload["request_id"],
+                        "type": payload["type"],
+                        "ok": True,
+                        "data": {"attempt": len(seen)},
+                    }
+                )
+            )
+        return ws
+
+    return handler
+
+
+def test_idempotent_request_is_replayed_after_reconnect() -> None:
+    async def _run() -> None:
+        seen: list[dict] = []
+        runner, url = await _start_server(_dropping_server(1, seen))
+        client = CrawlerClient(_config(url))
+        try:
+            await client.start()
+            data = await client.request("series_data", website_key="w", url_name="u")
+            assert data == {"attempt": 2}
+            assert len(seen) == 2
+            assert seen[0]["request_id"] == seen[1]["request_id"]
+        finally:
+            await client.stop()
+            await runner.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_non_idempotent_request_fails_on_disconnect() -> None:
+    async def _run() -> None:
+        seen: list[dict] = []
+        runner, url = await _start_server(_dropping_server(1, seen))
+        client = CrawlerClient(_config(url))
+        try:
+            await client.start()
+            with pytest.raises(Disconnected):
+                await client.request("track", website_key="w", url_name="u")
+            assert len(seen) == 1
+        finally:
+            await client.stop()
+            await runner.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_replay_stops_at_the_original_deadline() -> None:
+    async def _run() -> None:
+        seen: list[dict] = []
+        runner, url = await _start_server(_dropping_server(1_000, seen))
+        client = CrawlerClient(_config(url, request_timeout=0.5))
+        try:
+            await client.start()
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            with pytest.raises(RequestTimeout):
+                await client.request("info", url="https://example.test/s")
+            assert loop.time() - started < 1.5
+            assert len(seen) >= 2
+        finally:
+            await client.stop()
+            await runner.cleanup()
+
+    asyncio.run(_run())
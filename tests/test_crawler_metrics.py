@@ -0,0 +1,149 @@
+"""Per-op crawler metrics: histogram percentiles, caps, and client wiring."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from manhwa_bot.cogs.dev import _format_crawler_metrics
+from manhwa_bot.config import CrawlerConfig
+from manhwa_bot.crawler.client import CrawlerClient
+from manhwa_bot.crawler.errors import CrawlerError
+from manhwa_bot.crawler.metrics import LATENCY_BUCKETS, CrawlerMetrics
+from manhwa_bot.scripts.fake_crawler import FakeCrawler, sample_series
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_percentiles_are_within_one_bucket_of_the_truth() -> None:
+    metrics = CrawlerMetrics()
+    # 1..1000 ms, uniformly: true p50 = 500 ms, p95 = 950 ms, p99 = 990 ms.
+    for ms in range(1, 1001):
+        metrics.request_started("series_data")
+        metrics.request_finished("series_data", ms / 1000)
+
+    op = metrics.snapshot().op("series_data")
+    assert op is not None
+    assert op.count == 1000 and op.in_flight == 0
+    for estimate, truth in ((op.p50_seconds, 0.5), (op.p95_seconds, 0.95), (op.p99_seconds, 0.99)):
+        assert estimate is not None
+        assert truth / 1.25 <= estimate <= truth * 1.25
+    assert op.max_seconds == pytest.approx(1.0)
+    assert sum(op.latency_buckets) == 1000
+    assert len(op.latency_buckets) == len(LATENCY_BUCKETS) + 1
+
+
+def test_memory_stays_constant_with_many_distinct_error_codes_and_ops() -> None:
+    metrics = CrawlerMetrics()
+    for i in range(500):
+        metrics.request_started("search")
+        metrics.request_finished("search", 0.01, error=f"code_{i}")
+        metrics.frame_received(f"push_type_{i}", 10)
+
+    snapshot = metrics.snapshot()
+    search = snapshot.op("search")
+    assert search is not None
+    assert len(search.errors) <= 33
+    assert search.error_count == 500
+    assert search.errors["other"] > 0
+    assert len(snapshot.ops) <= 65
+    assert snapshot.op("other") is not None
+
+
+def test_timeouts_and_disconnects_do_not_enter_the_latency_histogram() -> None:
+    metrics = CrawlerMetrics()
+    for _ in range(3):
+        metrics.request_started("info")
+    metrics.request_finished("info", 0.2)
+    metrics.request_timed_out("info")
+    metrics.request_disconnected("info")
+
+    op = metrics.snapshot().op("info")
+    assert op is not None
+    assert op.count == 3
+    assert op.timeouts == 1
+    assert op.errors == {"disconnected": 1}
+    assert sum(op.latency_buckets) == 1
+    assert op.p99_seconds == pytest.approx(0.2)
+
+
+def test_progress_rate_covers_the_last_minute_only() -> None:
+    clock = _Clock()
+    metrics = CrawlerMetrics(clock=clock)
+    for _ in range(120):
+        metrics.progress_event("check_series")
+    assert metrics.snapshot().progress_per_second == pytest.approx(2.0)
+
+    clock.now += 61
+    snapshot = metrics.snapshot()
+    assert snapshot.progress_per_second == 0.0
+    op = snapshot.op("check_series")
+    assert op is not None and op.progress_events == 120
+
+
+def test_snapshot_as_dict_is_json_serialisable() -> None:
+    metrics = CrawlerMetrics()
+    metrics.request_started("series_data")
+    metrics.frame_sent("series_data", 120)
+    metrics.reconnected()
+
+    data = json.loads(json.dumps(metrics.snapshot().as_dict()))
+    assert data["in_flight"] == 1
+    assert data["reconnects"] == 1
+    assert data["ops"][0]["op"] == "series_data"
+    assert data["ops"][0]["bytes_out"] == 120
+    assert data["ops"][0]["p99_seconds"] is None
+    assert len(data["latency_bucket_bounds"]) == len(LATENCY_BUCKETS)
+
+
+def test_client_records_outcomes_and_frame_bytes_per_op() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler({("site", "s-0"): sample_series("site", "s-0", chapters=50)})
+        await crawler.start()
+        client = CrawlerClient(
+            CrawlerConfig(
+                ws_url=crawler.ws_url,
+                http_base_url="http://unused",
+                request_timeout_seconds=5.0,
+                transport_watchdog_seconds=10.0,
+                reconnect_initial_delay_seconds=0.05,
+                reconnect_max_delay_seconds=0.2,
+                reconnect_jitter_seconds=0.0,
+                consumer_key="test",
+                api_key="test-key",
+            )
+        )
+        await client.start()
+        try:
+            for _ in range(3):
+                await client.request("series_data", website_key="site", url_name="s-0")
+            with pytest.raises(CrawlerError):
+                await client.request("series_data", website_key="site", url_name="missing")
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+        snapshot = client.metrics_snapshot()
+        op = snapshot.op("series_data")
+        assert op is not None
+        assert op.count == 4
+        assert op.errors == {"not_found": 1}
+        assert op.in_flight == 0 and snapshot.in_flight == 0
+        assert op.p50_seconds is not None and op.p50_seconds > 0
+        assert op.bytes_out > 0
+        # Three full replies with 50 chapters each dwarf the requests.
+        assert op.bytes_in > 3 * 50 * 40
+
+        text = _format_crawler_metrics(snapshot)
+        assert "series_data" in text
+        assert "not_found=1" in text
+
+    asyncio.run(_run())
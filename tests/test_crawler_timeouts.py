@@ -0,0 +1,193 @@
+"""Adaptive per-op deadlines: the rolling estimator and the client's use of it."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from manhwa_bot.config import CrawlerConfig
+from manhwa_bot.crawler.client import CrawlerClient
+from manhwa_bot.crawler.errors import RequestTimeout
+from manhwa_bot.crawler.timeouts import AdaptiveTimeouts, latency_class
+from manhwa_bot.scripts.fake_crawler import FakeCrawler, sample_series
+
+
+def test_only_cheap_reads_have_a_latency_class() -> None:
+    assert latency_class("series_data", {"allow_live": False}) == "series_data:stored"
+    assert latency_class("supported_websites", {}) == "supported_websites"
+    assert latency_class("series_data", {"allow_live": True}) is None
+    assert latency_class("series_data", {"website_key": "x"}) is None
+    assert latency_class("search", {"query": "x"}) is None
+
+
+def test_deadline_is_the_ceiling_until_enough_samples() -> None:
+    timeouts = AdaptiveTimeouts(multiplier=4.0, floor_seconds=0.5, min_samples=10)
+    for _ in range(9):
+        timeouts.observe("info", 0.1)
+    assert timeouts.timeout_for("info", 30.0) == 30.0
+
+    timeouts.observe("info", 0.1)
+    assert timeouts.timeout_for("info", 30.0) == pytest.approx(0.5)  # 4 * 0.1, raised to the floor
+
+
+def test_deadline_is_p99_times_multiplier_clamped_to_ceiling() -> None:
+    timeouts = AdaptiveTimeouts(multiplier=3.0, floor_seconds=0.1, min_samples=10)
+    for _ in range(100):
+        timeouts.observe("search", 2.0)
+    assert 6.0 / 1.25 <= timeouts.timeout_for("search", 30.0) <= 6.0
+    assert timeouts.timeout_for("search", 4.0) == 4.0
+
+
+def test_estimate_forgets_samples_older_than_two_windows() -> None:
+    timeouts = AdaptiveTimeouts(multiplier=2.0, floor_seconds=0.01, min_samples=10, window=50)
+    for _ in range(50):
+        timeouts.observe("info", 10.0)
+    slow = timeouts.timeout_for("info", 60.0)
+    for _ in range(100):
+        timeouts.observe("info", 0.05)
+
+    assert slow >= 16.0
+    assert timeouts.timeout_for("info", 60.0) <= 0.1
+
+
+class _StallingCrawler(FakeCrawler):
+    """Never answers the next ``stall`` ``series_data`` requests."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stall = 0
+
+    async def _answer(self, ws: Any, envelope: dict[str, Any]) -> None:
+        if envelope.get("type") == "series_data" and self.stall > 0:
+            self.stall -= 1
+            return
+        await super()._answer(ws, envelope)
+
+
+def _config(ws_url: str) -> CrawlerConfig:
+    return CrawlerConfig(
+        ws_url=ws_url,
+        http_base_url="http://unused",
+        request_timeout_seconds=5.0,
+        transport_watchdog_seconds=10.0,
+        reconnect_initial_delay_seconds=0.05,
+        reconnect_max_delay_seconds=0.2,
+        reconnect_jitter_seconds=0.0,
+        consumer_key="test",
+        api_key="test-key",
+        adaptive_timeout_multiplier=2.0,
+        adaptive_timeout_min_seconds=0.1,
+        adaptive_timeout_min_samples=5,
+    )
+
+
+async def _warm_up(client: CrawlerClient) -> None:
+    for _ in range(5):
+        await client.request("series_data", website_key="site", url_name="s-0", allow_live=False)
+
+
+def test_stuck_stored_read_fails_over_to_one_retry_within_the_adaptive_deadline() -> None:
+    async def _run() -> None:
+        crawler = _StallingCrawler({("site", "s-0"): sample_series("site", "s-0")})
+        await crawler.start()
+        client = CrawlerClient(_config(crawler.ws_url))
+        await client.start()
+        try:
+            await _warm_up(client)
+            assert client.adaptive_timeouts()["series_data:stored"] < 1.0
+
+            crawler.stall = 1
+            started = time.monotonic()
+            data = await client.request(
+                "series_data", website_key="site", url_name="s-0", allow_live=False
+            )
+            assert data["url_name"] == "s-0"
+            assert time.monotonic() - started < 2.0
+
+            sent = crawler.requests_of("series_data")
+            assert sent[-1]["request_id"] != sent[-2]["request_id"]
+            op = client.metrics_snapshot().op("series_data")
+            assert op is not None and op.retries == 1 and op.timeouts == 0
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
+
+
+def test_explicit_timeout_overrides_the_adaptive_deadline() -> None:
+    async def _run() -> None:
+        crawler = _StallingCrawler({("site", "s-0"): sample_series("site", "s-0")})
+        await crawler.start()
+        client = CrawlerClient(_config(crawler.ws_url))
+        await client.start()
+        try:
+            await _warm_up(client)
+            crawler.stall = 2
+            started = time.monotonic()
+            with pytest.raises(RequestTimeout):
+                await client.request(
+                    "series_data",
+                    website_key="site",
+                    url_name="s-0",
+                    allow_live=False,
+                    timeout=1.5,
+                )
+            assert time.monotonic() - started >= 1.4
+            # No retry: only the one stalled attempt went out.
+            assert crawler.stall == 1
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
+
+
+class _SlowScrapeCrawler(FakeCrawler):
+    """Delays live ``series_data`` scrapes by ``scrape_seconds``; stored reads stay fast."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.scrape_seconds = 0.0
+
+    async def _answer(self, ws: Any, envelope: dict[str, Any]) -> None:
+        if envelope.get("type") == "series_data" and envelope.get("allow_live") is not False:
+            await asyncio.sleep(self.scrape_seconds)
+        await super()._answer(ws, envelope)
+
+
+def test_live_and_progress_requests_keep_the_static_deadline() -> None:
+    async def _run() -> None:
+        crawler = _SlowScrapeCrawler(
+            {("site", "s-0"): sample_series("site", "s-0")}, progress_events=2
+        )
+        await crawler.start()
+        client = CrawlerClient(_config(crawler.ws_url))
+        await client.start()
+        try:
+            await _warm_up(client)
+            for _ in range(5):
+                await client.request("series_data", website_key="site", url_name="s-0")
+            stored_deadline = client.adaptive_timeouts()["series_data:stored"]
+            assert "series_data" not in client.adaptive_timeouts()
+
+            # Well past p99 * k of every fast reply so far, but within the watchdog.
+            crawler.scrape_seconds = stored_deadline + 1.0
+            events: list[Any] = []
+            data = await client.request_with_progress(
+                "series_data", website_key="site", url_name="s-0", on_progress=events.append
+            )
+            assert data["url_name"] == "s-0"
+            assert events
+            data = await client.request("series_data", website_key="site", url_name="s-0")
+            assert data["url_name"] == "s-0"
+            op = client.metrics_snapshot().op("series_data")
+            assert op is not None and op.retries == 0 and op.timeouts == 0
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
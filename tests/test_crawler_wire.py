@@ -0,0 +1,101 @@
+"""WebSocket compression and binary framing negotiation against the fake crawler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from manhwa_bot.config import CrawlerConfig
+from manhwa_bot.crawler.client import CrawlerClient
+from manhwa_bot.scripts.fake_crawler import FakeCrawler, sample_series
+
+
+def _config(ws_url: str, *, wire_format: str = "json", ws_compress: bool = True) -> CrawlerConfig:
+    return CrawlerConfig(
+        ws_url=ws_url,
+        http_base_url="http://unused",
+        request_timeout_seconds=5.0,
+        transport_watchdog_seconds=10.0,
+        reconnect_initial_delay_seconds=0.05,
+        reconnect_max_delay_seconds=0.2,
+        reconnect_jitter_seconds=0.0,
+        consumer_key="test",
+        api_key="test-key",
+        wire_format=wire_format,
+        ws_compress=ws_compress,
+    )
+
+
+async def _series_data(crawler: FakeCrawler, config: CrawlerConfig) -> tuple[CrawlerClient, dict]:
+    client = CrawlerClient(config)
+    await client.start()
+    data = await client.request("series_data", website_key="site", url_name="s-0")
+    return client, data
+
+
+def _catalog() -> dict:
+    return {("site", "s-0"): sample_series("site", "s-0", chapters=200)}
+
+
+@pytest.mark.parametrize("wire_format", ["msgpack", "cbor"])
+def test_binary_wire_format_round_trips_through_dispatch(wire_format: str) -> None:
+    pytest.importorskip("msgpack" if wire_format == "msgpack" else "cbor2")
+
+    async def _run() -> None:
+        crawler = FakeCrawler(_catalog())
+        await crawler.start()
+        client, data = await _series_data(crawler, _config(crawler.ws_url, wire_format=wire_format))
+        try:
+            conn = client._connections[0]
+            assert conn.binary is not None and conn.binary.name == wire_format
+            assert data["chapter_count"] == 200
+            assert [chapter.name for chapter in data["chapters"][:2]] == ["Chapter 1", "Chapter 2"]
+            assert crawler.requests_of("series_data")[0]["url_name"] == "s-0"
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
+
+
+def test_binary_wire_format_falls_back_to_json_when_declined() -> None:
+    pytest.importorskip("msgpack")
+
+    async def _run() -> None:
+        crawler = FakeCrawler(_catalog(), binary=False)
+        await crawler.start()
+        client, data = await _series_data(crawler, _config(crawler.ws_url, wire_format="msgpack"))
+        try:
+            assert client._connections[0].binary is None
+            assert data["url_name"] == "s-0"
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
+
+
+@pytest.mark.parametrize(
+    ("client_compress", "server_compress", "expected"),
+    [(True, True, True), (True, False, False), (False, True, False)],
+)
+def test_permessage_deflate_negotiated_only_when_both_sides_agree(
+    client_compress: bool, server_compress: bool, expected: bool
+) -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler(_catalog(), compress=server_compress)
+        await crawler.start()
+        client, data = await _series_data(
+            crawler, _config(crawler.ws_url, ws_compress=client_compress)
+        )
+        try:
+            ws = client._connections[0].ws
+            assert ws is not None
+            assert bool(ws.compress) is expected
+            assert data["chapter_count"] == 200
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
@@ -0,0 +1,55 @@
+"""Tests for NotificationDeliveryStore."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from manhwa_bot.db.migrate import apply_pending
+from manhwa_bot.db.notification_deliveries import NotificationDeliveryStore
+from manhwa_bot.db.pool import DbPool
+
+
+def test_record_is_idempotent_and_scoped_per_record() -> None:
+    async def _run() -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pool = await DbPool.open(str(Path(tmp) / "test.db"))
+            await apply_pending(pool)
+            store = NotificationDeliveryStore(pool)
+            try:
+                guilds = [("guild", gid) for gid in range(1, 501)]
+                await store.record(7, guilds)
+                await store.record(7, [("guild", 1), ("dm", 1)])
+                await store.record(8, [("dm", 42)])
+
+                assert await store.delivered_targets(7) == {*guilds, ("dm", 1)}
+                assert await store.delivered_targets(8) == {("dm", 42)}
+                assert await store.delivered_targets(9) == set()
+            finally:
+                await pool.close()
+
+    asyncio.run(_run())
+
+
+def test_prune_drops_only_entries_past_the_ttl() -> None:
+    async def _run() -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pool = await DbPool.open(str(Path(tmp) / "test.db"))
+            await apply_pending(pool)
+            store = NotificationDeliveryStore(pool)
+            try:
+                await store.record(1, [("guild", 1), ("dm", 2)])
+                await store.record(2, [("guild", 1)])
+                await pool.execute(
+                    "UPDATE notification_deliveries "
+                    "SET delivered_at = datetime('now', '-3 days') WHERE record_id = 1"
+                )
+
+                assert await store.prune(2 * 24 * 60 * 60) == 2
+                assert await store.delivered_targets(1) == set()
+                assert await store.delivered_targets(2) == {("guild", 1)}
+            finally:
+                await pool.close()
+
+    asyncio.run(_run())
@@ -0,0 +1,57 @@
+"""Tests for NotificationInboxStore."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from manhwa_bot.db.migrate import apply_pending
+from manhwa_bot.db.notification_inbox import NotificationInboxStore
+from manhwa_bot.db.pool import DbPool
+
+
+def _record(notification_id: int) -> dict:
+    return {"id": notification_id, "website_key": "asura", "url_name": f"s-{notification_id}"}
+
+
+def test_append_is_idempotent_and_pending_is_ordered_per_consumer() -> None:
+    async def _run() -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pool = await DbPool.open(str(Path(tmp) / "test.db"))
+            await apply_pending(pool)
+            store = NotificationInboxStore(pool)
+            try:
+                await store.append("bot", [(i, _record(i)) for i in (3, 1, 2)])
+                await store.append("bot", [(2, {"id": 2, "changed": True})])
+                await store.append("alerts", [(1, _record(1))])
+
+                assert await store.pending("bot") == [_record(1), _record(2), _record(3)]
+                assert await store.pending("bot", after_id=1, limit=1) == [_record(2)]
+                assert await store.pending("bot", through_id=2) == [_record(1), _record(2)]
+                assert await store.max_id("bot") == 3
+                assert await store.max_id("nobody") == 0
+                assert await store.count("alerts") == 1
+            finally:
+                await pool.close()
+
+    asyncio.run(_run())
+
+
+def test_bulk_append_and_delete_through_plus_ids() -> None:
+    async def _run() -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pool = await DbPool.open(str(Path(tmp) / "test.db"))
+            await apply_pending(pool)
+            store = NotificationInboxStore(pool)
+            try:
+                await store.append("bot", [(i, _record(i)) for i in range(1, 501)])
+                assert await store.count("bot") == 500
+
+                await store.delete("bot", through_id=250, ids=[100, 300, *range(400, 451)])
+                remaining = [r["id"] for r in await store.pending("bot", limit=1000)]
+                assert remaining == [i for i in range(251, 501) if i != 300 and not 400 <= i <= 450]
+            finally:
+                await pool.close()
+
+    asyncio.run(_run())
@@ -12,6 +12,12 @@ class _FakeCrawler:
         self.calls: list[tuple[str, dict[str, Any]]] = []
         self.timeouts: list[float | None] = []
 
+    async def cached_request(
+        self, type_: str, *, ttl: float | None = None, **kwargs: Any
+    ) -> dict[str, Any]:
+        del ttl
+        return await self.request(type_, **kwargs)
+
     async def request(
         self, type_: str, *, timeout: float | None = None, **kwargs: Any
     ) -> dict[str, Any]:
@@ -46,15 +52,9 @@ class _FakeCrawler:
         }
 
 
-class _FakeCache:
-    async def get_or_set(self, _key: str, loader: Any, _ttl: int) -> Any:
-        return await loader()
-
-
 class _FakeBot:
     def __init__(self) -> None:
         self.crawler = _FakeCrawler()
-        self.websites_cache = _FakeCache()
         self.config = SimpleNamespace(
             supported_websites_cache=SimpleNamespace(ttl_seconds=3600),
             crawler=SimpleNamespace(transport_watchdog_seconds=180.0),
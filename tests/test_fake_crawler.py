@@ -0,0 +1,169 @@
+"""The fake crawler's protocol surface and fault knobs, through a real client."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from manhwa_bot.config import CrawlerConfig
+from manhwa_bot.crawler.client import CrawlerClient
+from manhwa_bot.crawler.errors import CrawlerError
+from manhwa_bot.crawler.notifications import NotificationConsumer
+from manhwa_bot.db.consumer_state import ConsumerStateStore
+from manhwa_bot.db.migrate import apply_pending
+from manhwa_bot.db.pool import DbPool
+from manhwa_bot.scripts.fake_crawler import FakeCrawler, sample_series
+
+
+def _config(ws_url: str) -> CrawlerConfig:
+    return CrawlerConfig(
+        ws_url=ws_url,
+        http_base_url="http://unused",
+        request_timeout_seconds=5.0,
+        transport_watchdog_seconds=10.0,
+        reconnect_initial_delay_seconds=0.05,
+        reconnect_max_delay_seconds=0.2,
+        reconnect_jitter_seconds=0.0,
+        consumer_key="test",
+        api_key="test-key",
+        progress_coalesce=False,
+    )
+
+
+def _catalog() -> dict:
+    return {
+        ("asura", "solo-leveling"): sample_series("asura", "solo-leveling"),
+        ("asura", "omniscient-reader"): sample_series("asura", "omniscient-reader"),
+        ("comix", "solo-leveling"): sample_series("comix", "solo-leveling"),
+    }
+
+
+def test_search_streams_one_partial_per_website_then_results() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler(_catalog(), progress_events=2)
+        await crawler.start()
+        client = CrawlerClient(_config(crawler.ws_url))
+        await client.start()
+        partials: list[dict] = []
+        progress: list[str] = []
+
+        async def _on_partial(data: dict) -> None:
+            partials.append(data)
+
+        async def _on_progress(event) -> None:
+            progress.append(event.status)
+
+        try:
+            data = await client.request_with_progress(
+                "search", query="solo", on_partial=_on_partial, on_progress=_on_progress
+            )
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+        assert [hit["website_key"] for hit in data["results"]] == ["asura", "comix"]
+        assert [p["status"] for p in partials] == ["started", "success", "success"]
+        assert partials[1]["pending_websites"] == ["comix"]
+        assert progress == ["running", "succeeded"]
+
+    asyncio.run(_run())
+
+
+def test_injected_errors_and_latency() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler(_catalog(), latency=0.1, error_rate=1.0)
+        await crawler.start()
+        client = CrawlerClient(_config(crawler.ws_url))
+        await client.start()
+        try:
+            started = time.monotonic()
+            with pytest.raises(CrawlerError) as excinfo:
+                await client.request("series_data", website_key="asura", url_name="solo-leveling")
+            assert excinfo.value.code == "unavailable"
+            assert time.monotonic() - started >= 0.1
+
+            crawler.error_rate = 0.0
+            crawler.latency = 0.0
+            data = await client.request(
+                "series_data", website_key="asura", url_name="solo-leveling"
+            )
+            assert data["url_name"] == "solo-leveling"
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
+
+
+def test_in_flight_request_survives_dropped_connections() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler(_catalog(), latency=0.2)
+        await crawler.start()
+        client = CrawlerClient(_config(crawler.ws_url))
+        await client.start()
+        try:
+            pending = asyncio.create_task(
+                client.request("series_data", website_key="asura", url_name="solo-leveling")
+            )
+            await asyncio.sleep(0.05)
+            assert await crawler.drop_connections() == 1
+            data = await pending
+            assert data["url_name"] == "solo-leveling"
+            assert client.metrics_snapshot().reconnects >= 1
+        finally:
+            await client.stop()
+            await crawler.stop()
+
+    asyncio.run(_run())
+
+
+def test_notification_consumer_catches_up_then_follows_pushes() -> None:
+    async def _run() -> None:
+        tmp = tempfile.TemporaryDirectory()
+        pool = await DbPool.open(str(Path(tmp.name) / "bot.db"))
+        await apply_pending(pool)
+        crawler = FakeCrawler(_catalog())
+        for index in range(5):
+            await crawler.publish_notification("asura", "solo-leveling", chapter_index=index)
+        await crawler.start()
+        client = CrawlerClient(_config(crawler.ws_url))
+        delivered: list[int] = []
+
+        async def _dispatch(record: dict) -> None:
+            delivered.append(record["id"])
+
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=_dispatch,
+            catchup_page_size=2,
+        )
+        try:
+            await consumer.start()
+            await client.start()
+            for _ in range(100):
+                if len(delivered) == 5:
+                    break
+                await asyncio.sleep(0.02)
+            await crawler.publish_notification("comix", "solo-leveling")
+            for _ in range(100):
+                if crawler.consumer_offsets.get("test") == 6:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await consumer.stop()
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+        assert delivered == [1, 2, 3, 4, 5, 6]
+        assert crawler.consumer_offsets == {"test": 6}
+        assert len(crawler.requests_of("notifications_list")) == 3
+
+    asyncio.run(_run())
@@ -22,15 +22,12 @@ def _make_bot(pool: DbPool, supported_keys: list[str]) -> SimpleNamespace:
     """Minimal bot stand-in with the attributes _get_lost_entries touches."""
     websites = [{"key": k} for k in supported_keys]
 
-    async def _get_or_set(key: str, loader: object, ttl: object) -> list:
-        return websites
-
-    cache = SimpleNamespace(get_or_set=AsyncMock(side_effect=_get_or_set))
+    crawler = SimpleNamespace(cached_request=AsyncMock(return_value={"websites": websites}))
     config = SimpleNamespace(
         supported_websites_cache=SimpleNamespace(ttl_seconds=3600),
         premium=SimpleNamespace(patreon=SimpleNamespace(pledge_url="")),
     )
-    return SimpleNamespace(db=pool, websites_cache=cache, config=config)
+    return SimpleNamespace(db=pool, crawler=crawler, config=config)
 
 
 def test_lost_entries_tracked() -> None:
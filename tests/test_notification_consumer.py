@@ -19,7 +19,9 @@ from manhwa_bot.crawler.client import CrawlerClient
 from manhwa_bot.crawler.notifications import NotificationConsumer
 from manhwa_bot.db.consumer_state import ConsumerStateStore
 from manhwa_bot.db.migrate import apply_pending
+from manhwa_bot.db.notification_inbox import NotificationInboxStore
 from manhwa_bot.db.pool import DbPool
+from manhwa_bot.scripts.fake_crawler import FakeCrawler
 
 
 def _config(ws_url: str, *, request_timeout: float = 5.0) -> CrawlerConfig:
@@ -177,6 +179,48 @@ def test_catchup_replays_in_order_and_acks() -> None:
     asyncio.run(_run())
 
 
+def test_catchup_publishes_series_invalidation_before_dispatch() -> None:
+    async def _run() -> None:
+        handler = _make_handler([[_record(21, url_name="alpha"), _record(22)], []], ack_log=[])
+        runner, url = await _start_server(handler)
+        pool, tmp = await _open_db()
+        client = CrawlerClient(_config(url))
+        events: list[tuple[str, ...]] = []
+        client.invalidations.subscribe(lambda wk, un: events.append(("evict", wk, un)))
+
+        async def dispatch(record: dict) -> None:
+            events.append(("dispatch", str(record["id"])))
+
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=dispatch,
+            invalidations=client.invalidations,
+        )
+        try:
+            await client.start()
+            await consumer.start()
+            for _ in range(40):
+                if consumer.last_acked == 22 and not consumer.catching_up:
+                    break
+                await asyncio.sleep(0.05)
+            assert events == [
+                ("evict", "comick", "alpha"),
+                ("dispatch", "21"),
+                ("evict", "comick", "demo"),
+                ("dispatch", "22"),
+            ]
+        finally:
+            await consumer.stop()
+            await client.stop()
+            await pool.close()
+            tmp.cleanup()
+            await runner.cleanup()
+
+    asyncio.run(_run())
+
+
 def test_paginates_until_short_batch() -> None:
     async def _run() -> None:
         page1 = [_record(i) for i in range(1, 201)]  # 200 records
@@ -581,7 +625,7 @@ def test_reconnect_resumes_from_last_acked() -> None:
             assert consumer.last_acked == 2
 
             # Force a reconnect by closing the underlying WS.
-            ws = client._ws  # type: ignore[attr-defined]
+            ws = client._connections[0].ws  # type: ignore[attr-defined]
             assert ws is not None
             await ws.close()
 
@@ -600,3 +644,651 @@ def test_reconnect_resumes_from_last_acked() -> None:
             await runner.cleanup()
 
     asyncio.run(_run())
+
+
+async def _wait_for(predicate, *, attempts: int = 150) -> None:
+    for _ in range(attempts):
+        if predicate():
+            return
+        await asyncio.sleep(0.02)
+
+
+def test_pipelined_dispatch_keeps_series_order_and_acks_the_low_watermark() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        for series in ("slow", "fast", "slow", "fast"):
+            await crawler.publish_notification("site", series)
+        await crawler.start()
+        pool, tmp = await _open_db()
+        client = CrawlerClient(_config(crawler.ws_url))
+        release_slow = asyncio.Event()
+        started: list[int] = []
+        finished: list[int] = []
+
+        async def dispatch(record: dict) -> None:
+            started.append(record["id"])
+            if record["url_name"] == "slow" and record["id"] == 1:
+                await release_slow.wait()
+            finished.append(record["id"])
+
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=dispatch,
+            max_in_flight=4,
+        )
+        try:
+            await consumer.start()
+            await client.start()
+            await _wait_for(lambda: finished == [2, 4])
+            # The other series ran past the stuck one; its successor waits behind it.
+            assert finished == [2, 4]
+            assert 3 not in started
+            assert consumer.last_acked == 0
+
+            release_slow.set()
+            await _wait_for(lambda: crawler.consumer_offsets.get("test") == 4)
+            assert finished == [2, 4, 1, 3]
+            assert consumer.last_acked == 4
+            assert await ConsumerStateStore(pool).get_last_acked("test") == 4
+        finally:
+            await consumer.stop()
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_pipelined_failure_pins_the_watermark_until_replay() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        for index in range(5):
+            await crawler.publish_notification("site", f"series-{index}")
+        await crawler.start()
+        pool, tmp = await _open_db()
+        client = CrawlerClient(_config(crawler.ws_url))
+        delivered: list[int] = []
+        failures = {2: 1}
+
+        async def dispatch(record: dict) -> None:
+            if failures.get(record["id"]):
+                failures[record["id"]] -= 1
+                raise RuntimeError("boom")
+            delivered.append(record["id"])
+
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=dispatch,
+            max_in_flight=4,
+        )
+        try:
+            await consumer.start()
+            await client.start()
+            await _wait_for(lambda: len(delivered) >= 4 and consumer.in_flight == 0)
+            assert sorted(delivered) == [1, 3, 4, 5]
+            assert consumer.last_acked == 1
+            assert crawler.consumer_offsets == {"test": 1}
+
+            # The next catch-up replays from the failed record.
+            await crawler.drop_connections()
+            await _wait_for(lambda: crawler.consumer_offsets.get("test") == 5)
+            assert consumer.last_acked == 5
+            assert 2 in delivered
+            assert [r["since_id"] for r in crawler.requests_of("notifications_list")][:2] == [0, 1]
+        finally:
+            await consumer.stop()
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_slow_series_backlog_does_not_hold_slots_from_other_series() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        for series in ("slow", "slow", "slow", "fast", "fast"):
+            await crawler.publish_notification("site", series, push=False)
+        await crawler.start()
+        pool, tmp = await _open_db()
+        client = CrawlerClient(_config(crawler.ws_url))
+        release_slow = asyncio.Event()
+        finished: list[int] = []
+
+        async def dispatch(record: dict) -> None:
+            if record["id"] == 1:
+                await release_slow.wait()
+            finished.append(record["id"])
+
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=dispatch,
+            max_in_flight=2,
+        )
+        try:
+            await consumer.start()
+            await client.start()
+            # 2 and 3 wait behind 1 without taking the second slot.
+            await _wait_for(lambda: finished == [4, 5])
+            assert finished == [4, 5]
+            assert consumer.last_acked == 0
+
+            release_slow.set()
+            await _wait_for(lambda: consumer.last_acked == 5)
+            assert finished == [4, 5, 1, 2, 3]
+        finally:
+            await consumer.stop()
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_failed_dispatch_replays_after_the_retry_delay_without_a_reconnect() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        for index in range(3):
+            await crawler.publish_notification("site", f"series-{index}", push=False)
+        await crawler.start()
+        pool, tmp = await _open_db()
+        client = CrawlerClient(_config(crawler.ws_url))
+        delivered: list[int] = []
+        fail_once = {2}
+        halted = asyncio.Event()
+        resume = asyncio.Event()
+
+        async def dispatch(record: dict) -> None:
+            if record["id"] in fail_once:
+                fail_once.discard(record["id"])
+                halted.set()
+                await resume.wait()
+                raise RuntimeError("boom")
+            delivered.append(record["id"])
+
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=dispatch,
+            max_in_flight=4,
+            retry_delay_seconds=0.3,
+        )
+        try:
+            await consumer.start()
+            await client.start()
+            await halted.wait()
+            resume.set()
+            await _wait_for(lambda: consumer.in_flight == 0 and not consumer.catching_up)
+            assert consumer.last_acked == 1
+            # Halted: a live push is left in the crawler's log, not dispatched.
+            await crawler.publish_notification("site", "live")
+            await asyncio.sleep(0.05)
+            assert 4 not in delivered
+
+            await _wait_for(lambda: consumer.last_acked == 4)
+            assert consumer.last_acked == 4
+            assert delivered.count(2) == 1 and 4 in delivered
+            assert crawler.connections == 1
+            assert [r["since_id"] for r in crawler.requests_of("notifications_list")] == [0, 1]
+        finally:
+            await consumer.stop()
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+async def _batched_consumer(
+    crawler: FakeCrawler, pool: DbPool, delivered: list[int], **kwargs
+) -> tuple[CrawlerClient, NotificationConsumer]:
+    client = CrawlerClient(_config(crawler.ws_url))
+
+    async def dispatch(record: dict) -> None:
+        delivered.append(record["id"])
+
+    consumer = NotificationConsumer(
+        client=client,
+        store=ConsumerStateStore(pool),
+        consumer_key="test",
+        dispatch=dispatch,
+        **kwargs,
+    )
+    await consumer.start()
+    await client.start()
+    return client, consumer
+
+
+def test_acks_are_batched_by_count_and_flushed_on_stop() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        for index in range(7):
+            await crawler.publish_notification("site", f"series-{index}", push=False)
+        await crawler.start()
+        pool, tmp = await _open_db()
+        delivered: list[int] = []
+        client, consumer = await _batched_consumer(crawler, pool, delivered, ack_every=3)
+        try:
+            await _wait_for(lambda: len(delivered) == 7 and not consumer.catching_up)
+            acks = [r["last_notification_id"] for r in crawler.requests_of("notifications_ack")]
+            assert acks == [3, 6]
+            assert consumer.last_acked == 7
+            assert await ConsumerStateStore(pool).get_last_acked("test") == 6
+
+            await consumer.stop()
+            assert await ConsumerStateStore(pool).get_last_acked("test") == 7
+            assert crawler.consumer_offsets == {"test": 7}
+        finally:
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_acks_flush_after_the_interval() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        await crawler.start()
+        pool, tmp = await _open_db()
+        delivered: list[int] = []
+        client, consumer = await _batched_consumer(
+            crawler, pool, delivered, ack_every=100, ack_interval_seconds=0.2
+        )
+        try:
+            await _wait_for(lambda: crawler.requests_of("notifications_list"))
+            await crawler.publish_notification("site", "a")
+            await crawler.publish_notification("site", "b")
+            await _wait_for(lambda: len(delivered) == 2)
+            assert crawler.consumer_offsets == {}
+            await _wait_for(lambda: crawler.consumer_offsets.get("test") == 2)
+            assert await ConsumerStateStore(pool).get_last_acked("test") == 2
+        finally:
+            await consumer.stop()
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_unflushed_offset_is_persisted_on_disconnect() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        for index in range(3):
+            await crawler.publish_notification("site", f"series-{index}", push=False)
+        await crawler.start()
+        pool, tmp = await _open_db()
+        store = ConsumerStateStore(pool)
+        delivered: list[int] = []
+        client, consumer = await _batched_consumer(crawler, pool, delivered, ack_every=100)
+        try:
+            await _wait_for(lambda: len(delivered) == 3 and not consumer.catching_up)
+            assert await store.get_last_acked("test") == 0
+
+            await crawler.drop_connections()
+            for _ in range(150):
+                if await store.get_last_acked("test") == 3:
+                    break
+                await asyncio.sleep(0.02)
+            assert await store.get_last_acked("test") == 3
+        finally:
+            await consumer.stop()
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_next_catchup_page_is_fetched_while_the_current_one_dispatches() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        for index in range(25):
+            await crawler.publish_notification("site", f"series-{index}", push=False)
+        await crawler.start()
+        pool, tmp = await _open_db()
+        lists_seen_by_first_record: list[int] = []
+        delivered: list[int] = []
+
+        async def dispatch(record: dict) -> None:
+            if record["id"] == 1:
+                await _wait_for(lambda: len(crawler.requests_of("notifications_list")) >= 2)
+                lists_seen_by_first_record.append(len(crawler.requests_of("notifications_list")))
+            delivered.append(record["id"])
+
+        client = CrawlerClient(_config(crawler.ws_url))
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=dispatch,
+            catchup_page_size=5,
+        )
+        try:
+            await consumer.start()
+            await client.start()
+            await _wait_for(lambda: len(delivered) == 25 and not consumer.catching_up)
+            assert delivered == list(range(1, 26))
+            assert lists_seen_by_first_record == [2]
+            # Fast dispatch grows the page: 5 (initial), 5 (prefetched), then doubling.
+            limits = [r["limit"] for r in crawler.requests_of("notifications_list")]
+            assert limits == [5, 5, 10, 20]
+            assert [r["since_id"] for r in crawler.requests_of("notifications_list")] == [
+                0,
+                5,
+                10,
+                20,
+            ]
+            assert consumer.catchup_page_size == 80
+        finally:
+            await consumer.stop()
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_pipelined_page_size_follows_dispatch_time_not_submit_time() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        for _ in range(5):
+            await crawler.publish_notification("site", "slow", push=False)
+        await crawler.start()
+        pool, tmp = await _open_db()
+        delivered: list[int] = []
+
+        async def dispatch(record: dict) -> None:
+            await asyncio.sleep(0.5)
+            delivered.append(record["id"])
+
+        client = CrawlerClient(_config(crawler.ws_url))
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=dispatch,
+            catchup_page_size=5,
+            max_in_flight=4,
+        )
+        try:
+            await consumer.start()
+            await client.start()
+            await _wait_for(lambda: consumer.catchup_page_size != 5, attempts=250)
+            assert len(delivered) == 5
+            # The page was queued at once but took ~2.5s to dispatch: it shrinks.
+            assert consumer.catchup_page_size == 4
+        finally:
+            await consumer.stop()
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_inbox_resumes_on_start_without_waiting_for_the_crawler() -> None:
+    async def _run() -> None:
+        pool, tmp = await _open_db()
+        inbox = NotificationInboxStore(pool)
+        await ConsumerStateStore(pool).set_last_acked("test", 3)
+        await ConsumerStateStore(pool).set_received_through("test", 5)
+        await inbox.append("test", [(i, _record(i, url_name=f"s-{i}")) for i in (2, 4, 5)])
+        # Nothing listens here: the client never connects.
+        client = CrawlerClient(_config("ws://127.0.0.1:9/ws"))
+        delivered: list[int] = []
+
+        async def dispatch(record: dict) -> None:
+            delivered.append(record["id"])
+
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=dispatch,
+            inbox=inbox,
+        )
+        try:
+            await consumer.start()
+            await _wait_for(lambda: consumer.last_acked == 5)
+            assert delivered == [4, 5]
+            await consumer.stop()
+            assert await inbox.count("test") == 0
+            assert await ConsumerStateStore(pool).get_last_acked("test") == 5
+        finally:
+            await client.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_inbox_stores_records_before_dispatch_and_lists_only_newer_ones() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        for index in range(6):
+            await crawler.publish_notification("site", f"series-{index}", push=False)
+        await crawler.start()
+        pool, tmp = await _open_db()
+        inbox = NotificationInboxStore(pool)
+        # A previous run stored 1..4 and crashed before dispatching them.
+        await inbox.append("test", [(r["id"], r) for r in crawler.notifications[:4]])
+        await ConsumerStateStore(pool).set_received_through("test", 4)
+        client = CrawlerClient(_config(crawler.ws_url))
+        stored_at_dispatch: list[int] = []
+
+        async def dispatch(record: dict) -> None:
+            pending = [r["id"] for r in await inbox.pending("test")]
+            stored_at_dispatch.append(record["id"] in pending)
+
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=dispatch,
+            inbox=inbox,
+            ack_every=100,
+        )
+        try:
+            await client.start()
+            await consumer.start()
+            await _wait_for(lambda: consumer.last_acked == 6 and not consumer.catching_up)
+            await crawler.publish_notification("site", "live")
+            await _wait_for(lambda: consumer.last_acked == 7)
+            assert stored_at_dispatch == [True] * 7
+            assert [r["since_id"] for r in crawler.requests_of("notifications_list")] == [4]
+            assert await inbox.count("test") == 7  # deletes are batched with the offset
+
+            await consumer.stop()
+            assert await inbox.count("test") == 0
+        finally:
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_live_push_stored_mid_catchup_does_not_skip_the_rest_after_a_restart() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        for index in range(9):
+            await crawler.publish_notification("site", f"series-{index}", push=False)
+        await crawler.start()
+        pool, tmp = await _open_db()
+        inbox = NotificationInboxStore(pool)
+        stuck = asyncio.Event()
+
+        async def stuck_dispatch(record: dict) -> None:
+            if record["id"] == 2:
+                await stuck.wait()
+
+        first_client = CrawlerClient(_config(crawler.ws_url))
+        first = NotificationConsumer(
+            client=first_client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=stuck_dispatch,
+            catchup_page_size=4,
+            inbox=inbox,
+        )
+        second_client = CrawlerClient(_config(crawler.ws_url))
+        delivered: list[int] = []
+
+        async def dispatch(record: dict) -> None:
+            delivered.append(record["id"])
+
+        second = NotificationConsumer(
+            client=second_client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=dispatch,
+            inbox=inbox,
+        )
+        try:
+            await first.start()
+            await first_client.start()
+            await _wait_for(lambda: first.last_acked == 1)
+            # Catch-up is stuck at id 2 when a live push for id 10 lands in the inbox.
+            await crawler.publish_notification("site", "live")
+            for _ in range(150):
+                if await inbox.max_id("test") == 10:
+                    break
+                await asyncio.sleep(0.02)
+            assert await inbox.max_id("test") == 10
+            await first.stop()
+            await first_client.stop()
+
+            await second.start()
+            await second_client.start()
+            await _wait_for(lambda: second.last_acked == 10)
+            assert delivered == list(range(2, 11))
+        finally:
+            await second.stop()
+            await second_client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_digest_collapses_a_series_backlog_and_acks_it_together() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        for series in ("a", "b", "a", "a", "a", "a", "c"):
+            await crawler.publish_notification("site", series, push=False)
+        # A status change splits series a's backlog into two runs.
+        crawler.notifications[3]["payload"] = {
+            "event": "status_change",
+            "website_key": "site",
+            "url_name": "a",
+            "new_status": "Hiatus",
+        }
+        await crawler.start()
+        pool, tmp = await _open_db()
+        client = CrawlerClient(_config(crawler.ws_url))
+        dispatched: list[tuple[int, list[int]]] = []
+
+        async def dispatch(record: dict) -> None:
+            dispatched.append((record["id"], [r["id"] for r in record.get("digest") or []]))
+
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=dispatch,
+            max_in_flight=4,
+            digest=True,
+        )
+        try:
+            await consumer.start()
+            await client.start()
+            await _wait_for(lambda: crawler.consumer_offsets.get("test") == 7)
+            assert sorted(dispatched) == [(2, []), (3, [1, 3]), (4, []), (6, [5, 6]), (7, [])]
+            series_a = [rid for rid, _ in dispatched if rid in (3, 4, 6)]
+            assert series_a == [3, 4, 6]
+            assert consumer.last_acked == 7
+
+            # Live pushes are never collapsed.
+            await crawler.publish_notification("site", "a")
+            await crawler.publish_notification("site", "a")
+            await _wait_for(lambda: crawler.consumer_offsets.get("test") == 9)
+            assert dispatched[-2:] == [(8, []), (9, [])]
+        finally:
+            await consumer.stop()
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_digest_leaves_pushes_stored_during_catchup_uncollapsed() -> None:
+    async def _run() -> None:
+        crawler = FakeCrawler()
+        for _ in range(2):
+            await crawler.publish_notification("site", "a", push=False)
+        await crawler.start()
+        pool, tmp = await _open_db()
+        inbox = NotificationInboxStore(pool)
+        client = CrawlerClient(_config(crawler.ws_url))
+        blocked = asyncio.Event()
+        release = asyncio.Event()
+        dispatched: list[tuple[int, list[int]]] = []
+
+        async def dispatch(record: dict) -> None:
+            if record["id"] == 2:
+                blocked.set()
+                await release.wait()
+            dispatched.append((record["id"], [r["id"] for r in record.get("digest") or []]))
+
+        consumer = NotificationConsumer(
+            client=client,
+            store=ConsumerStateStore(pool),
+            consumer_key="test",
+            dispatch=dispatch,
+            inbox=inbox,
+            digest=True,
+        )
+        try:
+            await consumer.start()
+            await client.start()
+            await asyncio.wait_for(blocked.wait(), timeout=3.0)
+            # Two live pushes for the same series land in the inbox mid-catch-up.
+            await crawler.publish_notification("site", "a")
+            await crawler.publish_notification("site", "a")
+            for _ in range(150):
+                if await inbox.max_id("test") == 4:
+                    break
+                await asyncio.sleep(0.02)
+            release.set()
+            await _wait_for(lambda: consumer.last_acked == 4)
+            assert dispatched == [(2, [1, 2]), (3, []), (4, [])]
+        finally:
+            await consumer.stop()
+            await client.stop()
+            await crawler.stop()
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
@@ -23,6 +23,8 @@ from manhwa_bot.config import (
     PremiumConfig,
     SupportedWebsitesCacheConfig,
 )
+from manhwa_bot.crawler.invalidation import InvalidationBus
+from manhwa_bot.db.dm_channels import DmChannelStore
 from manhwa_bot.db.dm_settings import DmSettingsStore
 from manhwa_bot.db.guild_settings import GuildSettings, GuildSettingsStore
 from manhwa_bot.db.migrate import apply_pending
@@ -87,7 +89,8 @@ class _BotStub:
     get_channel: MagicMock
     fetch_channel: AsyncMock
     fetch_user: AsyncMock
-    premium: object  # PremiumService-like; .is_premium(...) -> (bool, str | None)
+    premium: object  # PremiumService-like; .is_premium_many(user_ids) -> set[int]
+    get_partial_messageable: MagicMock
 
 
 def _payload(*, website_key: str = "comick", url_name: str = "demo", premium: bool = False) -> dict:
@@ -169,7 +172,10 @@ async def _setup() -> tuple[_BotStub, UpdatesCog, tempfile.TemporaryDirectory]:
         get_channel=MagicMock(),
         fetch_channel=AsyncMock(return_value=None),
         fetch_user=AsyncMock(),
-        premium=SimpleNamespace(is_premium=AsyncMock(return_value=(True, "disabled"))),
+        premium=SimpleNamespace(
+            is_premium_many=AsyncMock(side_effect=lambda user_ids, **_: set(user_ids))
+        ),
+        get_partial_messageable=MagicMock(),
     )
     cog = UpdatesCog(bot)  # type: ignore[arg-type]
     return bot, cog, tmp
@@ -263,10 +269,6 @@ def test_dispatch_persists_compact_context_for_long_comix_slug() -> None:
 
 
 def test_dispatch_resolves_human_scanlator_name_from_website_cache() -> None:
-    class _Cache:
-        async def get_or_set(self, _key, loader, _ttl):
-            return await loader()
-
     async def _run() -> None:
         bot, cog, tmp = await _setup()
         try:
@@ -274,9 +276,10 @@ def test_dispatch_resolves_human_scanlator_name_from_website_cache() -> None:
             await GuildSettingsStore(bot.db).set_notifications_channel(1, 100)
             channel = _make_channel()
             bot.get_channel.side_effect = lambda cid: channel if cid == 100 else None
-            bot.websites_cache = _Cache()  # type: ignore[attr-defined]
             bot.crawler = SimpleNamespace(
-                request=AsyncMock(return_value={"websites": [{"key": "comix", "name": "Comix"}]})
+                cached_request=AsyncMock(
+                    return_value={"websites": [{"key": "comix", "name": "Comix"}]}
+                )
             )
             record = _payload(website_key="comix")
             record["payload"]["source"] = "main"
@@ -292,6 +295,29 @@ def test_dispatch_resolves_human_scanlator_name_from_website_cache() -> None:
     asyncio.run(_run())
 
 
+def test_dispatch_publishes_series_invalidation() -> None:
+    async def _run() -> None:
+        bot, cog, tmp = await _setup()
+        try:
+            await _seed_tracked(bot.db, guild_ids=[1])
+            published: list[tuple[str, str]] = []
+            bus = InvalidationBus()
+            bus.subscribe(lambda wk, un: published.append((wk, un)))
+            bot.crawler = SimpleNamespace(
+                invalidations=bus,
+                cached_request=AsyncMock(return_value={"websites": []}),
+            )
+
+            await cog.dispatch(_payload())
+
+            assert published == [("comick", "demo")]
+        finally:
+            await bot.db.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
 def test_three_guilds_one_missing_channel_skipped() -> None:
     async def _run() -> None:
         bot, cog, tmp = await _setup()
@@ -599,6 +625,44 @@ def test_dm_forbidden_does_not_fail_dispatch() -> None:
     asyncio.run(_run())
 
 
+def test_dm_channel_is_cached_after_first_send_and_dropped_when_refused() -> None:
+    async def _run() -> None:
+        bot, cog, tmp = await _setup()
+        try:
+            await _seed_tracked(bot.db, guild_ids=[1])
+            await SubscriptionStore(bot.db).subscribe(42, 1, "comick", "demo")
+            user = MagicMock()
+            user.send = AsyncMock()
+            user.dm_channel = SimpleNamespace(id=4200)
+            bot.fetch_user.return_value = user
+            dm_channel = MagicMock()
+            dm_channel.send = AsyncMock()
+            bot.get_partial_messageable.return_value = dm_channel
+
+            await cog.dispatch(_payload())
+            assert bot.fetch_user.await_count == 1
+            assert await DmChannelStore(bot.db).get_many([42]) == {42: 4200}
+
+            second = _payload()
+            second["id"] = 2
+            await cog.dispatch(second)
+            # The second DM goes straight to the cached channel.
+            assert bot.fetch_user.await_count == 1
+            assert dm_channel.send.await_count == 1
+            assert bot.get_partial_messageable.call_args.args == (4200,)
+
+            dm_channel.send.side_effect = discord.Forbidden(MagicMock(status=403), "blocked")
+            third = _payload()
+            third["id"] = 3
+            await cog.dispatch(third)
+            assert await DmChannelStore(bot.db).get_many([42]) == {}
+        finally:
+            await bot.db.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
 def test_ping_role_resolution_uses_row_ping_role() -> None:
     async def _run() -> None:
         bot, cog, tmp = await _setup()
@@ -682,7 +746,7 @@ def test_non_premium_subscriber_is_skipped_for_dm() -> None:
     async def _run() -> None:
         bot, cog, tmp = await _setup()
         try:
-            bot.premium.is_premium = AsyncMock(return_value=(False, None))
+            bot.premium.is_premium_many = AsyncMock(return_value=set())
             await _seed_tracked(bot.db, guild_ids=[1])
             settings_store = GuildSettingsStore(bot.db)
             await settings_store.set_notifications_channel(1, 100)
@@ -708,6 +772,46 @@ def test_non_premium_subscriber_is_skipped_for_dm() -> None:
     asyncio.run(_run())
 
 
+def test_failed_bulk_premium_check_falls_back_to_each_user() -> None:
+    """A failing bulk query must not drop every DM for the event."""
+
+    async def _run() -> None:
+        bot, cog, tmp = await _setup()
+        try:
+            bot.premium.is_premium_many = AsyncMock(side_effect=RuntimeError("db down"))
+
+            async def _is_premium(*, user_id: int, **_: object) -> tuple[bool, str | None]:
+                if user_id == 43:
+                    raise RuntimeError("patreon down")
+                return True, "grant"
+
+            bot.premium.is_premium = AsyncMock(side_effect=_is_premium)
+            await _seed_tracked(bot.db, guild_ids=[1])
+            await GuildSettingsStore(bot.db).set_notifications_channel(1, 100)
+            channel = _make_channel()
+            bot.get_channel.side_effect = lambda cid: channel if cid == 100 else None
+            subscriptions = SubscriptionStore(bot.db)
+            await subscriptions.subscribe(42, 1, "comick", "demo")
+            await subscriptions.subscribe(43, 1, "comick", "demo")
+
+            user = MagicMock()
+            user.send = AsyncMock()
+            bot.fetch_user.return_value = user
+
+            await cog.dispatch(_payload())
+
+            # 42 still gets the DM; only 43, whose own check failed, is skipped.
+            assert bot.premium.is_premium.await_count == 2
+            assert [c.args for c in bot.fetch_user.await_args_list] == [(42,)]
+            assert user.send.await_count == 1
+            assert channel.send.await_count == 1
+        finally:
+            await bot.db.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
 def test_default_paid_chapter_setting_allows_premium() -> None:
     """Default settings (paid_chapter_notifs=True) must let premium chapters through."""
 
@@ -865,3 +969,89 @@ def test_terminal_status_change_dispatch_removes_local_tracking_and_subscription
             tmp.cleanup()
 
     asyncio.run(_run())
+
+
+def test_replayed_record_only_reaches_targets_it_missed() -> None:
+    async def _run() -> None:
+        bot, cog, tmp = await _setup()
+        try:
+            await _seed_tracked(bot.db, guild_ids=[1, 2, 3])
+            settings_store = GuildSettingsStore(bot.db)
+            for gid in (1, 2, 3):
+                await settings_store.set_notifications_channel(gid, gid * 100)
+            await SubscriptionStore(bot.db).subscribe(42, 1, "comick", "demo")
+
+            channels = {cid: _make_channel() for cid in (100, 200, 300)}
+            response = MagicMock(status=500, reason="Internal Server Error")
+            channels[200].send.side_effect = [discord.HTTPException(response, "boom"), None]
+            bot.get_channel.side_effect = lambda cid: channels.get(cid)
+            user = MagicMock()
+            user.send = AsyncMock()
+            bot.fetch_user.return_value = user
+
+            await cog.dispatch(_payload())
+            await cog.dispatch(_payload())  # the consumer replays the whole record
+
+            assert [channels[cid].send.await_count for cid in (100, 200, 300)] == [1, 2, 1]
+            assert user.send.await_count == 1
+            rows = await bot.db.fetchall(
+                "SELECT target_kind, target_id FROM notification_deliveries WHERE record_id = 1"
+            )
+            assert sorted((r["target_kind"], r["target_id"]) for r in rows) == [
+                ("dm", 42),
+                ("guild", 1),
+                ("guild", 2),
+                ("guild", 3),
+            ]
+
+            # A different record for the same series goes out to everyone again.
+            record = _payload()
+            record["id"] = 2
+            await cog.dispatch(record)
+            assert [channels[cid].send.await_count for cid in (100, 200, 300)] == [2, 3, 2]
+        finally:
+            await bot.db.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_digest_sends_one_message_listing_each_recipients_chapters() -> None:
+    async def _run() -> None:
+        bot, cog, tmp = await _setup()
+        try:
+            await _seed_tracked(bot.db, guild_ids=[1, 2])
+            settings_store = GuildSettingsStore(bot.db)
+            await settings_store.set_notifications_channel(1, 100)
+            await settings_store.set_notifications_channel(2, 200)
+            await settings_store.set_paid_chapter_notifs(2, False)
+            channels = {100: _make_channel(), 200: _make_channel()}
+            bot.get_channel.side_effect = lambda cid: channels.get(cid)
+
+            members = []
+            for index in (1, 2, 3):
+                member = _payload(premium=index == 2)
+                member["id"] = 10 + index
+                member["payload"]["chapter"].update(
+                    index=index,
+                    name=f"Chapter {index}",
+                    url=f"https://example.com/demo/{index}",
+                )
+                members.append(member)
+            await cog.dispatch({**members[-1], "digest": members})
+
+            everything = _all_text(channels[100].send.await_args.kwargs["view"])
+            assert "**3 new chapters:**" in everything
+            assert all(f"Chapter {index}" in everything for index in (1, 2, 3))
+            free_only = _all_text(channels[200].send.await_args.kwargs["view"])
+            assert "**2 new chapters:**" in free_only
+            assert "Chapter 2" not in free_only
+            assert [c.send.await_count for c in channels.values()] == [1, 1]
+            series = await TrackedStore(bot.db).find("comick", "demo")
+            assert series is not None
+            assert series.last_chapter_text == "Chapter 3"
+        finally:
+            await bot.db.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
@@ -0,0 +1,154 @@
+"""NotificationRoutingIndex: bulk load, resolved routes and write-driven refresh."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from manhwa_bot.db.dm_settings import DmSettingsStore
+from manhwa_bot.db.guild_settings import GuildSettingsStore
+from manhwa_bot.db.migrate import apply_pending
+from manhwa_bot.db.pool import DbPool
+from manhwa_bot.db.subscriptions import SubscriptionStore
+from manhwa_bot.db.tracked import TrackedStore
+from manhwa_bot.notification_routing import (
+    DmRoute,
+    FanoutQueryRouting,
+    GuildRoute,
+    NotificationRoutingIndex,
+)
+from manhwa_bot.ui.components.notification_buttons import ALL_UPDATE_BUTTONS
+
+
+async def _open_db() -> tuple[DbPool, tempfile.TemporaryDirectory]:
+    tmp = tempfile.TemporaryDirectory()
+    pool = await DbPool.open(str(Path(tmp.name) / "bot.db"))
+    await apply_pending(pool)
+    return pool, tmp
+
+
+async def _seed(pool: DbPool) -> None:
+    tracked = TrackedStore(pool)
+    await tracked.upsert_series("comick", "demo", "https://example.com/demo", "Demo")
+    await tracked.add_to_guild(1, "comick", "demo", ping_role_id=11)
+    await tracked.add_to_guild(2, "comick", "demo")
+    guilds = GuildSettingsStore(pool)
+    await guilds.set_notifications_channel(1, 100)
+    await guilds.set_default_ping_role(1, 12)
+    await guilds.set_notifications_channel(2, 200)
+    await guilds.set_scanlator_channel(2, "comick", 201)
+    await SubscriptionStore(pool).subscribe(7, 1, "comick", "demo")
+    await DmSettingsStore(pool).set_nsfw_spoiler_mode(7, "never")
+
+
+class _CountingPool:
+    """Counts reads that go through the wrapped pool."""
+
+    def __init__(self, pool: DbPool) -> None:
+        self.reads = 0
+        for name in ("fetchone", "fetchall"):
+            original = getattr(pool, name)
+
+            async def _counted(*args, _original=original, **kwargs):
+                self.reads += 1
+                return await _original(*args, **kwargs)
+
+            setattr(pool, name, _counted)
+
+
+def test_resolve_returns_fully_resolved_targets_without_further_queries() -> None:
+    async def _run() -> None:
+        pool, tmp = await _open_db()
+        try:
+            await _seed(pool)
+            index = NotificationRoutingIndex(pool)
+            await index.load()
+            counter = _CountingPool(pool)
+
+            routes = await index.resolve("comick", "demo")
+            assert await index.resolve("comick", "demo") is routes
+            assert counter.reads == 0
+            assert routes.guilds == (
+                GuildRoute(1, 100, 11, 12, True, ALL_UPDATE_BUTTONS, "always"),
+                GuildRoute(2, 201, None, None, True, ALL_UPDATE_BUTTONS, "always"),
+            )
+            assert routes.users == (DmRoute(7, nsfw_spoiler_mode="never"),)
+            empty = await index.resolve("comick", "untracked")
+            assert empty.guilds == () and empty.users == ()
+            index.close()
+        finally:
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_store_writes_refresh_only_the_touched_keys() -> None:
+    async def _run() -> None:
+        pool, tmp = await _open_db()
+        try:
+            await _seed(pool)
+            index = NotificationRoutingIndex(pool)
+            await index.load()
+            tracked = TrackedStore(pool)
+            guilds = GuildSettingsStore(pool)
+
+            await tracked.add_to_guild(3, "comick", "demo")
+            await guilds.set_notifications_channel(3, 300)
+            await guilds.set_update_buttons(1, ["open_chapter"])
+            await guilds.clear_scanlator_channel(2, "comick")
+            await DmSettingsStore(pool).set_notifications_enabled(7, False)
+            routes = await index.resolve("comick", "demo")
+            assert [(r.guild_id, r.channel_id) for r in routes.guilds] == [
+                (1, 100),
+                (2, 200),
+                (3, 300),
+            ]
+            assert routes.guilds[0].update_buttons == frozenset({"open_chapter"})
+            assert routes.users[0].notifications_enabled is False
+
+            await tracked.remove_from_guild(1, "comick", "demo")
+            await SubscriptionStore(pool).unsubscribe_all_for_user(7)
+            routes = await index.resolve("comick", "demo")
+            assert [r.guild_id for r in routes.guilds] == [2, 3]
+            assert routes.users == ()
+
+            # Writes that bypass the stores must publish the table themselves.
+            await pool.execute("DELETE FROM guild_settings WHERE guild_id = ?", (3,))
+            assert (await index.resolve("comick", "demo")).guilds[1].channel_id == 300
+            pool.changes.publish("guild_settings")
+            assert (await index.resolve("comick", "demo")).guilds[1].channel_id is None
+            index.close()
+        finally:
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
+
+
+def test_joined_query_routing_matches_the_index_in_one_guild_query() -> None:
+    async def _run() -> None:
+        pool, tmp = await _open_db()
+        try:
+            await _seed(pool)
+            # A tracking guild that never saved settings gets the column defaults.
+            await TrackedStore(pool).add_to_guild(4, "comick", "demo")
+            await SubscriptionStore(pool).subscribe(8, 1, "comick", "demo")
+            index = NotificationRoutingIndex(pool)
+            expected = await index.resolve("comick", "demo")
+            index.close()
+
+            counter = _CountingPool(pool)
+            routes = await FanoutQueryRouting(pool).resolve("comick", "demo")
+            assert routes == expected
+            assert routes.guilds[-1] == GuildRoute(4, None, None, None)
+            assert counter.reads == 3
+
+            found = await DmSettingsStore(pool).get_many([7, 8, 7])
+            assert list(found) == [7]
+        finally:
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
@@ -149,3 +149,18 @@ def test_from_interaction_returns_false_when_disabled() -> None:
     ok, reason = svc.from_interaction(interaction, dm_only=False)
     assert ok is False
     assert reason is None
+
+
+def test_premium_users_among_follows_listener_updates() -> None:
+    async def _run() -> None:
+        svc = DiscordEntitlementsService(_config(user_skus=(100,)))
+        kept = _ent(sku_id=100, user_id=42)
+        dropped = _ent(sku_id=100, user_id=43)
+        for ent in (kept, dropped, _ent(sku_id=999, user_id=44), _ent(sku_id=100, guild_id=7)):
+            await svc.on_entitlement_create(ent)
+        assert svc.premium_users_among([42, 43, 44, 45]) == {42, 43}
+
+        await svc.on_entitlement_delete(dropped)
+        assert svc.premium_users_among([42, 43]) == {42}
+
+    asyncio.run(_run())
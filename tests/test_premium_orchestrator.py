@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import tempfile
+from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 
 from manhwa_bot.config import DiscordPremiumConfig, PatreonPremiumConfig, PremiumConfig
+from manhwa_bot.db.migrate import apply_pending
+from manhwa_bot.db.patreon_links import PatreonLinkStore
+from manhwa_bot.db.pool import DbPool
+from manhwa_bot.db.premium_grants import PremiumGrantStore
+from manhwa_bot.premium.discord_entitlements import DiscordEntitlementsService
+from manhwa_bot.premium.grants import GrantsService
+from manhwa_bot.premium.patreon import PatreonClient
 from manhwa_bot.premium.service import PremiumService
 
 
@@ -229,3 +238,56 @@ def test_interaction_short_circuits_to_discord_user() -> None:
         assert reason == "discord_user"
 
     asyncio.run(_run())
+
+
+def test_is_premium_many_matches_per_user_decisions_with_one_query_per_source() -> None:
+    async def _run() -> None:
+        tmp = tempfile.TemporaryDirectory()
+        pool = await DbPool.open(str(Path(tmp.name) / "bot.db"))
+        try:
+            await apply_pending(pool)
+            config = _config()
+            grants = PremiumGrantStore(pool)
+            await grants.grant("user", 2, 1, None, None)
+            await grants.grant("guild", 3, 1, None, None)  # guild grants never cover DMs
+            revoked = await grants.grant("user", 4, 1, None, None)
+            await grants.revoke(revoked)
+            links = PatreonLinkStore(pool)
+            await links.upsert(5, "p5", "", 500, "2026-01-01 00:00:00", "2999-01-01 00:00:00")
+            await links.upsert(6, "p6", "", 500, "2026-01-01 00:00:00", "2000-01-01 00:00:00")
+            ents = DiscordEntitlementsService(config.discord)
+            await ents.on_entitlement_create(
+                SimpleNamespace(
+                    id=1, sku_id=100, user_id=7, guild_id=None, ends_at=None, deleted=False
+                )
+            )
+            svc = PremiumService(
+                SimpleNamespace(owner_ids={1}),
+                config,
+                GrantsService(grants),
+                PatreonClient(config.patreon, links),
+                ents,
+            )
+            users = list(range(1, 9))
+            expected = {
+                uid
+                for uid in users
+                if (await svc.is_premium(user_id=uid, guild_id=None, dm_only=True))[0]
+            }
+
+            reads = 0
+            fetchall = pool.fetchall
+
+            async def _counted(*args, **kwargs):
+                nonlocal reads
+                reads += 1
+                return await fetchall(*args, **kwargs)
+
+            pool.fetchall = _counted  # type: ignore[method-assign]
+            assert await svc.is_premium_many(users) == expected == {1, 2, 5, 7}
+            assert reads == 2
+        finally:
+            await pool.close()
+            tmp.cleanup()
+
+    asyncio.run(_run())
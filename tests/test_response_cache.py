@@ -0,0 +1,222 @@
+"""ResponseCache / CrawlerClient.cached_request — hits, coalescing, policy, LRU."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from manhwa_bot.config import CrawlerConfig
+from manhwa_bot.crawler.client import CrawlerClient
+from manhwa_bot.crawler.errors import CrawlerError
+from manhwa_bot.crawler.invalidation import InvalidationBus
+from manhwa_bot.crawler.response_cache import ResponseCache, cache_key
+
+
+class _ScriptedClient(CrawlerClient):
+    def __init__(self, *, max_entries: int = 1024) -> None:
+        super().__init__(
+            CrawlerConfig(
+                ws_url="ws://unused",
+                http_base_url="http://unused",
+                request_timeout_seconds=5.0,
+                transport_watchdog_seconds=10.0,
+                reconnect_initial_delay_seconds=0.05,
+                reconnect_max_delay_seconds=0.2,
+                reconnect_jitter_seconds=0.0,
+                consumer_key="test",
+                api_key="test-key",
+                response_cache_max_entries=max_entries,
+            )
+        )
+        self.calls: list[dict[str, Any]] = []
+        self.release: asyncio.Event | None = None
+
+    async def request(self, type_: str, **fields: Any) -> dict[str, Any]:
+        self.calls.append({"type": type_, **fields})
+        if self.release is not None:
+            await self.release.wait()
+        return {"n": len(self.calls)}
+
+
+def test_cache_key_ignores_field_order() -> None:
+    assert cache_key("series_data", {"website_key": "a", "url_name": "b"}) == cache_key(
+        "series_data", {"url_name": "b", "website_key": "a"}
+    )
+
+
+def test_cached_request_reuses_fresh_entry() -> None:
+    async def _run() -> None:
+        client = _ScriptedClient()
+
+        first = await client.cached_request("supported_websites")
+        second = await client.cached_request("supported_websites")
+
+        assert first == second == {"n": 1}
+        assert len(client.calls) == 1
+        stats = client.cache_stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    asyncio.run(_run())
+
+
+def test_cached_request_coalesces_identical_concurrent_calls() -> None:
+    async def _run() -> None:
+        client = _ScriptedClient()
+        client.release = asyncio.Event()
+
+        tasks = [
+            asyncio.create_task(
+                client.cached_request(
+                    "series_data", website_key="a", url_name="b", allow_live=False
+                )
+            )
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        client.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == [{"n": 1}] * 5
+        assert len(client.calls) == 1
+        assert client.cache_stats().coalesced == 4
+
+    asyncio.run(_run())
+
+
+def test_cached_request_passes_through_uncacheable_requests() -> None:
+    async def _run() -> None:
+        client = _ScriptedClient()
+
+        await client.cached_request("series_data", website_key="a", url_name="b", allow_live=True)
+        await client.cached_request("series_data", website_key="a", url_name="b", allow_live=True)
+        await client.cached_request("chapters", website_key="a", url="u")
+        await client.cached_request("chapters", website_key="a", url="u")
+
+        assert len(client.calls) == 4
+        assert client.cache_stats().entries == 0
+
+    asyncio.run(_run())
+
+
+def test_cached_request_evicts_least_recently_used_entry() -> None:
+    async def _run() -> None:
+        client = _ScriptedClient(max_entries=2)
+
+        await client.cached_request("autocomplete", query="a", limit=10)
+        await client.cached_request("autocomplete", query="b", limit=10)
+        await client.cached_request("autocomplete", query="a", limit=10)
+        await client.cached_request("autocomplete", query="c", limit=10)
+        await client.cached_request("autocomplete", query="a", limit=10)
+        await client.cached_request("autocomplete", query="b", limit=10)
+
+        assert [call["query"] for call in client.calls] == ["a", "b", "c", "b"]
+        assert client.cache_stats().evictions == 2
+
+    asyncio.run(_run())
+
+
+def test_invalidate_cached_forces_refetch() -> None:
+    async def _run() -> None:
+        client = _ScriptedClient()
+
+        await client.cached_request("website_stats", window="7d", recent_limit=0)
+        await client.cached_request("next_update_check")
+        client.invalidate_cached("website_stats", window="7d", recent_limit=0)
+        client.invalidate_cached("next_update_check")
+        await client.cached_request("website_stats", window="7d", recent_limit=0)
+        await client.cached_request("next_update_check")
+
+        assert len(client.calls) == 4
+
+    asyncio.run(_run())
+
+
+def test_failed_load_is_not_cached_and_reaches_every_waiter() -> None:
+    async def _run() -> None:
+        cache = ResponseCache()
+        calls = 0
+        release = asyncio.Event()
+
+        async def _loader() -> dict[str, Any]:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            raise CrawlerError("website_blocked", "blocked")
+
+        tasks = [
+            asyncio.create_task(cache.get_or_fetch("info", "k", _loader, 60.0)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        for task in tasks:
+            with pytest.raises(CrawlerError):
+                await task
+
+        release.clear()
+        retry = asyncio.create_task(cache.get_or_fetch("info", "k", _loader, 60.0))
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(CrawlerError):
+            await retry
+        assert calls == 2
+
+    asyncio.run(_run())
+
+
+def test_series_invalidation_evicts_only_that_series() -> None:
+    async def _run() -> None:
+        client = _ScriptedClient()
+
+        for url_name in ("a", "b"):
+            await client.cached_request(
+                "series_data", website_key="site", url_name=url_name, allow_live=False
+            )
+        await client.cached_request("supported_websites")
+        client.invalidations.publish("site", "a")
+        for url_name in ("a", "b"):
+            await client.cached_request(
+                "series_data", website_key="site", url_name=url_name, allow_live=False
+            )
+        await client.cached_request("supported_websites")
+
+        assert [call.get("url_name") for call in client.calls] == ["a", "b", None, "a"]
+
+    asyncio.run(_run())
+
+
+def test_series_invalidation_discards_racing_load() -> None:
+    async def _run() -> None:
+        client = _ScriptedClient()
+        client.release = asyncio.Event()
+        fields = {"website_key": "site", "url_name": "a", "allow_live": False}
+
+        stale = asyncio.create_task(client.cached_request("series_data", **fields))
+        await asyncio.sleep(0)
+        client.invalidations.publish("site", "a")
+        client.release.set()
+        assert await stale == {"n": 1}
+
+        assert await client.cached_request("series_data", **fields) == {"n": 2}
+        assert await client.cached_request("series_data", **fields) == {"n": 2}
+
+    asyncio.run(_run())
+
+
+def test_invalidation_bus_isolates_failing_listener() -> None:
+    bus = InvalidationBus()
+    seen: list[tuple[str, str]] = []
+
+    def _broken(website_key: str, url_name: str) -> None:
+        raise RuntimeError("boom")
+
+    bus.subscribe(_broken)
+    unsubscribe = bus.subscribe(lambda wk, un: seen.append((wk, un)))
+
+    assert bus.publish_record({"payload": {"website_key": "site", "url_name": "a"}})
+    assert not bus.publish_record({"payload": {"website_key": "site"}})
+    unsubscribe()
+    bus.publish("site", "b")
+
+    assert seen == [("site", "a")]
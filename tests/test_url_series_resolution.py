@@ -14,12 +14,6 @@ from manhwa_bot.db.pool import DbPool
 from manhwa_bot.db.tracked import TrackedStore
 
 
-class _Cache:
-    async def get_or_set(self, key, loader, ttl):
-        del key, loader, ttl
-        return [{"key": "toongod", "base_url": "https://www.toongod.org"}]
-
-
 class _Crawler:
     def __init__(self) -> None:
         self.calls: list[tuple[str, dict]] = []
@@ -31,6 +25,11 @@ class _Crawler:
         ]
         self.chapters_result: list[dict] | None = None
 
+    async def cached_request(self, type_: str, **kwargs) -> dict:
+        if type_ == "supported_websites":
+            return {"websites": [{"key": "toongod", "base_url": "https://www.toongod.org"}]}
+        return await self.request(type_, **kwargs)
+
     async def request(self, type_: str, **kwargs) -> dict:
         self.calls.append((type_, kwargs))
         if type_ == "info":
@@ -57,7 +56,6 @@ async def _bot(tmp: str) -> tuple[SimpleNamespace, DbPool, _Crawler]:
     bot = SimpleNamespace(
         db=pool,
         crawler=crawler,
-        websites_cache=_Cache(),
         config=SimpleNamespace(supported_websites_cache=SimpleNamespace(ttl_seconds=60)),
     )
     return bot, pool, crawler